@@ -4,7 +4,12 @@ Backtest package for grid trading strategy simulation.
 Uses gridcore's GridEngine with trade-through fill model.
 """
 
-from backtest.config import BacktestConfig, BacktestStrategyConfig, WindDownMode
+from backtest.config import (
+    BacktestConfig,
+    BacktestStrategyConfig,
+    BacktestVariant,
+    WindDownMode,
+)
 from backtest.session import BacktestSession, BacktestMetrics, BacktestTrade
 from backtest.fill_simulator import TradeThroughFillSimulator
 from backtest.position_tracker import BacktestPositionTracker, PositionState
@@ -12,11 +17,13 @@ from backtest.order_manager import BacktestOrderManager, SimulatedOrder
 from backtest.executor import BacktestExecutor
 from backtest.runner import BacktestRunner
 from backtest.engine import BacktestEngine
+from backtest.multi_variant import MultiVariantBacktestEngine
 
 __all__ = [
     # Config
     "BacktestConfig",
     "BacktestStrategyConfig",
+    "BacktestVariant",
     "WindDownMode",
     # Session
     "BacktestSession",
@@ -31,4 +38,5 @@ __all__ = [
     "BacktestExecutor",
     "BacktestRunner",
     "BacktestEngine",
+    "MultiVariantBacktestEngine",
 ]
@@ -7,11 +7,13 @@ import os
 from decimal import Decimal
 from enum import StrEnum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import yaml
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from backtest.fill_simulator import FillMode
+
 
 class WindDownMode(StrEnum):
     """Wind-down mode at end of backtest."""
@@ -66,6 +68,13 @@ class BacktestStrategyConfig(BaseModel):
     enable_risk_multipliers: bool = Field(
         default=True, description="Enable risk-based order size multipliers (A/B toggle)"
     )
+    amend_enabled: bool = Field(
+        default=False,
+        description="Collapse same-side cancel+place pairs into order amends, "
+                    "as gridbot's amend_enabled does. Not applied in "
+                    "event_follower mode, whose recorded fills carry the live "
+                    "order lifecycle.",
+    )
     risk_limits_cache_path: Optional[str] = Field(
         default=None, description="Path to risk_limits_cache.json for tiered MMR (None = auto-discover conf/risk_limits_cache.json, then hardcoded defaults)"
     )
@@ -144,6 +153,33 @@ class BacktestStrategyConfig(BaseModel):
         return v
 
 
+class BacktestVariant(BaseModel):
+    """One variant of a single-pass multi-variant backtest.
+
+    Every variant gets its own runners and session but consumes the same
+    tick stream (see ``backtest.multi_variant``).
+    """
+
+    name: str = Field(..., min_length=1, description="Variant label used in reports/exports")
+    fill_mode: FillMode = Field(
+        default=FillMode.STRICT_CROSS,
+        description="Fill simulator mode for this variant's runners",
+    )
+    strategy_overrides: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Strategy fields overridden for every strategy in this variant "
+        "(e.g. {grid_step: 0.3})",
+    )
+
+    @field_validator("fill_mode")
+    @classmethod
+    def reject_event_follower(cls, v):
+        """event_follower needs recorded executions, which backtest has no source for."""
+        if v == FillMode.EVENT_FOLLOWER:
+            raise ValueError("fill_mode 'event_follower' is only supported by replay")
+        return v
+
+
 class BacktestConfig(BaseModel):
     """Root configuration for backtest."""
 
@@ -185,6 +221,12 @@ class BacktestConfig(BaseModel):
         description="Hours before instrument cache is refreshed from API",
     )
 
+    # Single-pass multi-variant runs (empty = one plain run)
+    variants: list[BacktestVariant] = Field(
+        default_factory=list,
+        description="Variants run side by side over one pass of the data",
+    )
+
     @field_validator("initial_balance", mode="before")
     @classmethod
     def parse_initial_balance(cls, v):
@@ -205,6 +247,32 @@ class BacktestConfig(BaseModel):
             return Decimal(str(v))
         return v
 
+    @field_validator("variants")
+    @classmethod
+    def validate_unique_variant_names(cls, v):
+        """Variant names key the per-variant results and export files."""
+        names = [variant.name for variant in v]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate variant names: {duplicates}")
+        return v
+
+    def for_variant(self, variant: BacktestVariant) -> "BacktestConfig":
+        """Copy of this config with ``variant.strategy_overrides`` applied.
+
+        Overridden strategies are re-validated so a bad override fails at
+        setup rather than mid-run.
+        """
+        if not variant.strategy_overrides:
+            return self.model_copy(update={"variants": []})
+        strategies = [
+            BacktestStrategyConfig.model_validate(
+                {**s.model_dump(), **variant.strategy_overrides}
+            )
+            for s in self.strategies
+        ]
+        return self.model_copy(update={"strategies": strategies, "variants": []})
+
     def get_strategy(self, strat_id: str) -> Optional[BacktestStrategyConfig]:
         """Get strategy config by ID."""
         return next((s for s in self.strategies if s.strat_id == strat_id), None)
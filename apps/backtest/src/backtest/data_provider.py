@@ -3,13 +3,26 @@
 Provides historical price data from database as TickerEvent stream.
 """
 
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import Iterator, Optional
 
 from gridcore import TickerEvent, EventType
-from grid_db import DatabaseFactory, TickerSnapshot, PublicTrade
+from grid_db import DatabaseFactory, TickerSnapshot, TickerRollupRepository, PublicTrade
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RolledUpRange:
+    """A ticker range thinned to first/low/high/last per bucket (feature 0103)."""
+
+    start_ts: datetime
+    end_ts: datetime
+    bucket_seconds: int
 
 
 @dataclass
@@ -20,6 +33,8 @@ class DataRangeInfo:
     start_ts: Optional[datetime]
     end_ts: Optional[datetime]
     total_records: int
+    rolled_up: list[RolledUpRange] = field(default_factory=list)
+    """Parts of the window stored at rollup resolution (ticker source only)."""
 
 
 class HistoricalDataProvider:
@@ -66,8 +81,30 @@ class HistoricalDataProvider:
         if self._use_trades:
             yield from self._iterate_trades()
         else:
+            for rolled in self.rolled_up_ranges():
+                logger.warning(
+                    "%s ticks %s to %s are rolled up to %ds buckets "
+                    "(first/low/high/last kept): intra-bucket timing is coarse",
+                    self._symbol, rolled.start_ts, rolled.end_ts, rolled.bucket_seconds,
+                )
             yield from self._iterate_tickers()
 
+    def rolled_up_ranges(self) -> list[RolledUpRange]:
+        """Compacted ranges of this symbol's tickers that overlap the window.
+
+        Always empty for the trade source; ``recorder-compact`` only rolls up
+        ``ticker_snapshots``.
+        """
+        if self._use_trades:
+            return []
+        with self._db.get_session() as session:
+            return [
+                RolledUpRange(r.start_ts, r.end_ts, r.bucket_seconds)
+                for r in TickerRollupRepository(session).get_overlapping(
+                    self._symbol, self._start_ts, self._end_ts
+                )
+            ]
+
     def _iterate_tickers(self) -> Iterator[TickerEvent]:
         """Iterate over TickerSnapshot records.
 
@@ -215,12 +252,13 @@ class HistoricalDataProvider:
             actual_start = result[0] if result else None
             actual_end = result[1] if result else None
 
-            return DataRangeInfo(
-                symbol=self._symbol,
-                start_ts=actual_start,
-                end_ts=actual_end,
-                total_records=total_records,
-            )
+        return DataRangeInfo(
+            symbol=self._symbol,
+            start_ts=actual_start,
+            end_ts=actual_end,
+            total_records=total_records,
+            rolled_up=self.rolled_up_ranges(),
+        )
 
 
 class InMemoryDataProvider:
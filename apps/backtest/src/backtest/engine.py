@@ -7,6 +7,7 @@ import logging
 import uuid
 from datetime import datetime, timedelta
 from decimal import Decimal
+from time import perf_counter_ns
 from typing import Optional
 
 from grid_db import DatabaseFactory
@@ -14,7 +15,7 @@ from gridcore import DirectionType, SideType, create_qty_calculator
 
 from backtest.config import BacktestConfig, BacktestStrategyConfig, WindDownMode
 from backtest.data_provider import HistoricalDataProvider, InMemoryDataProvider
-from backtest.fill_simulator import TradeThroughFillSimulator
+from backtest.fill_simulator import FillMode, TradeThroughFillSimulator
 from backtest.instrument_info import (
     InstrumentInfo,
     InstrumentInfoProvider,
@@ -23,6 +24,7 @@ from backtest.instrument_info import (
 from backtest.order_manager import BacktestOrderManager
 from backtest.executor import BacktestExecutor
 from backtest.position_tracker import BacktestPositionTracker
+from backtest.profiling import PhaseProfiler
 from backtest.risk_limit_info import RiskLimitProvider
 from backtest.runner import BacktestRunner
 from backtest.session import BacktestSession, BacktestTrade
@@ -110,19 +112,34 @@ class BacktestEngine:
         self,
         config: BacktestConfig,
         db: Optional[DatabaseFactory] = None,
+        fill_mode: FillMode = FillMode.STRICT_CROSS,
+        profiler: Optional[PhaseProfiler] = None,
+        instrument_provider: Optional[InstrumentInfoProvider] = None,
+        risk_limit_provider: Optional[RiskLimitProvider] = None,
     ):
         """Initialize backtest engine.
 
         Args:
             config: Backtest configuration.
             db: Database factory (optional for in-memory backtests).
+            fill_mode: Fill simulator mode for every runner of this engine.
+            profiler: Phase profiler for ``--profile`` runs. None (default)
+                leaves the tick loop untimed.
+            instrument_provider: Instrument info lookups. None (default)
+                creates one with ``config.instrument_cache_ttl_hours``.
+            risk_limit_provider: Risk limit tier lookups. None (default)
+                creates one.
         """
         self._config = config
         self._db = db
-        self._instrument_provider = InstrumentInfoProvider(
-            cache_ttl=timedelta(hours=config.instrument_cache_ttl_hours),
-        )
-        self._risk_limit_provider = RiskLimitProvider()
+        self._fill_mode = fill_mode
+        self._profiler = profiler
+        if instrument_provider is None:
+            instrument_provider = InstrumentInfoProvider(
+                cache_ttl=timedelta(hours=config.instrument_cache_ttl_hours),
+            )
+        self._instrument_provider = instrument_provider
+        self._risk_limit_provider = risk_limit_provider or RiskLimitProvider()
 
         # Session and runners (created per run)
         self._session: Optional[BacktestSession] = None
@@ -153,6 +170,36 @@ class BacktestEngine:
         Returns:
             BacktestSession with results.
         """
+        if not self._start_run(symbol):
+            return self._session
+
+        provider = self._create_data_provider(symbol, start_ts, end_ts, data_provider)
+        profiler = self._profiler
+        if profiler is not None:
+            provider = profiler.timed_iter(provider, "data")
+
+        # Main backtest loop
+        tick_count = 0
+        for tick in provider:
+            self._process_tick(tick)
+            tick_count += 1
+            if profiler is not None:
+                profiler.ticks += 1
+
+            if tick_count % 10000 == 0:
+                logger.info(f"Processed {tick_count} ticks...")
+
+        logger.info(f"Backtest complete: {tick_count} ticks processed")
+
+        return self._finish_run()
+
+    def _start_run(self, symbol: str) -> bool:
+        """Reset per-run state, create the session and a runner per strategy.
+
+        Returns:
+            False if no strategies are configured for ``symbol`` (the empty
+            session is left in ``self._session``).
+        """
         # Reset state for clean run
         self._runners = {}
         self._last_prices = {}
@@ -169,13 +216,21 @@ class BacktestEngine:
         strategies = self._config.get_strategies_for_symbol(symbol)
         if not strategies:
             logger.warning(f"No strategies configured for symbol {symbol}")
-            return self._session
+            return False
 
         # Create runners for each strategy
         for strategy_config in strategies:
             self._init_runner(strategy_config)
+        return True
 
-        # Create data provider
+    def _create_data_provider(
+        self,
+        symbol: str,
+        start_ts: datetime,
+        end_ts: datetime,
+        data_provider: Optional[InMemoryDataProvider] = None,
+    ):
+        """Return ``data_provider`` or a DB-backed provider, logging its range."""
         if data_provider is not None:
             provider = data_provider
         elif self._db is not None:
@@ -194,17 +249,13 @@ class BacktestEngine:
             f"Backtest data range: {range_info.start_ts} to {range_info.end_ts} "
             f"({range_info.total_records} records)"
         )
+        return provider
 
-        # Main backtest loop
-        tick_count = 0
-        for tick in provider:
-            self._process_tick(tick)
-            tick_count += 1
-
-            if tick_count % 10000 == 0:
-                logger.info(f"Processed {tick_count} ticks...")
-
-        logger.info(f"Backtest complete: {tick_count} ticks processed")
+    def _finish_run(self) -> BacktestSession:
+        """Wind down and finalize the session after the last tick."""
+        profiler = self._profiler
+        if profiler is not None:
+            t = perf_counter_ns()
 
         # Wind down at end
         self._wind_down()
@@ -213,6 +264,8 @@ class BacktestEngine:
         final_unrealized = self._calculate_total_unrealized()
         self._session.finalize(final_unrealized)
 
+        if profiler is not None:
+            profiler.lap("finalize", t)
         return self._session
 
     def run_multiple_symbols(
@@ -267,7 +320,7 @@ class BacktestEngine:
         )
 
         # Create fill simulator and order manager
-        fill_simulator = TradeThroughFillSimulator()
+        fill_simulator = TradeThroughFillSimulator(mode=self._fill_mode)
         order_manager = BacktestOrderManager(
             fill_simulator=fill_simulator,
             commission_rate=strategy_config.commission_rate,
@@ -312,6 +365,7 @@ class BacktestEngine:
             short_tracker=short_tracker,
             instrument_info=instrument_info,
         )
+        runner.profiler = self._profiler
 
         self._runners[strategy_config.strat_id] = runner
         logger.info(f"Initialized runner for strategy {strategy_config.strat_id}")
@@ -332,7 +386,7 @@ class BacktestEngine:
         """
         return create_qty_calculator(config.amount, instrument_info)
 
-    def _process_tick(self, tick) -> None:
+    def _process_tick(self, tick, funding_due: Optional[bool] = None) -> None:
         """Process tick for all runners with proper equity timing.
 
         Order of operations:
@@ -340,31 +394,52 @@ class BacktestEngine:
         2. Process fills for all runners (updates realized PnL)
         3. Update equity (reflects fills, calculates fresh unrealized)
         4. Execute tick intents for all runners (uses updated balance)
+
+        Args:
+            tick: Ticker event.
+            funding_due: Funding decision made by the caller (multi-variant
+                runs schedule funding once for all variants). None lets this
+                engine's own FundingSimulator decide.
         """
+        profiler = self._profiler
+        if profiler is not None:
+            t = perf_counter_ns()
+
         # Track last price and timestamp for wind-down
         self._last_prices[tick.symbol] = tick.last_price
         self._last_timestamp = tick.exchange_ts
 
         # 1. Process funding first (if applicable)
-        if self._funding_simulator and self._funding_simulator.should_apply_funding(tick.exchange_ts):
+        if funding_due is None:
+            if self._funding_simulator and self._funding_simulator.should_apply_funding(tick.exchange_ts):
+                self._apply_funding(tick)
+                self._funding_simulator.mark_funding_applied(tick.exchange_ts)
+        elif funding_due and self._funding_simulator:
             self._apply_funding(tick)
-            self._funding_simulator.mark_funding_applied(tick.exchange_ts)
+        if profiler is not None:
+            t = profiler.lap("funding", t)
 
         # 2. Phase 1: Process fills for all runners (updates realized PnL in session)
         for runner in self._runners.values():
             if runner.symbol == tick.symbol:
                 runner.process_fills(tick)
+        if profiler is not None:
+            t = profiler.lap("fills", t)
 
         # 3. Update equity AFTER fills (reflects realized PnL from fills)
         # Aggregates unrealized PnL and margin from ALL runners for multi-strategy support
         total_unrealized = self._calculate_unrealized_at_price(tick.symbol, tick.last_price)
         total_im, total_mm = self._calculate_total_margin(tick.symbol)
         self._session.update_equity(tick.exchange_ts, total_unrealized, total_im, total_mm)
+        if profiler is not None:
+            t = profiler.lap("equity", t)
 
         # 4. Phase 2: Execute tick intents for all runners (uses updated balance)
         for runner in self._runners.values():
             if runner.symbol == tick.symbol:
                 runner.execute_tick(tick)
+        if profiler is not None:
+            profiler.lap("execute_tick", t)
 
     def _apply_funding(self, tick) -> None:
         """Apply funding payment to all runners."""
@@ -1,6 +1,6 @@
 """Backtest executor for intent execution.
 
-Executes PlaceLimitIntent and CancelIntent against simulated order book.
+Executes PlaceLimitIntent, CancelIntent and AmendIntent against simulated order book.
 """
 
 from dataclasses import dataclass
@@ -8,7 +8,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Callable, Optional
 
-from gridcore import PlaceLimitIntent, CancelIntent
+from gridcore import AmendIntent, PlaceLimitIntent, CancelIntent
 
 from backtest.order_manager import BacktestOrderManager
 
@@ -118,9 +118,50 @@ class BacktestExecutor:
 
         return CancelResult(success=True)
 
+    def execute_amend(
+        self,
+        intent: AmendIntent,
+        timestamp: datetime,
+        wallet_balance: Decimal = Decimal("0"),
+    ) -> OrderResult:
+        """Amend order in simulation (price/qty; the order_id is kept).
+
+        Args:
+            intent: AmendIntent (cancel+place pair collapsed by the runner)
+            timestamp: Current timestamp
+            wallet_balance: Current wallet balance for qty calculation
+
+        Returns:
+            OrderResult with success status and the amended order_id
+        """
+        place = intent.place
+        if self.qty_calculator is not None:
+            qty = self.qty_calculator(place, wallet_balance)
+        else:
+            qty = place.qty
+
+        if qty <= 0:
+            return OrderResult(success=False, error="qty <= 0")
+
+        order = self.order_manager.amend_order(
+            order_id=intent.order_id,
+            client_order_id=place.client_order_id,
+            price=place.price,
+            qty=qty,
+            grid_level=place.grid_level,
+            timestamp=timestamp,
+        )
+
+        if order is None:
+            return OrderResult(
+                success=False, error="order not found or duplicate client_order_id"
+            )
+
+        return OrderResult(success=True, order_id=order.order_id)
+
     def execute_batch(
         self,
-        intents: list[PlaceLimitIntent | CancelIntent],
+        intents: list[PlaceLimitIntent | CancelIntent | AmendIntent],
         timestamp: datetime,
         wallet_balance: Decimal = Decimal("0"),
     ) -> tuple[list[OrderResult], list[CancelResult]]:
@@ -132,7 +173,8 @@ class BacktestExecutor:
             wallet_balance: Current wallet balance for qty calculation
 
         Returns:
-            Tuple of (place_results, cancel_results)
+            Tuple of (place_results, cancel_results); amend results are
+            reported with the place results
         """
         place_results: list[OrderResult] = []
         cancel_results: list[CancelResult] = []
@@ -144,5 +186,8 @@ class BacktestExecutor:
             elif isinstance(intent, CancelIntent):
                 result = self.execute_cancel(intent, timestamp)
                 cancel_results.append(result)
+            elif isinstance(intent, AmendIntent):
+                result = self.execute_amend(intent, timestamp, wallet_balance)
+                place_results.append(result)
 
         return place_results, cancel_results
@@ -4,6 +4,8 @@ Usage:
     uv run python -m backtest.main --config conf/backtest.yaml
     uv run python -m backtest.main --config conf/backtest.yaml --start 2025-01-01 --end 2025-01-31
     uv run python -m backtest.main --config conf/backtest.yaml --export results.csv
+    uv run python -m backtest.main --config conf/backtest.yaml --fill-modes strict_cross,book_touch
+    uv run python -m backtest.main --config conf/backtest.yaml --profile profile.json --profiler sample
 """
 
 import argparse
@@ -11,11 +13,20 @@ import logging
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from grid_db import DatabaseFactory, DatabaseSettings
 
-from backtest.config import load_config
+from backtest.config import BacktestConfig, load_config
 from backtest.engine import BacktestEngine
+from backtest.fill_simulator import FillMode
+from backtest.multi_variant import MultiVariantBacktestEngine, variants_for_fill_modes
+from backtest.profiling import (
+    PhaseProfiler,
+    add_profile_arguments,
+    check_profile_arguments,
+    profile_run,
+)
 
 
 def setup_logging(debug: bool = False) -> None:
@@ -69,6 +80,15 @@ def parse_args() -> argparse.Namespace:
         help="Export results to CSV file",
     )
 
+    parser.add_argument(
+        "--fill-modes",
+        type=parse_fill_modes,
+        default=None,
+        help="Comma-separated fill modes run side by side in one pass over the "
+        "data (e.g. strict_cross,book_touch,trade_through_at_limit,last_cross); "
+        "overrides config variants",
+    )
+
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -81,7 +101,11 @@ def parse_args() -> argparse.Namespace:
         help="Exit on first symbol failure in multi-symbol runs",
     )
 
-    return parser.parse_args()
+    add_profile_arguments(parser)
+
+    args = parser.parse_args()
+    check_profile_arguments(parser, args)
+    return args
 
 
 def parse_datetime(s: str) -> datetime:
@@ -102,6 +126,32 @@ def parse_datetime(s: str) -> datetime:
     raise ValueError(f"Unable to parse datetime: {s}")
 
 
+def parse_fill_modes(s: str) -> list[FillMode]:
+    """Parse a comma-separated list of fill modes."""
+    # event_follower needs recorded executions: replay only.
+    valid = [m.value for m in FillMode if m != FillMode.EVENT_FOLLOWER]
+    modes = []
+    for part in s.split(","):
+        part = part.strip()
+        if part not in valid:
+            raise argparse.ArgumentTypeError(
+                f"invalid fill mode {part!r} (choose from {', '.join(valid)})"
+            )
+        modes.append(FillMode(part))
+    return modes
+
+
+def export_path_for(export: str, symbol: str, multi_symbol: bool, variant: str = "") -> str:
+    """Export filename with symbol / variant suffixes for multi-run exports."""
+    base = Path(export)
+    stem = base.stem
+    if multi_symbol:
+        stem = f"{stem}_{symbol}"
+    if variant:
+        stem = f"{stem}_{variant}"
+    return str(base.with_stem(stem))
+
+
 def export_results(session, filepath: str) -> None:
     """Export backtest results to CSV."""
     import csv
@@ -133,6 +183,93 @@ def export_results(session, filepath: str) -> None:
     print(f"Exported {len(session.trades)} trades to {filepath}")
 
 
+def run_backtests(
+    args: argparse.Namespace,
+    config: BacktestConfig,
+    db: DatabaseFactory,
+    profiler: Optional[PhaseProfiler] = None,
+) -> int:
+    """Run the configured backtest(s) and print/export each session.
+
+    Returns:
+        Process exit code (0 ok, 2 if any symbol failed).
+    """
+    logger = logging.getLogger(__name__)
+
+    # Create backtest engine (single-pass multi-variant when variants are set)
+    variants = config.variants
+    if args.fill_modes:
+        variants = variants_for_fill_modes(args.fill_modes)
+    if variants:
+        engine = MultiVariantBacktestEngine(
+            config=config, variants=variants, db=db, profiler=profiler
+        )
+        logger.info(f"Variants: {[v.name for v in variants]}")
+    else:
+        engine = BacktestEngine(config=config, db=db, profiler=profiler)
+
+    # Determine symbol(s) to backtest
+    if args.symbol:
+        symbols = [args.symbol]
+    else:
+        symbols = list(set(s.symbol for s in config.strategies))
+
+    # Determine date range
+    if args.start:
+        start_ts = parse_datetime(args.start)
+    else:
+        # Default: 30 days ago
+        start_ts = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        start_ts = start_ts.replace(day=1)  # First of month
+
+    if args.end:
+        end_ts = parse_datetime(args.end)
+    else:
+        # Default: now
+        end_ts = datetime.now()
+
+    logger.info(f"Backtest period: {start_ts} to {end_ts}")
+    logger.info(f"Symbols: {symbols}")
+
+    # Run backtest
+    failed_symbols: list[str] = []
+    for symbol in symbols:
+        logger.info(f"\n{'='*50}")
+        logger.info(f"Running backtest for {symbol}")
+        logger.info(f"{'='*50}")
+
+        try:
+            if variants:
+                sessions = engine.run(symbol, start_ts, end_ts)
+            else:
+                sessions = {"": engine.run(symbol, start_ts, end_ts)}
+        except Exception as e:
+            logger.exception(f"Backtest failed for {symbol}: {e}")
+            if args.strict:
+                return 2
+            failed_symbols.append(symbol)
+            continue
+
+        for variant_name, session in sessions.items():
+            # Print summary
+            if variant_name:
+                print(f"--- Variant: {variant_name} ---")
+            print(session.get_summary())
+
+            # Export if requested (symbol/variant suffixes for multi-run exports)
+            if args.export:
+                export_path = export_path_for(
+                    args.export, symbol, len(symbols) > 1, variant_name
+                )
+                export_results(session, export_path)
+
+    if failed_symbols:
+        logger.error(f"Failed symbols: {', '.join(failed_symbols)}")
+        return 2
+
+    return 0
+
+
 def main() -> int:
     """Main entry point."""
     args = parse_args()
@@ -149,65 +286,14 @@ def main() -> int:
         settings = DatabaseSettings(database_url=config.database_url)
         db = DatabaseFactory(settings)
 
-        # Create backtest engine
-        engine = BacktestEngine(config=config, db=db)
-
-        # Determine symbol(s) to backtest
-        if args.symbol:
-            symbols = [args.symbol]
-        else:
-            symbols = list(set(s.symbol for s in config.strategies))
-
-        # Determine date range
-        if args.start:
-            start_ts = parse_datetime(args.start)
-        else:
-            # Default: 30 days ago
-            start_ts = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            start_ts = start_ts.replace(day=1)  # First of month
-
-        if args.end:
-            end_ts = parse_datetime(args.end)
-        else:
-            # Default: now
-            end_ts = datetime.now()
-
-        logger.info(f"Backtest period: {start_ts} to {end_ts}")
-        logger.info(f"Symbols: {symbols}")
-
-        # Run backtest
-        failed_symbols: list[str] = []
-        for symbol in symbols:
-            logger.info(f"\n{'='*50}")
-            logger.info(f"Running backtest for {symbol}")
-            logger.info(f"{'='*50}")
-
-            try:
-                session = engine.run(symbol, start_ts, end_ts)
-            except Exception as e:
-                logger.exception(f"Backtest failed for {symbol}: {e}")
-                if args.strict:
-                    return 2
-                failed_symbols.append(symbol)
-                continue
-
-            # Print summary
-            print(session.get_summary())
-
-            # Export if requested
-            if args.export:
-                export_path = args.export
-                if len(symbols) > 1:
-                    # Add symbol to filename for multi-symbol runs
-                    base = Path(args.export)
-                    export_path = str(base.with_stem(f"{base.stem}_{symbol}"))
-                export_results(session, export_path)
-
-        if failed_symbols:
-            logger.error(f"Failed symbols: {', '.join(failed_symbols)}")
-            return 2
-
-        return 0
+        with profile_run(
+            args.profile,
+            sampler=args.profiler,
+            command="backtest",
+            meta={"config": args.config, "symbol": args.symbol,
+                  "start": args.start, "end": args.end},
+        ) as profiler:
+            return run_backtests(args, config, db, profiler)
 
     except FileNotFoundError as e:
         logger.error(f"Config error: {e}")
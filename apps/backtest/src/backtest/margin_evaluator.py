@@ -0,0 +1,215 @@
+"""Incremental margin evaluation for the per-tick backtest/replay path.
+
+Between fills a runner's position sizes and entry prices are fixed, yet the
+hedge-aware pair IM/MM (``BacktestRunner._estimate_pair_im_mm``) is re-derived
+from scratch on every tick it is asked for, including two risk-tier lookups.
+This module splits that work:
+
+- size/entry-dependent terms (fees-to-close, hedged/unhedged sizes, entry
+  spread) are computed once per distinct position state and reused;
+- mark-dependent terms are evaluated per call with the SAME Decimal
+  expressions, in the same operand order, so results are bit-identical to
+  the from-scratch path;
+- the tier for a position value is re-bisected only when the value leaves
+  the cached tier's ``(lower_max, max]`` bracket.
+"""
+
+import bisect
+from decimal import Decimal
+from typing import Optional
+
+from gridcore.pnl import MMTiers, calc_maintenance_margin
+
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+_NEG_INF = Decimal("-Infinity")
+
+Tier = tuple[Decimal, Decimal, Decimal, Decimal]
+
+
+class TierBracketLookup:
+    """Tier lookup that reuses the previous tier while pv stays in its bracket.
+
+    Equivalent to ``gridcore.pnl._find_matching_tier`` (first tier whose
+    ``max_value >= pv``): tier ``i`` covers ``(max_{i-1}, max_i]``, so a pv
+    inside the cached bracket must map to the cached tier.
+    """
+
+    def __init__(self, tiers: MMTiers):
+        self.tiers = tiers
+        self._max_values = [tier[0] for tier in tiers]
+        self._lower: Decimal = _NEG_INF
+        self._upper: Optional[Decimal] = None
+        self._tier: Optional[Tier] = None
+        self.lookups = 0
+
+    def find(self, pv: Decimal) -> Optional[Tier]:
+        """Return the tier matching pv, or None when pv exceeds every cap."""
+        if self._tier is not None and self._lower < pv <= self._upper:
+            return self._tier
+        self.lookups += 1
+        idx = bisect.bisect_left(self._max_values, pv)
+        if idx >= len(self.tiers):
+            return None
+        self._tier = self.tiers[idx]
+        self._lower = self._max_values[idx - 1] if idx > 0 else _NEG_INF
+        self._upper = self._max_values[idx]
+        return self._tier
+
+
+class IncrementalMarginEvaluator:
+    """Caches position-state-dependent margin terms for one runner.
+
+    Inputs that can change between calls (tier table, leverage, fee rate,
+    hedge factor) are passed on every call and are part of the cache keys,
+    so the evaluator never serves values for a stale configuration.
+    """
+
+    def __init__(self) -> None:
+        self._lookups: dict[str, TierBracketLookup] = {}
+        self._terms_key: Optional[tuple] = None
+        self._terms: Optional[tuple] = None
+        self._combined_mm_key: Optional[tuple] = None
+        self._combined_mm: Decimal = _ZERO
+        # Counters for benchmarks / tests: how often state-dependent work ran.
+        self.term_recomputes = 0
+        self.combined_mm_recomputes = 0
+
+    def _lookup(self, slot: str, tiers: MMTiers) -> TierBracketLookup:
+        lookup = self._lookups.get(slot)
+        if lookup is None or lookup.tiers is not tiers:
+            lookup = TierBracketLookup(tiers)
+            self._lookups[slot] = lookup
+        return lookup
+
+    def tier_mmr_and_deduction(
+        self, slot: str, pv: Decimal, tiers: Optional[MMTiers],
+    ) -> tuple[Decimal, Decimal]:
+        """``(mmr_rate, deduction)`` for pv; ``(0, 0)`` when unmatched or no tiers.
+
+        ``slot`` names an independent bracket cache (e.g. ``"long"``), so the
+        two legs of a pair do not evict each other's bracket every tick.
+        """
+        if pv <= _ZERO or tiers is None:
+            return _ZERO, _ZERO
+        tier = self._lookup(slot, tiers).find(pv)
+        if tier is None:
+            return _ZERO, _ZERO
+        _max_val, mmr, deduction, _imr = tier
+        return mmr, deduction
+
+    def combined_maintenance_margin(
+        self, combined_pv: Decimal, symbol: str, tiers: MMTiers,
+    ) -> Decimal:
+        """``calc_maintenance_margin(combined_pv, ...)[0]``, memoized on its inputs.
+
+        The combined notional is entry-based, so it only changes on fills.
+        """
+        key = (combined_pv, symbol, tiers)
+        if key != self._combined_mm_key:
+            self.combined_mm_recomputes += 1
+            self._combined_mm, _ = calc_maintenance_margin(combined_pv, symbol, tiers=tiers)
+            self._combined_mm_key = key
+        return self._combined_mm
+
+    def _state_terms(
+        self,
+        L_size: Decimal,
+        L_entry: Decimal,
+        S_size: Decimal,
+        S_entry: Decimal,
+        leverage,
+        taker: Decimal,
+    ) -> tuple:
+        """Mark-independent terms of the pair IM/MM formula (see runner)."""
+        key = (L_size, L_entry, S_size, S_entry, leverage, taker)
+        if key == self._terms_key:
+            return self._terms
+
+        self.term_recomputes += 1
+        lev = Decimal(str(leverage))
+        inv_lev = _ONE / lev
+        # Fee-to-close — formulas per Bybit docs (use avg entry price).
+        L_fee = L_size * L_entry * (_ONE - inv_lev) * taker if L_size > _ZERO else _ZERO
+        S_fee = S_size * S_entry * (_ONE + inv_lev) * taker if S_size > _ZERO else _ZERO
+        unhedged_long = max(L_size - S_size, _ZERO)
+        unhedged_short = max(S_size - L_size, _ZERO)
+        hedged_size = min(L_size, S_size) if (L_size > _ZERO and S_size > _ZERO) else _ZERO
+        entry_diff = abs(L_entry - S_entry) if hedged_size > _ZERO else _ZERO
+
+        self._terms = (lev, L_fee, S_fee, unhedged_long, unhedged_short, hedged_size, entry_diff)
+        self._terms_key = key
+        return self._terms
+
+    def pair_im_mm(
+        self,
+        long_state,
+        short_state,
+        mark_price: Decimal,
+        *,
+        leverage,
+        taker_fee_rate: Decimal,
+        hedge_factor: Decimal,
+        tiers: Optional[MMTiers],
+    ) -> tuple[Decimal, Decimal, Decimal, Decimal]:
+        """Hedge-aware ``(im_long, mm_long, im_short, mm_short)``.
+
+        Formula and rationale: ``BacktestRunner._estimate_pair_im_mm``.
+        """
+        L_size = long_state.size
+        S_size = short_state.size
+        if L_size <= _ZERO and S_size <= _ZERO:
+            return _ZERO, _ZERO, _ZERO, _ZERO
+
+        (lev, L_fee, S_fee, unhedged_long, unhedged_short,
+         hedged_size, entry_diff) = self._state_terms(
+            L_size, long_state.avg_entry_price,
+            S_size, short_state.avg_entry_price,
+            leverage, taker_fee_rate,
+        )
+
+        # Tier looked up on each leg's own mark-PV (Bybit assigns
+        # ``riskLimitValue`` per-leg on the full leg notional). Each
+        # tier contributes a ``(mmr_rate, deduction)`` pair; Bybit's
+        # documented MM formula is ``pv × mmr − deduction``, kept
+        # continuous at tier boundaries by the deduction. We re-apply
+        # that exact shape against the unhedged portion of the
+        # dominant leg.
+        L_pv_mark = L_size * mark_price
+        S_pv_mark = S_size * mark_price
+        mmr_long, deduction_long = self.tier_mmr_and_deduction("long", L_pv_mark, tiers)
+        mmr_short, deduction_short = self.tier_mmr_and_deduction("short", S_pv_mark, tiers)
+
+        if L_size >= S_size:
+            # Long-dominant (or equal) regime: long is the heavier leg.
+            im_long = L_pv_mark / lev + L_fee if L_size > _ZERO else _ZERO
+            if L_size > _ZERO:
+                mm_long_base = max(
+                    unhedged_long * mark_price * mmr_long - deduction_long, _ZERO,
+                )
+                mm_long = mm_long_base + L_fee
+            else:
+                mm_long = _ZERO
+            if S_size > _ZERO:
+                # Smaller leg uses the dominant leg's tier MMR for the
+                # hedged-buffer term (Bybit applies a single MMR per
+                # paired position — the smaller leg sees the dominant
+                # tier, not its own).
+                buffer_short = mmr_long * hedged_size * entry_diff * hedge_factor
+                im_short = mm_short = S_fee + buffer_short
+            else:
+                im_short = mm_short = _ZERO
+            return im_long, mm_long, im_short, mm_short
+
+        # Short-dominant regime (symmetric).
+        im_short = S_pv_mark / lev + S_fee
+        mm_short_base = max(
+            unhedged_short * mark_price * mmr_short - deduction_short, _ZERO,
+        )
+        mm_short = mm_short_base + S_fee
+        if L_size > _ZERO:
+            buffer_long = mmr_short * hedged_size * entry_diff * hedge_factor
+            im_long = mm_long = L_fee + buffer_long
+        else:
+            im_long = mm_long = _ZERO
+        return im_long, mm_long, im_short, mm_short
@@ -0,0 +1,170 @@
+"""Single-pass multi-variant backtest.
+
+Validation work compares fill modes (and small strategy tweaks) on the same
+window. Running one ``BacktestEngine`` per variant re-reads and re-decodes
+every tick N times; ``MultiVariantBacktestEngine`` instead iterates the data
+provider once and feeds each decoded tick to N independent engine stacks
+(runners, order books, position trackers, session). Funding is scheduled once
+per tick and applied to every variant.
+
+Each variant's session is identical to a separate ``BacktestEngine.run`` with
+that variant's fill mode and strategy overrides: ticks are immutable and no
+state is shared between stacks.
+
+Example:
+    engine = MultiVariantBacktestEngine(
+        config,
+        variants=[
+            BacktestVariant(name="strict_cross", fill_mode=FillMode.STRICT_CROSS),
+            BacktestVariant(name="book_touch", fill_mode=FillMode.BOOK_TOUCH),
+        ],
+        db=db,
+    )
+    sessions = engine.run("BTCUSDT", start_ts, end_ts)
+    for name, session in sessions.items():
+        print(name, session.get_summary())
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from grid_db import DatabaseFactory
+
+from backtest.config import BacktestConfig, BacktestVariant
+from backtest.data_provider import InMemoryDataProvider
+from backtest.engine import BacktestEngine, FundingSimulator
+from backtest.fill_simulator import FillMode
+from backtest.instrument_info import InstrumentInfoProvider
+from backtest.profiling import PhaseProfiler
+from backtest.risk_limit_info import RiskLimitProvider
+from backtest.session import BacktestSession
+
+
+logger = logging.getLogger(__name__)
+
+
+def variants_for_fill_modes(fill_modes: list[FillMode]) -> list[BacktestVariant]:
+    """One variant per fill mode, named after the mode."""
+    return [BacktestVariant(name=mode.value, fill_mode=mode) for mode in fill_modes]
+
+
+class MultiVariantBacktestEngine:
+    """Run N backtest variants over a single pass of the tick data.
+
+    Args:
+        config: Base backtest configuration (shared data/funding settings).
+        variants: Variants to run; names must be unique. Defaults to
+            ``config.variants``.
+        db: Database factory (optional for in-memory backtests).
+        profiler: Phase profiler for ``--profile`` runs, shared by every
+            variant engine (phase totals are summed across variants).
+    """
+
+    def __init__(
+        self,
+        config: BacktestConfig,
+        variants: Optional[list[BacktestVariant]] = None,
+        db: Optional[DatabaseFactory] = None,
+        profiler: Optional[PhaseProfiler] = None,
+    ):
+        if variants is None:
+            variants = config.variants
+        if not variants:
+            raise ValueError("At least one variant is required")
+        names = [variant.name for variant in variants]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Variant names must be unique, got {names}")
+
+        self._config = config
+        self._db = db
+        self._variants = list(variants)
+        self._profiler = profiler
+        # Instrument/risk-limit lookups are per symbol, not per variant:
+        # share one provider (and its cache) across stacks.
+        instrument_provider = InstrumentInfoProvider(
+            cache_ttl=timedelta(hours=config.instrument_cache_ttl_hours),
+        )
+        risk_limit_provider = RiskLimitProvider()
+        self._engines: dict[str, BacktestEngine] = {
+            variant.name: BacktestEngine(
+                config.for_variant(variant),
+                db=db,
+                fill_mode=variant.fill_mode,
+                profiler=profiler,
+                instrument_provider=instrument_provider,
+                risk_limit_provider=risk_limit_provider,
+            )
+            for variant in self._variants
+        }
+
+        self._funding_simulator: Optional[FundingSimulator] = None
+        if config.enable_funding:
+            self._funding_simulator = FundingSimulator(rate=config.funding_rate)
+
+    def run(
+        self,
+        symbol: str,
+        start_ts: datetime,
+        end_ts: datetime,
+        data_provider: Optional[InMemoryDataProvider] = None,
+    ) -> dict[str, BacktestSession]:
+        """Run every variant for a symbol over one pass of the data.
+
+        Args:
+            symbol: Trading symbol.
+            start_ts: Start timestamp.
+            end_ts: End timestamp.
+            data_provider: Optional in-memory data provider (for testing).
+
+        Returns:
+            Dict mapping variant name to its session (in variant order).
+        """
+        if self._funding_simulator:
+            self._funding_simulator.reset()
+
+        active = [
+            engine for engine in self._engines.values() if engine._start_run(symbol)
+        ]
+        if not active:
+            return {name: engine.session for name, engine in self._engines.items()}
+
+        provider = active[0]._create_data_provider(symbol, start_ts, end_ts, data_provider)
+        profiler = self._profiler
+        if profiler is not None:
+            provider = profiler.timed_iter(provider, "data")
+
+        tick_count = 0
+        for tick in provider:
+            funding_due = False
+            if self._funding_simulator and self._funding_simulator.should_apply_funding(tick.exchange_ts):
+                funding_due = True
+                self._funding_simulator.mark_funding_applied(tick.exchange_ts)
+
+            for engine in active:
+                engine._process_tick(tick, funding_due=funding_due)
+            tick_count += 1
+            if profiler is not None:
+                profiler.ticks += 1
+
+            if tick_count % 10000 == 0:
+                logger.info(f"Processed {tick_count} ticks x {len(active)} variants...")
+
+        logger.info(
+            f"Multi-variant backtest complete: {tick_count} ticks processed "
+            f"for {len(active)} variants"
+        )
+
+        for engine in active:
+            engine._finish_run()
+        return {name: engine.session for name, engine in self._engines.items()}
+
+    @property
+    def variants(self) -> list[BacktestVariant]:
+        """Configured variants, in run order."""
+        return list(self._variants)
+
+    @property
+    def engines(self) -> dict[str, BacktestEngine]:
+        """Per-variant engines (runners and session of the last run)."""
+        return self._engines
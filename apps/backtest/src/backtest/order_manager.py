@@ -205,6 +205,46 @@ class BacktestOrderManager:
         self._client_order_ids.discard(order.client_order_id)
         return True
 
+    def amend_order(
+        self,
+        order_id: str,
+        client_order_id: str,
+        price: Decimal,
+        qty: Decimal,
+        grid_level: int,
+        timestamp: datetime,
+    ) -> Optional[SimulatedOrder]:
+        """Move an active order to a new price/qty, keeping its order_id.
+
+        The order takes over ``client_order_id`` (the replacement's identity)
+        and frees its previous one, like a cancel + place of the same order.
+
+        Args:
+            order_id: Order ID to amend
+            client_order_id: Client order ID of the replacement
+            price: New limit price
+            qty: New order quantity
+            grid_level: Grid level index of the replacement
+            timestamp: Amend time
+
+        Returns:
+            Amended order, or None if not found or the replacement's
+            client_order_id belongs to another active order
+        """
+        order = self.active_orders.get(order_id)
+        if order is None:
+            return None
+        if client_order_id != order.client_order_id and client_order_id in self._client_order_ids:
+            return None
+
+        self._client_order_ids.discard(order.client_order_id)
+        self._client_order_ids.add(client_order_id)
+        order.client_order_id = client_order_id
+        order.price = price
+        order.qty = qty
+        order.grid_level = grid_level
+        return order
+
     def cancel_by_client_order_id(self, client_order_id: str, timestamp: datetime) -> bool:
         """Cancel order by client order ID.
 
@@ -108,6 +108,10 @@ class BacktestPositionTracker:
         self.tiers = tiers
         self.symbol = symbol
         self.state = PositionState()
+        # Inputs of the last _update_margin computation. Margin is entry-based,
+        # so it only changes on fills; per-tick calls with the same inputs
+        # keep the already-computed fields instead of re-running tier lookups.
+        self._margin_inputs: Optional[tuple] = None
 
     def seed_state(self, seed) -> None:
         """Direct state write from a PositionStateSeed. Bypasses process_fill.
@@ -293,7 +297,17 @@ class BacktestPositionTracker:
         - calc_position_value(size, entry_price)
         - calc_initial_margin(position_value, leverage, symbol, tiers)
         - calc_maintenance_margin(position_value, symbol, tiers)
+
+        Skipped when the state object, size, entry, leverage, tiers and symbol
+        are unchanged since the last computation (the outputs are a pure
+        function of them).
         """
+        state = self.state
+        inputs = (id(state), state.size, state.avg_entry_price, self.leverage, self.tiers, self.symbol)
+        if inputs == self._margin_inputs:
+            return
+        self._margin_inputs = inputs
+
         position_value = calc_position_value(self.state.size, self.state.avg_entry_price)
         self.state.position_value = position_value
         im, imr = calc_initial_margin(position_value, self.leverage, self.symbol, tiers=self.tiers)
@@ -310,6 +324,7 @@ class BacktestPositionTracker:
 
     def _reset_margin(self) -> None:
         """Zero out margin fields when position is closed."""
+        self._margin_inputs = None
         self.state.position_value = Decimal("0")
         self.state.initial_margin = Decimal("0")
         self.state.imr_rate = Decimal("0")
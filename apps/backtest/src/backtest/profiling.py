@@ -0,0 +1,348 @@
+"""Phase profiling for backtest, replay and live_check runs (``--profile``).
+
+A ``PhaseProfiler`` accumulates ``perf_counter_ns`` deltas per named phase
+(data paging, fills, equity update, ``execute_tick`` ...). Engines hold an
+``Optional[PhaseProfiler]`` and only take a timestamp when it is set, so a
+run without ``--profile`` pays one ``is not None`` check per phase per tick.
+
+Dotted phase names are sub-phases of their prefix (``execute_tick.on_event``
+is part of ``execute_tick``); each phase's ``pct`` is relative to the whole
+profiled run, so sub-phases are not double-counted against siblings.
+
+``profile_run`` wraps a CLI run: it optionally runs the whole thing under
+``cProfile`` or a stdlib sampling profiler and writes one JSON report
+(phases + cProfile top functions or folded flame stacks) on exit.
+
+Example:
+    with profile_run("profile.json", sampler="sample", command="replay") as prof:
+        ReplayEngine(config, db, profiler=prof).run()
+"""
+
+import argparse
+import cProfile
+import json
+import logging
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SCHEMA_VERSION = 1
+SAMPLERS = ("cprofile", "sample")
+DEFAULT_SAMPLE_INTERVAL = 0.005  # seconds; the interpreter's default switch interval
+CPROFILE_TOP = 40
+
+T = TypeVar("T")
+
+
+@dataclass
+class PhaseStats:
+    """Accumulated timings of one phase."""
+
+    calls: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+
+
+class PhaseProfiler:
+    """Per-phase ``perf_counter_ns`` accumulators for one profiled run.
+
+    Hot loops use ``lap`` (take a timestamp once, then lap each phase in
+    order); one-off stages use the ``phase`` context manager.
+    """
+
+    def __init__(self) -> None:
+        self._phases: dict[str, PhaseStats] = {}
+        self._started_ns = perf_counter_ns()
+        self._stopped_ns: Optional[int] = None
+        self.ticks = 0
+
+    def add(self, phase: str, elapsed_ns: int) -> None:
+        """Record one call of ``phase`` that took ``elapsed_ns``."""
+        stats = self._phases.get(phase)
+        if stats is None:
+            stats = self._phases[phase] = PhaseStats()
+        stats.calls += 1
+        stats.total_ns += elapsed_ns
+        if elapsed_ns > stats.max_ns:
+            stats.max_ns = elapsed_ns
+
+    def lap(self, phase: str, start_ns: int) -> int:
+        """Record ``phase`` as ending now; returns now (the next phase's start)."""
+        now = perf_counter_ns()
+        self.add(phase, now - start_ns)
+        return now
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one call of ``name``."""
+        start = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, perf_counter_ns() - start)
+
+    def timed_iter(self, iterable: Iterable[T], phase: str) -> Iterator[T]:
+        """Yield from ``iterable``, timing each ``next()`` as ``phase``.
+
+        Used for data providers, where fetching the next tick may page the DB.
+        """
+        iterator = iter(iterable)
+        while True:
+            start = perf_counter_ns()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(phase, perf_counter_ns() - start)
+                return
+            self.add(phase, perf_counter_ns() - start)
+            yield item
+
+    def timed(self, fn: Callable[..., T], phase: str) -> Callable[..., T]:
+        """Wrap ``fn`` so every call is recorded as ``phase``."""
+
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            start = perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add(phase, perf_counter_ns() - start)
+
+        return wrapper
+
+    def stop(self) -> None:
+        """Freeze the wall-clock total used for percentages."""
+        if self._stopped_ns is None:
+            self._stopped_ns = perf_counter_ns()
+
+    @property
+    def phases(self) -> dict[str, PhaseStats]:
+        return self._phases
+
+    @property
+    def wall_ns(self) -> int:
+        end = self._stopped_ns if self._stopped_ns is not None else perf_counter_ns()
+        return end - self._started_ns
+
+    def report(self) -> dict:
+        """Phase table sorted by cumulative time (largest first)."""
+        wall_ns = self.wall_ns
+        phases = []
+        for name, stats in sorted(
+            self._phases.items(), key=lambda item: item[1].total_ns, reverse=True
+        ):
+            phases.append({
+                "name": name,
+                "calls": stats.calls,
+                "total_ms": stats.total_ns / 1e6,
+                "pct": 100.0 * stats.total_ns / wall_ns if wall_ns else 0.0,
+                "mean_us": stats.total_ns / stats.calls / 1e3,
+                "max_us": stats.max_ns / 1e3,
+                "per_tick_us": (
+                    stats.total_ns / self.ticks / 1e3 if self.ticks else None
+                ),
+            })
+        return {
+            "wall_ms": wall_ns / 1e6,
+            "ticks": self.ticks,
+            "phases": phases,
+        }
+
+
+def phase_scope(profiler: Optional[PhaseProfiler], name: str):
+    """``profiler.phase(name)``, or a no-op context when profiling is off."""
+    return profiler.phase(name) if profiler is not None else nullcontext()
+
+
+class SamplingProfiler:
+    """Stdlib sampling profiler producing folded (flame graph) stacks.
+
+    A daemon thread samples the target thread's current frame every
+    ``interval`` seconds and counts ``root;...;leaf`` stacks, the input
+    format of flamegraph.pl and speedscope.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_SAMPLE_INTERVAL,
+        thread_id: Optional[int] = None,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        self.interval = interval
+        self._thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self._stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is not None:
+                self._stacks[_fold(frame)] += 1
+
+    @property
+    def samples(self) -> int:
+        return sum(self._stacks.values())
+
+    @property
+    def stacks(self) -> dict[str, int]:
+        return dict(self._stacks.most_common())
+
+    def write_folded(self, path: Path) -> None:
+        """Write ``stack count`` lines (flamegraph.pl / speedscope input)."""
+        with open(path, "w") as f:
+            for stack, count in self._stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def _fold(frame) -> str:
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+def _cprofile_top(profile: cProfile.Profile, limit: int = CPROFILE_TOP) -> list[dict]:
+    stats = pstats.Stats(profile)
+    rows = []
+    for (filename, line, func), (_cc, ncalls, tottime, cumtime, _callers) in stats.stats.items():
+        rows.append({
+            "function": f"{os.path.basename(filename)}:{line}:{func}",
+            "calls": ncalls,
+            "tottime_ms": tottime * 1e3,
+            "cumtime_ms": cumtime * 1e3,
+        })
+    rows.sort(key=lambda row: row["cumtime_ms"], reverse=True)
+    return rows[:limit]
+
+
+def write_report(
+    path: Path,
+    profiler: PhaseProfiler,
+    command: str = "",
+    meta: Optional[dict] = None,
+    extra: Optional[dict] = None,
+) -> None:
+    """Write the phase report (plus sampler sections in ``extra``) as JSON."""
+    payload = {
+        "schema": PROFILE_SCHEMA_VERSION,
+        "command": command,
+        "meta": meta or {},
+        **profiler.report(),
+        **(extra or {}),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2, default=str)
+        f.write("\n")
+
+
+@contextmanager
+def profile_run(
+    path: Optional[str | Path],
+    sampler: Optional[str] = None,
+    command: str = "",
+    meta: Optional[dict] = None,
+    sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+) -> Iterator[Optional[PhaseProfiler]]:
+    """Profile the enclosed run and write a JSON report to ``path``.
+
+    Yields None (and does nothing) when ``path`` is None, so callers can pass
+    the yielded value straight to engines. With ``sampler="cprofile"`` the
+    raw stats are also dumped to ``<path>.prof``; with ``sampler="sample"``
+    the folded stacks go to ``<path>.folded``. The report is written even if
+    the run raises.
+    """
+    if path is None:
+        yield None
+        return
+    if sampler is not None and sampler not in SAMPLERS:
+        raise ValueError(f"Unknown sampler {sampler!r}, expected one of {SAMPLERS}")
+
+    path = Path(path)
+    profiler = PhaseProfiler()
+    cprof: Optional[cProfile.Profile] = None
+    sampling: Optional[SamplingProfiler] = None
+    if sampler == "cprofile":
+        cprof = cProfile.Profile()
+        cprof.enable()
+    elif sampler == "sample":
+        sampling = SamplingProfiler(interval=sample_interval)
+        sampling.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        extra: dict = {}
+        if cprof is not None:
+            cprof.disable()
+            stats_path = path.with_name(path.name + ".prof")
+            stats_path.parent.mkdir(parents=True, exist_ok=True)
+            cprof.dump_stats(stats_path)
+            extra["cprofile"] = {
+                "stats_file": str(stats_path),
+                "top": _cprofile_top(cprof),
+            }
+        if sampling is not None:
+            sampling.stop()
+            folded_path = path.with_name(path.name + ".folded")
+            folded_path.parent.mkdir(parents=True, exist_ok=True)
+            sampling.write_folded(folded_path)
+            extra["flame"] = {
+                "interval_ms": sampling.interval * 1e3,
+                "samples": sampling.samples,
+                "folded_file": str(folded_path),
+                "stacks": sampling.stacks,
+            }
+        write_report(path, profiler, command=command, meta=meta, extra=extra)
+        logger.info(f"Wrote profile report to {path}")
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add ``--profile`` / ``--profiler`` to a CLI parser."""
+    parser.add_argument(
+        "--profile",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Time each run phase (per tick and cumulative) and write a JSON "
+        "report to PATH",
+    )
+    parser.add_argument(
+        "--profiler",
+        choices=SAMPLERS,
+        default=None,
+        help="With --profile, also run under cProfile (stats in PATH.prof) or "
+        "a sampling profiler (flame stacks in PATH.folded)",
+    )
+
+
+def check_profile_arguments(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> None:
+    """Reject ``--profiler`` without ``--profile`` (nowhere to write it)."""
+    if args.profiler and not args.profile:
+        parser.error("--profiler requires --profile")
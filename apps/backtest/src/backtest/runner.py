@@ -12,6 +12,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
+from time import perf_counter_ns
 from typing import Callable, Optional
 
 from gridcore import (
@@ -21,6 +22,8 @@ from gridcore import (
     ExecutionEvent,
     PlaceLimitIntent,
     CancelIntent,
+    AmendIntent,
+    collapse_to_amends,
     DirectionType,
     SideType,
     Position,
@@ -32,20 +35,20 @@ from gridcore.instrument_info import InstrumentInfo
 from gridcore.pnl import (
     calc_position_value,
     calc_margin_ratio,
-    calc_maintenance_margin,
     calc_unrealised_pnl,
     MMTiers,
     MM_TIERS,
     MM_TIERS_DEFAULT,
-    _find_matching_tier,
 )
 from grid_db.models import PositionSnapshot
 
 from backtest.config import BacktestStrategyConfig
 from backtest.executor import BacktestExecutor
 from backtest.fill_simulator import EventFollower, RecordedExecution
+from backtest.margin_evaluator import IncrementalMarginEvaluator
 from backtest.order_manager import BacktestOrderManager
 from backtest.position_tracker import BacktestPositionTracker
+from backtest.profiling import PhaseProfiler
 from backtest.session import BacktestSession, BacktestTrade
 
 
@@ -198,6 +201,8 @@ class BacktestRunner:
         self._hedge_smaller_buffer_factor: Decimal = (
             strategy_config.hedge_smaller_buffer_factor
         )
+        # Caches the size/entry-dependent margin terms between fills.
+        self._margin_eval = IncrementalMarginEvaluator()
 
         if self._enable_risk:
             risk_config = RiskConfig(
@@ -255,6 +260,10 @@ class BacktestRunner:
             Callable[[PositionSnapshot], None]
         ] = None
 
+        # --profile: splits execute_tick into on_event / dispatch_intents
+        # sub-phases. Set post-construction by the engines; None ⇒ untimed.
+        self.profiler: Optional[PhaseProfiler] = None
+
         # 0072 event_follower: recorded-execution fill source. Stashed
         # post-construction by the replay engine (same pattern as
         # _position_writer) — NOT an __init__ kwarg. None ⇒ simulator
@@ -858,6 +867,10 @@ class BacktestRunner:
         Returns:
             List of intents generated from tick.
         """
+        profiler = self.profiler
+        if profiler is not None:
+            t = perf_counter_ns()
+
         intents: list[PlaceLimitIntent | CancelIntent] = []
 
         # Get intents from engine for current price
@@ -868,9 +881,13 @@ class BacktestRunner:
         # Mark grid as built after first tick
         if not self._grid_built and len(self._engine.grid.grid) > 0:
             self._grid_built = True
+        if profiler is not None:
+            t = profiler.lap("execute_tick.on_event", t)
 
         # Execute intents (wallet_balance now reflects fills from phase 1)
         self._dispatch_intents(intents, event.exchange_ts)
+        if profiler is not None:
+            profiler.lap("execute_tick.dispatch_intents", t)
 
         return intents
 
@@ -894,38 +911,99 @@ class BacktestRunner:
         partials are the complete live lifecycle for that placement. This is
         the only cancel hook (``order_manager.cancel_order`` owns no rollup
         state).
+
+        With ``amend_enabled`` (outside event_follower mode), same-side
+        cancel+place pairs run as one ``execute_amend`` (``_dispatch_amend``).
         """
+        if self._config.amend_enabled and self._event_follower is None:
+            intents = collapse_to_amends(intents, self._can_amend)
         for intent in intents:
             if isinstance(intent, PlaceLimitIntent):
-                # Gate close orders: skip if no position to close or position
-                # is already fully covered by pending close orders.
-                # Matches BBU2 _is_good_to_place() pattern.
-                if intent.reduce_only and not self._should_place_close(intent):
-                    continue
-                result = self._executor.execute_place(
-                    intent,
-                    timestamp=timestamp,
-                    wallet_balance=self._session.current_balance,
-                )
-                logger.debug(
-                    "%s: Place %s %s @ %s, direction=%s, reduce_only=%s, placed=%s",
-                    self.strat_id, intent.side, intent.qty, intent.price,
-                    intent.direction, intent.reduce_only, result.success,
-                )
+                self._dispatch_place(intent, timestamp)
             elif isinstance(intent, CancelIntent):
-                if self._event_follower is not None:
-                    rollup_key = self._rollup_by_replay_order_id.get(
-                        intent.order_id
-                    )
-                    if rollup_key is not None:
-                        self._maybe_flush_aggregated_trade(rollup_key, trigger=3)
-                self._executor.execute_cancel(intent, timestamp=timestamp)
-                logger.debug(
-                    "%s: Cancel order %s, reason=%s",
-                    self.strat_id, intent.order_id, intent.reason,
-                )
+                self._dispatch_cancel(intent, timestamp)
+            elif isinstance(intent, AmendIntent):
+                self._dispatch_amend(intent, timestamp)
+
+    def _dispatch_place(self, intent: PlaceLimitIntent, timestamp: datetime) -> None:
+        # Gate close orders: skip if no position to close or position
+        # is already fully covered by pending close orders.
+        # Matches BBU2 _is_good_to_place() pattern.
+        if intent.reduce_only and not self._should_place_close(intent):
+            return
+        result = self._executor.execute_place(
+            intent,
+            timestamp=timestamp,
+            wallet_balance=self._session.current_balance,
+        )
+        logger.debug(
+            "%s: Place %s %s @ %s, direction=%s, reduce_only=%s, placed=%s",
+            self.strat_id, intent.side, intent.qty, intent.price,
+            intent.direction, intent.reduce_only, result.success,
+        )
+
+    def _dispatch_cancel(self, intent: CancelIntent, timestamp: datetime) -> None:
+        if self._event_follower is not None:
+            rollup_key = self._rollup_by_replay_order_id.get(
+                intent.order_id
+            )
+            if rollup_key is not None:
+                self._maybe_flush_aggregated_trade(rollup_key, trigger=3)
+        self._executor.execute_cancel(intent, timestamp=timestamp)
+        logger.debug(
+            "%s: Cancel order %s, reason=%s",
+            self.strat_id, intent.order_id, intent.reason,
+        )
+
+    def _dispatch_amend(self, intent: AmendIntent, timestamp: datetime) -> None:
+        """Amend in place; mirrors gridbot's StrategyRunner._execute_amend_intent.
+
+        The close gate runs as if the cancel had gone through (the amended
+        order's qty is not pending). A replacement it rejects leaves just the
+        cancel; a failed amend falls back to cancel + place.
+        """
+        place = intent.place
+        if place.reduce_only and not self._should_place_close(
+            place, exclude_order_id=intent.order_id
+        ):
+            self._dispatch_cancel(intent.cancel, timestamp)
+            return
+        result = self._executor.execute_amend(
+            intent,
+            timestamp=timestamp,
+            wallet_balance=self._session.current_balance,
+        )
+        logger.debug(
+            "%s: Amend order %s to %s @ %s, reason=%s, amended=%s",
+            self.strat_id, intent.order_id, place.side, place.price,
+            intent.reason, result.success,
+        )
+        if not result.success:
+            self._dispatch_cancel(intent.cancel, timestamp)
+            self._dispatch_place(place, timestamp)
+
+    def _can_amend(self, cancel: CancelIntent, place: PlaceLimitIntent) -> bool:
+        """``collapse_to_amends`` predicate (same rules as the live runner)."""
+        if cancel.reason == "duplicate":
+            return False
+        order_manager = self._executor.order_manager
+        order = order_manager.active_orders.get(cancel.order_id)
+        if order is None:
+            return False
+        if any(
+            o.client_order_id == place.client_order_id
+            for o in order_manager.active_orders.values()
+        ):
+            return False
+        return (
+            order.side == place.side
+            and order.direction == place.direction
+            and order.reduce_only == place.reduce_only
+        )
 
-    def _should_place_close(self, intent: PlaceLimitIntent) -> bool:
+    def _should_place_close(
+        self, intent: PlaceLimitIntent, exclude_order_id: Optional[str] = None
+    ) -> bool:
         """Check whether a reduce_only (close) order should be placed.
 
         Returns False when:
@@ -935,6 +1013,8 @@ class BacktestRunner:
 
         Resolves intent qty via the executor's qty_calculator before
         checking, matching live runner _is_good_to_place() pattern.
+        ``exclude_order_id`` leaves an order (one being amended) out of the
+        pending close qty.
         """
         tracker = (
             self._long_tracker
@@ -945,7 +1025,7 @@ class BacktestRunner:
         if pos_size == 0:
             return False
 
-        pending_qty = self._get_pending_close_qty(intent.direction)
+        pending_qty = self._get_pending_close_qty(intent.direction, exclude_order_id)
         if pending_qty > pos_size:
             close_orders = [
                 f"{o.order_id}: {o.qty}"
@@ -961,7 +1041,9 @@ class BacktestRunner:
         intent_qty = self._resolve_intent_qty(intent)
         return pos_size > (pending_qty + intent_qty)
 
-    def _get_pending_close_qty(self, direction: str) -> Decimal:
+    def _get_pending_close_qty(
+        self, direction: str, exclude_order_id: Optional[str] = None
+    ) -> Decimal:
         """Sum qty of active reduce_only orders for a direction.
 
         O(n) scan over active_orders — acceptable because order count is
@@ -971,7 +1053,8 @@ class BacktestRunner:
             return Decimal("0")
         total = Decimal("0")
         for order in self._executor.order_manager.active_orders.values():
-            if order.direction == direction and order.reduce_only:
+            if (order.direction == direction and order.reduce_only
+                    and order.order_id != exclude_order_id):
                 total += order.qty
         return total
 
@@ -1312,74 +1395,19 @@ class BacktestRunner:
             ``(im_long, mm_long, im_short, mm_short)`` as Decimals. Zero
             entries on legs with ``size == 0``.
         """
-        L_size = long_state.size
-        S_size = short_state.size
-        L_entry = long_state.avg_entry_price
-        S_entry = short_state.avg_entry_price
-
-        zero = Decimal("0")
-        if L_size <= zero and S_size <= zero:
-            return zero, zero, zero, zero
-
-        lev = Decimal(str(self._leverage))
-        inv_lev = Decimal("1") / lev
-        taker = self._taker_fee_rate
-        hedge_C = self._hedge_smaller_buffer_factor
-
-        # Fee-to-close — formulas per Bybit docs (use avg entry price).
-        L_fee = L_size * L_entry * (Decimal("1") - inv_lev) * taker if L_size > zero else zero
-        S_fee = S_size * S_entry * (Decimal("1") + inv_lev) * taker if S_size > zero else zero
-
-        # Tier looked up on each leg's own mark-PV (Bybit assigns
-        # ``riskLimitValue`` per-leg on the full leg notional). Each
-        # tier contributes a ``(mmr_rate, deduction)`` pair; Bybit's
-        # documented MM formula is ``pv × mmr − deduction``, kept
-        # continuous at tier boundaries by the deduction. We re-apply
-        # that exact shape against the unhedged portion of the
-        # dominant leg.
-        L_pv_mark = L_size * mark_price
-        S_pv_mark = S_size * mark_price
-        mmr_long, deduction_long = self._tier_mmr_and_deduction(L_pv_mark)
-        mmr_short, deduction_short = self._tier_mmr_and_deduction(S_pv_mark)
-
-        unhedged_long = max(L_size - S_size, zero)
-        unhedged_short = max(S_size - L_size, zero)
-        hedged_size = min(L_size, S_size) if (L_size > zero and S_size > zero) else zero
-        entry_diff = abs(L_entry - S_entry) if hedged_size > zero else zero
-
-        if L_size >= S_size:
-            # Long-dominant (or equal) regime: long is the heavier leg.
-            im_long = L_pv_mark / lev + L_fee if L_size > zero else zero
-            if L_size > zero:
-                mm_long_base = max(
-                    unhedged_long * mark_price * mmr_long - deduction_long, zero,
-                )
-                mm_long = mm_long_base + L_fee
-            else:
-                mm_long = zero
-            if S_size > zero:
-                # Smaller leg uses the dominant leg's tier MMR for the
-                # hedged-buffer term (Bybit applies a single MMR per
-                # paired position — the smaller leg sees the dominant
-                # tier, not its own).
-                buffer_short = mmr_long * hedged_size * entry_diff * hedge_C
-                im_short = mm_short = S_fee + buffer_short
-            else:
-                im_short = mm_short = zero
-            return im_long, mm_long, im_short, mm_short
-
-        # Short-dominant regime (symmetric).
-        im_short = S_pv_mark / lev + S_fee
-        mm_short_base = max(
-            unhedged_short * mark_price * mmr_short - deduction_short, zero,
+        # Implemented, with the per-step comments, in
+        # IncrementalMarginEvaluator.pair_im_mm (backtest.margin_evaluator):
+        # size/entry terms are cached per position state and the tier is
+        # re-bisected only on a bracket change.
+        return self._margin_eval.pair_im_mm(
+            long_state,
+            short_state,
+            mark_price,
+            leverage=self._leverage,
+            taker_fee_rate=self._taker_fee_rate,
+            hedge_factor=self._hedge_smaller_buffer_factor,
+            tiers=self._mm_tiers,
         )
-        mm_short = mm_short_base + S_fee
-        if L_size > zero:
-            buffer_long = mmr_short * hedged_size * entry_diff * hedge_C
-            im_long = mm_long = L_fee + buffer_long
-        else:
-            im_long = mm_long = zero
-        return im_long, mm_long, im_short, mm_short
 
     def _tier_mmr_and_deduction(self, pv: Decimal) -> tuple[Decimal, Decimal]:
         """Return ``(mmr_rate, deduction)`` for ``pv`` from the loaded tier table.
@@ -1390,14 +1418,7 @@ class BacktestRunner:
         using the leg's full-pv tier. Returns ``(0, 0)`` when no tier
         matches or when no tier table is loaded.
         """
-        zero = Decimal("0")
-        if pv <= zero or self._mm_tiers is None:
-            return zero, zero
-        tier = _find_matching_tier(pv, self._mm_tiers)
-        if tier is None:
-            return zero, zero
-        _max_val, mmr, deduction, _imr = tier
-        return mmr, deduction
+        return self._margin_eval.tier_mmr_and_deduction("default", pv, self._mm_tiers)
 
     def _estimate_pair_liq_prices(
         self,
@@ -1446,8 +1467,8 @@ class BacktestRunner:
         combined_pv = L_pv + S_pv
 
         if self._mm_tiers is not None and combined_pv > 0:
-            mm_total, _ = calc_maintenance_margin(
-                combined_pv, self.symbol, tiers=self._mm_tiers
+            mm_total = self._margin_eval.combined_maintenance_margin(
+                combined_pv, self.symbol, self._mm_tiers
             )
         else:
             mm_total = combined_pv * Decimal(str(self._mmr))
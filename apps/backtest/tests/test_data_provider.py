@@ -5,9 +5,9 @@ from decimal import Decimal
 
 
 from gridcore import EventType
-from grid_db import TickerSnapshot, PublicTrade
+from grid_db import TickerSnapshot, TickerRollup, PublicTrade
 
-from backtest.data_provider import HistoricalDataProvider
+from backtest.data_provider import HistoricalDataProvider, RolledUpRange
 
 
 # ---------------------------------------------------------------------------
@@ -597,3 +597,54 @@ class TestIterDispatch:
         # Should only get the 1 trade, not the ticker
         assert len(events) == 1
         assert events[0].exchange_ts == _BASE_TS + timedelta(seconds=1)
+
+
+# ---------------------------------------------------------------------------
+# TestRolledUpRanges
+# ---------------------------------------------------------------------------
+
+class TestRolledUpRanges:
+    """Compacted ticker ranges (feature 0103) surface through the provider."""
+
+    def _rollup(self, start, end, symbol="BTCUSDT"):
+        return TickerRollup(
+            symbol=symbol, start_ts=start, end_ts=end, bucket_seconds=60,
+            rows_before=100, rows_after=4,
+        )
+
+    def test_overlapping_ranges_reported(self, db, caplog):
+        _seed(db, [
+            _make_ticker(exchange_ts=_BASE_TS),
+            self._rollup(_BASE_TS - timedelta(hours=2), _BASE_TS - timedelta(hours=1)),
+            self._rollup(_BASE_TS - timedelta(hours=1), _BASE_TS + timedelta(minutes=1)),
+            self._rollup(_BASE_TS - timedelta(hours=1), _BASE_TS + timedelta(minutes=1), "ETHUSDT"),
+        ])
+        provider = HistoricalDataProvider(
+            db=db,
+            symbol="BTCUSDT",
+            start_ts=_BASE_TS - timedelta(minutes=30),
+            end_ts=_BASE_TS + timedelta(hours=1),
+        )
+
+        expected = [
+            RolledUpRange(_BASE_TS - timedelta(hours=1), _BASE_TS + timedelta(minutes=1), 60)
+        ]
+        assert provider.get_data_range_info().rolled_up == expected
+        with caplog.at_level("WARNING", logger="backtest.data_provider"):
+            assert len(list(provider)) == 1
+        assert "rolled up to 60s buckets" in caplog.text
+
+    def test_db_without_rollup_table(self, db):
+        """DBs that predate ticker_rollups read as never compacted."""
+        TickerRollup.__table__.drop(db.engine)
+        _seed(db, [_make_ticker(exchange_ts=_BASE_TS)])
+        provider = HistoricalDataProvider(
+            db=db,
+            symbol="BTCUSDT",
+            start_ts=_BASE_TS - timedelta(seconds=1),
+            end_ts=_BASE_TS + timedelta(seconds=1),
+        )
+
+        assert provider.get_data_range_info().rolled_up == []
+        assert len(list(provider)) == 1
+
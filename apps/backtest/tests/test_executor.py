@@ -4,7 +4,7 @@ from decimal import Decimal
 
 import pytest
 
-from gridcore import PlaceLimitIntent, CancelIntent
+from gridcore import AmendIntent, PlaceLimitIntent, CancelIntent
 
 from backtest.executor import BacktestExecutor
 
@@ -137,6 +137,42 @@ class TestBacktestExecutor:
         assert result.success is False
         assert "not found" in result.error
 
+    def test_execute_amend(self, executor, sample_timestamp):
+        """Amend keeps the order_id and moves the order to the new price."""
+        place_intent = PlaceLimitIntent.create(
+            symbol="BTCUSDT",
+            side="Buy",
+            price=Decimal("99000"),
+            qty=Decimal("0.1"),
+            grid_level=1,
+            direction="long",
+        )
+        placed = executor.execute_place(place_intent, sample_timestamp)
+        replacement = PlaceLimitIntent.create(
+            symbol="BTCUSDT",
+            side="Buy",
+            price=Decimal("98000"),
+            qty=Decimal("0.1"),
+            grid_level=2,
+            direction="long",
+        )
+        intent = AmendIntent(
+            cancel=CancelIntent(symbol="BTCUSDT", order_id=placed.order_id, reason="test"),
+            place=replacement,
+        )
+
+        result = executor.execute_amend(intent, sample_timestamp)
+
+        assert result.success is True
+        assert result.order_id == placed.order_id
+        order = executor.order_manager.get_order_by_id(placed.order_id)
+        assert order.price == Decimal("98000")
+        assert order.client_order_id == replacement.client_order_id
+
+        # Once the order is gone the amend fails (caller falls back).
+        executor.execute_cancel(intent.cancel, sample_timestamp)
+        assert executor.execute_amend(intent, sample_timestamp).success is False
+
     def test_execute_batch_mixed_intents(self, executor, sample_timestamp):
         """Execute batch of mixed place and cancel intents."""
         # Create place intents
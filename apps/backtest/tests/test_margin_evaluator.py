@@ -0,0 +1,197 @@
+"""Tests for the incremental margin evaluator (parity with the from-scratch path)."""
+
+import random
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from gridcore.pnl import MM_TIERS_BTCUSDT, _find_matching_tier, calc_maintenance_margin
+
+from backtest.margin_evaluator import IncrementalMarginEvaluator, TierBracketLookup
+from backtest.position_tracker import BacktestPositionTracker
+
+
+def _reference_pair_im_mm(long_state, short_state, mark_price, leverage, taker, hedge_C, tiers):
+    """The pre-evaluator BacktestRunner._estimate_pair_im_mm body, verbatim."""
+    def tier_mmr_and_deduction(pv):
+        zero = Decimal("0")
+        if pv <= zero or tiers is None:
+            return zero, zero
+        tier = _find_matching_tier(pv, tiers)
+        if tier is None:
+            return zero, zero
+        _max_val, mmr, deduction, _imr = tier
+        return mmr, deduction
+
+    L_size = long_state.size
+    S_size = short_state.size
+    L_entry = long_state.avg_entry_price
+    S_entry = short_state.avg_entry_price
+
+    zero = Decimal("0")
+    if L_size <= zero and S_size <= zero:
+        return zero, zero, zero, zero
+
+    lev = Decimal(str(leverage))
+    inv_lev = Decimal("1") / lev
+    L_fee = L_size * L_entry * (Decimal("1") - inv_lev) * taker if L_size > zero else zero
+    S_fee = S_size * S_entry * (Decimal("1") + inv_lev) * taker if S_size > zero else zero
+    L_pv_mark = L_size * mark_price
+    S_pv_mark = S_size * mark_price
+    mmr_long, deduction_long = tier_mmr_and_deduction(L_pv_mark)
+    mmr_short, deduction_short = tier_mmr_and_deduction(S_pv_mark)
+    unhedged_long = max(L_size - S_size, zero)
+    unhedged_short = max(S_size - L_size, zero)
+    hedged_size = min(L_size, S_size) if (L_size > zero and S_size > zero) else zero
+    entry_diff = abs(L_entry - S_entry) if hedged_size > zero else zero
+
+    if L_size >= S_size:
+        im_long = L_pv_mark / lev + L_fee if L_size > zero else zero
+        if L_size > zero:
+            mm_long = max(unhedged_long * mark_price * mmr_long - deduction_long, zero) + L_fee
+        else:
+            mm_long = zero
+        if S_size > zero:
+            im_short = mm_short = S_fee + mmr_long * hedged_size * entry_diff * hedge_C
+        else:
+            im_short = mm_short = zero
+        return im_long, mm_long, im_short, mm_short
+
+    im_short = S_pv_mark / lev + S_fee
+    mm_short = max(unhedged_short * mark_price * mmr_short - deduction_short, zero) + S_fee
+    if L_size > zero:
+        im_long = mm_long = L_fee + mmr_short * hedged_size * entry_diff * hedge_C
+    else:
+        im_long = mm_long = zero
+    return im_long, mm_long, im_short, mm_short
+
+
+class TestTierBracketLookup:
+    """Bracket-cached lookup must agree with _find_matching_tier."""
+
+    def test_matches_find_matching_tier_across_boundaries(self):
+        lookup = TierBracketLookup(MM_TIERS_BTCUSDT)
+        values = [
+            Decimal("1"), Decimal("2000000"), Decimal("2000000.01"), Decimal("1999999.99"),
+            Decimal("10000000"), Decimal("50000000"), Decimal("500"), Decimal("160000001"),
+        ]
+        for pv in values:
+            assert lookup.find(pv) == _find_matching_tier(pv, MM_TIERS_BTCUSDT)
+
+    def test_rebisects_only_on_bracket_change(self):
+        lookup = TierBracketLookup(MM_TIERS_BTCUSDT)
+        for pv in (Decimal("100"), Decimal("5000"), Decimal("1999999")):
+            lookup.find(pv)
+        assert lookup.lookups == 1
+        lookup.find(Decimal("2000001"))
+        assert lookup.lookups == 2
+
+    def test_no_match_returns_none(self):
+        tiers = [(Decimal("100"), Decimal("0.01"), Decimal("0"), Decimal("0.02"))]
+        assert TierBracketLookup(tiers).find(Decimal("101")) is None
+
+
+class TestIncrementalMarginEvaluator:
+    """pair_im_mm must be bit-identical to the from-scratch formula."""
+
+    @pytest.mark.parametrize("seed", [1, 7, 42])
+    def test_pair_im_mm_parity_over_random_fills_and_marks(self, seed):
+        rng = random.Random(seed)
+        evaluator = IncrementalMarginEvaluator()
+        taker = Decimal("0.00055")
+        hedge_C = Decimal("5.657")
+        long_state = SimpleNamespace(size=Decimal("0"), avg_entry_price=Decimal("0"))
+        short_state = SimpleNamespace(size=Decimal("0"), avg_entry_price=Decimal("0"))
+
+        for _ in range(40):  # fills
+            leg = rng.choice((long_state, short_state))
+            leg.size = Decimal(rng.randint(0, 400)) / Decimal("10")
+            leg.avg_entry_price = Decimal(rng.randint(90000, 110000)) / Decimal("3")
+            for _ in range(25):  # ticks between fills; marks span several tiers
+                mark = Decimal(rng.randint(10000, 9000000)) / Decimal("7")
+                expected = _reference_pair_im_mm(
+                    long_state, short_state, mark, 10, taker, hedge_C, MM_TIERS_BTCUSDT,
+                )
+                actual = evaluator.pair_im_mm(
+                    long_state, short_state, mark,
+                    leverage=10, taker_fee_rate=taker, hedge_factor=hedge_C,
+                    tiers=MM_TIERS_BTCUSDT,
+                )
+                assert actual == expected
+                assert [str(v) for v in actual] == [str(v) for v in expected]
+
+        assert evaluator.term_recomputes <= 40
+
+    def test_state_terms_reused_between_fills(self):
+        evaluator = IncrementalMarginEvaluator()
+        long_state = SimpleNamespace(size=Decimal("1"), avg_entry_price=Decimal("100000"))
+        short_state = SimpleNamespace(size=Decimal("0.5"), avg_entry_price=Decimal("101000"))
+        kwargs = dict(leverage=10, taker_fee_rate=Decimal("0.00055"),
+                      hedge_factor=Decimal("5.657"), tiers=MM_TIERS_BTCUSDT)
+
+        for mark in (Decimal("100000"), Decimal("100100"), Decimal("99900")):
+            evaluator.pair_im_mm(long_state, short_state, mark, **kwargs)
+        assert evaluator.term_recomputes == 1
+
+        long_state.size = Decimal("2")
+        evaluator.pair_im_mm(long_state, short_state, Decimal("100000"), **kwargs)
+        assert evaluator.term_recomputes == 2
+
+    def test_tier_table_swap_is_not_served_stale(self):
+        evaluator = IncrementalMarginEvaluator()
+        other = [(Decimal("Infinity"), Decimal("0.2"), Decimal("0"), Decimal("0.3"))]
+        pv = Decimal("1000")
+
+        assert evaluator.tier_mmr_and_deduction("x", pv, MM_TIERS_BTCUSDT) == (Decimal("0.005"), Decimal("0"))
+        assert evaluator.tier_mmr_and_deduction("x", pv, other) == (Decimal("0.2"), Decimal("0"))
+        assert evaluator.tier_mmr_and_deduction("x", pv, None) == (Decimal("0"), Decimal("0"))
+
+    def test_combined_maintenance_margin_memoized(self):
+        evaluator = IncrementalMarginEvaluator()
+        for pv in (Decimal("3000000"), Decimal("3000000"), Decimal("12000000")):
+            expected, _ = calc_maintenance_margin(pv, "BTCUSDT", tiers=MM_TIERS_BTCUSDT)
+            assert evaluator.combined_maintenance_margin(pv, "BTCUSDT", MM_TIERS_BTCUSDT) == expected
+        assert evaluator.combined_mm_recomputes == 2
+
+
+class TestTrackerMarginSkip:
+    """BacktestPositionTracker only recomputes margin when its inputs change."""
+
+    def test_margin_recomputed_only_after_fill(self, monkeypatch):
+        import backtest.position_tracker as position_tracker
+
+        calls = []
+        real = position_tracker.calc_initial_margin
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(position_tracker, "calc_initial_margin", counting)
+        tracker = BacktestPositionTracker(direction="long", tiers=MM_TIERS_BTCUSDT, symbol="BTCUSDT")
+        tracker.process_fill(side="Buy", qty=Decimal("0.1"), price=Decimal("100000"))
+
+        for price in (Decimal("100000"), Decimal("100500"), Decimal("99000")):
+            tracker.calculate_unrealized_pnl(price)
+        assert len(calls) == 1
+
+        tracker.process_fill(side="Buy", qty=Decimal("0.1"), price=Decimal("99000"))
+        tracker.calculate_unrealized_pnl(Decimal("99000"))
+        assert len(calls) == 2
+        assert tracker.state.initial_margin == real(
+            tracker.state.size * tracker.state.avg_entry_price, tracker.leverage,
+            "BTCUSDT", tiers=MM_TIERS_BTCUSDT,
+        )[0]
+
+    def test_margin_recomputed_after_close_and_reopen(self):
+        tracker = BacktestPositionTracker(direction="long", tiers=MM_TIERS_BTCUSDT, symbol="BTCUSDT")
+        tracker.process_fill(side="Buy", qty=Decimal("0.1"), price=Decimal("100000"))
+        tracker.calculate_unrealized_pnl(Decimal("100000"))
+        tracker.process_fill(side="Sell", qty=Decimal("0.1"), price=Decimal("100000"))
+        tracker.calculate_unrealized_pnl(Decimal("100000"))
+        assert tracker.state.initial_margin == Decimal("0")
+
+        tracker.process_fill(side="Buy", qty=Decimal("0.1"), price=Decimal("100000"))
+        tracker.calculate_unrealized_pnl(Decimal("100000"))
+        assert tracker.state.initial_margin == Decimal("100")
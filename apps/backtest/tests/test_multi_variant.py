@@ -0,0 +1,216 @@
+"""Tests for the single-pass multi-variant backtest engine."""
+
+import argparse
+import math
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from gridcore import EventType, TickerEvent
+
+from backtest.config import (
+    BacktestConfig,
+    BacktestStrategyConfig,
+    BacktestVariant,
+    WindDownMode,
+)
+from backtest.data_provider import InMemoryDataProvider
+from backtest.engine import BacktestEngine
+from backtest.fill_simulator import FillMode
+from backtest.main import export_path_for, parse_fill_modes
+from backtest.multi_variant import MultiVariantBacktestEngine, variants_for_fill_modes
+
+T0 = datetime(2025, 1, 15, 0, 0, 0)
+
+FILL_MODES = [
+    FillMode.STRICT_CROSS,
+    FillMode.BOOK_TOUCH,
+    FillMode.TRADE_THROUGH_AT_LIMIT,
+    FillMode.LAST_CROSS,
+]
+
+
+class CountingProvider(InMemoryDataProvider):
+    """In-memory provider that counts full passes over its events."""
+
+    def __init__(self, events):
+        super().__init__(events)
+        self.passes = 0
+
+    def __iter__(self):
+        self.passes += 1
+        return super().__iter__()
+
+
+def _events(n: int = 600, half_spread: Decimal = Decimal("0.5")) -> list[TickerEvent]:
+    events = []
+    for i in range(n):
+        price = Decimal(str(round(100000.0 + 2000.0 * math.sin(2 * math.pi * i / 150), 1)))
+        ts = T0 + timedelta(minutes=i * 10)
+        events.append(TickerEvent(
+            event_type=EventType.TICKER, symbol="BTCUSDT", exchange_ts=ts, local_ts=ts,
+            last_price=price, mark_price=price, bid1_price=price - half_spread,
+            ask1_price=price + half_spread, funding_rate=Decimal("0.0001"),
+        ))
+    return events
+
+
+def _config(**strategy_overrides) -> BacktestConfig:
+    fields = dict(
+        strat_id="mv", symbol="BTCUSDT", tick_size="0.1",
+        grid_count=20, grid_step=0.5, amount="1000",
+    )
+    strategy = BacktestStrategyConfig(**{**fields, **strategy_overrides})
+    return BacktestConfig(
+        strategies=[strategy], initial_balance=100000,
+        wind_down_mode=WindDownMode.CLOSE_ALL, enable_funding=True,
+    )
+
+
+def _run_single(config: BacktestConfig, events, fill_mode: FillMode):
+    return BacktestEngine(config=config, fill_mode=fill_mode).run(
+        symbol="BTCUSDT", start_ts=events[0].exchange_ts, end_ts=events[-1].exchange_ts,
+        data_provider=InMemoryDataProvider(events),
+    )
+
+
+def _fingerprint(session):
+    trades = [
+        (t.side, t.price, t.qty, t.direction, t.timestamp, t.realized_pnl, t.commission)
+        for t in session.trades
+    ]
+    return trades, session.equity_curve, session.total_funding, session.metrics.net_pnl
+
+
+class TestMultiVariantEngine:
+    """One pass over the data reproduces N separate backtests."""
+
+    def test_each_variant_matches_separate_run(self):
+        events = _events()
+        config = _config()
+        provider = CountingProvider(events)
+
+        sessions = MultiVariantBacktestEngine(
+            config, variants=variants_for_fill_modes(FILL_MODES),
+        ).run("BTCUSDT", events[0].exchange_ts, events[-1].exchange_ts, data_provider=provider)
+
+        assert provider.passes == 1
+        assert list(sessions) == [mode.value for mode in FILL_MODES]
+        for mode in FILL_MODES:
+            reference = _run_single(config, events, mode)
+            assert len(reference.trades) > 10
+            assert _fingerprint(sessions[mode.value]) == _fingerprint(reference)
+
+    def test_variants_are_independent(self):
+        """Different fill modes produce different fills over the same ticks."""
+        # A wide book lets book_touch fill before last price crosses.
+        events = _events(half_spread=Decimal("150"))
+        sessions = MultiVariantBacktestEngine(
+            _config(), variants=variants_for_fill_modes(
+                [FillMode.STRICT_CROSS, FillMode.BOOK_TOUCH]
+            ),
+        ).run("BTCUSDT", events[0].exchange_ts, events[-1].exchange_ts,
+              data_provider=InMemoryDataProvider(events))
+
+        strict = sessions["strict_cross"]
+        touch = sessions["book_touch"]
+        assert strict is not touch
+        assert _fingerprint(strict) != _fingerprint(touch)
+        # Funding is scheduled once but applied to every variant.
+        assert strict.total_funding != 0
+        assert touch.total_funding != 0
+
+    def test_strategy_override_variant_matches_separate_run(self):
+        events = _events()
+        variants = [
+            BacktestVariant(name="base"),
+            BacktestVariant(name="wide", strategy_overrides={"grid_step": 0.8}),
+        ]
+        sessions = MultiVariantBacktestEngine(_config(), variants=variants).run(
+            "BTCUSDT", events[0].exchange_ts, events[-1].exchange_ts,
+            data_provider=InMemoryDataProvider(events),
+        )
+
+        wide = _run_single(_config(grid_step=0.8), events, FillMode.STRICT_CROSS)
+        assert _fingerprint(sessions["wide"]) == _fingerprint(wide)
+        assert _fingerprint(sessions["base"]) != _fingerprint(wide)
+
+    def test_variants_default_to_config(self):
+        config = _config().model_copy(update={
+            "variants": variants_for_fill_modes([FillMode.LAST_CROSS]),
+        })
+        engine = MultiVariantBacktestEngine(config)
+        assert [v.name for v in engine.variants] == ["last_cross"]
+
+    def test_no_strategies_for_symbol(self):
+        events = _events(5)
+        sessions = MultiVariantBacktestEngine(
+            _config(), variants=variants_for_fill_modes(FILL_MODES[:2]),
+        ).run("ETHUSDT", events[0].exchange_ts, events[-1].exchange_ts,
+              data_provider=CountingProvider(events))
+
+        assert set(sessions) == {"strict_cross", "book_touch"}
+        assert all(len(s.trades) == 0 for s in sessions.values())
+
+    def test_variants_share_lookup_providers(self):
+        """Instrument / risk-limit lookups (and their caches) are per symbol."""
+        engine = MultiVariantBacktestEngine(
+            _config(), variants=variants_for_fill_modes(FILL_MODES),
+        )
+        stacks = list(engine._engines.values())
+        assert len({id(e._instrument_provider) for e in stacks}) == 1
+        assert len({id(e._risk_limit_provider) for e in stacks}) == 1
+
+    def test_requires_variants(self):
+        with pytest.raises(ValueError, match="At least one variant"):
+            MultiVariantBacktestEngine(_config(), variants=[])
+
+    def test_rejects_duplicate_names(self):
+        variants = [BacktestVariant(name="a"), BacktestVariant(name="a")]
+        with pytest.raises(ValueError, match="unique"):
+            MultiVariantBacktestEngine(_config(), variants=variants)
+
+
+class TestVariantConfig:
+    """BacktestVariant / BacktestConfig.variants validation."""
+
+    def test_event_follower_rejected(self):
+        with pytest.raises(ValidationError, match="only supported by replay"):
+            BacktestVariant(name="ef", fill_mode=FillMode.EVENT_FOLLOWER)
+
+    def test_duplicate_variant_names_rejected(self):
+        with pytest.raises(ValidationError, match="Duplicate variant names"):
+            BacktestConfig(variants=[{"name": "a"}, {"name": "a", "fill_mode": "book_touch"}])
+
+    def test_for_variant_applies_and_validates_overrides(self):
+        config = _config()
+        variant_config = config.for_variant(
+            BacktestVariant(name="v", strategy_overrides={"grid_count": 30})
+        )
+        assert variant_config.strategies[0].grid_count == 30
+        assert config.strategies[0].grid_count == 20
+
+        with pytest.raises(ValidationError):
+            config.for_variant(BacktestVariant(name="bad", strategy_overrides={"grid_count": 2}))
+
+
+class TestCli:
+    """--fill-modes parsing and per-variant export names."""
+
+    def test_parse_fill_modes(self):
+        assert parse_fill_modes("strict_cross, book_touch") == [
+            FillMode.STRICT_CROSS, FillMode.BOOK_TOUCH,
+        ]
+
+    @pytest.mark.parametrize("value", ["nope", "event_follower"])
+    def test_parse_fill_modes_rejects_invalid(self, value):
+        with pytest.raises(argparse.ArgumentTypeError, match="invalid fill mode"):
+            parse_fill_modes(value)
+
+    def test_export_path_for(self):
+        assert export_path_for("out/res.csv", "BTCUSDT", False) == "out/res.csv"
+        assert export_path_for("res.csv", "BTCUSDT", True) == "res_BTCUSDT.csv"
+        assert export_path_for("res.csv", "BTCUSDT", True, "book_touch") == \
+            "res_BTCUSDT_book_touch.csv"
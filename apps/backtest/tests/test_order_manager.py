@@ -527,6 +527,49 @@ class TestBacktestOrderManager:
         assert order_manager.get_order_by_client_id("nonexistent") is None
 
 
+    def test_amend_order_keeps_order_id(self, order_manager, sample_timestamp):
+        """Amend moves price/qty and hands the order the new client id."""
+        order = order_manager.place_order(
+            client_order_id="c1",
+            symbol="BTCUSDT",
+            side="Buy",
+            price=Decimal("100000"),
+            qty=Decimal("0.1"),
+            direction="long",
+            grid_level=0,
+            timestamp=sample_timestamp,
+        )
+
+        amended = order_manager.amend_order(
+            order.order_id, "c2", Decimal("99000"), Decimal("0.2"), 1, sample_timestamp
+        )
+
+        assert amended is order
+        assert (order.price, order.qty, order.grid_level) == (Decimal("99000"), Decimal("0.2"), 1)
+        assert order_manager.get_order_by_client_id("c2") is order
+        # The old client id is free for reuse.
+        assert order_manager.place_order(
+            client_order_id="c1", symbol="BTCUSDT", side="Buy", price=Decimal("98000"),
+            qty=Decimal("0.1"), direction="long", grid_level=2, timestamp=sample_timestamp,
+        ) is not None
+
+    def test_amend_order_rejects_unknown_or_taken_client_id(self, order_manager, sample_timestamp):
+        """Amend returns None for a missing order or another order's client id."""
+        for cid, price in (("c1", Decimal("100000")), ("c2", Decimal("99000"))):
+            order_manager.place_order(
+                client_order_id=cid, symbol="BTCUSDT", side="Buy", price=price,
+                qty=Decimal("0.1"), direction="long", grid_level=0, timestamp=sample_timestamp,
+            )
+        order = order_manager.get_order_by_client_id("c1")
+
+        assert order_manager.amend_order(
+            "nonexistent", "c3", Decimal("98000"), Decimal("0.1"), 0, sample_timestamp
+        ) is None
+        assert order_manager.amend_order(
+            order.order_id, "c2", Decimal("98000"), Decimal("0.1"), 0, sample_timestamp
+        ) is None
+        assert order.price == Decimal("100000")
+
 class TestLastCrossOrderManagerIntegration:
     """Feature 0051 integration: advance_market hook in check_fills."""
 
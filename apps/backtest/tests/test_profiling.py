@@ -0,0 +1,230 @@
+"""Tests for --profile phase timing (PhaseProfiler, profile_run, engine wiring)."""
+
+import argparse
+import json
+import math
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from gridcore import EventType, TickerEvent
+
+from backtest.config import BacktestConfig, BacktestStrategyConfig
+from backtest.data_provider import InMemoryDataProvider
+from backtest.engine import BacktestEngine
+from backtest.fill_simulator import FillMode
+from backtest.multi_variant import MultiVariantBacktestEngine, variants_for_fill_modes
+from backtest.profiling import (
+    PhaseProfiler,
+    SamplingProfiler,
+    add_profile_arguments,
+    check_profile_arguments,
+    phase_scope,
+    profile_run,
+)
+
+T0 = datetime(2025, 1, 15, 0, 0, 0)
+
+
+def _events(n: int = 200) -> list[TickerEvent]:
+    events = []
+    for i in range(n):
+        price = Decimal(str(round(100000.0 + 2000.0 * math.sin(2 * math.pi * i / 50), 1)))
+        ts = T0 + timedelta(minutes=i * 10)
+        events.append(TickerEvent(
+            event_type=EventType.TICKER, symbol="BTCUSDT", exchange_ts=ts, local_ts=ts,
+            last_price=price, mark_price=price, bid1_price=price - Decimal("0.5"),
+            ask1_price=price + Decimal("0.5"), funding_rate=Decimal("0.0001"),
+        ))
+    return events
+
+
+def _config() -> BacktestConfig:
+    strategy = BacktestStrategyConfig(
+        strat_id="prof", symbol="BTCUSDT", tick_size="0.1",
+        grid_count=20, grid_step=0.5, amount="1000",
+    )
+    return BacktestConfig(strategies=[strategy], initial_balance=100000)
+
+
+def _phases(profiler: PhaseProfiler) -> dict[str, dict]:
+    return {p["name"]: p for p in profiler.report()["phases"]}
+
+
+class TestPhaseProfiler:
+    def test_lap_accumulates_calls_total_and_max(self):
+        profiler = PhaseProfiler()
+        profiler.add("fills", 100)
+        profiler.add("fills", 300)
+        t = profiler.lap("equity", 0)
+
+        stats = profiler.phases["fills"]
+        assert (stats.calls, stats.total_ns, stats.max_ns) == (2, 400, 300)
+        assert t > 0
+        assert profiler.phases["equity"].calls == 1
+
+    def test_report_per_tick_and_sorting(self):
+        profiler = PhaseProfiler()
+        profiler.add("small", 1_000)
+        profiler.add("big", 8_000)
+        profiler.add("big", 2_000)
+        profiler.ticks = 2
+        profiler.stop()
+
+        report = profiler.report()
+        assert [p["name"] for p in report["phases"]] == ["big", "small"]
+        big = report["phases"][0]
+        assert big["mean_us"] == pytest.approx(5.0)
+        assert big["max_us"] == pytest.approx(8.0)
+        assert big["per_tick_us"] == pytest.approx(5.0)
+        assert report["ticks"] == 2
+
+    def test_timed_iter_times_every_next(self):
+        profiler = PhaseProfiler()
+        assert list(profiler.timed_iter([1, 2, 3], "data")) == [1, 2, 3]
+        # Three items plus the exhausting next().
+        assert profiler.phases["data"].calls == 4
+
+    def test_timed_and_phase_scope(self):
+        profiler = PhaseProfiler()
+        assert profiler.timed(lambda x: x * 2, "write")(21) == 42
+        with phase_scope(profiler, "compare"):
+            pass
+        with phase_scope(None, "compare"):
+            pass
+        assert profiler.phases["write"].calls == 1
+        assert profiler.phases["compare"].calls == 1
+
+
+class TestProfileRun:
+    def test_disabled_yields_none_and_writes_nothing(self, tmp_path):
+        with profile_run(None, sampler="cprofile") as profiler:
+            assert profiler is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_writes_phase_report(self, tmp_path):
+        path = tmp_path / "out" / "profile.json"
+        with profile_run(path, command="backtest", meta={"symbol": "BTCUSDT"}) as profiler:
+            profiler.add("fills", 5_000)
+            profiler.ticks = 1
+
+        payload = json.loads(path.read_text())
+        assert payload["command"] == "backtest"
+        assert payload["meta"] == {"symbol": "BTCUSDT"}
+        assert payload["ticks"] == 1
+        assert payload["phases"][0]["name"] == "fills"
+        assert "cprofile" not in payload and "flame" not in payload
+
+    def test_report_written_when_run_raises(self, tmp_path):
+        path = tmp_path / "profile.json"
+        with pytest.raises(RuntimeError):
+            with profile_run(path):
+                raise RuntimeError("boom")
+        assert path.exists()
+
+    def test_cprofile_section_and_stats_file(self, tmp_path):
+        path = tmp_path / "profile.json"
+        with profile_run(path, sampler="cprofile"):
+            sorted(range(10_000), key=lambda x: -x)
+
+        payload = json.loads(path.read_text())
+        assert payload["cprofile"]["top"]
+        assert (tmp_path / "profile.json.prof").exists()
+
+    def test_sampling_flame_stacks(self, tmp_path):
+        path = tmp_path / "profile.json"
+        with profile_run(path, sampler="sample", sample_interval=0.001):
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                sum(range(1000))
+
+        flame = json.loads(path.read_text())["flame"]
+        assert flame["samples"] > 0
+        assert any("test_sampling_flame_stacks" in stack for stack in flame["stacks"])
+        folded = (tmp_path / "profile.json.folded").read_text().splitlines()
+        assert folded and folded[0].rsplit(" ", 1)[1].isdigit()
+
+    @pytest.mark.parametrize("sampler,suffix", [("cprofile", ".prof"), ("sample", ".folded")])
+    def test_side_files_append_to_report_name(self, tmp_path, sampler, suffix):
+        """``<path>.prof`` / ``<path>.folded``: two reports never share one."""
+        names = ("run.a.json", "run.b.json", "report")
+        for name in names:
+            with profile_run(tmp_path / name, sampler=sampler, sample_interval=0.001):
+                sum(range(1000))
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+            [*names, *(name + suffix for name in names)]
+        )
+
+    def test_unknown_sampler_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown sampler"):
+            with profile_run(tmp_path / "p.json", sampler="perf"):
+                pass
+
+    def test_sampling_interval_must_be_positive(self):
+        with pytest.raises(ValueError):
+            SamplingProfiler(interval=0)
+
+
+class TestCliArguments:
+    def _parser(self) -> argparse.ArgumentParser:
+        parser = argparse.ArgumentParser()
+        add_profile_arguments(parser)
+        return parser
+
+    def test_profile_and_profiler(self):
+        parser = self._parser()
+        args = parser.parse_args(["--profile", "p.json", "--profiler", "sample"])
+        check_profile_arguments(parser, args)
+        assert (args.profile, args.profiler) == ("p.json", "sample")
+
+    def test_profiler_requires_profile(self):
+        parser = self._parser()
+        args = parser.parse_args(["--profiler", "cprofile"])
+        with pytest.raises(SystemExit):
+            check_profile_arguments(parser, args)
+
+
+class TestEngineWiring:
+    def test_backtest_phases_cover_tick_loop(self):
+        events = _events()
+        profiler = PhaseProfiler()
+        engine = BacktestEngine(config=_config(), profiler=profiler)
+        engine.run("BTCUSDT", T0, events[-1].exchange_ts, InMemoryDataProvider(events))
+
+        phases = _phases(profiler)
+        assert profiler.ticks == len(events)
+        for name in ("data", "funding", "fills", "equity", "execute_tick", "finalize"):
+            assert name in phases
+        assert phases["fills"]["calls"] == len(events)
+        assert phases["execute_tick.on_event"]["calls"] == len(events)
+        assert phases["execute_tick.dispatch_intents"]["calls"] == len(events)
+
+    def test_profiling_does_not_change_results(self):
+        events = _events()
+
+        def run(profiler):
+            return BacktestEngine(config=_config(), profiler=profiler).run(
+                "BTCUSDT", T0, events[-1].exchange_ts, InMemoryDataProvider(events)
+            )
+
+        plain, profiled = run(None), run(PhaseProfiler())
+        assert len(plain.trades) == len(profiled.trades)
+        assert plain.equity_curve == profiled.equity_curve
+
+    def test_multi_variant_counts_ticks_once(self):
+        events = _events(100)
+        profiler = PhaseProfiler()
+        engine = MultiVariantBacktestEngine(
+            _config(),
+            variants=variants_for_fill_modes([FillMode.STRICT_CROSS, FillMode.BOOK_TOUCH]),
+            profiler=profiler,
+        )
+        engine.run("BTCUSDT", T0, events[-1].exchange_ts, InMemoryDataProvider(events))
+
+        phases = _phases(profiler)
+        assert profiler.ticks == len(events)
+        assert phases["data"]["calls"] == len(events) + 1
+        assert phases["fills"]["calls"] == 2 * len(events)
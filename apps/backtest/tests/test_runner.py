@@ -8,7 +8,9 @@ from types import SimpleNamespace
 
 import pytest
 
-from gridcore import TickerEvent, EventType, PlaceLimitIntent, DirectionType, SideType
+from gridcore import (
+    TickerEvent, EventType, PlaceLimitIntent, CancelIntent, DirectionType, SideType,
+)
 from gridcore.instrument_info import InstrumentInfo
 from gridcore.pnl import calc_maintenance_margin
 
@@ -1784,6 +1786,74 @@ class TestGetPendingCloseQty:
         assert runner._get_pending_close_qty(DirectionType.SHORT) == Decimal("0.07")
 
 
+    def test_exclude_order_id(self, runner, sample_timestamp):
+        """An order being amended is left out of the pending sum."""
+        order = runner._executor.order_manager.place_order(
+            client_order_id="c1", symbol="BTCUSDT", side=SideType.SELL,
+            price=Decimal("101000"), qty=Decimal("0.1"),
+            direction=DirectionType.LONG, grid_level=10,
+            timestamp=sample_timestamp, reduce_only=True,
+        )
+        assert runner._get_pending_close_qty(
+            DirectionType.LONG, exclude_order_id=order.order_id
+        ) == Decimal("0")
+
+
+class TestAmendDispatch:
+    """Tests for amend_enabled collapsing in BacktestRunner._dispatch_intents."""
+
+    @pytest.fixture
+    def runner(self, sample_strategy_config, session):
+        order_mgr = BacktestOrderManager(
+            fill_simulator=TradeThroughFillSimulator(),
+            commission_rate=sample_strategy_config.commission_rate,
+        )
+        executor = BacktestExecutor(order_manager=order_mgr)
+        return BacktestRunner(
+            strategy_config=sample_strategy_config.model_copy(update={"amend_enabled": True}),
+            executor=executor,
+            session=session,
+        )
+
+    @staticmethod
+    def _place(side: SideType, price: str, grid_level: int) -> PlaceLimitIntent:
+        return PlaceLimitIntent.create(
+            symbol="BTCUSDT", side=side, price=Decimal(price), qty=Decimal("0.1"),
+            grid_level=grid_level, direction=DirectionType.LONG,
+        )
+
+    def _seed(self, runner, timestamp) -> str:
+        result = runner._executor.execute_place(self._place(SideType.BUY, "99000", 1), timestamp)
+        return result.order_id
+
+    def test_same_side_pair_is_amended(self, runner, sample_timestamp):
+        order_id = self._seed(runner, sample_timestamp)
+        place = self._place(SideType.BUY, "98000", 2)
+
+        runner._dispatch_intents(
+            [CancelIntent(symbol="BTCUSDT", order_id=order_id, reason="outside_grid"), place],
+            sample_timestamp,
+        )
+
+        order_mgr = runner._executor.order_manager
+        assert list(order_mgr.active_orders) == [order_id]
+        assert order_mgr.active_orders[order_id].price == Decimal("98000")
+        assert order_mgr.active_orders[order_id].client_order_id == place.client_order_id
+        assert order_mgr.cancelled_orders == []
+
+    def test_side_flip_stays_cancel_and_place(self, runner, sample_timestamp):
+        order_id = self._seed(runner, sample_timestamp)
+        place = self._place(SideType.SELL, "101000", 2)
+
+        runner._dispatch_intents(
+            [CancelIntent(symbol="BTCUSDT", order_id=order_id, reason="side_mismatch"), place],
+            sample_timestamp,
+        )
+
+        order_mgr = runner._executor.order_manager
+        assert [o.order_id for o in order_mgr.cancelled_orders] == [order_id]
+        assert order_mgr.get_order_by_client_id(place.client_order_id).order_id != order_id
+
 class TestSeedAwareConstruction:
     """Tests for replay-driven seeding of trackers, order manager, and runner.
 
@@ -11,6 +11,15 @@ from comparator.loader import NormalizedTrade, LiveTradeLoader, BacktestTradeLoa
 from comparator.matcher import TradeMatcher, MatchedTrade, MatchResult
 from comparator.metrics import ValidationMetrics, TradeDelta, calculate_metrics
 from comparator.reporter import ComparatorReporter
+from comparator.streaming import (
+    QuantileSketch,
+    SpillingQuantiles,
+    StreamingMatcher,
+    StreamingMetrics,
+    compare_streams,
+    iter_backtest_csv,
+    iter_live_trades,
+)
 
 __all__ = [
     # Config
@@ -31,4 +40,12 @@ __all__ = [
     "calculate_metrics",
     # Reporter
     "ComparatorReporter",
+    # Streaming
+    "QuantileSketch",
+    "SpillingQuantiles",
+    "StreamingMatcher",
+    "StreamingMetrics",
+    "compare_streams",
+    "iter_backtest_csv",
+    "iter_live_trades",
 ]
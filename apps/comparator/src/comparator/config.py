@@ -18,3 +18,9 @@ class ComparatorConfig(BaseModel):
     output_dir: str = "results/comparison"
     price_tolerance: Decimal = Decimal("0")
     qty_tolerance: Decimal = Decimal("0.001")
+    # Streaming mode (comparator.streaming): bounded-memory chunked compare.
+    streaming: bool = False
+    lookahead_seconds: float = 600.0
+    chunk_size: int = 5000
+    exact_quantiles: bool = False
+    spill_dir: Optional[str] = None
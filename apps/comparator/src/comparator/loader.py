@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
 from sqlalchemy.orm import Session
 
@@ -73,6 +73,58 @@ def _assign_occurrences(trades: list[NormalizedTrade]) -> None:
         counts[trade.client_order_id] += 1
 
 
+def _aggregate_fills(
+    client_order_id: str, fills: list[PrivateExecution]
+) -> NormalizedTrade:
+    """Aggregate partial fills of one order into one NormalizedTrade.
+
+    Uses VWAP for price, sums qty/fee/pnl, takes latest timestamp.
+    """
+    total_qty = Decimal("0")
+    total_notional = Decimal("0")
+    total_fee = Decimal("0")
+    total_pnl = Decimal("0")
+    latest_ts = _normalize_ts(fills[0].exchange_ts)
+
+    for f in fills:
+        qty = f.exec_qty
+        total_qty += qty
+        total_notional += f.exec_price * qty
+        total_fee += f.exec_fee or Decimal("0")
+        total_pnl += f.closed_pnl or Decimal("0")
+        f_ts = _normalize_ts(f.exchange_ts)
+        if f_ts > latest_ts:
+            latest_ts = f_ts
+
+    vwap_price = total_notional / total_qty if total_qty else _ZERO
+
+    # Infer direction: closing trades have non-zero closed_pnl.
+    # NOTE: Break-even closes (closed_pnl==0) are misclassified as opening
+    # trades. For matched pairs, metrics.py prefers backtest direction
+    # (always correct) over this inferred value.
+    side = SideType(fills[0].side)
+    is_closing = total_pnl != _ZERO
+    if is_closing:
+        # Buy closing = closing short; Sell closing = closing long
+        direction = DirectionType.SHORT if side == SideType.BUY else DirectionType.LONG
+    else:
+        # Buy opening = opening long; Sell opening = opening short
+        direction = DirectionType.LONG if side == SideType.BUY else DirectionType.SHORT
+
+    return NormalizedTrade(
+        client_order_id=client_order_id,
+        symbol=fills[0].symbol,
+        side=side,
+        price=vwap_price,
+        qty=total_qty,
+        fee=total_fee,
+        realized_pnl=total_pnl,
+        timestamp=latest_ts,
+        source="live",
+        direction=direction,
+    )
+
+
 class LiveTradeLoader:
     """Load and normalize live trades from database.
 
@@ -105,6 +157,19 @@ class LiveTradeLoader:
         if symbol:
             executions = [e for e in executions if e.symbol == symbol]
 
+        return self.normalize(executions)
+
+    @staticmethod
+    def normalize(executions: Sequence[PrivateExecution]) -> list[NormalizedTrade]:
+        """Normalize already-loaded executions (e.g. a replay's shared stream).
+
+        Args:
+            executions: Execution rows, already filtered to the wanted
+                window and symbol.
+
+        Returns:
+            List of NormalizedTrade sorted by timestamp.
+        """
         # Group by (client_id, order_id) to separate partial fills from
         # lifecycle reuse. Same client_id + same order_id = partial fills
         # (aggregate). Same client_id + different order_id = ID reuse
@@ -133,7 +198,7 @@ class LiveTradeLoader:
 
         trades = []
         for (client_id, _order_id), fills in grouped.items():
-            trade = self._aggregate_fills(client_id, fills)
+            trade = _aggregate_fills(client_id, fills)
             trades.append(trade)
 
         trades.sort(key=lambda t: (t.timestamp, t.client_order_id, t.side))
@@ -144,56 +209,21 @@ class LiveTradeLoader:
         logger.info("Loaded %d live trades (%d raw executions)", len(trades), len(executions))
         return trades
 
-    def _aggregate_fills(
-        self, client_order_id: str, fills: list[PrivateExecution]
-    ) -> NormalizedTrade:
-        """Aggregate partial fills into one NormalizedTrade.
 
-        Uses VWAP for price, sums qty/fee/pnl, takes latest timestamp.
-        """
-        total_qty = Decimal("0")
-        total_notional = Decimal("0")
-        total_fee = Decimal("0")
-        total_pnl = Decimal("0")
-        latest_ts = _normalize_ts(fills[0].exchange_ts)
-
-        for f in fills:
-            qty = f.exec_qty
-            total_qty += qty
-            total_notional += f.exec_price * qty
-            total_fee += f.exec_fee or Decimal("0")
-            total_pnl += f.closed_pnl or Decimal("0")
-            f_ts = _normalize_ts(f.exchange_ts)
-            if f_ts > latest_ts:
-                latest_ts = f_ts
-
-        vwap_price = total_notional / total_qty if total_qty else _ZERO
-
-        # Infer direction: closing trades have non-zero closed_pnl.
-        # NOTE: Break-even closes (closed_pnl==0) are misclassified as opening
-        # trades. For matched pairs, metrics.py prefers backtest direction
-        # (always correct) over this inferred value.
-        side = SideType(fills[0].side)
-        is_closing = total_pnl != _ZERO
-        if is_closing:
-            # Buy closing = closing short; Sell closing = closing long
-            direction = DirectionType.SHORT if side == SideType.BUY else DirectionType.LONG
-        else:
-            # Buy opening = opening long; Sell opening = opening short
-            direction = DirectionType.LONG if side == SideType.BUY else DirectionType.SHORT
-
-        return NormalizedTrade(
-            client_order_id=client_order_id,
-            symbol=fills[0].symbol,
-            side=side,
-            price=vwap_price,
-            qty=total_qty,
-            fee=total_fee,
-            realized_pnl=total_pnl,
-            timestamp=latest_ts,
-            source="live",
-            direction=direction,
-        )
+def _trade_from_csv_row(row: dict[str, str]) -> NormalizedTrade:
+    """Normalize one row of a backtest trades CSV export."""
+    return NormalizedTrade(
+        client_order_id=row["client_order_id"],
+        symbol=row["symbol"],
+        side=SideType(row["side"]),
+        price=Decimal(row["price"]),
+        qty=Decimal(row["qty"]),
+        fee=Decimal(row["commission"]),
+        realized_pnl=Decimal(row["realized_pnl"]),
+        timestamp=_normalize_ts(datetime.fromisoformat(row["timestamp"])),
+        source="backtest",
+        direction=DirectionType(row["direction"]) if row.get("direction") else None,
+    )
 
 
 class BacktestTradeLoader:
@@ -247,18 +277,7 @@ class BacktestTradeLoader:
         with open(path, "r") as f:
             reader = csv.DictReader(f)
             for row in reader:
-                normalized.append(NormalizedTrade(
-                    client_order_id=row["client_order_id"],
-                    symbol=row["symbol"],
-                    side=SideType(row["side"]),
-                    price=Decimal(row["price"]),
-                    qty=Decimal(row["qty"]),
-                    fee=Decimal(row["commission"]),
-                    realized_pnl=Decimal(row["realized_pnl"]),
-                    timestamp=_normalize_ts(datetime.fromisoformat(row["timestamp"])),
-                    source="backtest",
-                    direction=DirectionType(row["direction"]) if row.get("direction") else None,
-                ))
+                normalized.append(_trade_from_csv_row(row))
 
         normalized.sort(key=lambda t: (t.timestamp, t.client_order_id, t.side))
         _assign_occurrences(normalized)
@@ -15,22 +15,38 @@ Usage:
         --start "2025-01-01" --end "2025-01-31" \
         --symbol BTCUSDT \
         --output results/comparison/
+
+    # Bounded-memory streaming compare for multi-week windows
+    uv run python -m comparator.main \
+        --run-id "uuid" \
+        --backtest-trades path/to/trades.csv \
+        --start "2025-01-01" --end "2025-03-31" \
+        --streaming --exact-quantiles
 """
 
 import argparse
+import itertools
 import logging
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from typing import Iterable
 
 from grid_db import DatabaseFactory, DatabaseSettings
 
 from comparator.config import ComparatorConfig
 from comparator.equity import EquityComparator
 from comparator.loader import NormalizedTrade, LiveTradeLoader, BacktestTradeLoader
-from comparator.matcher import TradeMatcher
-from comparator.metrics import calculate_metrics
+from comparator.matcher import MatchResult, TradeMatcher
+from comparator.metrics import ValidationMetrics, calculate_metrics
 from comparator.reporter import ComparatorReporter
+from comparator.streaming import (
+    StreamingMetrics,
+    StreamingReportWriter,
+    compare_streams,
+    iter_backtest_csv,
+    iter_live_trades,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +110,33 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default="USDT",
         help="Coin for live wallet balance (default: USDT)",
     )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream both sides in time-ordered chunks (bounded memory)",
+    )
+    parser.add_argument(
+        "--lookahead",
+        type=float,
+        default=600.0,
+        help="Streaming: seconds a trade waits for its counterpart or late fills (default: 600)",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=5000,
+        help="Streaming: live executions fetched per DB page (default: 5000)",
+    )
+    parser.add_argument(
+        "--exact-quantiles",
+        action="store_true",
+        help="Streaming: exact medians/p95 via on-disk spill instead of a sketch",
+    )
+    parser.add_argument(
+        "--spill-dir",
+        default=None,
+        help="Streaming: directory for --exact-quantiles spill files (default: system temp)",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -176,61 +219,19 @@ def _load_backtest_from_config(
     return trades, equity
 
 
-def run(
+def _compare_equity_and_positions(
     config: ComparatorConfig,
-    backtest_trades: list[NormalizedTrade],
-    backtest_equity: list[EquityPoint] | None = None,
-    backtest_equity_path: str | None = None,
-    coin: str = "USDT",
-) -> int:
-    """Run the comparison.
-
-    Args:
-        config: Comparator configuration.
-        backtest_trades: Normalized backtest trades.
-        backtest_equity: Backtest equity curve from session (if available).
-        backtest_equity_path: Path to backtest equity CSV (alternative to backtest_equity).
-        coin: Coin for live wallet balance lookup.
+    db: DatabaseFactory,
+    metrics: ValidationMetrics,
+    backtest_equity: list[EquityPoint] | None,
+    backtest_equity_path: str | None,
+    coin: str,
+) -> tuple[list | None, list]:
+    """Fold equity-curve and position-telemetry parity into ``metrics``.
 
     Returns:
-        Exit code (0=success, 1=config error, 2=execution error).
+        Tuple of (resampled_equity or None, position_pairs) for the reporter.
     """
-    # Filter backtest trades by symbol to match live-side filtering
-    if config.symbol:
-        backtest_trades = [t for t in backtest_trades if t.symbol == config.symbol]
-
-    if not backtest_trades:
-        logger.error("No backtest trades to compare")
-        return 1
-
-    # Load live trades from database
-    settings = DatabaseSettings(database_url=config.database_url)
-    db = DatabaseFactory(settings)
-
-    with db.get_session() as session:
-        live_loader = LiveTradeLoader(session)
-        live_trades = live_loader.load(
-            run_id=config.run_id,
-            start_ts=config.start_ts,
-            end_ts=config.end_ts,
-            symbol=config.symbol,
-        )
-
-    if not live_trades:
-        logger.error("No live trades found for run_id=%s", config.run_id)
-        return 1
-
-    # Match trades
-    matcher = TradeMatcher()
-    match_result = matcher.match(live_trades, backtest_trades)
-
-    # Calculate metrics
-    metrics = calculate_metrics(
-        match_result,
-        price_tolerance=config.price_tolerance,
-        qty_tolerance=config.qty_tolerance,
-    )
-
     # Equity curve comparison
     eq = EquityComparator()
     bt_equity = backtest_equity
@@ -298,6 +299,68 @@ def run(
             )
         session.expunge_all()
 
+    return resampled_equity, position_pairs
+
+
+def run(
+    config: ComparatorConfig,
+    backtest_trades: list[NormalizedTrade],
+    backtest_equity: list[EquityPoint] | None = None,
+    backtest_equity_path: str | None = None,
+    coin: str = "USDT",
+) -> int:
+    """Run the comparison.
+
+    Args:
+        config: Comparator configuration.
+        backtest_trades: Normalized backtest trades.
+        backtest_equity: Backtest equity curve from session (if available).
+        backtest_equity_path: Path to backtest equity CSV (alternative to backtest_equity).
+        coin: Coin for live wallet balance lookup.
+
+    Returns:
+        Exit code (0=success, 1=config error, 2=execution error).
+    """
+    # Filter backtest trades by symbol to match live-side filtering
+    if config.symbol:
+        backtest_trades = [t for t in backtest_trades if t.symbol == config.symbol]
+
+    if not backtest_trades:
+        logger.error("No backtest trades to compare")
+        return 1
+
+    # Load live trades from database
+    settings = DatabaseSettings(database_url=config.database_url)
+    db = DatabaseFactory(settings)
+
+    with db.get_session() as session:
+        live_loader = LiveTradeLoader(session)
+        live_trades = live_loader.load(
+            run_id=config.run_id,
+            start_ts=config.start_ts,
+            end_ts=config.end_ts,
+            symbol=config.symbol,
+        )
+
+    if not live_trades:
+        logger.error("No live trades found for run_id=%s", config.run_id)
+        return 1
+
+    # Match trades
+    matcher = TradeMatcher()
+    match_result = matcher.match(live_trades, backtest_trades)
+
+    # Calculate metrics
+    metrics = calculate_metrics(
+        match_result,
+        price_tolerance=config.price_tolerance,
+        qty_tolerance=config.qty_tolerance,
+    )
+
+    resampled_equity, position_pairs = _compare_equity_and_positions(
+        config, db, metrics, backtest_equity, backtest_equity_path, coin,
+    )
+
     # Report (equity data and position pairs passed to reporter for export_all)
     reporter = ComparatorReporter(
         match_result, metrics,
@@ -313,6 +376,92 @@ def run(
     return 0
 
 
+def run_streaming(
+    config: ComparatorConfig,
+    backtest_trades: Iterable[NormalizedTrade],
+    backtest_equity: list[EquityPoint] | None = None,
+    backtest_equity_path: str | None = None,
+    coin: str = "USDT",
+) -> int:
+    """Run the comparison in bounded memory (see ``comparator.streaming``).
+
+    Same outputs as ``run``; per-trade CSV rows are written while the join
+    streams, and ``trade_deltas`` on the metrics stays empty.
+
+    Args:
+        config: Comparator configuration (``lookahead_seconds``,
+            ``chunk_size``, ``exact_quantiles``, ``spill_dir`` apply).
+        backtest_trades: Time-ordered backtest trades with occurrences set.
+        backtest_equity: Backtest equity curve from session (if available).
+        backtest_equity_path: Path to backtest equity CSV (alternative to backtest_equity).
+        coin: Coin for live wallet balance lookup.
+
+    Returns:
+        Exit code (0=success, 1=config error, 2=execution error).
+    """
+    if config.symbol:
+        backtest_trades = (t for t in backtest_trades if t.symbol == config.symbol)
+    backtest_trades = iter(backtest_trades)
+    first_bt = next(backtest_trades, None)
+    if first_bt is None:
+        logger.error("No backtest trades to compare")
+        return 1
+    backtest_trades = itertools.chain([first_bt], backtest_trades)
+
+    settings = DatabaseSettings(database_url=config.database_url)
+    db = DatabaseFactory(settings)
+    lookahead = timedelta(seconds=config.lookahead_seconds)
+    streaming_metrics = StreamingMetrics(
+        price_tolerance=config.price_tolerance,
+        qty_tolerance=config.qty_tolerance,
+        exact=config.exact_quantiles,
+        spill_dir=config.spill_dir,
+    )
+    try:
+        with db.get_session() as session:
+            live_trades = iter_live_trades(
+                session,
+                run_id=config.run_id,
+                start_ts=config.start_ts,
+                end_ts=config.end_ts,
+                symbol=config.symbol,
+                chunk_size=config.chunk_size,
+                fill_window=lookahead,
+            )
+            first_live = next(live_trades, None)
+            if first_live is None:
+                logger.error("No live trades found for run_id=%s", config.run_id)
+                return 1
+            with StreamingReportWriter(config.output_dir) as writer:
+                metrics = compare_streams(
+                    itertools.chain([first_live], live_trades),
+                    backtest_trades,
+                    streaming_metrics,
+                    match_window=lookahead,
+                    writer=writer,
+                )
+    finally:
+        streaming_metrics.close()
+
+    resampled_equity, position_pairs = _compare_equity_and_positions(
+        config, db, metrics, backtest_equity, backtest_equity_path, coin,
+    )
+
+    reporter = ComparatorReporter(
+        MatchResult(matched=[], live_only=[], backtest_only=[]), metrics,
+        equity_data=resampled_equity,
+        position_pairs=position_pairs,
+    )
+    reporter.print_summary()
+    paths = dict(writer.paths)
+    paths.update(reporter.export_all(config.output_dir, include_trades=False))
+
+    for name, path in paths.items():
+        logger.info("Exported %s → %s", name, path)
+
+    return 0
+
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entry point."""
     args = parse_args(argv)
@@ -330,6 +479,11 @@ def main(argv: list[str] | None = None) -> int:
             end_ts=_parse_datetime(args.end, end_of_day=True),
             symbol=args.symbol,
             output_dir=args.output,
+            streaming=args.streaming,
+            lookahead_seconds=args.lookahead,
+            chunk_size=args.chunk_size,
+            exact_quantiles=args.exact_quantiles,
+            spill_dir=args.spill_dir,
         )
     except Exception as e:
         logger.error("Configuration error: %s", e)
@@ -349,12 +503,23 @@ def main(argv: list[str] | None = None) -> int:
                 end_ts=config.end_ts,
                 database_url=config.database_url,
             )
-            return run(
+            compare = run_streaming if config.streaming else run
+            return compare(
                 config,
                 bt_trades,
                 backtest_equity=bt_equity,
                 coin=args.coin,
             )
+        elif config.streaming:
+            return run_streaming(
+                config,
+                iter_backtest_csv(
+                    args.backtest_trades,
+                    reorder_window=timedelta(seconds=config.lookahead_seconds),
+                ),
+                backtest_equity_path=args.backtest_equity,
+                coin=args.coin,
+            )
         else:
             # Load backtest trades from CSV
             bt_loader = BacktestTradeLoader()
@@ -28,6 +28,7 @@ from gridcore.pnl import calc_unrealised_pnl
 
 from grid_db.models import PositionSnapshot
 
+from comparator.loader import _normalize_ts
 from comparator.metrics import ValidationMetrics, _spike_stats
 
 
@@ -223,13 +224,16 @@ class PositionComparator:
         out: list[PositionComparisonPair] = []
         live_idx = 0
         tolerance = timedelta(seconds=self._tolerance_s)
+        # Timestamps compare as naive UTC: backtest rows handed over in
+        # memory need not share the DB rows' tz-awareness.
+        live_ts = [_normalize_ts(row.exchange_ts) for row in live]
         for bt_row in bt:
-            bt_ts = bt_row.exchange_ts
+            bt_ts = _normalize_ts(bt_row.exchange_ts)
             lower_bound = bt_ts - tolerance
             upper_bound = bt_ts + tolerance
 
             # Drop stale live rows that cannot match this or any future bt row.
-            while live_idx < len(live) and live[live_idx].exchange_ts < lower_bound:
+            while live_idx < len(live) and live_ts[live_idx] < lower_bound:
                 live_idx += 1
             if live_idx >= len(live):
                 # No unclaimed live row remains — bt unmatched.
@@ -237,7 +241,7 @@ class PositionComparator:
                 continue
 
             live_row = live[live_idx]
-            if live_row.exchange_ts > upper_bound:
+            if live_ts[live_idx] > upper_bound:
                 # No live row inside the bidirectional tolerance window. Do
                 # not advance live_idx; the next bt row may claim this live row.
                 out.append(_unmatched_bt_marker(bt_row))
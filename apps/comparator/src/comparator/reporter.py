@@ -11,8 +11,9 @@ from decimal import Decimal
 from pathlib import Path
 from typing import Optional, Union
 
-from comparator.matcher import MatchResult
-from comparator.metrics import ValidationMetrics
+from comparator.loader import NormalizedTrade
+from comparator.matcher import MatchedTrade, MatchResult
+from comparator.metrics import TradeDelta, ValidationMetrics
 from comparator.position_metrics import PositionComparisonPair
 
 logger = logging.getLogger(__name__)
@@ -20,6 +21,81 @@ logger = logging.getLogger(__name__)
 ResampledRow = tuple[datetime, Optional[Decimal], Optional[Decimal]]
 
 
+MATCHED_TRADES_HEADER = [
+    "client_order_id",
+    "occurrence",
+    "symbol",
+    "side",
+    "live_price",
+    "backtest_price",
+    "price_delta",
+    "live_qty",
+    "backtest_qty",
+    "qty_delta",
+    "live_fee",
+    "backtest_fee",
+    "fee_delta",
+    "live_pnl",
+    "backtest_pnl",
+    "pnl_delta",
+    "live_timestamp",
+    "backtest_timestamp",
+]
+
+UNMATCHED_TRADES_HEADER = [
+    "source",
+    "client_order_id",
+    "occurrence",
+    "symbol",
+    "side",
+    "price",
+    "qty",
+    "fee",
+    "realized_pnl",
+    "timestamp",
+]
+
+
+def matched_trade_row(pair: MatchedTrade, delta: TradeDelta) -> list:
+    """One ``matched_trades.csv`` row for a pair and its delta."""
+    return [
+        pair.live.client_order_id,
+        pair.live.occurrence,
+        pair.live.symbol,
+        pair.live.side,
+        str(pair.live.price),
+        str(pair.backtest.price),
+        str(delta.price_delta),
+        str(pair.live.qty),
+        str(pair.backtest.qty),
+        str(delta.qty_delta),
+        str(pair.live.fee),
+        str(pair.backtest.fee),
+        str(delta.fee_delta),
+        str(pair.live.realized_pnl),
+        str(pair.backtest.realized_pnl),
+        str(delta.pnl_delta),
+        pair.live.timestamp.isoformat(),
+        pair.backtest.timestamp.isoformat(),
+    ]
+
+
+def unmatched_trade_row(source: str, trade: NormalizedTrade) -> list:
+    """One ``unmatched_trades.csv`` row; ``source`` is live_only/backtest_only."""
+    return [
+        source,
+        trade.client_order_id,
+        trade.occurrence,
+        trade.symbol,
+        trade.side,
+        str(trade.price),
+        str(trade.qty),
+        str(trade.fee),
+        str(trade.realized_pnl),
+        trade.timestamp.isoformat(),
+    ]
+
+
 def _robust_stat_rows(m: ValidationMetrics, prefix: str) -> list[tuple[str, str]]:
     """0070: the six robust-stat ``(key, value)`` CSV rows for one family.
 
@@ -88,52 +164,14 @@ class ComparatorReporter:
 
         with open(path, "w", newline="") as f:
             writer = csv.writer(f)
-            writer.writerow([
-                "client_order_id",
-                "occurrence",
-                "symbol",
-                "side",
-                "live_price",
-                "backtest_price",
-                "price_delta",
-                "live_qty",
-                "backtest_qty",
-                "qty_delta",
-                "live_fee",
-                "backtest_fee",
-                "fee_delta",
-                "live_pnl",
-                "backtest_pnl",
-                "pnl_delta",
-                "live_timestamp",
-                "backtest_timestamp",
-            ])
+            writer.writerow(MATCHED_TRADES_HEADER)
 
             # Zip directly — trade_deltas is computed in the same order as
             # matched pairs (metrics.py:173), so they're 1:1.
             for pair, delta in zip(
                 self._match_result.matched, self._metrics.trade_deltas
             ):
-                writer.writerow([
-                    pair.live.client_order_id,
-                    pair.live.occurrence,
-                    pair.live.symbol,
-                    pair.live.side,
-                    str(pair.live.price),
-                    str(pair.backtest.price),
-                    str(delta.price_delta),
-                    str(pair.live.qty),
-                    str(pair.backtest.qty),
-                    str(delta.qty_delta),
-                    str(pair.live.fee),
-                    str(pair.backtest.fee),
-                    str(delta.fee_delta),
-                    str(pair.live.realized_pnl),
-                    str(pair.backtest.realized_pnl),
-                    str(delta.pnl_delta),
-                    pair.live.timestamp.isoformat(),
-                    pair.backtest.timestamp.isoformat(),
-                ])
+                writer.writerow(matched_trade_row(pair, delta))
 
         logger.info("Exported %d matched trades to %s", len(self._match_result.matched), path)
 
@@ -143,46 +181,13 @@ class ComparatorReporter:
 
         with open(path, "w", newline="") as f:
             writer = csv.writer(f)
-            writer.writerow([
-                "source",
-                "client_order_id",
-                "occurrence",
-                "symbol",
-                "side",
-                "price",
-                "qty",
-                "fee",
-                "realized_pnl",
-                "timestamp",
-            ])
+            writer.writerow(UNMATCHED_TRADES_HEADER)
 
             for trade in self._match_result.live_only:
-                writer.writerow([
-                    "live_only",
-                    trade.client_order_id,
-                    trade.occurrence,
-                    trade.symbol,
-                    trade.side,
-                    str(trade.price),
-                    str(trade.qty),
-                    str(trade.fee),
-                    str(trade.realized_pnl),
-                    trade.timestamp.isoformat(),
-                ])
+                writer.writerow(unmatched_trade_row("live_only", trade))
 
             for trade in self._match_result.backtest_only:
-                writer.writerow([
-                    "backtest_only",
-                    trade.client_order_id,
-                    trade.occurrence,
-                    trade.symbol,
-                    trade.side,
-                    str(trade.price),
-                    str(trade.qty),
-                    str(trade.fee),
-                    str(trade.realized_pnl),
-                    trade.timestamp.isoformat(),
-                ])
+                writer.writerow(unmatched_trade_row("backtest_only", trade))
 
         total = len(self._match_result.live_only) + len(self._match_result.backtest_only)
         logger.info("Exported %d unmatched trades to %s", total, path)
@@ -421,23 +426,29 @@ class ComparatorReporter:
         emitted = sum(1 for p in self._position_pairs if p.live is not None)
         logger.info("Exported %d position pairs to %s", emitted, path)
 
-    def export_all(self, output_dir: Union[str, Path]) -> dict[str, Path]:
+    def export_all(
+        self, output_dir: Union[str, Path], include_trades: bool = True
+    ) -> dict[str, Path]:
         """Export all reports to a directory.
 
+        Args:
+            output_dir: Directory for the CSV files.
+            include_trades: Write matched/unmatched trade CSVs. The streaming
+                comparator writes those row by row and passes False.
+
         Returns:
             Dict mapping report type to file path.
         """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        paths = {
-            "matched_trades": output_dir / "matched_trades.csv",
-            "unmatched_trades": output_dir / "unmatched_trades.csv",
-            "validation_metrics": output_dir / "validation_metrics.csv",
-        }
-
-        self.export_matched_trades(paths["matched_trades"])
-        self.export_unmatched_trades(paths["unmatched_trades"])
+        paths: dict[str, Path] = {}
+        if include_trades:
+            paths["matched_trades"] = output_dir / "matched_trades.csv"
+            paths["unmatched_trades"] = output_dir / "unmatched_trades.csv"
+            self.export_matched_trades(paths["matched_trades"])
+            self.export_unmatched_trades(paths["unmatched_trades"])
+        paths["validation_metrics"] = output_dir / "validation_metrics.csv"
         self.export_metrics(paths["validation_metrics"])
 
         if self._equity_data:
@@ -0,0 +1,703 @@
+"""Streaming, chunked comparator for very large live/backtest trade sets.
+
+The batch path (``LiveTradeLoader`` -> ``TradeMatcher`` -> ``calculate_metrics``)
+holds every trade, every key set and every delta list in memory at once. This
+module does the same comparison in bounded memory:
+
+* live executions are paged from the DB by keyset and aggregated into trades
+  as soon as an order has been quiet for ``fill_window``;
+* backtest CSV rows are read one at a time;
+* both sides are re-ordered through a small watermark buffer into
+  ``(timestamp, client_order_id, side)`` order, so occurrences can be assigned
+  on the fly exactly as ``_assign_occurrences`` does;
+* ``StreamingMatcher`` merge-joins the two time-ordered streams on
+  ``(client_order_id, occurrence)`` with a bounded lookahead;
+* ``StreamingMetrics`` folds the join into a ``ValidationMetrics`` with
+  running sums plus a quantile summary per delta family -- an approximate
+  log-bucketed sketch by default, or an exact, disk-spilling one.
+
+Semantics differ from the batch path only at the lookahead boundary: pairs
+whose live and backtest timestamps are further apart than ``match_window``
+are reported as one live-only and one backtest-only trade, and partial fills
+of one order spread over more than ``fill_window`` become separate trades
+(even without an idle gap between them).
+"""
+
+import csv
+import heapq
+import itertools
+import logging
+import math
+import tempfile
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal, localcontext
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional, Protocol, Sequence, Union
+
+from sqlalchemy.orm import Session
+
+from grid_db import PrivateExecution, PrivateExecutionRepository
+from gridcore.intents import extract_client_order_prefix
+from gridcore.position import DirectionType
+
+from comparator.loader import (
+    NormalizedTrade,
+    _aggregate_fills,
+    _normalize_ts,
+    _trade_from_csv_row,
+)
+from comparator.matcher import MatchedTrade
+from comparator.metrics import (
+    ABS_THRESHOLD,
+    REL_K,
+    RobustStats,
+    TradeDelta,
+    ValidationMetrics,
+    _compute_trade_delta,
+)
+from comparator.reporter import (
+    MATCHED_TRADES_HEADER,
+    UNMATCHED_TRADES_HEADER,
+    matched_trade_row,
+    unmatched_trade_row,
+)
+
+logger = logging.getLogger(__name__)
+
+_ZERO = Decimal("0")
+
+DEFAULT_LOOKAHEAD = timedelta(minutes=10)
+"""Default fill window and match window of the streaming comparator."""
+
+DEFAULT_CHUNK_SIZE = 5000
+"""Default page size for keyset-paged live executions."""
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+"""Default relative error bound of ``QuantileSketch``."""
+
+DEFAULT_SPILL_CHUNK_SIZE = 100_000
+"""Values held in memory per family before ``SpillingQuantiles`` writes a run."""
+
+MATCHED = "matched"
+LIVE_ONLY = "live_only"
+BACKTEST_ONLY = "backtest_only"
+
+
+class MatchEvent(NamedTuple):
+    """One output row of ``StreamingMatcher.match``.
+
+    ``item`` is a ``MatchedTrade`` for ``MATCHED`` and a ``NormalizedTrade``
+    for ``LIVE_ONLY`` / ``BACKTEST_ONLY``.
+    """
+
+    kind: str
+    item: Union[MatchedTrade, NormalizedTrade]
+
+
+def _trade_order(trade: NormalizedTrade) -> tuple:
+    """Sort key shared with the batch loaders (see ``_assign_occurrences``)."""
+    return (trade.timestamp, trade.client_order_id, trade.side)
+
+
+def _reorder(
+    trades: Iterable[NormalizedTrade], window: timedelta
+) -> Iterator[NormalizedTrade]:
+    """Sort a nearly time-ordered stream with a ``window``-deep buffer.
+
+    A trade is released once a trade more than ``window`` newer has been
+    seen. Raises ValueError if a trade arrives older than one already
+    released, i.e. the input is out of order by more than ``window``.
+    """
+    heap: list[tuple] = []
+    seq = itertools.count()
+    newest: Optional[datetime] = None
+    released: Optional[tuple] = None
+    for trade in trades:
+        key = _trade_order(trade)
+        if released is not None and key < released:
+            raise ValueError(
+                f"trade {trade.client_order_id} at {trade.timestamp} is out of "
+                f"order by more than the {window} lookahead"
+            )
+        heapq.heappush(heap, (key, next(seq), trade))
+        if newest is None or trade.timestamp > newest:
+            newest = trade.timestamp
+        watermark = newest - window
+        while heap and heap[0][0][0] < watermark:
+            released, _, ready = heapq.heappop(heap)
+            yield ready
+    while heap:
+        _, _, ready = heapq.heappop(heap)
+        yield ready
+
+
+def _with_occurrences(trades: Iterable[NormalizedTrade]) -> Iterator[NormalizedTrade]:
+    """Streaming ``_assign_occurrences`` over an already-ordered stream."""
+    counts: dict[str, int] = defaultdict(int)
+    for trade in trades:
+        trade.occurrence = counts[trade.client_order_id]
+        counts[trade.client_order_id] += 1
+        yield trade
+
+
+def iter_live_trades(
+    session: Session,
+    run_id: str,
+    start_ts: datetime,
+    end_ts: datetime,
+    symbol: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    fill_window: timedelta = DEFAULT_LOOKAHEAD,
+) -> Iterator[NormalizedTrade]:
+    """Stream live trades in ``LiveTradeLoader.load`` order and shape.
+
+    Executions are grouped by ``(client_id, order_id)`` like the batch loader;
+    a group becomes a trade once no fill for it has been seen for
+    ``fill_window`` of exchange time, or once its first fill is more than
+    ``fill_window`` old.
+    """
+    repo = PrivateExecutionRepository(session)
+    executions = repo.iter_by_run_range(
+        run_id, start_ts, end_ts, symbol=symbol, batch_size=chunk_size,
+    )
+    return _with_occurrences(_reorder(_aggregate_live(executions, fill_window), fill_window))
+
+
+def _aggregate_live(
+    executions: Iterable[PrivateExecution], fill_window: timedelta
+) -> Iterator[NormalizedTrade]:
+    """Close ``(client_id, order_id)`` groups idle for, or spanning, more than ``fill_window``.
+
+    The span cap bounds an order that keeps filling without an idle gap:
+    its group is closed (and later fills start a new one) once it is
+    ``fill_window`` old, so no group is held, or emitted, later than that.
+    """
+    groups: dict[tuple[str, str], list[PrivateExecution]] = {}
+    first_fill: dict[tuple[str, str], datetime] = {}
+    last_fill: dict[tuple[str, str], datetime] = {}
+    # (ts, key) heaps; an entry is stale once its ts no longer matches.
+    idle: list[tuple[datetime, tuple[str, str]]] = []
+    aged: list[tuple[datetime, tuple[str, str]]] = []
+    raw = fallback_hits = emitted = 0
+    for ex in executions:
+        raw += 1
+        ts = _normalize_ts(ex.exchange_ts)
+        cutoff = ts - fill_window
+        for heap, marks in ((idle, last_fill), (aged, first_fill)):
+            while heap and heap[0][0] < cutoff:
+                seen, key = heapq.heappop(heap)
+                if marks.get(key) == seen:
+                    del first_fill[key], last_fill[key]
+                    emitted += 1
+                    yield _aggregate_fills(key[0], groups.pop(key))
+
+        link_prefix = extract_client_order_prefix(ex.order_link_id)
+        if link_prefix is None:
+            fallback_hits += 1
+        key = (link_prefix or ex.order_id, ex.order_id)
+        if key not in groups:
+            groups[key] = []
+            first_fill[key] = ts
+            heapq.heappush(aged, (ts, key))
+        groups[key].append(ex)
+        last_fill[key] = ts
+        heapq.heappush(idle, (ts, key))
+
+    for key, fills in groups.items():
+        emitted += 1
+        yield _aggregate_fills(key[0], fills)
+
+    if fallback_hits:
+        logger.info(
+            "Used order_id fallback for %d executions without order_link_id",
+            fallback_hits,
+        )
+    logger.info("Streamed %d live trades (%d raw executions)", emitted, raw)
+
+
+def iter_backtest_csv(
+    path: Union[str, Path], reorder_window: timedelta = DEFAULT_LOOKAHEAD
+) -> Iterator[NormalizedTrade]:
+    """Stream a backtest trades CSV in ``load_from_csv`` order and shape.
+
+    The export is written in fill order, so a ``reorder_window`` buffer is
+    enough to restore the ``(timestamp, client_order_id, side)`` order.
+    """
+    with open(path, "r", newline="") as f:
+        rows = (_trade_from_csv_row(row) for row in csv.DictReader(f))
+        yield from _with_occurrences(_reorder(rows, reorder_window))
+
+
+class StreamingMatcher:
+    """Merge-join of two time-ordered trade streams on ``(client_order_id, occurrence)``.
+
+    Trades wait at most ``match_window`` for their counterpart; older ones are
+    emitted as live-only / backtest-only. Events come out ordered by anchor
+    time (the live timestamp for matched pairs), ties broken by key -- the
+    order ``calculate_metrics`` folds matched pairs in.
+    """
+
+    def __init__(self, match_window: timedelta = DEFAULT_LOOKAHEAD):
+        self._window = match_window
+
+    def match(
+        self,
+        live_trades: Iterable[NormalizedTrade],
+        backtest_trades: Iterable[NormalizedTrade],
+    ) -> Iterator[MatchEvent]:
+        """Join both streams; each must be sorted by timestamp."""
+        pending_live: dict[tuple[str, int], NormalizedTrade] = {}
+        pending_bt: dict[tuple[str, int], NormalizedTrade] = {}
+        out: list[tuple] = []
+        seq = itertools.count()
+
+        def emit(anchor: NormalizedTrade, kind: str, item) -> None:
+            order = (anchor.timestamp, anchor.client_order_id, anchor.occurrence)
+            heapq.heappush(out, (order, next(seq), MatchEvent(kind, item)))
+
+        def expire(pending: dict, kind: str, cutoff: Optional[datetime]) -> None:
+            # Pending dicts fill in time order, so the oldest entry is first.
+            while pending:
+                key = next(iter(pending))
+                trade = pending[key]
+                if cutoff is not None and trade.timestamp >= cutoff:
+                    return
+                del pending[key]
+                emit(trade, kind, trade)
+
+        live_iter = iter(live_trades)
+        bt_iter = iter(backtest_trades)
+        live_next = next(live_iter, None)
+        bt_next = next(bt_iter, None)
+        while live_next is not None or bt_next is not None:
+            if bt_next is None or (
+                live_next is not None and live_next.timestamp <= bt_next.timestamp
+            ):
+                trade, own, other, is_live = live_next, pending_live, pending_bt, True
+                live_next = next(live_iter, None)
+            else:
+                trade, own, other, is_live = bt_next, pending_bt, pending_live, False
+                bt_next = next(bt_iter, None)
+
+            cutoff = trade.timestamp - self._window
+            expire(pending_live, LIVE_ONLY, cutoff)
+            expire(pending_bt, BACKTEST_ONLY, cutoff)
+
+            key = (trade.client_order_id, trade.occurrence)
+            counterpart = other.pop(key, None)
+            if counterpart is None:
+                own[key] = trade
+            elif is_live:
+                emit(trade, MATCHED, MatchedTrade(live=trade, backtest=counterpart))
+            else:
+                emit(counterpart, MATCHED, MatchedTrade(live=counterpart, backtest=trade))
+
+            while out and out[0][0][0] < cutoff:
+                yield heapq.heappop(out)[2]
+
+        expire(pending_live, LIVE_ONLY, None)
+        expire(pending_bt, BACKTEST_ONLY, None)
+        while out:
+            yield heapq.heappop(out)[2]
+
+
+class QuantileSummary(Protocol):
+    """Order statistics over a stream of non-negative Decimals."""
+
+    count: int
+
+    def add(self, value: Decimal) -> None:
+        """Record one value."""
+        ...
+
+    def ranked(self, ranks: Sequence[int]) -> list[Decimal]:
+        """Values at ascending 0-based ``ranks`` of the sorted stream."""
+        ...
+
+    def count_above(self, threshold: Decimal) -> int:
+        """Number of values strictly greater than ``threshold``."""
+        ...
+
+    def close(self) -> None:
+        """Release any resources held by the summary."""
+        ...
+
+
+class QuantileSketch:
+    """Log-bucketed quantile sketch with bounded relative error.
+
+    Every positive value lands in bucket ``ceil(log_gamma(v))`` with
+    ``gamma = (1 + a) / (1 - a)``; a rank query returns the bucket midpoint,
+    within ``a`` of the true value relative to it. Memory grows with the
+    log of the value range, not the number of values. Zeros are counted
+    exactly.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                f"relative_accuracy must be in (0, 1), got {relative_accuracy}"
+            )
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = defaultdict(int)
+        self._zeros = 0
+        self.count = 0
+
+    def add(self, value: Decimal) -> None:
+        self.count += 1
+        if value <= 0:
+            self._zeros += 1
+            return
+        self._buckets[math.ceil(math.log(float(value)) / self._log_gamma)] += 1
+
+    def _midpoint(self, index: int) -> Decimal:
+        return Decimal(repr(2 * self._gamma ** index / (self._gamma + 1)))
+
+    def _walk(self) -> Iterator[tuple[Decimal, int]]:
+        if self._zeros:
+            yield _ZERO, self._zeros
+        for index in sorted(self._buckets):
+            yield self._midpoint(index), self._buckets[index]
+
+    def ranked(self, ranks: Sequence[int]) -> list[Decimal]:
+        result: list[Decimal] = []
+        pending = iter(ranks)
+        rank = next(pending, None)
+        seen = 0
+        for value, n in self._walk():
+            seen += n
+            while rank is not None and rank < seen:
+                result.append(value)
+                rank = next(pending, None)
+        return result
+
+    def count_above(self, threshold: Decimal) -> int:
+        return sum(n for value, n in self._walk() if value > threshold)
+
+    def close(self) -> None:
+        pass
+
+
+class SpillingQuantiles:
+    """Exact order statistics that spill sorted runs to disk.
+
+    Values are buffered up to ``chunk_size``, sorted and written as one
+    text run per chunk; rank queries stream a ``heapq.merge`` of the runs,
+    so memory stays at one chunk plus one value per run.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path, None] = None,
+        chunk_size: int = DEFAULT_SPILL_CHUNK_SIZE,
+    ):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+        self._tmp = tempfile.TemporaryDirectory(
+            prefix="comparator-spill-", dir=directory,
+        )
+        self._chunk_size = chunk_size
+        self._buffer: list[Decimal] = []
+        self._runs: list[Path] = []
+        self.count = 0
+
+    def add(self, value: Decimal) -> None:
+        self.count += 1
+        self._buffer.append(value)
+        if len(self._buffer) >= self._chunk_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        self._buffer.sort()
+        run = Path(self._tmp.name) / f"run-{len(self._runs):06d}.txt"
+        with open(run, "w") as f:
+            f.writelines(f"{v}\n" for v in self._buffer)
+        self._runs.append(run)
+        self._buffer = []
+
+    @staticmethod
+    def _read_run(run: Path) -> Iterator[Decimal]:
+        with open(run) as f:
+            for line in f:
+                yield Decimal(line)
+
+    def _sorted(self) -> Iterator[Decimal]:
+        self._buffer.sort()
+        return heapq.merge(*(self._read_run(r) for r in self._runs), self._buffer)
+
+    def ranked(self, ranks: Sequence[int]) -> list[Decimal]:
+        result: list[Decimal] = []
+        pending = iter(ranks)
+        rank = next(pending, None)
+        for position, value in enumerate(self._sorted()):
+            while rank is not None and rank == position:
+                result.append(value)
+                rank = next(pending, None)
+            if rank is None:
+                break
+        return result
+
+    def count_above(self, threshold: Decimal) -> int:
+        return sum(1 for v in self._sorted() if v > threshold)
+
+    def close(self) -> None:
+        self._tmp.cleanup()
+
+
+@dataclass
+class _DeltaFamily:
+    """Running mean/max/std plus a quantile summary over one abs-delta stream."""
+
+    summary: QuantileSummary
+    total: Decimal = _ZERO
+    total_sq: Decimal = _ZERO
+    max: Decimal = _ZERO
+    over_abs_threshold: int = 0
+
+    def add(self, value: Decimal) -> None:
+        self.summary.add(value)
+        # Wide context: the sums must not round before the final division.
+        with localcontext() as ctx:
+            ctx.prec = 60
+            self.total += value
+            self.total_sq += value * value
+        if value > self.max:
+            self.max = value
+        if value > ABS_THRESHOLD:
+            self.over_abs_threshold += 1
+
+    @property
+    def count(self) -> int:
+        return self.summary.count
+
+    def mean(self) -> Decimal:
+        return self.total / self.count
+
+    def median(self) -> Decimal:
+        """``_decimal_median`` semantics (average of the middle two)."""
+        n = self.count
+        if n % 2 == 1:
+            return self.summary.ranked([n // 2])[0]
+        low, high = self.summary.ranked([n // 2 - 1, n // 2])
+        return (low + high) / 2
+
+    def robust(self) -> RobustStats:
+        """``_spike_stats`` semantics over the streamed values."""
+        n = self.count
+        median, p95 = self.summary.ranked([n // 2, min(int(n * 0.95), n - 1)])
+        with localcontext() as ctx:
+            ctx.prec = 60
+            variance = (self.total_sq - self.total * self.total / n) / n
+        std = variance.sqrt() if variance > 0 else _ZERO
+        spike_count_rel = (
+            self.summary.count_above(REL_K * median) if median > 0 else 0
+        )
+        return RobustStats(
+            median, p95, +std, self.max - median,
+            self.over_abs_threshold, spike_count_rel,
+        )
+
+
+@dataclass
+class _Correlation:
+    """Online Pearson correlation (Welford co-moments)."""
+
+    n: int = 0
+    mean_x: float = 0.0
+    mean_y: float = 0.0
+    m2_x: float = 0.0
+    m2_y: float = 0.0
+    co_moment: float = 0.0
+
+    def add(self, x: float, y: float) -> None:
+        self.n += 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.n
+        self.mean_y += dy / self.n
+        self.co_moment += dx * (y - self.mean_y)
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+
+    def value(self) -> float:
+        if self.n < 2:
+            return 0.0
+        denom = (self.m2_x * self.m2_y) ** 0.5
+        return self.co_moment / denom if denom else 0.0
+
+
+class StreamingMetrics:
+    """Fold ``MatchEvent``s into ``ValidationMetrics`` without keeping them.
+
+    Produces the same fields as ``calculate_metrics`` except
+    ``trade_deltas``, which stays empty (``StreamingReportWriter`` writes the
+    per-trade rows instead). With ``exact=False`` the medians, p95 and
+    relative spike counts come from a ``QuantileSketch``; with ``exact=True``
+    they are exact via ``SpillingQuantiles`` under ``spill_dir``.
+    """
+
+    def __init__(
+        self,
+        price_tolerance: Decimal = Decimal("0"),
+        qty_tolerance: Decimal = Decimal("0.001"),
+        exact: bool = False,
+        spill_dir: Union[str, Path, None] = None,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        spill_chunk_size: int = DEFAULT_SPILL_CHUNK_SIZE,
+    ):
+        def summary() -> QuantileSummary:
+            if exact:
+                return SpillingQuantiles(spill_dir, spill_chunk_size)
+            return QuantileSketch(relative_accuracy)
+
+        self._price_tolerance = price_tolerance
+        self._qty_tolerance = qty_tolerance
+        self._metrics = ValidationMetrics()
+        self._price = _DeltaFamily(summary())
+        self._qty = _DeltaFamily(summary())
+        self._pnl = _DeltaFamily(summary())
+        self._correlation = _Correlation()
+        self._time_delta_total = 0.0
+
+    def add(self, event: MatchEvent) -> Optional[TradeDelta]:
+        """Fold one event; returns the trade delta for matched pairs."""
+        m = self._metrics
+        if event.kind == LIVE_ONLY:
+            m.live_only_count += 1
+            m.total_live_volume += event.item.qty
+            return None
+        if event.kind == BACKTEST_ONLY:
+            m.backtest_only_count += 1
+            m.total_backtest_volume += event.item.qty
+            return None
+
+        pair: MatchedTrade = event.item
+        delta = _compute_trade_delta(pair)
+        m.matched_count += 1
+
+        abs_price = abs(delta.price_delta)
+        abs_qty = abs(delta.qty_delta)
+        self._price.add(abs_price)
+        self._qty.add(abs_qty)
+        self._pnl.add(abs(delta.pnl_delta))
+        if abs_price > self._price_tolerance or abs_qty > self._qty_tolerance:
+            m.breaches.append((delta.client_order_id, pair.live.occurrence))
+
+        m.total_live_fees += pair.live.fee
+        m.total_backtest_fees += pair.backtest.fee
+        m.total_live_pnl += pair.live.realized_pnl
+        m.total_backtest_pnl += pair.backtest.realized_pnl
+        self._correlation.add(float(m.total_live_pnl), float(m.total_backtest_pnl))
+        m.total_live_volume += pair.live.qty
+        m.total_backtest_volume += pair.backtest.qty
+
+        direction = pair.backtest.direction or pair.live.direction
+        if direction == DirectionType.LONG:
+            m.long_match_count += 1
+            m.long_pnl_delta += delta.pnl_delta
+        else:
+            m.short_match_count += 1
+            m.short_pnl_delta += delta.pnl_delta
+
+        self._time_delta_total += abs(delta.time_delta.total_seconds())
+        return delta
+
+    def result(self) -> ValidationMetrics:
+        """Finalize the aggregates; call once after the last event."""
+        m = self._metrics
+        m.total_live_trades = m.matched_count + m.live_only_count
+        m.total_backtest_trades = m.matched_count + m.backtest_only_count
+        m.match_rate = m.matched_count / m.total_live_trades if m.total_live_trades else 0.0
+        m.phantom_rate = (
+            m.backtest_only_count / m.total_backtest_trades
+            if m.total_backtest_trades else 0.0
+        )
+        if not m.matched_count:
+            return m
+
+        m.price_mean_abs_delta = self._price.mean()
+        m.price_median_abs_delta = self._price.median()
+        m.price_max_abs_delta = self._price.max
+        m.qty_mean_abs_delta = self._qty.mean()
+        m.qty_median_abs_delta = self._qty.median()
+        m.qty_max_abs_delta = self._qty.max
+
+        pnl_stats = self._pnl.robust()
+        m.pnl_median_abs_delta = pnl_stats.median
+        m.pnl_p95_abs_delta = pnl_stats.p95
+        m.pnl_std_abs_delta = pnl_stats.std
+        m.pnl_spike_intensity = pnl_stats.spike_intensity
+        m.pnl_spike_count_30c = pnl_stats.spike_count_abs
+        m.pnl_spike_count_relative_3 = pnl_stats.spike_count_rel
+
+        m.breaches_count = len(m.breaches)
+        m.fee_delta = m.total_backtest_fees - m.total_live_fees
+        m.cumulative_pnl_delta = m.total_backtest_pnl - m.total_live_pnl
+        m.pnl_correlation = self._correlation.value()
+        m.mean_time_delta_seconds = self._time_delta_total / m.matched_count
+        return m
+
+    def close(self) -> None:
+        """Drop spill files (exact mode)."""
+        for family in (self._price, self._qty, self._pnl):
+            family.summary.close()
+
+
+class StreamingReportWriter:
+    """Writes ``matched_trades.csv`` / ``unmatched_trades.csv`` row by row.
+
+    Same columns as ``ComparatorReporter``; rows are in event (time) order,
+    with live-only and backtest-only trades interleaved.
+    """
+
+    def __init__(self, output_dir: Union[str, Path]):
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.paths = {
+            "matched_trades": output_dir / "matched_trades.csv",
+            "unmatched_trades": output_dir / "unmatched_trades.csv",
+        }
+        self._files = [open(p, "w", newline="") for p in self.paths.values()]
+        self._matched = csv.writer(self._files[0])
+        self._unmatched = csv.writer(self._files[1])
+        self._matched.writerow(MATCHED_TRADES_HEADER)
+        self._unmatched.writerow(UNMATCHED_TRADES_HEADER)
+
+    def write(self, event: MatchEvent, delta: Optional[TradeDelta]) -> None:
+        if event.kind == MATCHED:
+            self._matched.writerow(matched_trade_row(event.item, delta))
+        else:
+            self._unmatched.writerow(unmatched_trade_row(event.kind, event.item))
+
+    def close(self) -> None:
+        for f in self._files:
+            f.close()
+
+    def __enter__(self) -> "StreamingReportWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def compare_streams(
+    live_trades: Iterable[NormalizedTrade],
+    backtest_trades: Iterable[NormalizedTrade],
+    metrics: StreamingMetrics,
+    match_window: timedelta = DEFAULT_LOOKAHEAD,
+    writer: Optional[StreamingReportWriter] = None,
+) -> ValidationMetrics:
+    """Join both streams, fold metrics and optionally write per-trade rows."""
+    for event in StreamingMatcher(match_window).match(live_trades, backtest_trades):
+        delta = metrics.add(event)
+        if writer is not None:
+            writer.write(event, delta)
+    result = metrics.result()
+    logger.info(
+        "Streaming match result: %d matched, %d live-only, %d backtest-only",
+        result.matched_count, result.live_only_count, result.backtest_only_count,
+    )
+    return result
@@ -7,6 +7,7 @@ from decimal import Decimal
 from grid_db import (
     DatabaseFactory,
     PrivateExecution,
+    PrivateExecutionRepository,
     User,
     BybitAccount,
     Strategy,
@@ -103,6 +104,28 @@ class TestLiveTradeLoader:
         assert t.fee == Decimal("0.02")
         assert t.source == "live"
 
+    def test_normalize_matches_load(self, db):
+        """Preloaded rows normalize exactly as load() does, without a session."""
+        run_id = self._seed_data(db)
+        ts = datetime(2025, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+        for i, link in enumerate(["client_1", "client_1", None]):
+            self._add_execution(
+                db, run_id, f"e{i}", link, "Sell",
+                Decimal("100000"), Decimal("0.001"), Decimal("0.01"), Decimal("0.5"),
+                ts + timedelta(seconds=i), order_id="oid_shared" if link else None,
+            )
+
+        window = (ts - timedelta(hours=1), ts + timedelta(hours=1))
+        with db.get_session() as session:
+            loaded = LiveTradeLoader(session).load(run_id, *window)
+            rows = PrivateExecutionRepository(session).get_by_run_range(run_id, *window)
+            session.expunge_all()
+
+        assert LiveTradeLoader.normalize(rows) == loaded
+        assert [(t.client_order_id, t.qty) for t in loaded] == [
+            ("client_1", Decimal("0.002")), ("oid_e2", Decimal("0.001")),
+        ]
+
     def test_aggregates_partial_fills(self, db):
         """Multiple executions with same order_link_id + order_id are aggregated."""
         run_id = self._seed_data(db)
@@ -89,6 +89,21 @@ def test_pair_live_before_backtest_within_tolerance(base_ts):
     assert metrics.position_pairs_unmatched_bt == 0
 
 
+def test_pair_mixed_tz_awareness(base_ts):
+    """Naive (SQLite) live rows pair with tz-aware backtest rows and vice versa."""
+    naive = base_ts.replace(tzinfo=None)
+    live = [_snap("Buy", naive + timedelta(seconds=1), source="live")]
+    bt = [_snap("Buy", base_ts, source="backtest")]
+
+    pairs = PositionComparator().pair_and_compare(live, bt)
+    assert pairs[0].live is live[0]
+
+    swapped = PositionComparator().pair_and_compare(
+        [_snap("Buy", base_ts, source="live")], [_snap("Buy", naive, source="backtest")],
+    )
+    assert swapped[0].live is not None
+
+
 def test_pair_outside_tolerance_unmatched(base_ts):
     """Bt with no live in tolerance window counts as unmatched, no consume."""
     live = [_snap("Buy", base_ts + timedelta(seconds=PAIR_TOLERANCE_S + 5), source="live")]
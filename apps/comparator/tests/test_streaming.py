@@ -0,0 +1,366 @@
+"""Tests for comparator.streaming (chunked, bounded-memory comparison)."""
+
+import csv
+import random
+from dataclasses import fields, replace
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from grid_db import BybitAccount, PrivateExecution, Run, RunType, Strategy, User
+from gridcore.position import DirectionType, SideType
+
+from comparator.config import ComparatorConfig
+from comparator.loader import (
+    BacktestTradeLoader,
+    LiveTradeLoader,
+    NormalizedTrade,
+    _assign_occurrences,
+)
+from comparator.main import main, run_streaming
+from comparator.matcher import TradeMatcher
+from comparator.metrics import calculate_metrics
+from comparator.streaming import (
+    BACKTEST_ONLY,
+    LIVE_ONLY,
+    MATCHED,
+    QuantileSketch,
+    SpillingQuantiles,
+    StreamingMatcher,
+    StreamingMetrics,
+    compare_streams,
+    iter_backtest_csv,
+    iter_live_trades,
+)
+
+T0 = datetime(2025, 1, 15, 12, 0, 0)
+CSV_HEADER = [
+    "trade_id", "timestamp", "symbol", "side", "direction", "price", "qty",
+    "notional", "realized_pnl", "commission", "order_id", "client_order_id", "strat_id",
+]
+
+
+def _trade(cid, seconds, source, occurrence=0, price="100000", pnl="0", side="Buy"):
+    return NormalizedTrade(
+        client_order_id=cid, symbol="BTCUSDT", side=SideType(side),
+        price=Decimal(price), qty=Decimal("0.001"), fee=Decimal("0.02"),
+        realized_pnl=Decimal(pnl), timestamp=T0 + timedelta(seconds=seconds),
+        source=source, direction=DirectionType.LONG, occurrence=occurrence,
+    )
+
+
+def _random_sides(seed=3, n=400):
+    """Live/backtest trade lists with ID reuse, jitter and one-sided trades."""
+    rng = random.Random(seed)
+    live, backtest = [], []
+    for i in range(n):
+        cid = f"cid{rng.randrange(40):02d}"
+        side = rng.choice(["Buy", "Sell"])
+        price = Decimal(100000 + rng.randrange(-500, 500))
+        pnl = Decimal(rng.randrange(-300, 300)) / 100
+        ts = T0 + timedelta(seconds=30 * i)
+        # One-sided trades get their own IDs so occurrences stay aligned.
+        only = rng.choice([None, "live", "backtest"] + [None] * 18)
+        if only:
+            cid = f"{only}-only-{i}"
+        if only != "backtest":
+            live.append(NormalizedTrade(
+                cid, "BTCUSDT", SideType(side), price, Decimal("0.001"),
+                Decimal("0.02"), pnl, ts, "live",
+            ))
+        if only != "live":
+            backtest.append(NormalizedTrade(
+                cid, "BTCUSDT", SideType(side),
+                price + Decimal(rng.randrange(0, 4)) / 10, Decimal("0.001"),
+                Decimal("0.021"), pnl + Decimal(rng.randrange(-50, 50)) / 100,
+                ts + timedelta(seconds=rng.randrange(0, 20)), "backtest",
+                DirectionType(rng.choice(["long", "short"])),
+            ))
+    return _sorted(live), _sorted(backtest)
+
+
+def _sorted(trades):
+    trades.sort(key=lambda t: (t.timestamp, t.client_order_id, t.side))
+    _assign_occurrences(trades)
+    return trades
+
+
+def _copies(trades):
+    return [replace(t) for t in trades]
+
+
+class TestStreamingMatcher:
+    def test_same_pairs_as_batch_matcher(self):
+        live, backtest = _random_sides()
+        batch = TradeMatcher().match(_copies(live), _copies(backtest))
+        events = list(StreamingMatcher(timedelta(minutes=5)).match(live, backtest))
+
+        def keys(kind):
+            items = [e.item for e in events if e.kind == kind]
+            if kind == MATCHED:
+                items = [p.live for p in items]
+            return sorted((t.client_order_id, t.occurrence) for t in items)
+
+        def batch_keys(items):
+            return sorted((t.client_order_id, t.occurrence) for t in items)
+
+        assert keys(MATCHED) == batch_keys(p.live for p in batch.matched)
+        assert keys(LIVE_ONLY) == batch_keys(batch.live_only)
+        assert keys(BACKTEST_ONLY) == batch_keys(batch.backtest_only)
+
+    def test_events_are_in_anchor_time_order(self):
+        live, backtest = _random_sides()
+        events = list(StreamingMatcher(timedelta(minutes=5)).match(live, backtest))
+        anchors = [
+            e.item.live.timestamp if e.kind == MATCHED else e.item.timestamp
+            for e in events
+        ]
+        assert anchors == sorted(anchors)
+
+    def test_counterpart_beyond_window_is_reported_one_sided(self):
+        live = [_trade("a", 0, "live"), _trade("b", 10, "live")]
+        backtest = [_trade("b", 15, "backtest"), _trade("a", 200, "backtest")]
+        events = list(StreamingMatcher(timedelta(seconds=60)).match(live, backtest))
+        assert [(e.kind, getattr(e.item, "client_order_id", None)) for e in events] == [
+            (LIVE_ONLY, "a"), (MATCHED, None), (BACKTEST_ONLY, "a"),
+        ]
+
+
+class TestQuantileSummaries:
+    VALUES = [Decimal(v) / 100 for v in random.Random(5).choices(range(0, 5000), k=2001)]
+
+    def test_spilling_is_exact(self, tmp_path):
+        spill = SpillingQuantiles(tmp_path, chunk_size=97)
+        for v in self.VALUES:
+            spill.add(v)
+        ordered = sorted(self.VALUES)
+        assert spill.ranked([0, 1000, 1900, 2000]) == [
+            ordered[0], ordered[1000], ordered[1900], ordered[2000],
+        ]
+        assert spill.count_above(Decimal("25")) == sum(1 for v in self.VALUES if v > 25)
+        assert len(list(tmp_path.glob("comparator-spill-*/run-*"))) == 20
+        spill.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_sketch_is_within_relative_accuracy(self):
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for v in self.VALUES:
+            sketch.add(v)
+        ordered = sorted(self.VALUES)
+        for rank, approx in zip([200, 1000, 1900], sketch.ranked([200, 1000, 1900])):
+            assert abs(approx - ordered[rank]) <= ordered[rank] * Decimal("0.0101")
+
+    def test_sketch_counts_zeros_exactly(self):
+        sketch = QuantileSketch()
+        for v in (Decimal("0"), Decimal("0"), Decimal("1")):
+            sketch.add(v)
+        assert sketch.ranked([0, 1]) == [Decimal("0"), Decimal("0")]
+        assert sketch.count_above(Decimal("0")) == 1
+
+    def test_sketch_rejects_bad_accuracy(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy=1.5)
+
+
+def _metric_values(m):
+    return {f.name: getattr(m, f.name) for f in fields(m) if f.name != "trade_deltas"}
+
+
+class TestStreamingMetrics:
+    def test_exact_mode_matches_calculate_metrics(self, tmp_path):
+        live, backtest = _random_sides()
+        batch = calculate_metrics(TradeMatcher().match(_copies(live), _copies(backtest)))
+        metrics = StreamingMetrics(exact=True, spill_dir=tmp_path, spill_chunk_size=50)
+        streamed = compare_streams(live, backtest, metrics, match_window=timedelta(minutes=5))
+        metrics.close()
+
+        expected, actual = _metric_values(batch), _metric_values(streamed)
+        assert actual.pop("pnl_correlation") == pytest.approx(expected.pop("pnl_correlation"))
+        assert actual.pop("pnl_std_abs_delta") == pytest.approx(
+            expected.pop("pnl_std_abs_delta"), rel=Decimal("1e-20"),
+        )
+        # Batch lists breaches in key order, streaming in time order.
+        assert sorted(actual.pop("breaches")) == sorted(expected.pop("breaches"))
+        assert actual == expected
+        assert streamed.trade_deltas == []
+
+    def test_sketch_mode_is_close(self):
+        live, backtest = _random_sides()
+        batch = calculate_metrics(TradeMatcher().match(_copies(live), _copies(backtest)))
+        streamed = compare_streams(live, backtest, StreamingMetrics())
+        assert streamed.matched_count == batch.matched_count
+        assert streamed.pnl_spike_count_30c == batch.pnl_spike_count_30c
+        for name in ("price_median_abs_delta", "pnl_median_abs_delta", "pnl_p95_abs_delta"):
+            want = getattr(batch, name)
+            assert abs(getattr(streamed, name) - want) <= want * Decimal("0.0101"), name
+
+    def test_no_matches_keeps_defaults(self):
+        streamed = compare_streams(
+            [_trade("a", 0, "live")], [_trade("b", 0, "backtest")], StreamingMetrics(),
+        )
+        assert (streamed.live_only_count, streamed.backtest_only_count) == (1, 1)
+        assert streamed.pnl_median_abs_delta == Decimal("0")
+        assert streamed.match_rate == 0.0
+
+
+class TestBacktestCsv:
+    def _write(self, path, rows):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADER)
+            for i, (ts, cid, side) in enumerate(rows):
+                writer.writerow([
+                    f"t{i}", ts, "BTCUSDT", side, "long", "100000", "0.001",
+                    "100", "0", "0.02", f"o{i}", cid, "s",
+                ])
+
+    def test_matches_load_from_csv(self, tmp_path):
+        path = tmp_path / "trades.csv"
+        self._write(path, [
+            ("2025-01-15T12:00:05", "b", "Buy"),
+            ("2025-01-15T12:00:00", "a", "Sell"),
+            ("2025-01-15T12:00:00", "a", "Buy"),
+            ("2025-01-15T12:01:00", "a", "Buy"),
+        ])
+        streamed = list(iter_backtest_csv(path, reorder_window=timedelta(seconds=10)))
+        assert streamed == BacktestTradeLoader().load_from_csv(path)
+        assert [t.occurrence for t in streamed] == [0, 1, 0, 2]
+
+    def test_disorder_beyond_window_raises(self, tmp_path):
+        path = tmp_path / "trades.csv"
+        self._write(path, [
+            ("2025-01-15T12:01:00", "a", "Buy"),
+            ("2025-01-15T12:05:00", "b", "Buy"),
+            ("2025-01-15T12:00:00", "c", "Buy"),
+        ])
+        with pytest.raises(ValueError, match="out of order"):
+            list(iter_backtest_csv(path, reorder_window=timedelta(seconds=30)))
+
+
+def _seed_run(db, executions):
+    with db.get_session() as session:
+        session.add(User(user_id="u1", username="test", email="t@t.com"))
+        session.add(BybitAccount(
+            account_id="acc1", user_id="u1", account_name="main", environment="testnet",
+        ))
+        session.add(Strategy(
+            strategy_id="s1", account_id="acc1", strategy_type="GridStrategy",
+            symbol="BTCUSDT", config_json={},
+        ))
+        session.add(Run(
+            run_id="run_1", user_id="u1", account_id="acc1", strategy_id="s1",
+            run_type=RunType.LIVE,
+        ))
+        session.flush()
+        for i, (seconds, link, order_id, side, qty, pnl, symbol) in enumerate(executions):
+            session.add(PrivateExecution(
+                run_id="run_1", account_id="acc1", symbol=symbol,
+                exec_id=f"e{i:03d}", order_id=order_id, order_link_id=link,
+                exchange_ts=T0 + timedelta(seconds=seconds), side=side,
+                exec_price=Decimal(100000 + i), exec_qty=Decimal(qty),
+                exec_fee=Decimal("0.01"), closed_pnl=Decimal(pnl),
+            ))
+
+
+LIVE_EXECUTIONS = [
+    # partial fills of one order, then ID reuse with a new order_id
+    (0, "gridA", "o1", "Buy", "0.001", "0", "BTCUSDT"),
+    (0, "gridB", "o2", "Sell", "0.002", "0.5", "BTCUSDT"),
+    (3, "gridA", "o1", "Buy", "0.002", "0", "BTCUSDT"),
+    (60, None, "o3", "Buy", "0.001", "0", "BTCUSDT"),
+    (90, "gridC", "o4", "Buy", "0.001", "0", "ETHUSDT"),
+    (120, "gridA", "o5", "Buy", "0.001", "0", "BTCUSDT"),
+    (125, "gridA", "o5", "Buy", "0.004", "0", "BTCUSDT"),
+    (400, "gridB", "o6", "Sell", "0.001", "-0.1", "BTCUSDT"),
+]
+
+
+class TestLiveStream:
+    @pytest.mark.parametrize("chunk_size", [1, 3, 100])
+    def test_matches_live_trade_loader(self, db, chunk_size):
+        _seed_run(db, LIVE_EXECUTIONS)
+        with db.get_session() as session:
+            batch = LiveTradeLoader(session).load(
+                "run_1", T0, T0 + timedelta(hours=1), symbol="BTCUSDT",
+            )
+            streamed = list(iter_live_trades(
+                session, "run_1", T0, T0 + timedelta(hours=1), symbol="BTCUSDT",
+                chunk_size=chunk_size, fill_window=timedelta(seconds=30),
+            ))
+        assert streamed == batch
+        assert [(t.client_order_id, t.occurrence, t.qty) for t in streamed[:2]] == [
+            ("gridB", 0, Decimal("0.002")), ("gridA", 0, Decimal("0.003")),
+        ]
+
+    def test_fills_further_apart_than_window_split(self, db):
+        _seed_run(db, LIVE_EXECUTIONS)
+        with db.get_session() as session:
+            streamed = list(iter_live_trades(
+                session, "run_1", T0, T0 + timedelta(hours=1), symbol="BTCUSDT",
+                fill_window=timedelta(seconds=2),
+            ))
+        assert [t.qty for t in streamed if t.client_order_id == "gridA"][:2] == [
+            Decimal("0.001"), Decimal("0.002"),
+        ]
+
+    def test_fills_spanning_more_than_window_split_without_idle_gap(self, db):
+        # One order filling every 10 s for 70 s: never idle for the 30 s window.
+        _seed_run(db, [
+            (s, "gridA", "o1", "Buy", "0.001", "0", "BTCUSDT") for s in range(0, 80, 10)
+        ])
+        with db.get_session() as session:
+            streamed = list(iter_live_trades(
+                session, "run_1", T0, T0 + timedelta(hours=1), symbol="BTCUSDT",
+                fill_window=timedelta(seconds=30),
+            ))
+        # Groups close once older than 30 s: fills 0-30, 40-70.
+        assert [(t.qty, (t.timestamp - T0).total_seconds()) for t in streamed] == [
+            (Decimal("0.004"), 30), (Decimal("0.004"), 70),
+        ]
+        assert [t.occurrence for t in streamed] == [0, 1]
+
+
+class TestRunStreaming:
+    def test_cli_streaming_writes_reports(self, db, tmp_path):
+        _seed_run(db, LIVE_EXECUTIONS)
+        csv_path = tmp_path / "bt.csv"
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_HEADER)
+            writer.writerow([
+                "t1", "2025-01-15T12:00:03", "BTCUSDT", "Buy", "long", "100001",
+                "0.003", "300", "0", "0.02", "x", "gridA", "s",
+            ])
+            writer.writerow([
+                "t2", "2025-01-15T13:30:00", "BTCUSDT", "Buy", "long", "99000",
+                "0.001", "99", "0", "0.02", "y", "phantom", "s",
+            ])
+
+        output = tmp_path / "out"
+        with patch("comparator.main.DatabaseFactory", return_value=db):
+            code = main([
+                "--run-id", "run_1", "--backtest-trades", str(csv_path),
+                "--start", "2025-01-15", "--end", "2025-01-15", "--symbol", "BTCUSDT",
+                "--output", str(output), "--streaming", "--exact-quantiles",
+                "--lookahead", "30", "--chunk-size", "2", "--spill-dir", str(tmp_path),
+            ])
+
+        assert code == 0
+        with open(output / "matched_trades.csv") as f:
+            matched = list(csv.DictReader(f))
+        assert [(r["client_order_id"], Decimal(r["live_qty"])) for r in matched] == [
+            ("gridA", Decimal("0.003")),
+        ]
+        with open(output / "unmatched_trades.csv") as f:
+            sources = [r["source"] for r in csv.DictReader(f)]
+        assert sources.count("live_only") == 4
+        assert sources[-1] == "backtest_only"
+        metrics = dict(csv.reader(open(output / "validation_metrics.csv")))
+        assert metrics["matched_count"] == "1"
+        assert not list(tmp_path.glob("comparator-spill-*"))
+
+    def test_empty_backtest_returns_1(self, tmp_path):
+        config = ComparatorConfig(run_id="run_1", output_dir=str(tmp_path), streaming=True)
+        assert run_streaming(config, iter([])) == 1
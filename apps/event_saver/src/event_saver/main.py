@@ -162,6 +162,7 @@ class EventSaver:
             api_key="",
             api_secret="",
             testnet=self._config.testnet,
+            rate_limit_caller="event_saver",
         )
 
         # Initialize reconciler
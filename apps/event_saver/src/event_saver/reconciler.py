@@ -267,6 +267,7 @@ class GapReconciler:
                 api_key=api_key,
                 api_secret=api_secret,
                 testnet=testnet,
+                rate_limit_caller="event_saver",
             )
 
             # Get executions from REST API (with pagination)
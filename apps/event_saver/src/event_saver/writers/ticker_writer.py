@@ -12,11 +12,25 @@ from gridcore.events import TickerEvent
 
 logger = logging.getLogger(__name__)
 
+# Feature 0103: with dedupe on, an unchanged L1 state is still written once
+# this long after the symbol's last written row. Readers that measure time
+# between rows — live_check's MAX(exchange_ts) freshness gate and the >60 s
+# gap report — then see a quiet market as quiet, not as an outage.
+DEDUPE_HEARTBEAT_SECONDS = 30.0
+
 
 class TickerWriter:
     """Buffers and bulk-inserts ticker snapshots.
 
     Uses the same buffering pattern as TradeWriter/ExecutionWriter.
+
+    With ``dedupe_unchanged`` (feature 0103), a ticker whose L1 state
+    (last/mark/bid1/ask1 price and funding rate) equals the previous one
+    accepted for its symbol is dropped before buffering, unless
+    ``dedupe_heartbeat_seconds`` have passed since that row: the heartbeat
+    keeps consecutive rows at most that far apart. Replay/backtest carry the
+    last state forward, so the stored stream replays identically; per-day
+    tick counts (importer density report) do drop.
     """
 
     def __init__(
@@ -24,10 +38,16 @@ class TickerWriter:
         db: DatabaseFactory,
         batch_size: int = 100,
         flush_interval: float = 5.0,
+        dedupe_unchanged: bool = False,
+        dedupe_heartbeat_seconds: float = DEDUPE_HEARTBEAT_SECONDS,
     ):
         self._db = db
         self._batch_size = batch_size
         self._flush_interval = flush_interval
+        self._dedupe_unchanged = dedupe_unchanged
+        self._dedupe_heartbeat_seconds = dedupe_heartbeat_seconds
+        # symbol -> (L1 state, exchange_ts) of the last accepted ticker.
+        self._last_state: dict[str, tuple[tuple, datetime]] = {}
 
         self._buffer: deque[TickerEvent] = deque()
         self._last_flush: datetime = datetime.now(UTC)
@@ -37,13 +57,32 @@ class TickerWriter:
 
         self._total_written = 0
         self._flush_count = 0
+        self._skipped_unchanged = 0
 
     async def write(self, events: list[TickerEvent]) -> None:
         async with self._lock:
+            if self._dedupe_unchanged:
+                events = self._drop_unchanged(events)
             self._buffer.extend(events)
             if len(self._buffer) >= self._batch_size:
                 await self._flush_internal()
 
+    def _drop_unchanged(self, events: list[TickerEvent]) -> list[TickerEvent]:
+        kept = []
+        for e in events:
+            state = (e.last_price, e.mark_price, e.bid1_price, e.ask1_price, e.funding_rate)
+            last = self._last_state.get(e.symbol)
+            if (
+                last is not None
+                and last[0] == state
+                and (e.exchange_ts - last[1]).total_seconds() < self._dedupe_heartbeat_seconds
+            ):
+                self._skipped_unchanged += 1
+                continue
+            self._last_state[e.symbol] = (state, e.exchange_ts)
+            kept.append(e)
+        return kept
+
     async def flush(self) -> None:
         async with self._lock:
             await self._flush_internal()
@@ -120,5 +159,6 @@ class TickerWriter:
             "total_written": self._total_written,
             "flush_count": self._flush_count,
             "buffer_size": len(self._buffer),
+            "skipped_unchanged": self._skipped_unchanged,
         }
 
@@ -283,6 +283,52 @@ class TestTickerWriter:
             await writer.flush()
             assert len(writer._buffer) == 0
 
+    @pytest.mark.asyncio
+    async def test_dedupe_unchanged_drops_repeated_l1_state(self, mock_db, sample_ticker_events):
+        """With dedupe on, a ticker repeating its symbol's last L1 state is skipped."""
+        from dataclasses import replace
+        from datetime import timedelta
+
+        first, second = sample_ticker_events
+        repeat = replace(second, exchange_ts=second.exchange_ts + timedelta(seconds=1))
+        other_symbol = replace(second, symbol="ETHUSDT")
+        writer = TickerWriter(db=mock_db, batch_size=100, dedupe_unchanged=True)
+
+        await writer.write([first, second, repeat])
+        await writer.write([repeat, other_symbol, first])
+
+        assert list(writer._buffer) == [first, second, other_symbol, first]
+        assert writer.get_stats()["skipped_unchanged"] == 2
+
+    @pytest.mark.asyncio
+    async def test_dedupe_keeps_heartbeat_row(self, mock_db, sample_ticker_events):
+        """An unchanged state is still written once the heartbeat elapses."""
+        from dataclasses import replace
+        from datetime import timedelta
+
+        first = sample_ticker_events[0]
+        repeats = [
+            replace(first, exchange_ts=first.exchange_ts + timedelta(seconds=s))
+            for s in (10, 29, 30, 45, 61)
+        ]
+        writer = TickerWriter(
+            db=mock_db, batch_size=100, dedupe_unchanged=True, dedupe_heartbeat_seconds=30,
+        )
+
+        await writer.write([first, *repeats])
+
+        kept = [(e.exchange_ts - first.exchange_ts).total_seconds() for e in writer._buffer]
+        assert kept == [0, 30, 61]
+        assert writer.get_stats()["skipped_unchanged"] == 3
+
+    @pytest.mark.asyncio
+    async def test_dedupe_off_by_default(self, mock_db, sample_ticker_events):
+        writer = TickerWriter(db=mock_db, batch_size=100)
+
+        await writer.write(sample_ticker_events + sample_ticker_events[-1:])
+
+        assert len(writer._buffer) == 3
+
 
 class TestExecutionWriter:
     """Tests for ExecutionWriter."""
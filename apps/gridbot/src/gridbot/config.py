@@ -7,7 +7,7 @@ import os
 import re
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 import yaml
 from dotenv import load_dotenv
@@ -278,6 +278,21 @@ class StrategyConfig(BaseModel):
         ),
     )
 
+    # Order amend — collapse cancel+place pairs into one amend. Default OFF: an
+    # amended order keeps the orderLinkId of the price it was first placed at,
+    # so its exchange rows no longer join to the replacement's client_order_id.
+    amend_enabled: bool = Field(
+        default=False,
+        description=(
+            "When True, a cancel and a place in the same dispatch batch whose "
+            "orders differ only in price/qty (same side, direction, reduce-only "
+            "and post-only) go out as one Bybit amend instead: one order-rate "
+            "slot and no gap with nothing resting (chase re-peg, grid-edge "
+            "shifts). Side flips (side_mismatch) and duplicate-healing cancels "
+            "are never amended."
+        ),
+    )
+
     # Feature 0067 — suppress LowBalanceSkip log spam (issue #164). Both
     # default-on and kill-switchable; with BOTH False the preflight emits the
     # per-intent DEBUG line exactly as today (byte-for-byte current behavior).
@@ -459,6 +474,42 @@ class GridbotConfig(BaseModel):
         description="Database connection URL",
     )
 
+    # Grid state persistence (gridcore.persistence backends).
+    grid_state_backend: Literal["json", "sqlite"] = Field(
+        default="json",
+        description=(
+            "Storage for saved grid levels. 'json' rewrites one shared file "
+            "(db/grid_anchor.json) on every save. 'sqlite' keeps one row per "
+            "strategy in db/grid_anchor.sqlite3 (WAL), committing all pending "
+            "saves in one transaction; on first start it imports the JSON file, "
+            "which is left in place for rollback."
+        ),
+    )
+
+    # grid_state_snapshots DB writer (gridbot.writers.GridStateWriter).
+    grid_snapshot_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="Most grid snapshots committed in one multi-row INSERT.",
+    )
+    grid_snapshot_batch_latency: float = Field(
+        default=0.05,
+        ge=0,
+        description=(
+            "Seconds a queued grid snapshot may wait for others (any strat) "
+            "to share its commit. 0 batches only what is already queued."
+        ),
+    )
+    grid_snapshot_coalesce: bool = Field(
+        default=False,
+        description=(
+            "Within one batch, insert only the latest snapshot per strategy. "
+            "Intermediate grids superseded inside the batch window are not "
+            "recorded (counted as total_coalesced); replay then cannot seed "
+            "from those exact instants."
+        ),
+    )
+
     # Feature 0082 (issue #185) — operational observability status file.
     status_file_path: str = Field(
         default="/tmp/gridbot_status.json",
@@ -490,6 +541,16 @@ class GridbotConfig(BaseModel):
         default=61.0,
         description="Seconds between periodic order reconciliation (0 to disable)",
     )
+    min_tick_interval: float = Field(
+        default=0.0,
+        ge=0,
+        description=(
+            "Minimum seconds between the starts of two main-loop ticks. The "
+            "loop otherwise wakes as soon as a WS event arrives; a small "
+            "floor (e.g. 0.02) batches event floods into fewer ticks while "
+            "tickers keep coalescing to the latest. 0 = no floor."
+        ),
+    )
     wallet_cache_interval: float = Field(
         default=300.0,
         description="Seconds to cache wallet balance (0 to disable caching)",
@@ -522,6 +583,34 @@ class GridbotConfig(BaseModel):
         description="Seconds to wait for REST API calls (positions, wallet balance)",
     )
 
+    # Order entry transport (bybit_adapter.WebSocketTradeClient).
+    order_entry_transport: Literal["rest", "ws"] = Field(
+        default="rest",
+        description=(
+            "How orders are placed, amended and cancelled. 'ws' keeps one "
+            "authenticated WebSocket trade session per account and falls back "
+            "to REST while that socket is down or timing out. Round trips are "
+            "recorded per transport (ws_*/rest_* latency histograms)."
+        ),
+    )
+    ws_order_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        description=(
+            "Seconds to wait for a WS order-entry response. A timed-out "
+            "request may still have reached Bybit, so it fails like a REST "
+            "timeout rather than being re-sent over REST."
+        ),
+    )
+    ws_order_max_timeouts: int = Field(
+        default=3,
+        ge=1,
+        description=(
+            "Consecutive WS order-entry timeouts after which the socket counts "
+            "as unhealthy (REST is used) until the health check reconnects it."
+        ),
+    )
+
     # Auth error cooldown
     auth_cooldown_minutes: int = Field(
         default=30,
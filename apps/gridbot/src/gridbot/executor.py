@@ -1,7 +1,8 @@
 """Intent executor for converting strategy intents to Bybit API calls.
 
 The executor is the bridge between the pure strategy logic (gridcore)
-and the exchange. It handles the actual order placement and cancellation.
+and the exchange. It handles the actual order placement and cancellation,
+over REST or, when configured, the WebSocket trade API.
 """
 
 import logging
@@ -9,19 +10,31 @@ import re
 import time
 from dataclasses import dataclass
 from datetime import datetime, UTC
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 from bybit_adapter.rest_client import BybitRestClient
+from bybit_adapter.ws_trade_client import TradeSocketUnavailableError, WebSocketTradeClient
 from bybit_adapter.error_codes import (
     INSUFFICIENT_BALANCE,
     ORDER_LINK_ID_DUPLICATE,
     ORDER_QTY_TRUNCATED_TO_ZERO,
 )
-from gridcore.intents import PlaceLimitIntent, CancelIntent
+from gridcore.intents import AmendIntent, PlaceLimitIntent, CancelIntent
 from gridcore.position import DirectionType
 from gridbot.order_link_id import make_order_link_id
 from gridbot.safety_caps import SafetyCaps
-from gridbot.health import HealthMetrics
+from gridbot.health import (
+    LATENCY_ENGINE_TO_SUBMIT,
+    LATENCY_REST_AMEND,
+    LATENCY_REST_CANCEL,
+    LATENCY_REST_PLACE,
+    LATENCY_TICK_TO_ACK,
+    LATENCY_WS_AMEND,
+    LATENCY_WS_CANCEL,
+    LATENCY_WS_PLACE,
+    HealthMetrics,
+    latency_key,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -44,6 +57,16 @@ _CATEGORY_TO_REST_CODE = {
     "network": "network",
 }
 
+# Round-trip latency metric per (operation, order-entry transport).
+_ROUND_TRIP_METRICS = {
+    ("place_order", "rest"): LATENCY_REST_PLACE,
+    ("place_order", "ws"): LATENCY_WS_PLACE,
+    ("cancel_order", "rest"): LATENCY_REST_CANCEL,
+    ("cancel_order", "ws"): LATENCY_WS_CANCEL,
+    ("amend_order", "rest"): LATENCY_REST_AMEND,
+    ("amend_order", "ws"): LATENCY_WS_AMEND,
+}
+
 # Matches both our _check_response format [NNNNN] and pybit's native format (ErrCode: NNNNN)
 _ERR_CODE_RE = re.compile(r"(?:\[(\d+)\]|\(ErrCode:\s*(\d+)\))")
 
@@ -164,8 +187,8 @@ class CancelResult:
 class IntentExecutor:
     """Executes trading intents against Bybit API.
 
-    Converts PlaceLimitIntent and CancelIntent objects from gridcore
-    into actual API calls to Bybit.
+    Converts PlaceLimitIntent, CancelIntent and AmendIntent objects from
+    gridcore into actual API calls to Bybit.
 
     In shadow mode, logs intents without executing them.
 
@@ -189,6 +212,8 @@ class IntentExecutor:
         safety_caps: Optional[SafetyCaps] = None,
         clock: Callable[[], float] = time.monotonic,
         health_metrics: Optional[HealthMetrics] = None,
+        account_name: str = "",
+        ws_trade_client: Optional[WebSocketTradeClient] = None,
     ):
         """Initialize executor.
 
@@ -210,8 +235,18 @@ class IntentExecutor:
             health_metrics: Optional shared ``HealthMetrics`` collector (feature
                 0082 / issue #185). The orchestrator passes its shared instance;
                 None for direct/test callers (then metric recording is inert).
+            account_name: Account label for the per-account/symbol latency
+                histograms (engine->submit, REST round trips).
+            ws_trade_client: Optional WS order-entry session. When set,
+                place/cancel/amend go over it and fall back to ``rest_client``
+                whenever the socket is down or unhealthy (nothing was sent).
+                Round trips are recorded under the ``ws_*`` latency metrics.
         """
         self._client = rest_client
+        self._ws_trade_client = ws_trade_client
+        # Transport of the most recent order-entry call ("rest" / "ws"), for
+        # its latency metric (also on the exception path).
+        self._last_transport = "rest"
         self._shadow_mode = shadow_mode
         self._position_idx_long = position_idx_long
         self._position_idx_short = position_idx_short
@@ -229,6 +264,25 @@ class IntentExecutor:
         # The orchestrator passes its shared HealthMetrics; None for direct/test
         # callers (then every record_* below is skipped — no behavior change).
         self._health_metrics = health_metrics
+        self._account_name = account_name
+        # perf_counter() when the current runner.on_ticker call started, set by
+        # the orchestrator around it (begin_tick/end_tick). None outside a
+        # ticker-driven dispatch (retry queue, order sync): no engine->submit.
+        self._tick_started_at: Optional[float] = None
+        self._tick_received_at: Optional[float] = None
+
+    def begin_tick(self, started_at: float, received_at: Optional[float] = None) -> None:
+        """Mark the start of engine work for the engine->submit latency.
+
+        ``received_at`` (same perf_counter clock) is when the ticker arrived
+        off the WS, for the end-to-end tick->ack latency; None skips it.
+        """
+        self._tick_started_at = started_at
+        self._tick_received_at = received_at
+
+    def end_tick(self) -> None:
+        self._tick_started_at = None
+        self._tick_received_at = None
 
     @property
     def shadow_mode(self) -> bool:
@@ -297,6 +351,36 @@ class IntentExecutor:
         else:
             self._auth_failure_count = 0
 
+    @property
+    def ws_trade_client(self) -> Optional[WebSocketTradeClient]:
+        """WS order-entry session, or None for REST-only order entry."""
+        return self._ws_trade_client
+
+    def _submit(self, method: str, **kwargs: Any) -> Any:
+        """Call order-entry ``method`` over the WS trade socket, else REST.
+
+        Falls back to REST only when the socket refused the request before
+        sending it; a WS timeout or reject propagates like a REST one.
+        """
+        if self._ws_trade_client is not None:
+            self._last_transport = "ws"
+            try:
+                return getattr(self._ws_trade_client, method)(**kwargs)
+            except TradeSocketUnavailableError as e:
+                logger.debug(f"WS order entry unavailable, using REST: {e}")
+                if self._health_metrics is not None:
+                    self._health_metrics.record_order_entry_fallback()
+        self._last_transport = "rest"
+        return getattr(self._client, method)(**kwargs)
+
+    def _record_round_trip(self, method: str, symbol: str, seconds: float) -> None:
+        if self._health_metrics is not None:
+            self._health_metrics.record_latency(
+                _ROUND_TRIP_METRICS[(method, self._last_transport)],
+                latency_key(self._account_name, symbol),
+                seconds,
+            )
+
     def execute_place(self, intent: PlaceLimitIntent) -> OrderResult:
         """Execute a place order intent.
 
@@ -351,6 +435,7 @@ class IntentExecutor:
                     error="safety_cap_rate_limit",
                 )
 
+        submit_at: Optional[float] = None
         try:
             # Determine position index based on direction
             position_idx = self._get_position_idx(intent.direction)
@@ -360,7 +445,15 @@ class IntentExecutor:
             # triggers ErrCode 110072 "OrderLinkedID is duplicate" in a tight loop.
             # The runner assigns one wire id per placement lifecycle so retries
             # remain idempotent; direct callers fall back to the generated id above.
-            result = self._client.place_order(
+            submit_at = time.perf_counter()
+            if self._health_metrics is not None and self._tick_started_at is not None:
+                self._health_metrics.record_latency(
+                    LATENCY_ENGINE_TO_SUBMIT,
+                    latency_key(self._account_name, intent.symbol),
+                    submit_at - self._tick_started_at,
+                )
+            result = self._submit(
+                "place_order",
                 symbol=intent.symbol,
                 side=intent.side,
                 order_type="Limit",
@@ -373,6 +466,15 @@ class IntentExecutor:
                 # Default GTC == today's implicit behavior for every other order.
                 time_in_force="PostOnly" if intent.post_only else "GTC",
             )
+            if self._health_metrics is not None:
+                acked_at = time.perf_counter()
+                self._record_round_trip("place_order", intent.symbol, acked_at - submit_at)
+                if self._tick_received_at is not None:
+                    self._health_metrics.record_latency(
+                        LATENCY_TICK_TO_ACK,
+                        latency_key(self._account_name, intent.symbol),
+                        acked_at - self._tick_received_at,
+                    )
 
             order_id = result.get("orderId")
             logger.info(
@@ -396,6 +498,11 @@ class IntentExecutor:
 
         except Exception as e:
             logger.error(f"Failed to place order: {e}")
+            # Failed submits (timeouts especially) belong in the round trip.
+            if submit_at is not None:
+                self._record_round_trip(
+                    "place_order", intent.symbol, time.perf_counter() - submit_at
+                )
             self._handle_error(str(e))
             if self._health_metrics is not None:
                 self._health_metrics.record_reject(self._classify_error(str(e)))
@@ -422,10 +529,13 @@ class IntentExecutor:
             return CancelResult(success=True)
 
         try:
-            success = self._client.cancel_order(
+            submit_at = time.perf_counter()
+            success = self._submit(
+                "cancel_order",
                 symbol=intent.symbol,
                 order_id=intent.order_id,
             )
+            self._record_round_trip("cancel_order", intent.symbol, time.perf_counter() - submit_at)
 
             if success:
                 logger.info(
@@ -450,14 +560,83 @@ class IntentExecutor:
                 self._health_metrics.record_cancel(success=False)
             return CancelResult(success=False, error=str(e))
 
+    def execute_amend(self, intent: AmendIntent) -> OrderResult:
+        """Execute an amend intent: move a resting order to a new price/qty.
+
+        Subject to the C4 rate limit like a placement: it replaces a cancel +
+        place pair, of which only the place counted. The order keeps its
+        exchange order_id and orderLinkId.
+
+        Args:
+            intent: AmendIntent from the runner.
+
+        Returns:
+            OrderResult with the (unchanged) order_id if successful.
+        """
+        place = intent.place
+
+        if self._shadow_mode:
+            logger.info(
+                f"[SHADOW] Would amend order: {intent.symbol} "
+                f"order_id={intent.order_id} qty={place.qty} price={place.price} "
+                f"reason={intent.reason}"
+            )
+            return OrderResult(success=True, order_id=intent.order_id)
+
+        if self._safety_caps is not None:
+            now = self._clock()
+            if self._safety_caps.rate_limited(now):
+                if (now - self._rate_limit_warn_last) >= _RATE_LIMIT_WARN_THROTTLE_SEC:
+                    self._rate_limit_warn_last = now
+                    logger.warning(
+                        f"Safety cap rate limit: dropping amend of {intent.symbol} "
+                        f"order_id={intent.order_id} to price={place.price} (not submitted)"
+                    )
+                if self._health_metrics is not None:
+                    self._health_metrics.record_reject("rate_limit")
+                return OrderResult(success=False, error="safety_cap_rate_limit")
+
+        submit_at = time.perf_counter()
+        try:
+            result = self._submit(
+                "amend_order",
+                symbol=intent.symbol,
+                order_id=intent.order_id,
+                qty=str(place.qty),
+                price=str(place.price),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to amend order {intent.order_id}: {e}")
+            self._record_round_trip("amend_order", intent.symbol, time.perf_counter() - submit_at)
+            if self._health_metrics is not None:
+                self._health_metrics.record_amend(success=False)
+            self._handle_error(str(e))
+            return OrderResult(success=False, error=str(e))
+
+        self._record_round_trip("amend_order", intent.symbol, time.perf_counter() - submit_at)
+        if self._health_metrics is not None:
+            self._health_metrics.record_amend(success=True)
+        logger.info(
+            f"Amended order: {intent.symbol} order_id={intent.order_id} "
+            f"qty={place.qty} price={place.price} reason={intent.reason}"
+        )
+        self._auth_failure_count = 0
+        if self._safety_caps is not None:
+            self._safety_caps.record_accepted_submission(self._clock())
+        return OrderResult(
+            success=True,
+            order_id=result.get("orderId") or intent.order_id,
+            order_link_id=result.get("orderLinkId"),
+        )
+
     def execute_batch(
         self,
-        intents: list[PlaceLimitIntent | CancelIntent],
+        intents: list[PlaceLimitIntent | CancelIntent | AmendIntent],
     ) -> list[OrderResult | CancelResult]:
         """Execute a batch of intents sequentially.
 
         Args:
-            intents: List of PlaceLimitIntent or CancelIntent.
+            intents: List of PlaceLimitIntent, CancelIntent or AmendIntent.
 
         Returns:
             List of results in same order as intents.
@@ -469,6 +648,8 @@ class IntentExecutor:
                 result = self.execute_place(intent)
             elif isinstance(intent, CancelIntent):
                 result = self.execute_cancel(intent)
+            elif isinstance(intent, AmendIntent):
+                result = self.execute_amend(intent)
             else:
                 logger.warning(f"Unknown intent type: {type(intent)}")
                 continue
@@ -6,6 +6,11 @@ sweep all run there), the same model as SafetyCaps / AuthCooldownManager — no
 locking required. A snapshot is built once per ~10s health sweep and written to a
 JSON status file; it COMPLEMENTS the gridbot-health CLI (it does NOT touch the
 skill-owned health_state.json).
+
+Latency histograms (tick-to-order path, per-phase ``_tick`` durations, loop
+lag) ride along in ``HealthMetrics.latency``. Each is an HDR-style log-linear
+``LatencyHistogram`` with a fixed bucket bound, so memory stays constant no
+matter how long the bot runs.
 """
 
 import json
@@ -17,6 +22,27 @@ from typing import Any, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
+# Latency metric names (HealthMetrics.record_latency). Tick-to-order metrics are
+# keyed "<account>/<symbol>"; tick phases by phase name; loop lag by "main".
+LATENCY_EXCHANGE_TO_RECEIVE = "exchange_to_receive"
+LATENCY_RECEIVE_TO_ENGINE = "receive_to_engine"
+LATENCY_ON_TICKER = "on_ticker"
+LATENCY_ENGINE_TO_SUBMIT = "engine_to_submit"
+LATENCY_REST_PLACE = "rest_place_round_trip"
+LATENCY_REST_CANCEL = "rest_cancel_round_trip"
+LATENCY_REST_AMEND = "rest_amend_round_trip"
+# Same round trips over the WS trade socket (executor ws_trade_client), so the
+# two order-entry transports can be compared side by side.
+LATENCY_WS_PLACE = "ws_place_round_trip"
+LATENCY_WS_CANCEL = "ws_cancel_round_trip"
+LATENCY_WS_AMEND = "ws_amend_round_trip"
+LATENCY_TICK_TO_ACK = "tick_to_ack"  # WS receive -> place acknowledged (end to end)
+LATENCY_TICK_PHASE = "tick_phase"
+LATENCY_LOOP_LAG = "loop_lag"
+
+# Reported percentiles (snapshot keys p50_ms ... p999_ms).
+_PERCENTILES = ((50.0, "p50_ms"), (90.0, "p90_ms"), (99.0, "p99_ms"), (99.9, "p999_ms"))
+
 
 class HealthState(StrEnum):
     """Overall bot health. ``str``-valued so it serializes directly to JSON."""
@@ -60,6 +86,100 @@ def worst_state(states: Iterable[HealthState]) -> HealthState:
     return worst
 
 
+def latency_key(account: str, symbol: str) -> str:
+    """Label for per-account/symbol latency histograms."""
+    return f"{account}/{symbol}"
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of durations, in whole microseconds.
+
+    Values below ``2**sub_bucket_bits`` us get one bucket each; every power of
+    two above that is split into ``2**sub_bucket_bits`` linear sub-buckets, so
+    any recorded value is reported within ``1/2**sub_bucket_bits`` (~6% at the
+    default 4 bits) of its true value. Values above ``clamp_us`` (default ~1.2h)
+    are clamped. Buckets are a sparse dict bounded by ~(log2(clamp_us) - bits +
+    1) * 2**bits entries (~470 by default), independent of the count.
+
+    Percentiles report the bucket's upper bound (capped at the exact max), the
+    conservative choice for latency SLOs.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 4, clamp_us: int = 2**32) -> None:
+        if sub_bucket_bits < 1:
+            raise ValueError(f"sub_bucket_bits must be >= 1, got {sub_bucket_bits}")
+        self._bits = sub_bucket_bits
+        self._clamp_us = clamp_us
+        self._buckets: dict[int, int] = defaultdict(int)
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def _index(self, value_us: int) -> int:
+        shift = value_us.bit_length() - self._bits - 1
+        if shift < 0:
+            return value_us
+        return ((shift + 1) << self._bits) + (value_us >> shift) - (1 << self._bits)
+
+    def _upper_bound(self, index: int) -> int:
+        if index < (1 << self._bits):
+            return index
+        shift = (index >> self._bits) - 1
+        mantissa = (index & ((1 << self._bits) - 1)) + (1 << self._bits)
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Record one duration; negative values (clock skew) count as zero."""
+        value_us = min(max(int(seconds * 1e6), 0), self._clamp_us)
+        self._buckets[self._index(value_us)] += 1
+        self.count += 1
+        self.total_us += value_us
+        if self.min_us is None or value_us < self.min_us:
+            self.min_us = value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    def percentile(self, pct: float) -> int:
+        """Value (us) at or below which ``pct`` percent of samples fall."""
+        if self.count == 0:
+            return 0
+        rank = max(1, -(-self.count * pct // 100))  # ceil, at least the first sample
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max_us)
+        return self.max_us
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._buckets)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add ``other``'s samples (same ``sub_bucket_bits``) into this one."""
+        if other._bits != self._bits:
+            raise ValueError("cannot merge histograms with different sub_bucket_bits")
+        for index, n in other._buckets.items():
+            self._buckets[index] += n
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def as_dict(self) -> dict:
+        summary = {
+            "count": self.count,
+            "min_ms": (self.min_us or 0) / 1e3,
+            "mean_ms": round(self.total_us / self.count / 1e3, 3) if self.count else 0.0,
+            "max_ms": self.max_us / 1e3,
+        }
+        for pct, key in _PERCENTILES:
+            summary[key] = self.percentile(pct) / 1e3
+        return summary
+
+
 class HealthMetrics:
     """Process-lifetime monotonic counters (reset only on restart).
 
@@ -77,8 +197,14 @@ class HealthMetrics:
         self.orders_rejected: dict[str, int] = defaultdict(int)
         self.cancels = 0
         self.cancels_failed = 0
+        self.amends = 0
+        self.amends_failed = 0
         self.rest_errors_by_code: dict[str, int] = defaultdict(int)
+        self.order_entry_fallbacks = 0  # WS order entry unavailable -> sent over REST
         self.ws_reconnects: dict[str, int] = defaultdict(int)  # 'public' / 'private'
+        # metric name -> label -> histogram. Labels are bounded by config
+        # (accounts x symbols, fixed phase names), so the map is bounded too.
+        self.latency: dict[str, dict[str, LatencyHistogram]] = defaultdict(dict)
 
     def record_place(self, *, shadow: bool) -> None:
         if shadow:
@@ -95,12 +221,28 @@ class HealthMetrics:
         else:
             self.cancels_failed += 1
 
+    def record_amend(self, *, success: bool) -> None:
+        if success:
+            self.amends += 1
+        else:
+            self.amends_failed += 1
+
     def record_rest_error(self, code: str) -> None:
         self.rest_errors_by_code[code] += 1
 
+    def record_order_entry_fallback(self) -> None:
+        self.order_entry_fallbacks += 1
+
     def record_ws_reconnect(self, kind: str) -> None:
         self.ws_reconnects[kind] += 1
 
+    def record_latency(self, metric: str, label: str, seconds: float) -> None:
+        by_label = self.latency[metric]
+        histogram = by_label.get(label)
+        if histogram is None:
+            histogram = by_label[label] = LatencyHistogram()
+        histogram.record(seconds)
+
     def as_dict(self) -> dict:
         return {
             "orders_placed": self.orders_placed,
@@ -108,8 +250,15 @@ class HealthMetrics:
             "orders_rejected": dict(self.orders_rejected),
             "cancels": self.cancels,
             "cancels_failed": self.cancels_failed,
+            "amends": self.amends,
+            "amends_failed": self.amends_failed,
             "rest_errors_by_code": dict(self.rest_errors_by_code),
+            "order_entry_fallbacks": self.order_entry_fallbacks,
             "ws_reconnects": dict(self.ws_reconnects),
+            "latency": {
+                metric: {label: h.as_dict() for label, h in by_label.items()}
+                for metric, by_label in self.latency.items()
+            },
         }
 
 
@@ -0,0 +1,494 @@
+"""Load-test gridbot against the local Bybit stand-in exchange.
+
+Runs the real ``Orchestrator`` (rate-limited REST clients, WS clients,
+normalizer, runners, executors, reconcilers) for N accounts x M symbols
+against ``bybit_adapter.standin.StandInExchange``, drives prices from a
+seeded random walk or from recorder ticks replayed at ``--speed`` times real
+time, and reports throughput, main-loop lag, rate-limiter waits and the
+tick-to-order latency histograms from ``HealthMetrics``.
+
+Nothing touches the network: the stand-in is plugged in through the
+orchestrator's ``session_factory`` / ``ws_factory`` / ``trade_ws_factory`` seams, so a run needs no
+API keys and places no real orders.
+
+Usage:
+    python -m gridbot.loadtest --accounts 4 --symbols 2 --ticks 3000 --speed 10
+    python -m gridbot.loadtest --database-url sqlite:///recorder.db \\
+        --symbols 1 --start 2025-01-15T00:00:00 --end 2025-01-15T01:00:00 \\
+        --speed 60 --output loadtest.json
+    python -m gridbot.loadtest --order-entry ws --rest-latency-ms 20 --ws-latency-ms 5
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import random
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from bybit_adapter.standin import ORDER_NOT_EXISTS, StandInExchange
+from grid_db import DatabaseFactory, DatabaseSettings, TickerSnapshot
+
+from gridbot.config import AccountConfig, GridbotConfig, StrategyConfig
+from gridbot.health import (
+    LATENCY_LOOP_LAG,
+    LATENCY_ON_TICKER,
+    LATENCY_TICK_PHASE,
+    LatencyHistogram,
+)
+from gridbot.notifier import Notifier
+from gridbot.orchestrator import Orchestrator
+
+logger = logging.getLogger(__name__)
+
+
+class PriceTick(NamedTuple):
+    """One published price: ``offset`` seconds after the start of the path."""
+
+    offset: float
+    symbol: str
+    price: Decimal
+
+
+@dataclass(frozen=True)
+class InstrumentSpec:
+    """Stand-in instrument plus the price a synthetic path starts from."""
+
+    tick_size: str
+    qty_step: str
+    start_price: str
+
+
+DEFAULT_INSTRUMENTS: dict[str, InstrumentSpec] = {
+    "BTCUSDT": InstrumentSpec("0.1", "0.001", "100000"),
+    "ETHUSDT": InstrumentSpec("0.01", "0.01", "3500"),
+    "SOLUSDT": InstrumentSpec("0.01", "0.1", "200"),
+    "XRPUSDT": InstrumentSpec("0.0001", "1", "2.5"),
+}
+_FALLBACK_INSTRUMENT = InstrumentSpec("0.01", "0.1", "100")
+
+
+def instrument_spec(symbol: str) -> InstrumentSpec:
+    return DEFAULT_INSTRUMENTS.get(symbol, _FALLBACK_INSTRUMENT)
+
+
+def default_symbols(count: int) -> list[str]:
+    """``count`` symbols: the known instruments first, then ``SYM<i>USDT``."""
+    known = list(DEFAULT_INSTRUMENTS)
+    return known[:count] + [f"SYM{i}USDT" for i in range(len(known), count)]
+
+
+def synthetic_price_path(
+    symbols: list[str],
+    ticks: int,
+    interval: float = 0.1,
+    volatility: float = 0.0005,
+    seed: int = 0,
+) -> Iterator[PriceTick]:
+    """Seeded Gaussian random walk, one tick per symbol every ``interval`` s.
+
+    ``volatility`` is the per-tick standard deviation of the relative price
+    change. Prices are rounded to each symbol's tick size.
+    """
+    rng = random.Random(seed)
+    prices = {s: float(instrument_spec(s).start_price) for s in symbols}
+    ticks_per_symbol = {s: Decimal(instrument_spec(s).tick_size) for s in symbols}
+    for i in range(ticks):
+        for symbol in symbols:
+            prices[symbol] *= 1.0 + rng.gauss(0.0, volatility)
+            tick = ticks_per_symbol[symbol]
+            price = (Decimal(str(prices[symbol])) / tick).quantize(Decimal("1")) * tick
+            yield PriceTick(i * interval, symbol, price)
+
+
+def recorded_price_path(
+    db: DatabaseFactory,
+    symbols: list[str],
+    start: datetime,
+    end: datetime,
+    batch_size: int = 1000,
+) -> Iterator[PriceTick]:
+    """Recorder ticker snapshots for ``symbols`` in ``[start, end]``, time-merged.
+
+    Each symbol is paged by ``exchange_ts`` (keyset, like the backtest data
+    provider); offsets are relative to the earliest snapshot of the merge.
+    """
+    streams = [_recorded_symbol(db, s, start, end, batch_size) for s in symbols]
+    origin: Optional[datetime] = None
+    for ts, symbol, price in heapq.merge(*streams):
+        if origin is None:
+            origin = ts
+        yield PriceTick((ts - origin).total_seconds(), symbol, price)
+
+
+def _recorded_symbol(
+    db: DatabaseFactory, symbol: str, start: datetime, end: datetime, batch_size: int
+) -> Iterator[tuple[datetime, str, Decimal]]:
+    cursor: Optional[datetime] = None
+    while True:
+        with db.get_session() as session:
+            query = (
+                session.query(TickerSnapshot.exchange_ts, TickerSnapshot.last_price)
+                .filter(TickerSnapshot.symbol == symbol)
+                .filter(TickerSnapshot.exchange_ts <= end)
+            )
+            if cursor is None:
+                query = query.filter(TickerSnapshot.exchange_ts >= start)
+            else:
+                query = query.filter(TickerSnapshot.exchange_ts > cursor)
+            rows = query.order_by(TickerSnapshot.exchange_ts).limit(batch_size).all()
+        for ts, price in rows:
+            yield ts, symbol, Decimal(price)
+        if len(rows) < batch_size:
+            return
+        cursor = rows[-1][0]
+
+
+@dataclass
+class LoadTestConfig:
+    """Shape of one load-test run."""
+
+    accounts: int = 2
+    symbols: list[str] = field(default_factory=lambda: ["BTCUSDT"])
+    speed: float = 1.0  # path seconds per wall second
+    rest_latency: float = 0.0  # seconds added to every stand-in REST call
+    ws_trade_latency: float = 0.0  # the same for stand-in trade socket requests
+    order_entry: str = "rest"  # GridbotConfig.order_entry_transport
+    grid_count: int = 20
+    grid_step: float = 0.2
+    amount: str = "100"  # USDT per order
+    initial_balance: Decimal = Decimal("100000")
+    settle: float = 0.5  # seconds to keep running after the last tick
+
+
+def build_gridbot_config(cfg: LoadTestConfig) -> GridbotConfig:
+    """One strategy per account x symbol, all against the stand-in."""
+    accounts = [
+        AccountConfig(name=f"acct{i}", api_key=f"loadtest-key-{i}", api_secret="loadtest")
+        for i in range(cfg.accounts)
+    ]
+    strategies = [
+        StrategyConfig(
+            strat_id=f"{account.name}_{symbol.lower()}",
+            account=account.name,
+            symbol=symbol,
+            grid_count=cfg.grid_count,
+            grid_step=cfg.grid_step,
+            amount=cfg.amount,
+        )
+        for account in accounts
+        for symbol in cfg.symbols
+    ]
+    return GridbotConfig(
+        accounts=accounts,
+        strategies=strategies,
+        database_url="",
+        status_file_enabled=False,
+        order_entry_transport=cfg.order_entry,
+    )
+
+
+@dataclass
+class LoadTestReport:
+    """Result of ``run_load_test``; ``as_dict`` is the JSON report."""
+
+    accounts: int
+    symbols: list[str]
+    wall_seconds: float
+    path_ticks: int
+    dispatches: int
+    max_behind_seconds: float
+    orders_placed: int
+    orders_cancelled: int
+    orders_filled: int
+    place_rejected: int
+    cancel_missed: int
+    rate_limit_waits: int
+    rate_limit_wait_seconds: float
+    latency: dict[str, dict]
+    exchange: dict
+
+    def as_dict(self) -> dict:
+        wall = self.wall_seconds or 1.0
+        coalesced = self.path_ticks * self.accounts - self.dispatches
+        return {
+            "accounts": self.accounts,
+            "symbols": self.symbols,
+            "wall_seconds": self.wall_seconds,
+            "path_ticks": self.path_ticks,
+            "ticks_per_second": self.path_ticks / wall,
+            "dispatches": self.dispatches,
+            # Runners see only the latest ticker per main-loop iteration.
+            "coalesced_fraction": (
+                max(coalesced, 0) / (self.path_ticks * self.accounts)
+                if self.path_ticks and self.accounts else 0.0
+            ),
+            "max_behind_seconds": self.max_behind_seconds,
+            "orders": {
+                "placed": self.orders_placed,
+                "cancelled": self.orders_cancelled,
+                "filled": self.orders_filled,
+                "place_rejected": self.place_rejected,
+                # Cancels of orders that filled first (reconciled, not an error).
+                "cancel_missed": self.cancel_missed,
+                "placed_per_second": self.orders_placed / wall,
+            },
+            "rate_limiter": {
+                "waits": self.rate_limit_waits,
+                "wait_seconds": self.rate_limit_wait_seconds,
+            },
+            "latency": self.latency,
+            "exchange": self.exchange,
+        }
+
+
+def run_load_test(
+    cfg: LoadTestConfig,
+    path: Iterable[PriceTick],
+    work_dir: Path,
+) -> LoadTestReport:
+    """Run gridbot against a fresh stand-in exchange while replaying ``path``.
+
+    The orchestrator's main loop runs on the calling thread (as in
+    ``gridbot.main``); a driver thread publishes the path, waits ``settle``
+    seconds and then requests a stop.
+    """
+    ticks = list(path)
+    exchange = StandInExchange(
+        initial_balance=cfg.initial_balance,
+        rest_latency=cfg.rest_latency,
+        ws_trade_latency=cfg.ws_trade_latency,
+    )
+    for symbol in cfg.symbols:
+        spec = instrument_spec(symbol)
+        exchange.add_instrument(symbol, tick_size=spec.tick_size, qty_step=spec.qty_step)
+    # Runners build their grid from the first ticker; the stand-in needs a
+    # last price to match arriving orders against.
+    for symbol in cfg.symbols:
+        first = next((t.price for t in ticks if t.symbol == symbol), None)
+        if first is None:
+            raise ValueError(f"Price path has no ticks for {symbol}")
+        exchange.publish_ticker(symbol, first)
+
+    orchestrator = Orchestrator(
+        build_gridbot_config(cfg),
+        db=None,
+        anchor_store_path=str(work_dir / "grid_state.json"),
+        notifier=Notifier(),
+        session_factory=exchange.http,
+        ws_factory=exchange.websocket,
+        trade_ws_factory=exchange.trade_websocket,
+    )
+    max_behind = 0.0
+
+    def drive() -> None:
+        nonlocal max_behind
+        started = time.perf_counter()
+        for tick in ticks:
+            if not orchestrator.running:
+                return
+            delay = started + tick.offset / cfg.speed - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                max_behind = max(max_behind, -delay)
+            exchange.publish_ticker(tick.symbol, tick.price)
+        time.sleep(cfg.settle)
+        orchestrator.request_stop()
+
+    exchange.start()
+    driver = threading.Thread(target=drive, name="loadtest-driver", daemon=True)
+    try:
+        orchestrator.start()
+        started = time.perf_counter()
+        driver.start()
+        orchestrator.run()
+        wall = time.perf_counter() - started
+    finally:
+        orchestrator.stop()
+        if driver.is_alive():
+            driver.join(timeout=5.0)
+        exchange.close()
+
+    metrics = orchestrator.health_metrics
+    latency = {}
+    for metric, by_label in metrics.latency.items():
+        if metric in (LATENCY_TICK_PHASE, LATENCY_LOOP_LAG):
+            latency.update({
+                f"{metric}/{label}": hist.as_dict() for label, hist in by_label.items()
+            })
+            continue
+        merged = LatencyHistogram()
+        for hist in by_label.values():
+            merged.merge(hist)
+        latency[metric] = merged.as_dict()
+    dispatches = sum(h.count for h in metrics.latency.get(LATENCY_ON_TICKER, {}).values())
+    limiter = orchestrator.rate_limit_status().values()
+    stats = exchange.stats
+    return LoadTestReport(
+        accounts=cfg.accounts,
+        symbols=list(cfg.symbols),
+        wall_seconds=wall,
+        path_ticks=len(ticks),
+        dispatches=dispatches,
+        max_behind_seconds=max_behind,
+        orders_placed=stats.orders_placed,
+        orders_cancelled=stats.orders_cancelled,
+        orders_filled=stats.orders_filled,
+        place_rejected=sum(
+            n for code, n in stats.rejects.items() if code != ORDER_NOT_EXISTS
+        ),
+        cancel_missed=stats.rejects.get(ORDER_NOT_EXISTS, 0),
+        rate_limit_waits=sum(int(s["waits"]) for s in limiter),
+        rate_limit_wait_seconds=sum(float(s["wait_seconds"]) for s in limiter),
+        latency=latency,
+        exchange=stats.as_dict(),
+    )
+
+
+def _format_report(report: dict) -> str:
+    orders = report["orders"]
+    lines = [
+        f"{report['accounts']} accounts x {len(report['symbols'])} symbols, "
+        f"{report['path_ticks']} ticks in {report['wall_seconds']:.2f}s "
+        f"({report['ticks_per_second']:.0f}/s, "
+        f"{report['coalesced_fraction']:.0%} coalesced, "
+        f"driver max behind {report['max_behind_seconds'] * 1e3:.1f} ms)",
+        f"orders: {orders['placed']} placed ({orders['placed_per_second']:.1f}/s), "
+        f"{orders['cancelled']} cancelled, {orders['filled']} filled, "
+        f"{orders['place_rejected']} rejected, "
+        f"{orders['cancel_missed']} cancels too late",
+        f"rate limiter: {report['rate_limiter']['waits']} waits, "
+        f"{report['rate_limiter']['wait_seconds']:.2f}s",
+        f"{'latency':<32} {'count':>8} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}",
+    ]
+    for name, summary in sorted(report["latency"].items()):
+        if not summary["count"]:
+            continue
+        lines.append(
+            f"{name:<32} {summary['count']:>8} {summary['p50_ms']:>9.3f} "
+            f"{summary['p99_ms']:>9.3f} {summary['max_ms']:>9.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Load-test gridbot against a local Bybit stand-in exchange",
+    )
+    parser.add_argument("--accounts", type=int, default=2, help="Number of accounts")
+    parser.add_argument("--symbols", type=int, default=1, help="Symbols per account")
+    parser.add_argument(
+        "--ticks", type=int, default=1000,
+        help="Synthetic ticks per symbol (ignored with --database-url)",
+    )
+    parser.add_argument(
+        "--interval-ms", type=float, default=100.0,
+        help="Synthetic path spacing between ticks in ms (default: 100)",
+    )
+    parser.add_argument(
+        "--speed", type=float, default=1.0,
+        help="Replay speed multiplier vs. path time (default: 1.0)",
+    )
+    parser.add_argument(
+        "--rest-latency-ms", type=float, default=0.0,
+        help="Latency added to every stand-in REST call in ms (default: 0)",
+    )
+    parser.add_argument(
+        "--order-entry", choices=("rest", "ws"), default="rest",
+        help="Order entry transport (default: rest)",
+    )
+    parser.add_argument(
+        "--ws-latency-ms", type=float, default=0.0,
+        help="Latency added to every stand-in trade socket request in ms (default: 0)",
+    )
+    parser.add_argument("--grid-count", type=int, default=20)
+    parser.add_argument("--grid-step", type=float, default=0.2)
+    parser.add_argument("--amount", type=str, default="100", help="USDT per order")
+    parser.add_argument("--balance", type=str, default="100000", help="USDT per account")
+    parser.add_argument(
+        "--settle", type=float, default=0.5,
+        help="Seconds to keep running after the last tick (default: 0.5)",
+    )
+    parser.add_argument(
+        "--database-url", type=str, default=None,
+        help="Replay recorder ticker snapshots from this database instead of "
+        "a synthetic path",
+    )
+    parser.add_argument("--start", type=str, default=None, help="Recorded range start (ISO)")
+    parser.add_argument("--end", type=str, default=None, help="Recorded range end (ISO)")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic path seed")
+    parser.add_argument("--output", type=str, default=None, help="Write JSON report here")
+    parser.add_argument(
+        "--work-dir", type=str, default=None,
+        help="Directory for the grid state file (default: a temporary directory)",
+    )
+    parser.add_argument("--log-level", type=str, default="WARNING")
+    args = parser.parse_args(argv)
+
+    if args.accounts < 1 or args.symbols < 1:
+        parser.error("--accounts and --symbols must be at least 1")
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+    if args.database_url and not (args.start and args.end):
+        parser.error("--database-url requires --start and --end")
+
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.WARNING),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    symbols = default_symbols(args.symbols)
+    cfg = LoadTestConfig(
+        accounts=args.accounts,
+        symbols=symbols,
+        speed=args.speed,
+        rest_latency=args.rest_latency_ms / 1e3,
+        ws_trade_latency=args.ws_latency_ms / 1e3,
+        order_entry=args.order_entry,
+        grid_count=args.grid_count,
+        grid_step=args.grid_step,
+        amount=args.amount,
+        initial_balance=Decimal(args.balance),
+        settle=args.settle,
+    )
+    if args.database_url:
+        db = DatabaseFactory(DatabaseSettings(database_url=args.database_url))
+        path: Iterable[PriceTick] = recorded_price_path(
+            db, symbols, datetime.fromisoformat(args.start), datetime.fromisoformat(args.end)
+        )
+    else:
+        path = synthetic_price_path(
+            symbols, args.ticks, interval=args.interval_ms / 1e3, seed=args.seed
+        )
+
+    try:
+        if args.work_dir:
+            work_dir = Path(args.work_dir)
+            work_dir.mkdir(parents=True, exist_ok=True)
+            report = run_load_test(cfg, path, work_dir).as_dict()
+        else:
+            with tempfile.TemporaryDirectory(prefix="gridbot-loadtest-") as tmp:
+                report = run_load_test(cfg, path, Path(tmp)).as_dict()
+    except ValueError as e:
+        logger.error(f"Load test failed: {e}")
+        return 1
+
+    print(_format_report(report))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+            f.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
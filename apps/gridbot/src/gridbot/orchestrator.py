@@ -14,22 +14,22 @@ import time
 from collections import deque
 from datetime import datetime, UTC
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Callable, Optional
 from uuid import UUID
 
 from bybit_adapter.rest_client import BybitRestClient
 from bybit_adapter.ws_client import PublicWebSocketClient, PrivateWebSocketClient
+from bybit_adapter.ws_trade_client import WebSocketTradeClient
 from bybit_adapter.normalizer import BybitNormalizer
 from grid_db import DatabaseFactory
 from grid_db import Run, RunRepository, Strategy, BybitAccount, User
 from grid_db.identity import account_id_for, strategy_id_for, user_id_for
 from gridcore import (
     DirectionType,
-    GridStateStore,
     InstrumentInfo,
     TickerEvent,
 )
-from gridcore.persistence import grid_fingerprint
+from gridcore.persistence import grid_fingerprint, open_grid_state_store
 from gridcore.intents import CancelIntent
 
 from gridbot.config import GridbotConfig, AccountConfig, StrategyConfig
@@ -42,17 +42,23 @@ from gridbot.retry_queue import RetryQueue
 from gridbot.position_fetcher import PositionFetcher, _POSITION_TICK_BASE
 from gridbot.auth_cooldown_manager import AuthCooldownManager
 from gridbot.health import (
+    LATENCY_EXCHANGE_TO_RECEIVE,
+    LATENCY_LOOP_LAG,
+    LATENCY_ON_TICKER,
+    LATENCY_RECEIVE_TO_ENGINE,
+    LATENCY_TICK_PHASE,
     HealthMetrics,
     HealthState,
     HealthStatusWriter,
     build_snapshot,
+    latency_key,
 )
 from gridbot.writers import GridStateWriter
 
 _HEALTH_CHECK_INTERVAL = 10  # seconds
 _WS_HEALTH_CHECK_INTERVAL = 10.0  # seconds — bbu2 ENSURE_SOCKET_INTERVAL parity
 _STATUS_WRITE_WARN_THROTTLE = 60.0  # seconds — throttle health status-write error logs (0082)
-_CHECK_INTERVAL = 0.1  # 100 ms main loop tick (bbu2 value)
+_MAX_IDLE_WAIT = 1.0  # s — upper bound on one wakeup wait (safety net for missed signals)
 _RETRY_TICK_INTERVAL = 1.0  # seconds between retry-queue drains
 _WS_RECONNECT_SLOW_THRESHOLD = 5.0  # log a warning if a single WS disconnect+connect takes longer
 _MAX_TICK_BACKOFF = 30.0  # cap (s) on main-loop backoff after consecutive _tick() failures
@@ -119,6 +125,9 @@ class Orchestrator:
         db: Optional[DatabaseFactory] = None,
         anchor_store_path: str = "db/grid_anchor.json",
         notifier: Optional[Notifier] = None,
+        session_factory: Optional[Callable[..., Any]] = None,
+        ws_factory: Optional[Callable[..., Any]] = None,
+        trade_ws_factory: Optional[Callable[..., Any]] = None,
     ):
         """Initialize orchestrator.
 
@@ -127,18 +136,35 @@ class Orchestrator:
             db: Database factory for persistence (optional).
             anchor_store_path: Path to grid state JSON file. Name preserved
                 for deploy-config compatibility; the file now holds full grid
-                state, not just anchor prices.
+                state, not just anchor prices. With
+                ``grid_state_backend: sqlite`` it is only the legacy file
+                imported on first start.
             notifier: Alert notifier (optional, log-only if None).
+            session_factory: Replacement for pybit's ``HTTP`` in every
+                account's REST client (None = real Bybit). Used by
+                ``gridbot.loadtest`` to run against the local stand-in exchange.
+            ws_factory: Replacement for pybit's ``WebSocket`` in every
+                account's public/private WS client (None = real Bybit).
+            trade_ws_factory: Replacement for pybit's ``WebSocketTrading`` in
+                every account's WS order-entry session (None = real Bybit).
+                Only used with ``order_entry_transport: ws``.
         """
         self._config = config
         self._db = db
-        self._state_store = GridStateStore(anchor_store_path)
+        self._session_factory = session_factory
+        self._ws_factory = ws_factory
+        self._trade_ws_factory = trade_ws_factory
+        self._state_store = open_grid_state_store(
+            anchor_store_path, backend=config.grid_state_backend
+        )
         self._notifier = notifier or Notifier()
 
         # Per-account resources
         self._rest_clients: dict[str, BybitRestClient] = {}
         self._public_ws: dict[str, PublicWebSocketClient] = {}
         self._private_ws: dict[str, PrivateWebSocketClient] = {}
+        # Only with order_entry_transport == "ws"; account_name -> session.
+        self._trade_ws: dict[str, WebSocketTradeClient] = {}
         self._normalizers: dict[str, BybitNormalizer] = {}
 
         # Runners and supporting components
@@ -162,6 +188,8 @@ class Orchestrator:
             enabled=self._config.status_file_enabled,
         )
         self._safety_caps: dict[str, SafetyCaps] = {}  # strat_id -> caps (health sweep)
+        # strat_id -> "<account>/<symbol>" label of its latency histograms.
+        self._latency_labels: dict[str, str] = {}
         # strat_id -> dirty-REST count observed at the previous sweep, so degraded
         # keys off a RECENT delta (not the sticky monotonic absolute) — review #195.
         self._dirty_rest_last_count: dict[str, int] = {}
@@ -205,6 +233,9 @@ class Orchestrator:
                     if strat_id in self._run_ids
                     else None
                 ),
+                max_batch_size=config.grid_snapshot_batch_size,
+                max_batch_latency=config.grid_snapshot_batch_latency,
+                coalesce=config.grid_snapshot_coalesce,
             )
         else:
             self._grid_state_writer = None
@@ -296,6 +327,13 @@ class Orchestrator:
         self._next_order_sync: float = 0.0
         self._next_retry_tick: float = 0.0
 
+        # Main-loop wakeup: set by the WS callbacks (and request_stop /
+        # fast-track paths) so run() ticks as soon as there is work instead
+        # of on a fixed 100 ms cadence. Cleared at the top of each tick —
+        # an event landing mid-tick leaves it set and the next wait returns
+        # immediately, so no signal is lost.
+        self._wakeup = threading.Event()
+
         # Debounce window for WS-triggered fast-track order syncs. Bursts of
         # untracked-order WS events coalesce into a single reconciliation sweep.
         self._unknown_order_debounce_until: float = 0.0
@@ -305,6 +343,18 @@ class Orchestrator:
         """Whether orchestrator is running."""
         return self._running
 
+    @property
+    def health_metrics(self) -> HealthMetrics:
+        """Shared process-lifetime counters and latency histograms."""
+        return self._health_metrics
+
+    def rate_limit_status(self) -> dict[str, dict[str, int | float]]:
+        """Per-account REST rate-limiter status (capacity, waits)."""
+        return {
+            name: client.get_rate_limit_status()
+            for name, client in self._rest_clients.items()
+        }
+
     def start(self) -> None:
         """Start the orchestrator (non-blocking initialization).
 
@@ -469,8 +519,12 @@ class Orchestrator:
     def run(self) -> None:
         """Main polling loop. Blocks until request_stop() / stop().
 
-        On a successful _tick() we sleep the normal _CHECK_INTERVAL (100 ms).
-        On a failure we escalate sleep exponentially (1 s → 2 s → 4 s → …) up
+        On a successful _tick() we block on the wakeup event until a WS
+        callback signals new work or the earliest periodic-check deadline
+        (``_next_wakeup``) is due, whichever comes first. With
+        ``min_tick_interval`` > 0 the next tick also never starts sooner
+        than that after the previous one began, so event floods still
+        coalesce into one tick. On a failure we escalate sleep exponentially (1 s → 2 s → 4 s → …) up
         to _MAX_TICK_BACKOFF, then hold at the cap until a tick succeeds. The
         bot never stops — sustained failures keep retrying at the capped
         interval, because the root cause may be exchange-side and self-heal.
@@ -483,11 +537,23 @@ class Orchestrator:
         """
         logger.info("Orchestrator main loop started")
         consecutive_failures = 0
+        wake_due: Optional[float] = None
         while self._running:
+            self._wakeup.clear()
+            tick_start = time.perf_counter()
+            # Loop lag: how late this iteration starts vs. when it was due
+            # (deadline overshoot, or signal-to-tick delay + GIL contention
+            # from WS threads).
+            if wake_due is not None:
+                self._health_metrics.record_latency(
+                    LATENCY_LOOP_LAG, "main", tick_start - wake_due
+                )
             try:
                 self._tick()
+                self._health_metrics.record_latency(
+                    LATENCY_TICK_PHASE, "total", time.perf_counter() - tick_start
+                )
                 consecutive_failures = 0
-                sleep_for = _CHECK_INTERVAL
             except Exception as e:
                 consecutive_failures += 1
                 sleep_for = min(2 ** (consecutive_failures - 1), _MAX_TICK_BACKOFF)
@@ -496,16 +562,60 @@ class Orchestrator:
                     consecutive_failures, type(e).__name__, sleep_for, e, exc_info=True,
                 )
                 self._notifier.alert_exception("main_loop", e, error_key="main_loop")
-            time.sleep(sleep_for)
+                wake_due = time.perf_counter() + sleep_for
+                time.sleep(sleep_for)
+                continue
+            wake_due = self._wait_for_work(tick_start)
         logger.info("Orchestrator main loop exited")
 
+    def _next_wakeup(self) -> float:
+        """Earliest periodic-check deadline (``time.monotonic`` seconds).
+
+        The ``_next_*`` gates stay the single source of truth — fast-track
+        paths zero them directly — so the "deadline heap" is just their
+        minimum; with six timers a real heap would only add invalidation.
+        """
+        deadlines = [
+            self._next_position_check,
+            self._next_health_check,
+            self._next_ws_health_check,
+            self._next_divergence_size_check,
+            self._next_retry_tick,
+        ]
+        if self._config.order_sync_interval > 0:
+            deadlines.append(self._next_order_sync)
+        return min(deadlines)
+
+    def _wait_for_work(self, tick_start: float) -> float:
+        """Block until a WS signal or the next deadline; returns when due.
+
+        The return value (``time.perf_counter`` seconds) is what the next
+        tick's loop-lag sample is measured against.
+        """
+        floor = self._config.min_tick_interval - (time.perf_counter() - tick_start)
+        if floor > 0:
+            time.sleep(floor)
+        timeout = min(max(self._next_wakeup() - time.monotonic(), 0.0), _MAX_IDLE_WAIT)
+        due = time.perf_counter() + timeout
+        if self._wakeup.wait(timeout):
+            return min(due, time.perf_counter())
+        return due
+
+    def _signal_wakeup(self) -> None:
+        """Wake the main loop now. Safe to call from any thread."""
+        self._wakeup.set()
+
     def _tick(self) -> None:
         """Single iteration of the main polling loop.
 
         Drains pending events, processes the latest ticker per symbol, and
         runs time-gated periodic checks. Exceptions are caught one level up
         in run() so one bad iteration cannot kill the loop.
+
+        Each section's duration is recorded under the ``tick_phase`` latency
+        metric; periodic checks only when they actually ran this tick.
         """
+        t = time.perf_counter()
         # 1. Drain pending execution events
         for runner in self._runners.values():
             dq = self._pending_executions.get(runner.strat_id)
@@ -528,6 +638,8 @@ class Orchestrator:
                         error_key=f"on_execution_{runner.strat_id}",
                     )
 
+        t = self._lap_tick_phase("drain_executions", t)
+
         # 2. Drain pending order-update events
         for runner in self._runners.values():
             dq = self._pending_orders.get(runner.strat_id)
@@ -550,6 +662,8 @@ class Orchestrator:
                         error_key=f"on_order_update_{runner.strat_id}",
                     )
 
+        t = self._lap_tick_phase("drain_orders", t)
+
         # 2.5 Drain coalesced WS position snapshots (feature 0023).
         #     One dispatch per (account, symbol) per tick, deduped via the
         #     monotonic seq counter set in `_on_position`. Older snapshots
@@ -593,6 +707,8 @@ class Orchestrator:
                         error_key=f"on_position_update_{runner.strat_id}",
                     )
 
+        t = self._lap_tick_phase("drain_positions", t)
+
         # 3. Process latest ticker per symbol (coalesced — WS callback
         #    overwrites older events, so only the freshest is processed).
         #    Identity check (`is`) relies on normalize_ticker() returning a
@@ -605,17 +721,8 @@ class Orchestrator:
                 continue
             self._last_processed_ticker[symbol] = event
             for runner in runners:
-                try:
-                    runner.on_ticker(event)
-                except Exception as e:
-                    logger.error(
-                        "%s: on_ticker error: %s",
-                        runner.strat_id, e, exc_info=True,
-                    )
-                    self._notifier.alert_exception(
-                        "runner.on_ticker", e,
-                        error_key=f"on_ticker_{runner.strat_id}",
-                    )
+                self._dispatch_ticker(runner, event)
+        t = self._lap_tick_phase("tickers", t)
 
         # 4. Periodic checks via timestamp gating (bbu2 check_job pattern).
         #    Each check is wrapped so that one flaky REST call cannot wedge
@@ -625,6 +732,7 @@ class Orchestrator:
         now = time.monotonic()
         if now >= self._next_position_check:
             self._next_position_check = now + _POSITION_TICK_BASE
+            t = time.perf_counter()
             try:
                 self._position_fetcher.fetch_and_update()
             except Exception as e:
@@ -636,8 +744,10 @@ class Orchestrator:
                     "_fetch_and_update_positions", e,
                     error_key="periodic_fetch_positions",
                 )
+            self._lap_tick_phase("position_check", t)
         if now >= self._next_health_check:
             self._next_health_check = now + _HEALTH_CHECK_INTERVAL
+            t = time.perf_counter()
             try:
                 self._health_check_once()
             except Exception as e:
@@ -649,8 +759,10 @@ class Orchestrator:
                     "_health_check_once", e,
                     error_key="periodic_health_check",
                 )
+            self._lap_tick_phase("health_check", t)
         if now >= self._next_ws_health_check:
             self._next_ws_health_check = now + _WS_HEALTH_CHECK_INTERVAL
+            t = time.perf_counter()
             try:
                 self._ws_health_check_once()
             except Exception as e:
@@ -662,6 +774,7 @@ class Orchestrator:
                     "_ws_health_check_once", e,
                     error_key="periodic_ws_health_check",
                 )
+            self._lap_tick_phase("ws_health_check", t)
         # Feature 0069 signal 4 — drain post-WS-recovery forced reconciles.
         # PINNED here: after the per-tick WS event drains (steps 1/2/2.5) so no
         # order-update event is adjudicated against a half-cleared dedup cache,
@@ -696,6 +809,7 @@ class Orchestrator:
             and now >= self._next_order_sync
         ):
             self._next_order_sync = now + self._config.order_sync_interval
+            t = time.perf_counter()
             try:
                 self._order_sync_once()
             except Exception as e:
@@ -707,11 +821,13 @@ class Orchestrator:
                     "_order_sync_once", e,
                     error_key="periodic_order_sync",
                 )
+            self._lap_tick_phase("order_sync", t)
         # Feature 0069 signal 3 — periodic REST-vs-local position-size delta sweep.
         if now >= self._next_divergence_size_check:
             self._next_divergence_size_check = (
                 now + self._divergence_size_check_interval()
             )
+            t = time.perf_counter()
             try:
                 self._divergence_size_check_once()
             except Exception as e:
@@ -723,7 +839,9 @@ class Orchestrator:
                     "_divergence_size_check_once", e,
                     error_key="periodic_divergence_size_check",
                 )
+            self._lap_tick_phase("divergence_size_check", t)
         if now >= self._next_retry_tick:
+            t = time.perf_counter()
             for rq in self._retry_queues.values():
                 try:
                     rq.process_due()
@@ -733,6 +851,60 @@ class Orchestrator:
                         "retry_queue.process_due", e, error_key="retry_queue_tick",
                     )
             self._next_retry_tick = now + _RETRY_TICK_INTERVAL
+            self._lap_tick_phase("retry_queue", t)
+
+    def _lap_tick_phase(self, phase: str, started: float) -> float:
+        """Record ``phase`` as ending now; returns now (the next phase's start)."""
+        now = time.perf_counter()
+        self._health_metrics.record_latency(LATENCY_TICK_PHASE, phase, now - started)
+        return now
+
+    def _dispatch_ticker(self, runner: StrategyRunner, event: TickerEvent) -> None:
+        """Feed one coalesced ticker to ``runner`` and record its latencies.
+
+        ``exchange_to_receive`` (exchange stamp -> WS callback) and
+        ``receive_to_engine`` (WS callback -> this dispatch, i.e. the main
+        loop's queueing delay) are recorded per runner under its
+        ``<account>/<symbol>`` label. While ``on_ticker`` runs, the strategy's
+        executor measures ``engine_to_submit`` and REST round trips against
+        the same tick start, plus ``tick_to_ack`` from the WS receive.
+        Tickers overwritten before the main loop got to
+        them are not measured.
+        """
+        label = self._latency_labels.get(runner.strat_id) or latency_key("", runner.symbol)
+        metrics = self._health_metrics
+        started = time.perf_counter()
+        received_at: Optional[float] = None
+        # Measuring must never block dispatch: skip events without real stamps.
+        if isinstance(event.local_ts, datetime) and isinstance(event.exchange_ts, datetime):
+            local_ts = _ensure_utc_aware(event.local_ts)
+            metrics.record_latency(
+                LATENCY_EXCHANGE_TO_RECEIVE, label,
+                (local_ts - _ensure_utc_aware(event.exchange_ts)).total_seconds(),
+            )
+            queued = (datetime.now(UTC) - local_ts).total_seconds()
+            metrics.record_latency(LATENCY_RECEIVE_TO_ENGINE, label, queued)
+            received_at = started - queued
+        executor = self._strategy_executors.get(runner.strat_id)
+        if executor is not None:
+            executor.begin_tick(started, received_at)
+        try:
+            runner.on_ticker(event)
+        except Exception as e:
+            logger.error(
+                "%s: on_ticker error: %s",
+                runner.strat_id, e, exc_info=True,
+            )
+            self._notifier.alert_exception(
+                "runner.on_ticker", e,
+                error_key=f"on_ticker_{runner.strat_id}",
+            )
+        finally:
+            if executor is not None:
+                executor.end_tick()
+            metrics.record_latency(
+                LATENCY_ON_TICKER, label, time.perf_counter() - started
+            )
 
     def request_stop(self) -> None:
         """Signal the main loop to exit. Safe to call from any thread.
@@ -740,9 +912,9 @@ class Orchestrator:
         Thread-safety model: `self._running = False` is a single
         attribute assignment, which is atomic under the CPython GIL.
         There is no memory barrier, but none is needed — the main
-        loop reads `self._running` at the top of every iteration
-        (every `_CHECK_INTERVAL` = 100 ms), so the worst case is
-        one extra tick of delay before the loop notices the flag.
+        loop reads `self._running` at the top of every iteration and
+        the wakeup signal below ends its current wait, so the worst
+        case is one in-flight tick of delay before the loop notices.
 
         `_running` is used ONLY as a loop gate; it does not guard any
         critical section, protect any invariant across multiple reads,
@@ -759,6 +931,7 @@ class Orchestrator:
         a harmless no-op.
         """
         self._running = False
+        self._signal_wakeup()
 
     def stop(self) -> None:
         """Stop the orchestrator gracefully (non-blocking).
@@ -788,17 +961,21 @@ class Orchestrator:
             ws.disconnect()
         for ws in self._private_ws.values():
             ws.disconnect()
+        for ws in self._trade_ws.values():
+            ws.disconnect()
 
         # Retry queues have no background task to stop (see 0017_PLAN.md).
 
-        # Grid state writes are dispatched to daemon threads so the hot path
+        # Grid state writes go to a daemon writer thread so the hot path
         # never blocks on disk I/O. On graceful shutdown, wait for any pending
         # writes before the process exits; otherwise the daemon writer can be
         # killed and the latest post-fill grid state is lost. Bound the wait
         # so a stuck writer (slow/dead disk) cannot block stop() forever —
         # losing one save is preferable to a process that won't exit on
         # SIGTERM. 10s matches typical fsync upper bounds on healthy disks.
-        self._state_store.flush(timeout=10.0)
+        # close() drains first, then stops the writer thread and closes the
+        # backend (the sqlite backend checkpoints its WAL on close).
+        self._state_store.close(timeout=10.0)
 
         # 0047: drain the parallel DB writer before exit so the last
         # post-fill snapshot(s) sitting in its queue don't get killed
@@ -823,12 +1000,28 @@ class Orchestrator:
             api_secret=account_config.api_secret,
             testnet=account_config.testnet,
             timeout=self._config.rest_fetch_timeout,
+            session_factory=self._session_factory,
+            rate_limit_caller="gridbot",
         )
 
+        # WS order entry (optional): shares the REST client's order limiter,
+        # since Bybit counts both transports against one per-UID budget.
+        if self._config.order_entry_transport == "ws":
+            self._trade_ws[name] = WebSocketTradeClient(
+                api_key=account_config.api_key,
+                api_secret=account_config.api_secret,
+                testnet=account_config.testnet,
+                request_timeout=self._config.ws_order_timeout,
+                max_consecutive_timeouts=self._config.ws_order_max_timeouts,
+                ws_factory=self._trade_ws_factory,
+                acquire_order_slot=self._rest_clients[name].wait_for_order_slot,
+            )
+
         # Create executor
         self._executors[name] = IntentExecutor(
             self._rest_clients[name],
             shadow_mode=False,  # Will be overridden per-strategy
+            ws_trade_client=self._trade_ws.get(name),
         )
 
         # Create reconciler
@@ -851,6 +1044,7 @@ class Orchestrator:
                 a, msg.get("data", {}).get("symbol", ""), msg
             ),
             on_disconnect=lambda ts, a=name: self._on_ws_disconnect(a, "public", ts),
+            ws_factory=self._ws_factory,
         )
         # Feature 0066 Phase 4: subscribe the real-time `wallet` topic only when
         # the kill-switch is on. PrivateWebSocketClient subscribes wallet_stream
@@ -870,6 +1064,7 @@ class Orchestrator:
             on_wallet=on_wallet,
             on_disconnect=lambda ts, a=name: self._on_ws_disconnect(a, "private", ts),
             message_gap_watchdog_enabled=False,
+            ws_factory=self._ws_factory,
         )
 
         logger.info(f"Initialized account: {name}")
@@ -899,6 +1094,8 @@ class Orchestrator:
             safety_caps=safety_caps,
             clock=safety_caps_clock,
             health_metrics=self._health_metrics,
+            account_name=account_name,
+            ws_trade_client=base_executor.ws_trade_client,
         )
 
         # Create retry queue with dispatcher that routes by intent type.
@@ -984,6 +1181,7 @@ class Orchestrator:
         self._strategy_executors[strat_id] = executor
         # Feature 0082 — retain caps so _health_check_once can read circuit/C4 state.
         self._safety_caps[strat_id] = safety_caps
+        self._latency_labels[strat_id] = latency_key(account_name, strategy_config.symbol)
 
         logger.info(
             f"Initialized strategy: {strat_id} (symbol={strategy_config.symbol}, "
@@ -1015,6 +1213,13 @@ class Orchestrator:
         """
         self._public_ws[account_name].connect()
         self._private_ws[account_name].connect()
+        trade_ws = self._trade_ws.get(account_name)
+        if trade_ws is not None:
+            try:
+                trade_ws.connect()
+            except Exception as e:
+                # Order entry falls back to REST; the health check reconnects.
+                logger.error(f"Trade WebSocket connect failed for {account_name}: {e}")
 
         logger.info(f"Connected WebSockets for account: {account_name}")
 
@@ -1094,6 +1299,7 @@ class Orchestrator:
                 "short": short_pos,
                 "seq": self._position_seq,
             }
+            self._signal_wakeup()
         except Exception as e:
             self._notifier.alert_exception("_on_position", e, error_key="ws_on_position")
 
@@ -1117,6 +1323,7 @@ class Orchestrator:
             # overwrite a value that hasn't been read yet; the reader picks
             # up the newer one on the next iteration.
             self._latest_ticker[symbol] = event
+            self._signal_wakeup()
         except Exception as e:
             self._notifier.alert_exception("_on_ticker", e, error_key="ws_on_ticker")
 
@@ -1128,10 +1335,9 @@ class Orchestrator:
 
         Thread-safety: `collections.deque.append` is atomic under the
         CPython GIL (single C-level operation), as is `popleft` on the
-        main thread. No lock is needed. Races are benign: worst case
-        an event queues after the main loop has already drained but
-        before it sleeps, and the event is picked up on the next 100 ms
-        tick — an acceptable delay. The `_pending_orders.get(...)` read
+        main thread. No lock is needed. An event queued after the main
+        loop has drained but before it waits still sets the wakeup, so
+        the next wait returns at once and the event is not delayed. The `_pending_orders.get(...)` read
         is also GIL-atomic; the deque object is created up-front in
         start() and never replaced, so `is not None` is race-free.
         """
@@ -1148,6 +1354,8 @@ class Orchestrator:
                     if dq is not None:
                         # deque.append is atomic under CPython GIL.
                         dq.append(event)
+            if events:
+                self._signal_wakeup()
         except Exception as e:
             self._notifier.alert_exception("_on_order", e, error_key="ws_on_order")
 
@@ -1159,8 +1367,9 @@ class Orchestrator:
 
         Thread-safety: identical guarantees to `_on_order` —
         `deque.append` is GIL-atomic, the deque object is created
-        up-front in start() and never replaced, and races with the
-        main-thread drainer cost at most one 100 ms tick of delay.
+        up-front in start() and never replaced, and the wakeup signal
+        means an append racing the drainer is picked up on the next tick
+        without waiting for a deadline.
         """
         try:
             normalizer = self._normalizers[account_name]
@@ -1175,6 +1384,8 @@ class Orchestrator:
                     if dq is not None:
                         # deque.append is atomic under CPython GIL.
                         dq.append(event)
+            if events:
+                self._signal_wakeup()
         except Exception as e:
             self._notifier.alert_exception("_on_execution", e, error_key="ws_on_execution")
 
@@ -1495,6 +1706,26 @@ class Orchestrator:
                     f"ws_health_check {account_name}/private", e,
                     error_key=f"ws_health_check_priv_{account_name}",
                 )
+        # WS order entry: also reset a live socket that keeps timing out
+        # (is_healthy); meanwhile the executor sends over REST.
+        for account_name, trade_ws in list(self._trade_ws.items()):
+            try:
+                if trade_ws.is_healthy():
+                    continue
+                logger.warning(
+                    "WS trade socket unhealthy for %s; resetting",
+                    account_name,
+                )
+                trade_ws.reset()
+            except Exception as e:
+                logger.error(
+                    "ws_health_check failed for %s/trade: %s",
+                    account_name, e, exc_info=True,
+                )
+                self._notifier.alert_exception(
+                    f"ws_health_check {account_name}/trade", e,
+                    error_key=f"ws_health_check_trade_{account_name}",
+                )
 
     def _on_ws_disconnect(
         self, account_name: str, kind: str, disconnected_at: datetime
@@ -1560,7 +1791,7 @@ class Orchestrator:
         Invoked by `StrategyRunner.on_order_update` when a `New`-status WS
         event arrives for an order ID we don't track (i.e., a manual order
         placed mid-run). Zeroing `_next_order_sync` makes the main polling
-        loop run `_order_sync_once` on its next iteration (~100 ms), which
+        loop wake and run `_order_sync_once` on its next iteration, which
         adopts the unknown order via `Reconciler.reconcile_reconnect` so the
         next tick can cancel it if it's off-grid.
 
@@ -1571,6 +1802,7 @@ class Orchestrator:
             return
         self._unknown_order_debounce_until = now + _UNKNOWN_ORDER_DEBOUNCE_SEC
         self._next_order_sync = 0.0
+        self._signal_wakeup()
         logger.info(
             "%s: Untracked order seen — fast-tracking order sync", strat_id,
         )
@@ -1770,6 +2002,7 @@ class Orchestrator:
                 if cfg is None or not cfg.divergence_detector_enabled:
                     continue
                 self._pending_post_recovery_reconcile.add(runner.strat_id)
+        self._signal_wakeup()
 
     def _divergence_size_check_interval(self) -> float:
         """Cadence for the signal-3 size-delta sweep (orchestrator-level gate).
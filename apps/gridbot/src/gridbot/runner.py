@@ -40,6 +40,8 @@ from gridcore import (  # noqa: E402
     OrderUpdateEvent,
     PlaceLimitIntent,
     CancelIntent,
+    AmendIntent,
+    collapse_to_amends,
     extract_client_order_prefix,
     GridStateStore,
     DirectionType,
@@ -1264,13 +1266,18 @@ class StrategyRunner:
         Cancels run before places so margin and the per-symbol active-order
         slots held by stale orders are freed before new placements try to
         consume them. Within each group the engine's nearest-to-farthest
-        ordering is preserved.
+        ordering is preserved. With ``amend_enabled``, cancel+place pairs that
+        differ only in price/qty are collapsed into amends, which run between
+        the two groups.
         """
         if self._executor.auth_cooldown:
             logger.debug(f"{self.strat_id}: Auth cooldown active, skipping {len(intents)} intents")
             return
 
+        if self._config.amend_enabled:
+            intents = collapse_to_amends(intents, self._can_amend)
         cancels = [i for i in intents if isinstance(i, CancelIntent)]
+        amends = [i for i in intents if isinstance(i, AmendIntent)]
         places = [i for i in intents if isinstance(i, PlaceLimitIntent)]
 
         for intent in cancels:
@@ -1279,7 +1286,13 @@ class StrategyRunner:
                 return
             self._execute_cancel_intent(intent)
 
-        if cancels:
+        for intent in amends:
+            if self._executor.auth_cooldown:
+                logger.debug(f"{self.strat_id}: Auth cooldown activated mid-batch, skipping remaining intents")
+                return
+            self._execute_amend_intent(intent)
+
+        if cancels or amends:
             limits = self.get_limit_orders()
 
         for intent in places:
@@ -1344,13 +1357,20 @@ class StrategyRunner:
         the deterministic prefix used as the dict key.
         """
         prefix = extract_client_order_prefix(order_link_id)
-        if prefix and prefix in self._tracked_orders:
-            return self._tracked_orders[prefix]
+        by_prefix = self._tracked_orders.get(prefix) if prefix else None
+        # An amended order keeps its original orderLinkId while it is tracked
+        # under the replacement's id, so a later order at the original price
+        # can own that prefix. A different exchange order_id means the event
+        # is not for that order: let the order_id scan find the amended one.
+        if by_prefix is not None and (
+            not order_id or by_prefix.order_id in (None, order_id)
+        ):
+            return by_prefix
         if order_id:
             for t in self._tracked_orders.values():
                 if t.order_id == order_id:
                     return t
-        return None
+        return by_prefix
 
     def _clear_dirty(self, direction: str) -> None:
         """Clear a direction's dirty episode and its episode-scoped state (0064).
@@ -2226,27 +2246,19 @@ class StrategyRunner:
             return False, decision.reason
         return True, None
 
-    def _execute_place_intent(self, intent: PlaceLimitIntent, limits: dict[str, list[dict]]) -> None:
-        """Execute a place order intent.
+    def _vet_place_intent(
+        self, intent: PlaceLimitIntent, limits: dict[str, list[dict]], now: float
+    ) -> Optional[PlaceLimitIntent]:
+        """Steps 1-4 of the placement pipeline (see ``_execute_place_intent``).
 
-        Pipeline (feature 0064 — explicit order, do not reorder):
-        1. resolve qty → qty<=0 early return.
-        2. breaker ``is_blocked`` → early return (no REST, no guard, no submit
-           while a scope key is in cooldown).
-        3. dirty-mirror REST refresh (reduce-only only, throttled) BEFORE the
-           guard, so step 4 evaluates fresh size.
-        4. ``_is_good_to_place`` → unchanged guard (now reads the freshened
-           mirror); oversized reduce-only is rejected here, nothing submitted.
-        5. duplicate-track + wire-link-id (existing).
-        6. ``execute_place`` → post-submit breaker bookkeeping.
+        Shared with the amend path (``_execute_amend_intent``). Returns the
+        qty-resolved intent, or None when a step drops it.
         """
         # Step 1 — resolve qty (engine emits qty=0, we fill it in)
         intent = self._resolve_qty(intent)
         if intent.qty <= 0:
             logger.debug(f"{self.strat_id}: Skipping order with qty<=0 at {intent.price}")
-            return
-
-        now = self._clock()
+            return None
 
         # Step 2 — circuit-breaker: drop while this scope key is in cooldown.
         # Sits first so a tripped scope never triggers a REST refresh on
@@ -2256,7 +2268,7 @@ class StrategyRunner:
                 f"{self.strat_id}: 110017 breaker tripped — dropping "
                 f"{intent.side} @ {intent.price}"
             )
-            return
+            return None
 
         # Step 2.5 — production safety caps (feature 0079 / issue #182). Runs
         # AFTER qty-resolve + the 110017 breaker and BEFORE the dirty refresh /
@@ -2276,7 +2288,7 @@ class StrategyRunner:
                 )
             else:
                 self._emit_safety_cap_rejection(intent, reason)
-            return
+            return None
 
         # Step 3 — dirty-mirror REST refresh before the guard (reduce-only only).
         # `dirty_refresh_enabled` is the FIRST term so flipping it off is a true
@@ -2304,6 +2316,29 @@ class StrategyRunner:
                 f"{self.strat_id}: Skipping order at {intent.price} - "
                 f"rejected by _is_good_to_place"
             )
+            return None
+
+        return intent
+
+    def _execute_place_intent(self, intent: PlaceLimitIntent, limits: dict[str, list[dict]]) -> None:
+        """Execute a place order intent.
+
+        Pipeline (feature 0064 — explicit order, do not reorder):
+        1. resolve qty → qty<=0 early return.
+        2. breaker ``is_blocked`` → early return (no REST, no guard, no submit
+           while a scope key is in cooldown).
+        3. dirty-mirror REST refresh (reduce-only only, throttled) BEFORE the
+           guard, so step 4 evaluates fresh size.
+        4. ``_is_good_to_place`` → unchanged guard (now reads the freshened
+           mirror); oversized reduce-only is rejected here, nothing submitted.
+        5. duplicate-track + wire-link-id (existing).
+        6. ``execute_place`` → post-submit breaker bookkeeping.
+
+        Steps 1-4 live in ``_vet_place_intent``.
+        """
+        now = self._clock()
+        intent = self._vet_place_intent(intent, limits, now)
+        if intent is None:
             return
 
         # Step 5 — duplicate-track + wire-link-id assignment (existing).
@@ -2522,6 +2557,77 @@ class StrategyRunner:
         if not result.success and self._on_intent_failed:
             self._on_intent_failed(intent, result.error)
 
+    def _can_amend(self, cancel: CancelIntent, place: PlaceLimitIntent) -> bool:
+        """``collapse_to_amends`` predicate: can this pair go out as one amend?
+
+        Bybit amends only price and qty, so the resting order must already
+        have the replacement's side, direction, reduce-only and post-only
+        flags. Duplicate-healing cancels stay cancels (they drain queued
+        retries, feature 0087), and a replacement id that is pending, placed
+        or failed goes through the normal placement dedup instead.
+        """
+        if cancel.reason == "duplicate":
+            return False
+        tracked = self._find_tracked_order(None, cancel.order_id)
+        if tracked is None or tracked.status != "placed" or tracked.intent is None:
+            return False
+        existing = self._tracked_orders.get(place.client_order_id)
+        if existing is not None and existing.status in ("pending", "placed", "failed"):
+            return False
+        resting = tracked.intent
+        return (
+            resting.side == place.side
+            and resting.direction == place.direction
+            and resting.reduce_only == place.reduce_only
+            and resting.post_only == place.post_only
+        )
+
+    def _execute_amend_intent(self, intent: AmendIntent) -> None:
+        """Execute a cancel+place pair collapsed into an amend.
+
+        The replacement runs the placement guards against the book without
+        the order being amended, as if the cancel had already gone through;
+        when they drop it, only the cancel is executed. When Bybit rejects
+        the amend (order filled or cancelled meanwhile, ...) the pair falls
+        back to cancel + place.
+
+        On success the tracked order is re-keyed to the replacement's
+        client_order_id. The exchange keeps the original orderLinkId, so WS
+        events for the order resolve through ``_find_tracked_order``'s
+        order_id fallback.
+        """
+        tracked = self._find_tracked_order(None, intent.order_id)
+        if tracked is None or tracked.status != "placed" or tracked.intent is None:
+            self._execute_cancel_intent(intent.cancel)
+            self._execute_place_intent(intent.place, self.get_limit_orders())
+            return
+
+        limits = {
+            direction: [o for o in orders if o["orderId"] != intent.order_id]
+            for direction, orders in self.get_limit_orders().items()
+        }
+        place = self._vet_place_intent(intent.place, limits, self._clock())
+        if place is None:
+            self._execute_cancel_intent(intent.cancel)
+            return
+
+        result = self._executor.execute_amend(replace(intent, place=place))
+        if result.success:
+            self._tracked_orders.pop(tracked.client_order_id, None)
+            tracked.client_order_id = place.client_order_id
+            tracked.intent = replace(place, order_link_id=tracked.intent.order_link_id)
+            self._tracked_orders[place.client_order_id] = tracked
+            return
+
+        if self._executor.auth_cooldown:
+            return
+        logger.info(
+            "%s: amend of %s to %s @ %s failed (%s) — falling back to cancel + place",
+            self.strat_id, intent.order_id, place.side, place.price, result.error,
+        )
+        self._execute_cancel_intent(intent.cancel)
+        self._execute_place_intent(intent.place, self.get_limit_orders())
+
     def _emit_safety_cap_rejection(self, intent: PlaceLimitIntent, reason: str) -> None:
         """Log (throttled) + alert a safety-cap rejection (feature 0079).
 
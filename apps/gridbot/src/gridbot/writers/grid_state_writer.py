@@ -8,6 +8,13 @@ Concurrency model:
   worker thread; INSERTs land in dequeue order so the loader's
   ``ORDER BY exchange_ts DESC, id DESC`` tie-break picks the FINAL notify
   of a multi-notify outer mutation (e.g. ``update_grid`` out-of-bounds path).
+* The worker batches across strats: after the first snapshot it keeps
+  dequeuing for up to ``max_batch_latency`` seconds (or ``max_batch_size``
+  snapshots) and commits them as one multi-row ``INSERT ... ON CONFLICT DO
+  NOTHING``. If the batch fails it retries row by row, so a poison snapshot
+  still cannot block the others. With ``coalesce=True`` only the last
+  snapshot per scope in a batch is inserted; the superseded ones are counted
+  in ``total_coalesced``.
 * In-memory tuple dedupe is a separate gate run BEFORE enqueue: if the new
   ``grid_fingerprint(...)`` tuple equals the last-enqueued tuple for the
   same ``(run_id, account_id, strat_id)``, the write is dropped pre-queue.
@@ -22,6 +29,7 @@ Concurrency model:
 import logging
 import queue
 import threading
+import time
 from datetime import datetime, UTC
 from decimal import Decimal
 from typing import Callable, Optional
@@ -31,6 +39,8 @@ from grid_db.models import GridStateSnapshot
 from grid_db.repositories import GridStateSnapshotRepository
 from gridcore.persistence import grid_fingerprint, grid_fingerprint_hash
 
+from gridbot.health import LatencyHistogram
+
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +49,12 @@ logger = logging.getLogger(__name__)
 # clean exit.
 _STOP_SENTINEL = object()
 
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_MAX_BATCH_LATENCY = 0.05  # seconds
+
+Scope = tuple[str, str, str]  # (run_id, account_id, strat_id)
+_Item = tuple[GridStateSnapshot, Scope, tuple]
+
 
 class GridStateWriter:
     """Persists ``grid.grid`` mutations to ``grid_state_snapshots``.
@@ -60,6 +76,9 @@ class GridStateWriter:
         db: DatabaseFactory,
         run_id_provider: Callable[[str], Optional[str]],
         max_queue_size: int = 0,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_batch_latency: float = DEFAULT_MAX_BATCH_LATENCY,
+        coalesce: bool = False,
     ):
         """Initialize writer.
 
@@ -72,13 +91,26 @@ class GridStateWriter:
                 creation; see plan 0047 v18 Phase 2B.
             max_queue_size: Upper bound on pending snapshots. 0 = unbounded
                 (default — grid mutations are rare relative to ticker rate).
+            max_batch_size: Most snapshots committed in one INSERT.
+            max_batch_latency: Longest a dequeued snapshot waits for more to
+                batch with before the commit (seconds; 0 = only batch what
+                is already queued).
+            coalesce: Insert only the last snapshot per scope within a batch
+                (drops intermediate states superseded inside the window).
         """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be >= 1, got {max_batch_size}")
+        if max_batch_latency < 0:
+            raise ValueError(f"max_batch_latency must be >= 0, got {max_batch_latency}")
         self._db = db
         self._run_id_provider = run_id_provider
+        self._max_batch_size = max_batch_size
+        self._max_batch_latency = max_batch_latency
+        self._coalesce = coalesce
         self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
         # Per-scope last-enqueued fingerprint tuple; guards pre-enqueue
         # dedupe so identical successive mutations don't bloat the queue.
-        self._last_fingerprint: dict[tuple[str, str, str], tuple] = {}
+        self._last_fingerprint: dict[Scope, tuple] = {}
         # Lock guards _last_fingerprint only — the queue itself is
         # thread-safe.
         self._dedupe_lock = threading.Lock()
@@ -94,6 +126,13 @@ class GridStateWriter:
         self._total_dedup_skipped = 0
         self._total_errors = 0
         self._total_bootstrap_failures = 0
+        self._total_coalesced = 0
+        self._total_batches = 0
+        self._total_batched_rows = 0
+        self._max_batch_seen = 0
+        # Written by the worker, read by get_stats() on the main thread.
+        self._stats_lock = threading.Lock()
+        self._commit_latency = LatencyHistogram()
 
     def write(
         self,
@@ -213,7 +252,7 @@ class GridStateWriter:
                 row.exchange_ts,
             )
 
-    def prime_fingerprint(self, scope: tuple[str, str, str], fp_tuple: tuple) -> None:
+    def prime_fingerprint(self, scope: Scope, fp_tuple: tuple) -> None:
         """Seed the in-memory dedupe gate without enqueueing a snapshot."""
         with self._dedupe_lock:
             self._last_fingerprint[scope] = fp_tuple
@@ -232,33 +271,89 @@ class GridStateWriter:
             self._worker.join(timeout=10.0)
         logger.info(
             "GridStateWriter stopped. written=%d dedup_skipped=%d "
-            "dropped_no_run_id=%d dropped_no_ts=%d errors=%d",
+            "coalesced=%d batches=%d dropped_no_run_id=%d dropped_no_ts=%d "
+            "errors=%d",
             self._total_written, self._total_dedup_skipped,
+            self._total_coalesced, self._total_batches,
             self._total_dropped_no_run_id, self._total_dropped_no_ts,
             self._total_errors,
         )
 
     def _worker_loop(self) -> None:
-        """Drain the queue, one snapshot per session-and-commit.
-
-        Per-snapshot commits trade throughput for safety: a poison snapshot
-        cannot block subsequent ones from landing, and ``orchestrator.stop()``
-        flush is bounded by the number of inflight items.
-        """
+        """Drain the queue in batches, one session-and-commit per batch."""
         while True:
-            item = self._queue.get()
+            items, stop = self._next_batch()
             try:
-                if item is _STOP_SENTINEL:
-                    return
-                snapshot, scope, fp_tuple = item
-                self._insert_one(snapshot, scope, fp_tuple)
+                if items:
+                    self._write_batch(items)
             finally:
-                self._queue.task_done()
+                for _ in range(len(items) + stop):
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _next_batch(self) -> tuple[list[_Item], bool]:
+        """Block for one snapshot, then gather more until the batch is full
+        or ``max_batch_latency`` has passed. Returns ``(items, stop_seen)``."""
+        first = self._queue.get()
+        if first is _STOP_SENTINEL:
+            return [], True
+        items = [first]
+        deadline = time.monotonic() + self._max_batch_latency
+        while len(items) < self._max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=remaining) if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            if item is _STOP_SENTINEL:
+                return items, True
+            items.append(item)
+        return items, False
+
+    def _write_batch(self, items: list[_Item]) -> None:
+        if self._coalesce:
+            latest: dict[Scope, int] = {}
+            for i, (_, scope, _) in enumerate(items):
+                latest[scope] = i
+            kept = [item for i, item in enumerate(items) if latest[item[1]] == i]
+            self._total_coalesced += len(items) - len(kept)
+            items = kept
+
+        started = time.perf_counter()
+        if len(items) == 1:
+            self._insert_one(*items[0])
+        else:
+            try:
+                with self._db.get_session() as session:
+                    inserted = GridStateSnapshotRepository(session).insert_many(
+                        [snapshot for snapshot, _, _ in items]
+                    )
+                self._total_written += inserted
+                # Partial-index conflicts — silent no-op is correct
+                # (race-double-insert protection).
+                self._total_dedup_skipped += len(items) - inserted
+            except Exception as e:
+                logger.warning(
+                    "GridStateWriter batch insert of %d failed (%s); retrying row by row",
+                    len(items), e,
+                )
+                for item in items:
+                    self._insert_one(*item)
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self._total_batches += 1
+            self._total_batched_rows += len(items)
+            self._max_batch_seen = max(self._max_batch_seen, len(items))
+            self._commit_latency.record(elapsed)
 
     def _insert_one(
         self,
         snapshot: GridStateSnapshot,
-        scope: tuple[str, str, str],
+        scope: Scope,
         fp_tuple: tuple,
     ) -> None:
         try:
@@ -290,5 +385,19 @@ class GridStateWriter:
             "total_dropped_no_ts": self._total_dropped_no_ts,
             "total_errors": self._total_errors,
             "total_bootstrap_failures": self._total_bootstrap_failures,
+            "total_coalesced": self._total_coalesced,
             "queue_size": self._queue.qsize(),
+            **self._batch_stats(),
         }
+
+    def _batch_stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "total_batches": self._total_batches,
+                "mean_batch_size": (
+                    self._total_batched_rows / self._total_batches
+                    if self._total_batches else 0.0
+                ),
+                "max_batch_size": self._max_batch_seen,
+                "commit_latency": self._commit_latency.as_dict(),
+            }
@@ -293,6 +293,14 @@ class TestGridbotConfig:
         assert len(config.accounts) == 1
         assert len(config.strategies) == 1
 
+    def test_grid_state_backend(self, sample_account_config, sample_strategy_config):
+        """grid_state_backend defaults to json and only accepts known backends."""
+        kwargs = dict(accounts=[sample_account_config], strategies=[sample_strategy_config])
+        assert GridbotConfig(**kwargs).grid_state_backend == "json"
+        assert GridbotConfig(**kwargs, grid_state_backend="sqlite").grid_state_backend == "sqlite"
+        with pytest.raises(ValidationError):
+            GridbotConfig(**kwargs, grid_state_backend="lmdb")
+
     def test_account_reference_validation(self):
         """Test validation catches invalid account references."""
         account = AccountConfig(
@@ -1,12 +1,13 @@
 """Tests for gridbot executor module."""
 
+import time
 from dataclasses import replace
 from decimal import Decimal
 from unittest.mock import Mock, MagicMock
 
 import pytest
 
-from gridcore.intents import PlaceLimitIntent, CancelIntent
+from gridcore.intents import AmendIntent, PlaceLimitIntent, CancelIntent
 from gridbot.config import SafetyCapsConfig
 from gridbot.executor import (
     IntentExecutor,
@@ -19,6 +20,7 @@ from gridbot.executor import (
     is_duplicate_link_error,
 )
 from gridbot.safety_caps import SafetyCaps
+from gridbot.health import HealthMetrics
 from bybit_adapter.error_codes import (
     ORDER_QTY_TRUNCATED_TO_ZERO,
     INSUFFICIENT_BALANCE,
@@ -145,6 +147,9 @@ def mock_rest_client():
     client = Mock()
     client.place_order = MagicMock(return_value={"orderId": "test_order_123"})
     client.cancel_order = MagicMock(return_value=True)
+    client.amend_order = MagicMock(
+        return_value={"orderId": "order_to_cancel_123", "orderLinkId": "link-1"}
+    )
     return client
 
 
@@ -460,6 +465,69 @@ class TestExecutorCancelOrder:
         mock_rest_client.cancel_order.assert_not_called()
 
 
+@pytest.fixture
+def amend_intent(place_intent):
+    """Sample AmendIntent moving order_to_cancel_123 to place_intent."""
+    cancel = CancelIntent(
+        symbol="BTCUSDT", order_id="order_to_cancel_123", reason="outside_grid", side="Buy",
+    )
+    return AmendIntent(cancel=cancel, place=place_intent)
+
+
+class TestExecutorAmendOrder:
+    """Tests for execute_amend method."""
+
+    def test_amend_order_success(self, executor, mock_rest_client, amend_intent):
+        result = executor.execute_amend(amend_intent)
+
+        assert result.success is True
+        assert result.order_id == "order_to_cancel_123"
+        assert result.order_link_id == "link-1"
+        mock_rest_client.amend_order.assert_called_once_with(
+            symbol="BTCUSDT",
+            order_id="order_to_cancel_123",
+            qty="0.001",
+            price="50000.0",
+        )
+
+    def test_amend_order_failure(self, executor, mock_rest_client, amend_intent):
+        mock_rest_client.amend_order.side_effect = Exception("[110001] order not exists")
+
+        result = executor.execute_amend(amend_intent)
+
+        assert result.success is False
+        assert "110001" in result.error
+
+    def test_amend_order_shadow_mode(self, shadow_executor, mock_rest_client, amend_intent):
+        result = shadow_executor.execute_amend(amend_intent)
+
+        assert result.success is True
+        assert result.order_id == "order_to_cancel_123"
+        mock_rest_client.amend_order.assert_not_called()
+
+    def test_amend_counts_toward_c4(self, mock_rest_client, place_intent, amend_intent):
+        clock = _FakeClock(1000.0)
+        caps = SafetyCaps(
+            SafetyCapsConfig(max_orders_per_minute=1), strat_id="btcusdt_test", clock=clock,
+        )
+        ex = IntentExecutor(mock_rest_client, safety_caps=caps, clock=clock)
+
+        assert ex.execute_amend(amend_intent).success is True
+        assert ex.execute_place(place_intent).error == "safety_cap_rate_limit"
+        assert ex.execute_amend(amend_intent).error == "safety_cap_rate_limit"
+        assert mock_rest_client.amend_order.call_count == 1
+
+    def test_amend_metrics(self, mock_rest_client, amend_intent):
+        metrics = HealthMetrics()
+        ex = IntentExecutor(mock_rest_client, health_metrics=metrics, account_name="acct")
+        ex.execute_amend(amend_intent)
+        mock_rest_client.amend_order.side_effect = Exception("[110001] order not exists")
+        ex.execute_amend(amend_intent)
+
+        assert (metrics.amends, metrics.amends_failed) == (1, 1)
+        assert metrics.latency["rest_amend_round_trip"]["acct/BTCUSDT"].count == 2
+
+
 class TestExecutorBatch:
     """Tests for execute_batch method."""
 
@@ -487,6 +555,13 @@ class TestExecutorBatch:
         assert results[0].success is False
         assert results[1].success is True
 
+    def test_batch_dispatches_amend(self, executor, mock_rest_client, amend_intent):
+        results = executor.execute_batch([amend_intent])
+
+        assert len(results) == 1
+        assert isinstance(results[0], OrderResult)
+        mock_rest_client.amend_order.assert_called_once()
+
     def test_batch_empty_list(self, executor):
         """Test batch with empty list."""
         results = executor.execute_batch([])
@@ -758,3 +833,52 @@ class TestExecutorRateLimitC4:
             assert ex.execute_place(place_intent).success is False
         # No accepted submission recorded → window empty → not rate-limited.
         assert caps.rate_limited(clock()) is False
+
+
+class TestExecutorLatency:
+    """Tick-to-order latency histograms recorded by the executor."""
+
+    def _latency(self, metrics):
+        return metrics.as_dict()["latency"]
+
+    def test_place_round_trip_labelled_by_account_and_symbol(
+        self, mock_rest_client, place_intent
+    ):
+        metrics = HealthMetrics()
+        ex = IntentExecutor(mock_rest_client, health_metrics=metrics, account_name="acct")
+        ex.execute_place(place_intent)
+
+        latency = self._latency(metrics)
+        assert latency["rest_place_round_trip"]["acct/BTCUSDT"]["count"] == 1
+        assert "engine_to_submit" not in latency  # no tick in progress
+
+    def test_engine_to_submit_only_within_tick(self, mock_rest_client, place_intent):
+        metrics = HealthMetrics()
+        ex = IntentExecutor(mock_rest_client, health_metrics=metrics, account_name="acct")
+        ex.begin_tick(time.perf_counter())
+        ex.execute_place(place_intent)
+        ex.end_tick()
+        ex.execute_place(place_intent)
+
+        latency = self._latency(metrics)
+        assert latency["engine_to_submit"]["acct/BTCUSDT"]["count"] == 1
+        assert latency["rest_place_round_trip"]["acct/BTCUSDT"]["count"] == 2
+
+    def test_failed_place_and_cancel_round_trips(
+        self, mock_rest_client, place_intent, cancel_intent
+    ):
+        metrics = HealthMetrics()
+        mock_rest_client.place_order = MagicMock(side_effect=Exception("timeout"))
+        ex = IntentExecutor(mock_rest_client, health_metrics=metrics, account_name="acct")
+        ex.execute_place(place_intent)
+        ex.execute_cancel(cancel_intent)
+
+        latency = self._latency(metrics)
+        assert latency["rest_place_round_trip"]["acct/BTCUSDT"]["count"] == 1
+        assert latency["rest_cancel_round_trip"]["acct/BTCUSDT"]["count"] == 1
+
+    def test_shadow_mode_records_nothing(self, mock_rest_client, place_intent):
+        metrics = HealthMetrics()
+        ex = IntentExecutor(mock_rest_client, shadow_mode=True, health_metrics=metrics)
+        ex.execute_place(place_intent)
+        assert self._latency(metrics) == {}
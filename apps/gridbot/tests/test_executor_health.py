@@ -3,9 +3,15 @@
 from decimal import Decimal
 from unittest.mock import MagicMock, Mock
 
-from gridcore.intents import PlaceLimitIntent
+from bybit_adapter.ws_trade_client import TradeSocketUnavailableError
+from gridcore.intents import CancelIntent, PlaceLimitIntent
 from gridbot.executor import IntentExecutor
-from gridbot.health import HealthMetrics
+from gridbot.health import (
+    LATENCY_REST_PLACE,
+    LATENCY_WS_CANCEL,
+    LATENCY_WS_PLACE,
+    HealthMetrics,
+)
 
 
 def _intent():
@@ -58,7 +64,6 @@ def test_insufficient_balance_failure_bumps_reject_and_rest_code():
 def test_cancel_success_bumps_cancels():
     m = HealthMetrics()
     ex = IntentExecutor(_client(), shadow_mode=False, health_metrics=m)
-    from gridcore.intents import CancelIntent
     ex.execute_cancel(CancelIntent(symbol="BTCUSDT", order_id="x", reason="rebuild"))
     assert m.cancels == 1 and m.cancels_failed == 0
 
@@ -66,3 +71,56 @@ def test_cancel_success_bumps_cancels():
 def test_metrics_optional_none_is_inert():
     ex = IntentExecutor(_client(), shadow_mode=False)  # no health_metrics
     assert ex.execute_place(_intent()).success is True
+
+
+class TestOrderEntryTransport:
+    """WS order entry (ws_trade_client) with REST fallback and per-transport latency."""
+
+    @staticmethod
+    def _ws(error=None):
+        ws = Mock()
+        if error is None:
+            ws.place_order = MagicMock(return_value={"orderId": "ws1"})
+        else:
+            ws.place_order = MagicMock(side_effect=error)
+        ws.cancel_order = MagicMock(return_value=True)
+        return ws
+
+    def test_healthy_socket_places_over_ws(self):
+        m = HealthMetrics()
+        rest, ws = _client(), self._ws()
+        ex = IntentExecutor(rest, health_metrics=m, account_name="a", ws_trade_client=ws)
+
+        assert ex.execute_place(_intent()).order_id == "ws1"
+        ex.execute_cancel(CancelIntent(symbol="BTCUSDT", order_id="ws1", reason="rebuild"))
+
+        rest.place_order.assert_not_called()
+        rest.cancel_order.assert_not_called()
+        assert m.latency[LATENCY_WS_PLACE]["a/BTCUSDT"].count == 1
+        assert m.latency[LATENCY_WS_CANCEL]["a/BTCUSDT"].count == 1
+        assert LATENCY_REST_PLACE not in m.latency
+        assert m.order_entry_fallbacks == 0
+
+    def test_unavailable_socket_falls_back_to_rest(self):
+        m = HealthMetrics()
+        rest, ws = _client(), self._ws(TradeSocketUnavailableError("down"))
+        ex = IntentExecutor(rest, health_metrics=m, account_name="a", ws_trade_client=ws)
+
+        assert ex.execute_place(_intent()).order_id == "oid1"
+
+        rest.place_order.assert_called_once()
+        assert m.order_entry_fallbacks == 1
+        assert m.latency[LATENCY_REST_PLACE]["a/BTCUSDT"].count == 1
+        assert LATENCY_WS_PLACE not in m.latency
+
+    def test_ws_timeout_fails_without_resending_over_rest(self):
+        m = HealthMetrics()
+        rest, ws = _client(), self._ws(TimeoutError("Trade WS place_order timeout: no response within 5.0s"))
+        ex = IntentExecutor(rest, health_metrics=m, account_name="a", ws_trade_client=ws)
+
+        result = ex.execute_place(_intent())
+
+        assert result.success is False
+        rest.place_order.assert_not_called()
+        assert m.orders_rejected["network"] == 1
+        assert m.latency[LATENCY_WS_PLACE]["a/BTCUSDT"].count == 1
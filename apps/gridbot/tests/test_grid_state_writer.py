@@ -4,6 +4,7 @@ Real SQLite session — the partial unique index and FIFO id ordering are
 both dialect-level behaviours that mocked sessions cannot exercise.
 """
 
+import time
 from datetime import datetime, UTC
 from decimal import Decimal
 
@@ -450,3 +451,115 @@ class TestGridStateWriter:
         finally:
             gsw.GridStateWriter._insert_one = original_insert
             writer.stop()
+
+
+def _level_grid(i: int) -> list[dict]:
+    return [{"side": "Buy", "price": 100.0 + i}, {"side": "Sell", "price": 200.0 + i}]
+
+
+def _write_many(writer, count: int, strats: int, ts: datetime) -> None:
+    for i in range(count):
+        writer.write(
+            strat_id=f"strat{i % strats}", grid=_level_grid(i), grid_step=0.5,
+            grid_count=2, account_id="acc1", symbol="LTCUSDT", exchange_ts=ts,
+        )
+
+
+class TestGridStateWriterBatching:
+    def test_burst_across_strats_commits_as_one_batch(self, db):
+        run_ids = {f"strat{i}": "run1" for i in range(4)}
+        writer = GridStateWriter(
+            db, run_id_provider=run_ids.get, max_batch_latency=5.0, max_batch_size=8,
+        )
+        _write_many(writer, 8, strats=4, ts=datetime(2026, 1, 1, tzinfo=UTC))
+        writer.start()  # everything is queued: one full batch, no latency wait
+        assert writer.flush(timeout=2.0) is True
+        writer.stop()
+
+        stats = writer.get_stats()
+        assert (stats["total_batches"], stats["max_batch_size"]) == (1, 8)
+        assert stats["total_written"] == 8
+        assert stats["commit_latency"]["count"] == 1
+        # FIFO preserved inside the multi-row insert.
+        assert [r["grid_json"][0]["price"] for r in _rows(db)] == [100.0 + i for i in range(8)]
+
+    def test_max_batch_latency_bounds_wait_for_more(self, db, grid):
+        writer = GridStateWriter(db, run_id_provider={"strat1": "run1"}.get, max_batch_latency=0.05)
+        writer.start()
+        started = time.monotonic()
+        writer.write(
+            strat_id="strat1", grid=grid, grid_step=0.5, grid_count=3,
+            account_id="acc1", symbol="LTCUSDT", exchange_ts=datetime(2026, 1, 1, tzinfo=UTC),
+        )
+        assert writer.flush(timeout=2.0) is True
+        writer.stop()
+        assert time.monotonic() - started < 1.0
+        assert len(_rows(db)) == 1
+
+    def test_coalesce_keeps_latest_per_scope(self, db):
+        run_ids = {"strat0": "run1", "strat1": "run1"}
+        writer = GridStateWriter(db, run_id_provider=run_ids.get, coalesce=True)
+        _write_many(writer, 6, strats=2, ts=datetime(2026, 1, 1, tzinfo=UTC))
+        writer.start()
+        writer.flush(timeout=2.0)
+        writer.stop()
+
+        rows = _rows(db)
+        assert [(r["strat_id"], r["grid_json"][0]["price"]) for r in rows] == [
+            ("strat0", 104.0), ("strat1", 105.0),
+        ]
+        assert writer.get_stats()["total_coalesced"] == 4
+
+    def test_failed_batch_falls_back_to_row_inserts(self, db):
+        """A poison row fails the multi-row insert; the rest still land and
+        only the poison row's dedupe key is rolled back."""
+        from gridbot.writers import grid_state_writer as gsw
+
+        original_repo = gsw.GridStateSnapshotRepository
+
+        class PoisonRepo(original_repo):
+            def insert_many(self, snapshots):
+                if any(s.strat_id == "strat1" for s in snapshots):
+                    raise RuntimeError("poison row")
+                return super().insert_many(snapshots)
+
+        run_ids = {f"strat{i}": "run1" for i in range(3)}
+        writer = GridStateWriter(db, run_id_provider=run_ids.get)
+        _write_many(writer, 3, strats=3, ts=datetime(2026, 1, 1, tzinfo=UTC))
+        gsw.GridStateSnapshotRepository = PoisonRepo
+        try:
+            writer.start()
+            writer.flush(timeout=2.0)
+        finally:
+            gsw.GridStateSnapshotRepository = original_repo
+            writer.stop()
+
+        assert sorted(r["strat_id"] for r in _rows(db)) == ["strat0", "strat2"]
+        stats = writer.get_stats()
+        assert (stats["total_written"], stats["total_errors"]) == (2, 1)
+        assert ("run1", "acc1", "strat1") not in writer._last_fingerprint
+
+    def test_invalid_batch_settings_rejected(self, db):
+        with pytest.raises(ValueError):
+            GridStateWriter(db, run_id_provider=dict().get, max_batch_size=0)
+        with pytest.raises(ValueError):
+            GridStateWriter(db, run_id_provider=dict().get, max_batch_latency=-1)
+
+
+def test_insert_many_skips_conflicts_within_and_across_statements(db, grid):
+    ts = datetime(2026, 1, 1, tzinfo=UTC)
+
+    def snap(g):
+        return GridStateSnapshot(
+            run_id="run1", account_id="acc1", strat_id="strat1", symbol="LTCUSDT",
+            exchange_ts=ts, local_ts=ts, grid_json=g, grid_step=Decimal("0.5"),
+            grid_count=len(g), raw_fingerprint=grid_fingerprint_hash(g, 0.5, len(g)),
+        )
+
+    with db.get_session() as sess:
+        repo = GridStateSnapshotRepository(sess)
+        assert repo.insert_many([snap(grid), snap(grid), snap(grid[:2])]) == 2
+        assert repo.insert_many([snap(grid[:2]), snap(grid[:1])]) == 1
+        assert repo.insert_many([]) == 0
+    assert len(_rows(db)) == 3
+
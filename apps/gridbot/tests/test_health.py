@@ -5,10 +5,13 @@ import json
 import pytest
 
 from gridbot.health import (
+    LATENCY_REST_PLACE,
     HealthMetrics,
     HealthState,
     HealthStatusWriter,
+    LatencyHistogram,
     build_snapshot,
+    latency_key,
     worst_state,
 )
 
@@ -70,6 +73,66 @@ class TestHealthMetrics:
         m.record_reject("other")
         json.dumps(m.as_dict())  # must not raise
 
+    def test_record_latency_by_metric_and_label(self):
+        m = HealthMetrics()
+        label = latency_key("main", "BTCUSDT")
+        m.record_latency(LATENCY_REST_PLACE, label, 0.010)
+        m.record_latency(LATENCY_REST_PLACE, label, 0.030)
+
+        summary = m.as_dict()["latency"][LATENCY_REST_PLACE]["main/BTCUSDT"]
+        assert summary["count"] == 2
+        assert summary["max_ms"] == pytest.approx(30.0)
+        json.dumps(m.as_dict())  # must not raise
+
+
+class TestLatencyHistogram:
+    def test_empty(self):
+        h = LatencyHistogram()
+        assert h.percentile(99) == 0
+        assert h.as_dict()["count"] == 0
+
+    def test_percentiles_within_bucket_precision(self):
+        h = LatencyHistogram()
+        for us in range(1, 10_001):
+            h.record(us / 1e6)
+
+        for pct, exact in ((50, 5_000), (90, 9_000), (99, 9_900)):
+            assert exact <= h.percentile(pct) <= exact * 1.07
+        assert h.percentile(100) == 10_000
+        assert h.min_us == 1
+
+    def test_percentile_capped_at_max(self):
+        h = LatencyHistogram()
+        h.record(0.001234)
+        assert h.percentile(50) == h.percentile(99.9) == 1234
+
+    def test_negative_counts_as_zero_and_huge_is_clamped(self):
+        h = LatencyHistogram(clamp_us=1_000_000)
+        h.record(-0.5)
+        h.record(3600.0)
+        assert h.min_us == 0
+        assert h.max_us == 1_000_000
+
+    def test_bucket_count_is_bounded(self):
+        h = LatencyHistogram()
+        value = 1e-6
+        while value < 4000:
+            h.record(value)
+            value *= 1.01
+        assert h.count > 1000
+        assert h.bucket_count <= (32 - 4 + 1) * 16
+
+    def test_merge_combines_samples(self):
+        a, b = LatencyHistogram(), LatencyHistogram()
+        for us in (100, 200):
+            a.record(us / 1e6)
+        b.record(5000 / 1e6)
+        a.merge(b)
+        assert (a.count, a.min_us, a.max_us) == (3, 100, 5000)
+        assert a.percentile(100) == 5000
+        with pytest.raises(ValueError):
+            a.merge(LatencyHistogram(sub_bucket_bits=3))
+
 
 class TestBuildSnapshot:
     def _metrics(self):
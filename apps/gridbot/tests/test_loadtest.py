@@ -0,0 +1,125 @@
+"""Tests for the stand-in exchange load-test harness (gridbot.loadtest)."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+
+from grid_db import DatabaseFactory, DatabaseSettings, TickerSnapshot
+
+from gridbot.health import (
+    LATENCY_ENGINE_TO_SUBMIT,
+    LATENCY_ON_TICKER,
+    LATENCY_REST_PLACE,
+    LATENCY_TICK_TO_ACK,
+    LATENCY_WS_PLACE,
+)
+from gridbot.loadtest import (
+    LoadTestConfig,
+    PriceTick,
+    build_gridbot_config,
+    default_symbols,
+    main,
+    recorded_price_path,
+    run_load_test,
+    synthetic_price_path,
+)
+
+
+class TestPricePaths:
+    def test_synthetic_path_is_seeded_and_on_tick(self):
+        path = list(synthetic_price_path(["BTCUSDT", "ETHUSDT"], ticks=50, interval=0.2, seed=7))
+        assert path == list(synthetic_price_path(["BTCUSDT", "ETHUSDT"], 50, 0.2, seed=7))
+        assert path != list(synthetic_price_path(["BTCUSDT", "ETHUSDT"], 50, 0.2, seed=8))
+        assert len(path) == 100
+        assert path[2] == PriceTick(0.2, "BTCUSDT", path[2].price)
+        assert all(t.price % Decimal("0.1") == 0 for t in path if t.symbol == "BTCUSDT")
+
+    def test_recorded_path_merges_symbols_by_time(self):
+        db = DatabaseFactory(DatabaseSettings(db_type="sqlite", db_name=":memory:"))
+        db.create_tables()
+        t0 = datetime(2025, 1, 15, tzinfo=timezone.utc)
+        with db.get_session() as session:
+            for i in range(5):
+                for symbol, offset, price in (("BTCUSDT", 0, 100000 + i), ("ETHUSDT", 1, 3500 + i)):
+                    ts = t0 + timedelta(seconds=2 * i + offset)
+                    session.add(TickerSnapshot(
+                        symbol=symbol, exchange_ts=ts, local_ts=ts,
+                        last_price=Decimal(price), mark_price=Decimal(price),
+                        bid1_price=Decimal(price), ask1_price=Decimal(price),
+                        funding_rate=Decimal("0.0001"),
+                    ))
+
+        path = list(recorded_price_path(
+            db, ["BTCUSDT", "ETHUSDT"], t0 + timedelta(seconds=2), t0 + timedelta(seconds=7),
+            batch_size=2,
+        ))
+        assert [t.offset for t in path] == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+        assert [t.symbol for t in path[:2]] == ["BTCUSDT", "ETHUSDT"]
+        assert path[-1].price == Decimal("3503")
+
+
+def test_build_gridbot_config_one_strategy_per_account_and_symbol():
+    cfg = LoadTestConfig(accounts=3, symbols=default_symbols(2), grid_count=10)
+    config = build_gridbot_config(cfg)
+    assert [a.name for a in config.accounts] == ["acct0", "acct1", "acct2"]
+    assert len({a.api_key for a in config.accounts}) == 3
+    assert len(config.strategies) == 6
+    assert {s.symbol for s in config.strategies} == {"BTCUSDT", "ETHUSDT"}
+    assert config.status_file_enabled is False
+
+
+class TestRunLoadTest:
+    def test_orchestrator_trades_against_stand_in(self, tmp_path):
+        cfg = LoadTestConfig(
+            accounts=2, symbols=["BTCUSDT"], speed=20.0, grid_count=6,
+            grid_step=0.1, settle=0.3,
+        )
+        path = synthetic_price_path(cfg.symbols, ticks=100, interval=0.1, volatility=0.001)
+        report = run_load_test(cfg, path, tmp_path).as_dict()
+
+        assert report["path_ticks"] == 100
+        assert 0 < report["dispatches"] <= 200
+        assert report["orders"]["placed"] > 0
+        assert report["orders"]["place_rejected"] == 0
+        assert report["exchange"]["rest_calls"]["place_order"] == report["orders"]["placed"]
+        for metric in (LATENCY_ON_TICKER, LATENCY_ENGINE_TO_SUBMIT, LATENCY_REST_PLACE,
+                       LATENCY_TICK_TO_ACK, "loop_lag/main", "tick_phase/total"):
+            assert report["latency"][metric]["count"] > 0, metric
+        assert report["rate_limiter"]["waits"] >= 0
+
+    def test_ws_order_entry(self, tmp_path):
+        cfg = LoadTestConfig(
+            accounts=1, symbols=["BTCUSDT"], speed=20.0, grid_count=6,
+            grid_step=0.1, settle=0.3, order_entry="ws",
+        )
+        path = synthetic_price_path(cfg.symbols, ticks=50, interval=0.1, volatility=0.001)
+        report = run_load_test(cfg, path, tmp_path).as_dict()
+
+        assert report["orders"]["placed"] > 0
+        assert report["exchange"]["ws_trade_calls"]["order.create"] == report["orders"]["placed"]
+        assert "place_order" not in report["exchange"]["rest_calls"]
+        assert report["latency"][LATENCY_WS_PLACE]["count"] > 0
+        assert LATENCY_REST_PLACE not in report["latency"]
+
+    def test_path_without_ticks_for_a_symbol_is_rejected(self, tmp_path):
+        cfg = LoadTestConfig(symbols=["BTCUSDT", "ETHUSDT"])
+        with pytest.raises(ValueError, match="ETHUSDT"):
+            run_load_test(cfg, synthetic_price_path(["BTCUSDT"], ticks=3), tmp_path)
+
+
+def test_cli_writes_json_report(tmp_path, capsys):
+    output = tmp_path / "report.json"
+    code = main([
+        "--accounts", "1", "--ticks", "20", "--speed", "50", "--grid-count", "4",
+        "--settle", "0.2", "--work-dir", str(tmp_path), "--output", str(output),
+    ])
+    assert code == 0
+    assert "orders:" in capsys.readouterr().out
+    assert json.loads(output.read_text())["accounts"] == 1
+
+
+def test_cli_recorded_path_requires_range():
+    with pytest.raises(SystemExit):
+        main(["--database-url", "sqlite:///x.db"])
@@ -84,6 +84,24 @@ class TestOrchestratorBasic:
         assert orchestrator.running is False
         assert len(orchestrator._runners) == 0
 
+    def test_sqlite_grid_state_backend_imports_legacy_json(self, gridbot_config, tmp_path):
+        """grid_state_backend=sqlite opens <anchor>.sqlite3 seeded from the JSON file."""
+        from gridcore import GridStateStore
+        from gridcore.persistence import SqliteBackend
+
+        anchor_path = tmp_path / "grid_anchor.json"
+        legacy = GridStateStore(str(anchor_path))
+        legacy.save("s1", [{"side": "Buy", "price": 1.0}], 0.2, 4)
+        legacy.flush()
+
+        config = gridbot_config.model_copy(update={"grid_state_backend": "sqlite"})
+        orchestrator = Orchestrator(config, anchor_store_path=str(anchor_path))
+        store = orchestrator._state_store
+        assert isinstance(store._backend, SqliteBackend)
+        assert (tmp_path / "grid_anchor.sqlite3").exists()
+        assert store.load("s1")["grid"] == [{"side": "Buy", "price": 1.0}]
+        store.close()
+
 
 class TestOrchestratorInit:
     """Tests for orchestrator initialization."""
@@ -467,6 +485,43 @@ class TestOrchestratorLifecycle:
 
         orchestrator._state_store.flush.assert_called_once_with(timeout=10.0)
 
+    @patch("gridbot.orchestrator.BybitRestClient")
+    @patch("gridbot.orchestrator.PublicWebSocketClient")
+    @patch("gridbot.orchestrator.PrivateWebSocketClient")
+    def test_stop_closes_sqlite_grid_state_backend(
+        self,
+        mock_private_ws,
+        mock_public_ws,
+        mock_rest_client,
+        gridbot_config,
+        tmp_path,
+    ):
+        """stop() drains the store, then stops its writer and closes the backend."""
+        import sqlite3
+
+        mock_public_ws.return_value.connect = Mock()
+        mock_private_ws.return_value.connect = Mock()
+        mock_rest_client.return_value.get_open_orders = Mock(return_value=[])
+
+        config = gridbot_config.model_copy(update={"grid_state_backend": "sqlite"})
+        orchestrator = Orchestrator(
+            config, anchor_store_path=str(tmp_path / "grid_anchor.json")
+        )
+        orchestrator.start()
+        store = orchestrator._state_store
+        store.save("s1", [{"side": "Buy", "price": 1.0}], 0.2, 4)
+        writer = store._writer
+
+        orchestrator.stop()
+
+        assert store._closed
+        assert not writer.is_alive()
+        with pytest.raises(sqlite3.ProgrammingError):
+            store._backend._conn.execute("SELECT 1")
+        reopened = sqlite3.connect(tmp_path / "grid_anchor.sqlite3")
+        assert reopened.execute("SELECT strat_id FROM grid_state").fetchall() == [("s1",)]
+        reopened.close()
+
     @patch("gridbot.orchestrator.BybitRestClient")
     @patch("gridbot.orchestrator.PublicWebSocketClient")
     @patch("gridbot.orchestrator.PrivateWebSocketClient")
@@ -1157,6 +1212,67 @@ class TestOrchestratorTick:
 
         notifier.alert_exception.assert_called_once()
 
+    @patch("gridbot.orchestrator.BybitRestClient")
+    @patch("gridbot.orchestrator.PublicWebSocketClient")
+    @patch("gridbot.orchestrator.PrivateWebSocketClient")
+    def test_tick_records_tick_to_order_latency(
+        self, mock_private_ws, mock_public_ws, mock_rest_client,
+        gridbot_config, account_config, strategy_config,
+    ):
+        """A dispatched ticker feeds the per-account/symbol latency histograms
+        (exchange->receive->engine->submit->REST) and the tick-phase timings."""
+        from gridcore.intents import PlaceLimitIntent
+
+        mock_rest_client.return_value.place_order.return_value = {"orderId": "o1"}
+        orchestrator = Orchestrator(gridbot_config)
+        orchestrator._init_account(account_config)
+        orchestrator._init_strategy(strategy_config)
+        orchestrator._build_routing_maps()
+        from collections import deque
+        orchestrator._pending_executions["btcusdt_test"] = deque()
+        orchestrator._pending_orders["btcusdt_test"] = deque()
+
+        executor = orchestrator._strategy_executors["btcusdt_test"]
+        intent = PlaceLimitIntent.create(
+            symbol="BTCUSDT", side="Buy", price=Decimal("50000.0"),
+            qty=Decimal("0.001"), grid_level=10, direction="long", reduce_only=False,
+        )
+        mock_runner = Mock()
+        mock_runner.strat_id = "btcusdt_test"
+        mock_runner.symbol = "BTCUSDT"
+        mock_runner.truncate_breaker_reconcile_count = 0  # 0064 health sweep reads this
+        mock_runner.dirty_rest_refresh_failure_count = 0  # 0064 health sweep reads this
+        mock_runner.on_ticker.side_effect = lambda ev: executor.execute_place(intent)
+        orchestrator._runners = {"btcusdt_test": mock_runner}
+        orchestrator._symbol_to_runners = {"BTCUSDT": [mock_runner]}
+
+        now = datetime.now(UTC)
+        orchestrator._latest_ticker["BTCUSDT"] = TickerEvent(
+            event_type=EventType.TICKER,
+            symbol="BTCUSDT",
+            exchange_ts=now,
+            local_ts=now,
+            last_price=Decimal("50000.0"),
+        )
+        orchestrator._tick()
+
+        latency = orchestrator._health_metrics.as_dict()["latency"]
+        for metric in (
+            "exchange_to_receive", "receive_to_engine", "on_ticker",
+            "engine_to_submit", "rest_place_round_trip",
+        ):
+            assert latency[metric]["test_account/BTCUSDT"]["count"] == 1, metric
+        phases = latency["tick_phase"]
+        for phase in ("drain_executions", "drain_orders", "drain_positions", "tickers"):
+            assert phases[phase]["count"] == 1
+
+        # Outside a ticker dispatch (retry queue, order sync) there is no
+        # engine->submit sample, only the REST round trip.
+        executor.execute_place(intent)
+        latency = orchestrator._health_metrics.as_dict()["latency"]
+        assert latency["engine_to_submit"]["test_account/BTCUSDT"]["count"] == 1
+        assert latency["rest_place_round_trip"]["test_account/BTCUSDT"]["count"] == 2
+
 
 class TestOrchestratorWsPositionDrain:
     """Feature 0023 — coalesced WS position snapshot drained from main loop.
@@ -3826,17 +3942,73 @@ class TestOrchestratorRunBackoff:
 
         return recorded, fake_sleep
 
-    def test_success_sleeps_check_interval(self, gridbot_config):
-        from gridbot.orchestrator import _CHECK_INTERVAL
+    @staticmethod
+    def _install_wait_stub(orchestrator, stop_after):
+        """Replace the wakeup wait to record timeouts and stop after N calls."""
+        recorded: list[float] = []
+
+        def fake_wait(timeout):
+            recorded.append(timeout)
+            if len(recorded) >= stop_after:
+                orchestrator._running = False
+            return False
+
+        orchestrator._wakeup.wait = fake_wait
+        return recorded
 
+    @staticmethod
+    def _set_deadlines(orchestrator, **offsets):
+        now = time.monotonic()
+        for name in (
+            "position_check", "health_check", "ws_health_check",
+            "order_sync", "retry_tick", "divergence_size_check",
+        ):
+            setattr(orchestrator, f"_next_{name}", now + offsets.get(name, 100.0))
+
+    def test_success_waits_until_next_deadline(self, gridbot_config):
         orchestrator = self._make_orchestrator(gridbot_config)
         orchestrator._tick = Mock(return_value=None)
-        recorded, fake_sleep = self._install_sleep_stub(orchestrator, stop_after=1)
+        self._set_deadlines(orchestrator, retry_tick=0.5)
+        recorded = self._install_wait_stub(orchestrator, stop_after=1)
+
+        with patch("gridbot.orchestrator.time.sleep") as sleep:
+            orchestrator.run()
+
+        assert recorded == [pytest.approx(0.5, abs=0.05)]
+        sleep.assert_not_called()
+
+    def test_idle_wait_is_capped(self, gridbot_config):
+        from gridbot.orchestrator import _MAX_IDLE_WAIT
+
+        orchestrator = self._make_orchestrator(gridbot_config)
+        orchestrator._tick = Mock(return_value=None)
+        self._set_deadlines(orchestrator)
+        recorded = self._install_wait_stub(orchestrator, stop_after=1)
+
+        orchestrator.run()
+
+        assert recorded == [_MAX_IDLE_WAIT]
+
+    def test_disabled_order_sync_is_not_a_deadline(self, gridbot_config):
+        gridbot_config.order_sync_interval = 0
+        orchestrator = self._make_orchestrator(gridbot_config)
+        self._set_deadlines(orchestrator, order_sync=-100.0, retry_tick=0.7)
+        assert orchestrator._next_wakeup() == pytest.approx(
+            time.monotonic() + 0.7, abs=0.05
+        )
+
+    def test_min_tick_interval_batches_events(self, gridbot_config):
+        gridbot_config.min_tick_interval = 0.05
+        orchestrator = self._make_orchestrator(gridbot_config)
+        orchestrator._tick = Mock(return_value=None)
+        self._set_deadlines(orchestrator)
+        self._install_wait_stub(orchestrator, stop_after=1)
+        recorded, fake_sleep = self._install_sleep_stub(orchestrator, stop_after=99)
 
         with patch("gridbot.orchestrator.time.sleep", side_effect=fake_sleep):
             orchestrator.run()
 
-        assert recorded == [_CHECK_INTERVAL]
+        assert len(recorded) == 1 and 0 < recorded[0] <= 0.05
 
     def test_escalates_1_2_4_on_repeated_failures(self, gridbot_config):
         orchestrator = self._make_orchestrator(gridbot_config)
@@ -3849,19 +4021,20 @@ class TestOrchestratorRunBackoff:
         assert recorded == [1.0, 2.0, 4.0]
         assert orchestrator._notifier.alert_exception.call_count == 3
 
-    def test_resets_to_check_interval_after_success(self, gridbot_config):
-        from gridbot.orchestrator import _CHECK_INTERVAL
-
+    def test_resets_to_wakeup_wait_after_success(self, gridbot_config):
         orchestrator = self._make_orchestrator(gridbot_config)
         orchestrator._tick = Mock(
             side_effect=[RuntimeError("a"), RuntimeError("b"), None]
         )
-        recorded, fake_sleep = self._install_sleep_stub(orchestrator, stop_after=3)
+        self._set_deadlines(orchestrator)
+        waits = self._install_wait_stub(orchestrator, stop_after=1)
+        recorded, fake_sleep = self._install_sleep_stub(orchestrator, stop_after=99)
 
         with patch("gridbot.orchestrator.time.sleep", side_effect=fake_sleep):
             orchestrator.run()
 
-        assert recorded == [1.0, 2.0, _CHECK_INTERVAL]
+        assert recorded == [1.0, 2.0]
+        assert len(waits) == 1
 
     def test_caps_at_max_tick_backoff(self, gridbot_config):
         from gridbot.orchestrator import _MAX_TICK_BACKOFF
@@ -3897,9 +4070,10 @@ class TestOrchestratorRunRequestStop:
         thread = threading.Thread(target=orchestrator.run, name="run-loop")
         thread.start()
 
-        # Give the loop time to run a few ticks (_CHECK_INTERVAL=0.1s).
+        # Wake the loop a few times the way WS callbacks do.
         deadline = time.monotonic() + 1.0
         while tick_count["n"] < 3 and time.monotonic() < deadline:
+            orchestrator._signal_wakeup()
             time.sleep(0.05)
 
         assert tick_count["n"] >= 3, "run() didn't tick — loop never started"
@@ -3907,13 +4081,66 @@ class TestOrchestratorRunRequestStop:
         # Cross-thread stop signal.
         orchestrator.request_stop()
 
-        # Worst case: one tick already in-flight + one _CHECK_INTERVAL sleep.
-        # 2s leaves plenty of margin on any CI.
+        # request_stop() also signals the wakeup, so the loop exits after at
+        # most the in-flight tick. 2s leaves plenty of margin on any CI.
         thread.join(timeout=2.0)
         assert not thread.is_alive(), "run() did not exit within 2s of request_stop()"
         assert orchestrator._running is False
 
 
+class TestOrchestratorWakeup:
+    """WS callbacks wake the main loop instead of waiting for a fixed tick."""
+
+    def test_signal_wakes_blocked_loop_promptly(self, gridbot_config):
+        orchestrator = Orchestrator(gridbot_config, notifier=Mock(spec=Notifier))
+        ticked = threading.Event()
+        orchestrator._tick = Mock(side_effect=lambda: ticked.set())
+        now = time.monotonic()
+        orchestrator._next_position_check = now + 100
+        orchestrator._next_health_check = now + 100
+        orchestrator._next_ws_health_check = now + 100
+        orchestrator._next_order_sync = now + 100
+        orchestrator._next_retry_tick = now + 100
+        orchestrator._next_divergence_size_check = now + 100
+        orchestrator._running = True
+
+        thread = threading.Thread(target=orchestrator.run, name="run-loop")
+        thread.start()
+        try:
+            assert ticked.wait(1.0)
+            ticked.clear()
+            time.sleep(0.05)  # loop is now parked on the wakeup
+            signalled = time.monotonic()
+            orchestrator._signal_wakeup()
+            assert ticked.wait(1.0)
+            assert time.monotonic() - signalled < 0.5
+        finally:
+            orchestrator.request_stop()
+            thread.join(timeout=2.0)
+        assert not thread.is_alive()
+
+    def test_ticker_callback_signals_wakeup(self, gridbot_config):
+        orchestrator = Orchestrator(gridbot_config, notifier=Mock(spec=Notifier))
+        orchestrator._normalizers["acct"] = Mock(
+            normalize_ticker=Mock(return_value=object())
+        )
+        orchestrator._on_ticker("acct", "BTCUSDT", {})
+        assert orchestrator._wakeup.is_set()
+
+    def test_empty_execution_message_does_not_wake(self, gridbot_config):
+        orchestrator = Orchestrator(gridbot_config, notifier=Mock(spec=Notifier))
+        orchestrator._normalizers["acct"] = Mock(
+            normalize_execution=Mock(return_value=[])
+        )
+        orchestrator._on_execution("acct", {})
+        assert not orchestrator._wakeup.is_set()
+
+    def test_request_stop_signals_wakeup(self, gridbot_config):
+        orchestrator = Orchestrator(gridbot_config)
+        orchestrator.request_stop()
+        assert orchestrator._wakeup.is_set()
+
+
 class TestRequestImmediateOrderSync:
     """Fast-track path for WS-reported untracked (manual) orders."""
 
@@ -8,7 +8,7 @@ from unittest.mock import Mock, MagicMock
 import pytest
 
 from gridcore import TickerEvent, ExecutionEvent, OrderUpdateEvent, EventType, InstrumentInfo
-from gridcore.intents import PlaceLimitIntent, CancelIntent
+from gridcore.intents import AmendIntent, PlaceLimitIntent, CancelIntent
 
 from gridbot.config import StrategyConfig, SafetyCapsConfig
 from gridbot.executor import IntentExecutor, OrderResult, CancelResult
@@ -5596,3 +5596,128 @@ class TestSafetyCapsIntegration:
     @staticmethod
     def _assign_wire(intent: PlaceLimitIntent) -> PlaceLimitIntent:
         return replace(intent, order_link_id=f"{intent.client_order_id}-123")
+
+
+class TestAmendCollapse:
+    """Cancel+place pairs go out as one amend when amend_enabled."""
+
+    def _runner(self, strategy_config, mock_executor, instrument_info, enabled=True):
+        cfg = strategy_config.model_copy(update={"amend_enabled": enabled})
+        r = StrategyRunner(
+            strategy_config=cfg, executor=mock_executor, instrument_info=instrument_info,
+        )
+        r._wallet_balance = Decimal("10000")
+        mock_executor.execute_amend = MagicMock(
+            return_value=OrderResult(success=True, order_id="o1")
+        )
+        return r
+
+    @staticmethod
+    def _track(runner, side="Buy", price="49000.0", order_id="o1") -> PlaceLimitIntent:
+        intent = PlaceLimitIntent.create(
+            symbol="BTCUSDT", side=side, price=Decimal(price), qty=Decimal("0.001"),
+            grid_level=5, direction="long",
+        )
+        intent = replace(intent, order_link_id=f"{intent.client_order_id}-1")
+        runner._tracked_orders[intent.client_order_id] = TrackedOrder(
+            client_order_id=intent.client_order_id, order_id=order_id,
+            intent=intent, status="placed",
+        )
+        return intent
+
+    @staticmethod
+    def _pair(side="Buy", price="48900.0"):
+        cancel = CancelIntent(symbol="BTCUSDT", order_id="o1", reason="outside_grid", side="Buy")
+        place = PlaceLimitIntent.create(
+            symbol="BTCUSDT", side=side, price=Decimal(price), qty=Decimal("0"),
+            grid_level=3, direction="long",
+        )
+        return cancel, place
+
+    def test_disabled_by_default(self, strategy_config, mock_executor, instrument_info):
+        r = self._runner(strategy_config, mock_executor, instrument_info, enabled=False)
+        self._track(r)
+
+        r._execute_intents(list(self._pair()), r.get_limit_orders())
+
+        mock_executor.execute_cancel.assert_called_once()
+        mock_executor.execute_place.assert_called_once()
+        mock_executor.execute_amend.assert_not_called()
+
+    def test_same_side_pair_is_amended_and_rekeyed(
+        self, strategy_config, mock_executor, instrument_info
+    ):
+        r = self._runner(strategy_config, mock_executor, instrument_info)
+        resting = self._track(r)
+        cancel, place = self._pair()
+
+        r._execute_intents([place, cancel], r.get_limit_orders())
+
+        mock_executor.execute_cancel.assert_not_called()
+        mock_executor.execute_place.assert_not_called()
+        amend = mock_executor.execute_amend.call_args.args[0]
+        assert isinstance(amend, AmendIntent)
+        assert amend.order_id == "o1"
+        assert amend.place.price == Decimal("48900.0") and amend.place.qty > 0
+
+        assert resting.client_order_id not in r._tracked_orders
+        tracked = r._tracked_orders[place.client_order_id]
+        assert (tracked.order_id, tracked.status) == ("o1", "placed")
+        # The exchange keeps the orderLinkId the order was placed with.
+        assert tracked.intent.order_link_id == resting.order_link_id
+        assert r.get_limit_orders()["long"][0]["price"] == "48900.0"
+
+    def test_side_flip_is_not_amended(self, strategy_config, mock_executor, instrument_info):
+        r = self._runner(strategy_config, mock_executor, instrument_info)
+        self._track(r)
+        cancel, place = self._pair(side="Sell")
+        place = replace(place, reduce_only=True)
+
+        r._execute_intents([cancel, place], r.get_limit_orders())
+
+        mock_executor.execute_amend.assert_not_called()
+        mock_executor.execute_cancel.assert_called_once()
+
+    def test_duplicate_cancel_is_not_amended(
+        self, strategy_config, mock_executor, instrument_info
+    ):
+        r = self._runner(strategy_config, mock_executor, instrument_info)
+        self._track(r)
+        cancel, place = self._pair()
+
+        r._execute_intents([replace(cancel, reason="duplicate"), place], r.get_limit_orders())
+
+        mock_executor.execute_amend.assert_not_called()
+        mock_executor.execute_cancel.assert_called_once()
+        mock_executor.execute_place.assert_called_once()
+
+    def test_rejected_amend_falls_back_to_cancel_and_place(
+        self, strategy_config, mock_executor, instrument_info
+    ):
+        r = self._runner(strategy_config, mock_executor, instrument_info)
+        resting = self._track(r)
+        mock_executor.execute_amend.return_value = OrderResult(
+            success=False, error="[110001] order not exists"
+        )
+        cancel, place = self._pair()
+
+        r._execute_intents([cancel, place], r.get_limit_orders())
+
+        mock_executor.execute_cancel.assert_called_once_with(cancel)
+        mock_executor.execute_place.assert_called_once()
+        assert r._tracked_orders[resting.client_order_id].status == "cancelled"
+        assert r._tracked_orders[place.client_order_id].order_id == "order_123"
+
+    def test_events_for_amended_order_resolve_by_order_id(
+        self, strategy_config, mock_executor, instrument_info
+    ):
+        r = self._runner(strategy_config, mock_executor, instrument_info)
+        resting = self._track(r)
+        cancel, place = self._pair()
+        r._execute_intents([cancel, place], r.get_limit_orders())
+        # A new order at the original price now owns the original prefix.
+        self._track(r, order_id="o2")
+
+        found = r._find_tracked_order(resting.order_link_id, "o1")
+
+        assert found is r._tracked_orders[place.client_order_id]
@@ -421,6 +421,28 @@ def test_chase_replaces_on_drift(chase_runner):
     assert chase_runner._chase_order["price"] != first_price
 
 
+def test_chase_repeg_goes_out_as_amend(chase_runner, mock_executor):
+    """With amend_enabled the re-peg's cancel + place is one amend."""
+    chase_runner._config = chase_runner._config.model_copy(update={"amend_enabled": True})
+    mock_executor.execute_amend = MagicMock(
+        return_value=OrderResult(success=True, order_id="order_1")
+    )
+    chase_runner._low_balance = True
+    chase_runner._long_position.size = Decimal("10")
+    chase_runner._evaluate_chase(100.0, 8.0)
+    chase_runner._drain_pending_chase_intents()  # chase placed as order_1
+
+    chase_runner._evaluate_chase(110.0, 8.0)
+    chase_runner._drain_pending_chase_intents()
+
+    assert mock_executor.execute_place.call_count == 1
+    amend = mock_executor.execute_amend.call_args.args[0]
+    assert amend.order_id == "order_1"
+    assert amend.place.price == Decimal("110.11")
+    coid = chase_runner._chase_order["client_order_id"]
+    assert chase_runner._tracked_orders[coid].order_id == "order_1"
+
+
 def test_chase_exits_on_balance_recovery(chase_runner):
     chase_runner._low_balance = True
     chase_runner._long_position.size = Decimal("10")
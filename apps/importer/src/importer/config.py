@@ -72,6 +72,14 @@ def positive_int(value: str) -> int:
     return number
 
 
+def positive_float(value: str) -> float:
+    """argparse type: strictly positive float."""
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError("must be a positive number")
+    return number
+
+
 def unit_fraction(value: str) -> float:
     """argparse type: float in (0, 1] (0 would disable the OHLC value gate)."""
     number = float(value)
@@ -331,6 +339,34 @@ def build_parser() -> argparse.ArgumentParser:
         default=10000,
         help="Source fetch batch size (default 10000).",
     )
+    parser.add_argument(
+        "--fetch-workers",
+        type=positive_int,
+        default=1,
+        help="Fetch this many time windows concurrently; a single writer "
+        "still commits them in order (default 1: sequential paging).",
+    )
+    parser.add_argument(
+        "--fetch-window",
+        choices=("hour", "day"),
+        default="day",
+        help="Window size for --fetch-workers > 1 (default day).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="Import this many symbols in parallel worker processes, each "
+        "writing its own output DB (default 1: one symbol at a time).",
+    )
+    parser.add_argument(
+        "--max-requests-per-second",
+        type=positive_float,
+        default=None,
+        help="Global HTTP request budget shared by all --jobs workers and "
+        "fetch threads (default: unlimited; 429 Retry-After is always "
+        "shared).",
+    )
     parser.add_argument(
         "--validate",
         action="store_true",
@@ -8,10 +8,16 @@ sweeps on that data are qualified.
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import date, datetime, time as dt_time, timedelta
-from typing import Iterator, List, Optional
+from pathlib import Path
+from typing import List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
 
 from grid_db.database import DatabaseFactory
 from grid_db.models import TickerSnapshot
@@ -20,7 +26,7 @@ logger = logging.getLogger(__name__)
 
 GAP_THRESHOLD_S = 60.0
 LOW_DENSITY_TICKS_PER_S = 0.5
-_PAGE_SIZE = 50000
+_CACHE_VERSION = 1
 
 
 @dataclass
@@ -43,52 +49,151 @@ class DayDensity:
         return self.ticks_per_second < LOW_DENSITY_TICKS_PER_S
 
 
-def _iter_exchange_ts(db: DatabaseFactory, symbol: str) -> Iterator[datetime]:
-    """Stream exchange_ts ascending, keyset-paginated (unique per symbol)."""
-    with db.get_session() as session:
-        cursor: Optional[datetime] = None
-        while True:
-            query = session.query(TickerSnapshot.exchange_ts).filter(
-                TickerSnapshot.symbol == symbol
+def density_cache_path(db_path: Path) -> Path:
+    """Sidecar density cache next to the output DB."""
+    return db_path.with_name(db_path.name + ".density.json")
+
+
+def _load_cache(
+    path: Optional[Path], symbol: str, first: datetime, last: datetime
+) -> tuple[dict[date, DayDensity], Optional[datetime]]:
+    """Cached days plus the MAX(exchange_ts) they were computed through.
+
+    The output DB is append-only past its resume cursor, so a cache whose
+    first tick still matches and whose last tick is not ahead of the DB is
+    exact for every day before its last tick's day. Anything else (other
+    symbol, rebuilt DB, unreadable file) is ignored and the report is
+    recomputed in full.
+    """
+    if path is None or not path.exists():
+        return {}, None
+    try:
+        payload = json.loads(path.read_text())
+        if payload.get("version") != _CACHE_VERSION or payload["symbol"] != symbol:
+            return {}, None
+        cached_first = datetime.fromisoformat(payload["first"])
+        cached_last = datetime.fromisoformat(payload["last"])
+        if cached_first != first or cached_last > last:
+            return {}, None
+        days = {}
+        for item in payload["days"]:
+            day = date.fromisoformat(item["day"])
+            days[day] = DayDensity(
+                day=day,
+                tick_count=item["tick_count"],
+                gaps=[
+                    (datetime.fromisoformat(a), datetime.fromisoformat(b))
+                    for a, b in item["gaps"]
+                ],
             )
-            if cursor is not None:
-                query = query.filter(TickerSnapshot.exchange_ts > cursor)
-            rows = (
-                query.order_by(TickerSnapshot.exchange_ts)
-                .limit(_PAGE_SIZE)
-                .all()
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.warning("ignoring unreadable density cache %s: %s", path, exc)
+        return {}, None
+    return days, cached_last
+
+
+def _save_cache(
+    path: Path, symbol: str, first: datetime, last: datetime, days: List[DayDensity]
+) -> None:
+    payload = {
+        "version": _CACHE_VERSION,
+        "symbol": symbol,
+        "first": first.isoformat(),
+        "last": last.isoformat(),
+        "days": [
+            {
+                "day": entry.day.isoformat(),
+                "tick_count": entry.tick_count,
+                "gaps": [[a.isoformat(), b.isoformat()] for a, b in entry.gaps],
+            }
+            for entry in days
+        ],
+    }
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(payload))
+    os.replace(tmp, path)
+
+
+def _day_counts(
+    session: Session, symbol: str, since: Optional[datetime]
+) -> List[tuple[date, int]]:
+    """Per-UTC-day tick counts from ``since`` on, aggregated in SQL."""
+    day_expr = func.date(TickerSnapshot.exchange_ts)
+    query = session.query(day_expr, func.count()).filter(
+        TickerSnapshot.symbol == symbol
+    )
+    if since is not None:
+        query = query.filter(TickerSnapshot.exchange_ts >= since)
+    rows = query.group_by(day_expr).all()
+    return [(date.fromisoformat(str(day)), count) for day, count in rows]
+
+
+def _gaps(
+    session: Session, symbol: str, since: Optional[datetime]
+) -> List[tuple[datetime, datetime]]:
+    """Consecutive-tick gaps > GAP_THRESHOLD_S from ``since`` on, via LAG.
+
+    SQLite julianday arithmetic is only good to tens of microseconds, so
+    the SQL filter keeps a one-second margin and the exact threshold is
+    applied to the returned timestamps.
+    """
+    ts = TickerSnapshot.exchange_ts
+    ordered = session.query(
+        ts.label("ts"),
+        func.lag(ts, type_=ts.type).over(order_by=ts).label("prev"),
+    ).filter(TickerSnapshot.symbol == symbol)
+    if since is not None:
+        ordered = ordered.filter(ts >= since)
+    pairs = ordered.subquery()
+    seconds = (func.julianday(pairs.c.ts) - func.julianday(pairs.c.prev)) * 86400
+    rows = (
+        session.query(pairs.c.prev, pairs.c.ts)
+        .filter(pairs.c.prev.isnot(None), seconds > GAP_THRESHOLD_S - 1)
+        .order_by(pairs.c.ts)
+        .all()
+    )
+    return [
+        (prev, cur)
+        for prev, cur in rows
+        if (cur - prev).total_seconds() > GAP_THRESHOLD_S
+    ]
+
+
+def compute_density(
+    db: DatabaseFactory, symbol: str, cache_path: Optional[Path] = None
+) -> List[DayDensity]:
+    """Per-UTC-day tick counts, >60 s gaps (keyed to the gap's start day).
+
+    Counts come from ``GROUP BY date(exchange_ts)`` and gaps from a ``LAG``
+    window, so no per-tick rows cross into Python. With ``cache_path`` the
+    result is persisted and later calls only recompute days from the
+    previous MAX(exchange_ts)'s day onward — the day a resumed import
+    starts appending to, and the day any gap into the new rows starts on.
+    """
+    with db.get_session() as session:
+        first, last = (
+            session.query(
+                func.min(TickerSnapshot.exchange_ts),
+                func.max(TickerSnapshot.exchange_ts),
             )
-            if not rows:
-                return
-            for (ts,) in rows:
-                yield ts
-            cursor = rows[-1][0]
-
+            .filter(TickerSnapshot.symbol == symbol)
+            .one()
+        )
+        if first is None:
+            return []
 
-def compute_density(db: DatabaseFactory, symbol: str) -> List[DayDensity]:
-    """Per-UTC-day tick counts, >60 s gaps (keyed to the gap's start day)."""
-    days: dict[date, DayDensity] = {}
-    prev: Optional[datetime] = None
-    first: Optional[datetime] = None
-    last: Optional[datetime] = None
+        days, cached_last = _load_cache(cache_path, symbol, first, last)
+        since: Optional[datetime] = None
+        if cached_last is not None:
+            since = datetime.combine(cached_last.date(), dt_time.min)
+            days = {d: entry for d, entry in days.items() if d < since.date()}
 
-    for ts in _iter_exchange_ts(db, symbol):
-        if first is None:
-            first = ts
-        last = ts
-        day = ts.date()
-        entry = days.get(day)
-        if entry is None:
-            entry = days[day] = DayDensity(day=day)
-        entry.tick_count += 1
-        if prev is not None and (ts - prev).total_seconds() > GAP_THRESHOLD_S:
+        for day, count in _day_counts(session, symbol, since):
+            days[day] = DayDensity(day=day, tick_count=count)
+        for prev, cur in _gaps(session, symbol, since):
             days.setdefault(prev.date(), DayDensity(day=prev.date())).gaps.append(
-                (prev, ts)
+                (prev, cur)
             )
-        prev = ts
-
-    if first is None:
-        return []
 
     # Partial first/last days: rate denominator is the covered span within
     # the day, not a full 86400 s.
@@ -99,7 +204,10 @@ def compute_density(db: DatabaseFactory, symbol: str) -> List[DayDensity]:
         span_end = min(day_end, last)
         entry.covered_seconds = max((span_end - span_start).total_seconds(), 0.0)
 
-    return [days[d] for d in sorted(days)]
+    result = [days[d] for d in sorted(days)]
+    if cache_path is not None:
+        _save_cache(cache_path, symbol, first, last, result)
+    return result
 
 
 def log_density_report(symbol: str, days: List[DayDensity]) -> bool:
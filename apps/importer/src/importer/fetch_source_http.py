@@ -7,14 +7,18 @@ import logging
 import math
 import random
 import re
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from typing import Iterator, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
 
+from importer.source import RateBudget
+
 logger = logging.getLogger(__name__)
 
 _TIMEOUT = (5, 30)
@@ -86,6 +90,8 @@ class HttpSource:
         batch_size: int = 10000,
         session: Optional[requests.Session] = None,
         api_key: str | None = None,
+        pool_maxsize: int | None = None,
+        rate_budget: RateBudget | None = None,
     ):
         if batch_size <= 0:
             raise ValueError(f"batch_size must be positive, got {batch_size}")
@@ -98,7 +104,20 @@ class HttpSource:
         self._api_key = api_key
         self._owns_session = session is None
         self._session = requests.Session() if session is None else session
+        if session is None and pool_maxsize is not None:
+            # Concurrent window fetches share this session; size its
+            # connection pool to the worker count.
+            adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
         self._closed = False
+        # A 429 Retry-After pauses every thread sharing this source, not
+        # just the one that received it.
+        self._pause_lock = threading.Lock()
+        self._paused_until = 0.0
+        self._paused_by: int | None = None
+        # Optional pacing shared with other processes (``--jobs``).
+        self._rate_budget = rate_budget
 
     def close(self) -> None:
         """Close an owned session exactly once; injected sessions remain open."""
@@ -164,6 +183,21 @@ class HttpSource:
         seconds = (parsed.astimezone(timezone.utc) - now).total_seconds()
         return seconds if seconds >= 0 else None
 
+    def _pause_all(self, seconds: float) -> None:
+        with self._pause_lock:
+            until = time.monotonic() + seconds
+            if until > self._paused_until:
+                self._paused_until = until
+                self._paused_by = threading.get_ident()
+
+    def _await_shared_pause(self) -> None:
+        """Wait out a Retry-After received by another thread."""
+        with self._pause_lock:
+            remaining = self._paused_until - time.monotonic()
+            owner = self._paused_by
+        if remaining > 0 and owner != threading.get_ident():
+            time.sleep(remaining)
+
     def _request_json(self, endpoint: str, params: dict) -> dict:
         """Run one shared authenticated JSON request with bounded retries."""
         url = f"{self._base_url}/{endpoint}"
@@ -171,6 +205,9 @@ class HttpSource:
         for attempt in range(1, _MAX_ATTEMPTS + 1):
             retry_kind: str | None = None
             response = None
+            self._await_shared_pause()
+            if self._rate_budget is not None:
+                self._rate_budget.acquire()
             try:
                 response = self._session.get(
                     url,
@@ -232,6 +269,9 @@ class HttpSource:
                             f"{endpoint} Retry-After exceeds the client retry cap"
                         )
                     delay = max(delay, retry_after)
+                    self._pause_all(delay)
+                    if self._rate_budget is not None:
+                        self._rate_budget.pause(delay)
             logger.warning(
                 "HTTP %s %s (attempt %d/%d); retrying unchanged request",
                 endpoint,
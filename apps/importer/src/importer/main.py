@@ -2,13 +2,18 @@
 
 Usage:
     python -m importer.main --source db --source-url sqlite:///ticker.db \
-        --symbols BTCUSDT,ETHUSDT [--start ...] [--end ...] [--validate]
+        --symbols BTCUSDT,ETHUSDT [--start ...] [--end ...] [--validate] \
+        [--fetch-workers N --fetch-window hour|day] \
+        [--jobs N] [--max-requests-per-second R]
 
 Per symbol: acquire the .importlock sidecar, open/create the per-symbol
 output DB, resume-append new source rows (per-batch commit), refresh the
-single synthetic recording run row, print the density report, optionally
+single synthetic recording run row, print the density report (cached in a
+``.density.json`` sidecar and refreshed from the resume day on), optionally
 validate. Symbols fail independently; the process exit code is non-zero if
-ANY symbol failed (aggregate, not fail-fast).
+ANY symbol failed (aggregate, not fail-fast). ``--jobs N`` imports symbols
+in N worker processes (see ``importer.parallel``); either way a per-symbol
+summary table closes the run.
 """
 
 from __future__ import annotations
@@ -16,11 +21,18 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+import time
 from datetime import datetime
 from typing import Optional
 
+from grid_db import DatabaseFactory
+
 from importer.config import ConfigurationError, build_parser, load_market_data_api_key
-from importer.density import compute_density, log_density_report
+from importer.density import (
+    compute_density,
+    density_cache_path,
+    log_density_report,
+)
 from importer.mapping import FallbackCounters, map_row
 from importer.output_db import (
     ImportLockHeldError,
@@ -35,8 +47,16 @@ from importer.output_db import (
     release_lock,
     verify_source_fingerprint,
 )
+from importer.parallel import (
+    SharedRateBudget,
+    SymbolSummary,
+    log_summary,
+    run_jobs,
+    worker_rate_budget,
+)
 from importer.source import SourceTransport, make_source
 from importer.validate import run_validation
+from importer.windowed import WINDOW_STEPS, fetch_windows
 
 logger = logging.getLogger(__name__)
 
@@ -85,10 +105,36 @@ def _resolve_window(
     return start, end
 
 
+def _write_batch(
+    db: DatabaseFactory,
+    batch: list[dict],
+    resume_from: Optional[datetime],
+    counters: FallbackCounters,
+) -> int:
+    """Map one source batch and commit it; returns rows inserted."""
+    snapshots = []
+    for row in batch:
+        # Resume skip BEFORE mapping (naive-vs-naive comparison —
+        # transports already normalized timestamps to naive UTC).
+        if resume_from is not None and row["timestamp"] <= resume_from:
+            continue
+        snapshot = map_row(row, counters)
+        if snapshot is not None:
+            snapshots.append(snapshot)
+    return insert_batch(db, snapshots)
+
+
 def import_symbol(
-    args: argparse.Namespace, source: SourceTransport, symbol: str
+    args: argparse.Namespace,
+    source: SourceTransport,
+    symbol: str,
+    summary: Optional[SymbolSummary] = None,
 ) -> bool:
-    """Import one symbol into its output DB; returns success."""
+    """Import one symbol into its output DB; returns success.
+
+    When given, ``summary`` receives the rows inserted and the
+    ``--validate`` result for the end-of-run table.
+    """
     db_path = output_db_path(
         args.out_dir,
         symbol,
@@ -131,26 +177,51 @@ def import_symbol(
         counters = FallbackCounters()
         total_inserted = 0
         last_logged_day = None
-        for batch in source.fetch_batches(symbol, lower, end):
-            snapshots = []
-            for row in batch:
-                # Resume skip BEFORE mapping (naive-vs-naive comparison —
-                # transports already normalized timestamps to naive UTC).
-                if resume_from is not None and row["timestamp"] <= resume_from:
-                    continue
-                snapshot = map_row(row, counters)
-                if snapshot is not None:
-                    snapshots.append(snapshot)
-            total_inserted += insert_batch(db, snapshots)
-            day = batch[-1]["timestamp"].date()
-            if day != last_logged_day:
+        if args.fetch_workers > 1:
+            # Windows arrive in order, so committing them one after another
+            # keeps MAX(exchange_ts) an append-only resume cursor.
+            checkpoint = resume_from
+            for (_, window_end), batches in fetch_windows(
+                source,
+                symbol,
+                lower,
+                end,
+                WINDOW_STEPS[args.fetch_window],
+                args.fetch_workers,
+            ):
+                for batch in batches:
+                    total_inserted += _write_batch(db, batch, resume_from, counters)
+                window_checkpoint = get_resume_ts(db, symbol)
+                if checkpoint is not None and (
+                    window_checkpoint is None or window_checkpoint < checkpoint
+                ):
+                    raise RuntimeError(
+                        f"resume checkpoint moved backwards to {window_checkpoint}"
+                    )
+                checkpoint = window_checkpoint
                 logger.info(
-                    "%s: imported through %s (%d rows total)",
+                    "%s: imported window through %s (%d rows total, resume "
+                    "checkpoint %s)",
                     symbol,
-                    day,
+                    window_end,
                     total_inserted,
+                    checkpoint,
                 )
-                last_logged_day = day
+        else:
+            for batch in source.fetch_batches(symbol, lower, end):
+                total_inserted += _write_batch(db, batch, resume_from, counters)
+                day = batch[-1]["timestamp"].date()
+                if day != last_logged_day:
+                    logger.info(
+                        "%s: imported through %s (%d rows total)",
+                        symbol,
+                        day,
+                        total_inserted,
+                    )
+                    last_logged_day = day
+
+        if summary is not None:
+            summary.rows = total_inserted
 
         fallback_counts = counters.as_dict()
         if any(fallback_counts.values()):
@@ -183,12 +254,14 @@ def import_symbol(
             run_id,
         )
 
-        days = compute_density(db, symbol)
+        days = compute_density(
+            db, symbol, cache_path=density_cache_path(db_path)
+        )
         log_density_report(symbol, days)
 
         if args.validate:
             bounds = (get_min_ts(db, symbol), get_resume_ts(db, symbol))
-            return run_validation(
+            validated = run_validation(
                 db,
                 db_path,
                 symbol,
@@ -199,50 +272,99 @@ def import_symbol(
                 args.recorder_db,
                 http_source=source if args.source == "http" else None,
             )
+            if summary is not None:
+                summary.validation = validated
+            return validated
         return True
     finally:
         release_lock(lock)
 
 
-def main(argv: Optional[list[str]] = None) -> int:
-    """Entry point; returns non-zero when ANY symbol failed."""
-    parser = build_parser()
-    args = parser.parse_args(argv)
+def run_symbol(
+    args: argparse.Namespace, source: SourceTransport, symbol: str
+) -> SymbolSummary:
+    """Import one symbol, timing it; failures are logged, never raised."""
+    summary = SymbolSummary(symbol=symbol)
+    started = time.monotonic()
     try:
-        api_key = load_market_data_api_key() if args.source == "http" else None
-    except ConfigurationError as exc:
-        parser.error(str(exc))
-    setup_logging(debug=args.debug)
+        summary.ok = import_symbol(args, source, symbol, summary)
+    except ImportLockHeldError as e:
+        logger.error("%s: %s", symbol, e)
+    except Exception:
+        logger.error("%s: import failed", symbol, exc_info=True)
+    summary.seconds = time.monotonic() - started
+    return summary
+
 
+def _open_source(
+    args: argparse.Namespace,
+    api_key: Optional[str],
+    rate_budget: Optional[SharedRateBudget],
+) -> SourceTransport:
     source_url = (
         args.http_base_url if args.source == "http" else args.source_url
     )
-    source = make_source(
-        args.source, source_url, args.batch_size, api_key=api_key
+    source_options: dict = {}
+    if args.fetch_workers > 1:
+        source_options["pool_maxsize"] = args.fetch_workers
+    if rate_budget is not None:
+        source_options["rate_budget"] = rate_budget
+    return make_source(
+        args.source, source_url, args.batch_size, api_key=api_key, **source_options
     )
 
-    failed: list[str] = []
+
+def _import_worker(
+    args: argparse.Namespace, api_key: Optional[str], symbol: str
+) -> SymbolSummary:
+    """``--jobs`` worker: one symbol on its own source, sharing the budget."""
+    source = _open_source(args, api_key, worker_rate_budget())
     try:
-        for symbol in args.symbols:
-            try:
-                ok = import_symbol(args, source, symbol)
-            except ImportLockHeldError as e:
-                logger.error("%s: %s", symbol, e)
-                ok = False
-            except Exception:
-                logger.error("%s: import failed", symbol, exc_info=True)
-                ok = False
-            if not ok:
-                failed.append(symbol)
-
-        if failed:
-            logger.error("FAILED symbols: %s", ", ".join(failed))
-            return 1
-        return 0
+        return run_symbol(args, source, symbol)
     finally:
         if args.source == "http":
             source.close()
 
 
+def main(argv: Optional[list[str]] = None) -> int:
+    """Entry point; returns non-zero when ANY symbol failed."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        api_key = load_market_data_api_key() if args.source == "http" else None
+    except ConfigurationError as exc:
+        parser.error(str(exc))
+    setup_logging(debug=args.debug)
+
+    if args.jobs > 1 and len(args.symbols) > 1:
+        summaries = run_jobs(
+            args.jobs,
+            args.symbols,
+            _import_worker,
+            (args, api_key),
+            debug=args.debug,
+            requests_per_second=args.max_requests_per_second,
+        )
+    else:
+        rate_budget = (
+            SharedRateBudget(args.max_requests_per_second)
+            if args.max_requests_per_second is not None
+            else None
+        )
+        source = _open_source(args, api_key, rate_budget)
+        try:
+            summaries = [run_symbol(args, source, symbol) for symbol in args.symbols]
+        finally:
+            if args.source == "http":
+                source.close()
+
+    log_summary(summaries)
+    failed = [s.symbol for s in summaries if not s.ok]
+    if failed:
+        logger.error("FAILED symbols: %s", ", ".join(failed))
+        return 1
+    return 0
+
+
 if __name__ == "__main__":  # pragma: no cover
     raise SystemExit(main())
@@ -0,0 +1,162 @@
+"""Multi-symbol ``--jobs`` driver for the importer.
+
+Every symbol writes its own output DB under its own ``.importlock``, so
+symbols are independent and can be imported in parallel worker processes.
+Workers share one :class:`SharedRateBudget` (request spacing plus 429
+``Retry-After`` pauses across all processes) and log through the parent
+(:func:`grid_db.parallel.worker_pool`). Each
+worker returns a :class:`SymbolSummary`; the parent logs them as a single
+table.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SymbolSummary:
+    """Outcome of one symbol's import, for the end-of-run table."""
+
+    symbol: str
+    ok: bool = False
+    rows: int = 0
+    seconds: float = 0.0
+    validation: Optional[bool] = None  # None: --validate not run
+
+    @property
+    def rows_per_second(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.rows / self.seconds
+
+
+class SharedRateBudget:
+    """Request spacing shared by every process that holds this object.
+
+    A GCRA-style "next free slot" on ``time.monotonic()`` (system-wide on
+    the supported platforms) kept in shared memory: each request claims the
+    next slot ``1 / requests_per_second`` after the previous one. A 429
+    ``Retry-After`` pushes the slot out so every worker backs off, not just
+    the one that was throttled. ``requests_per_second=None`` only shares
+    the pauses.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        context: Any = None,
+    ):
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError(
+                f"requests_per_second must be positive, got {requests_per_second}"
+            )
+        ctx = context if context is not None else multiprocessing
+        self._interval = 0.0 if requests_per_second is None else 1.0 / requests_per_second
+        self._next_slot = ctx.RawValue("d", 0.0)
+        self._lock = ctx.Lock()
+
+    def acquire(self) -> float:
+        """Block until this caller's slot; returns the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self._interval
+        wait = slot - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold every holder's next request for at least ``seconds``."""
+        with self._lock:
+            self._next_slot.value = max(
+                self._next_slot.value, time.monotonic() + seconds
+            )
+
+
+_worker_budget: Optional[SharedRateBudget] = None
+
+
+def _init_worker(budget: SharedRateBudget) -> None:
+    """Remember the budget shared with this worker process."""
+    global _worker_budget
+    _worker_budget = budget
+
+
+def worker_rate_budget() -> Optional[SharedRateBudget]:
+    """The budget shared with this worker process (None outside workers)."""
+    return _worker_budget
+
+
+def run_jobs(
+    jobs: int,
+    symbols: Sequence[str],
+    worker: Callable[..., SymbolSummary],
+    worker_args: tuple,
+    *,
+    debug: bool = False,
+    requests_per_second: Optional[float] = None,
+) -> list[SymbolSummary]:
+    """Run ``worker(*worker_args, symbol)`` per symbol in ``jobs`` processes.
+
+    ``worker`` must be a module-level function (see
+    :func:`grid_db.parallel.worker_pool`). Results come back in ``symbols``
+    order; a worker that dies is reported as a failed symbol rather than
+    aborting the others.
+    """
+    # Imported here, not at module level: a spawned process that only
+    # unpickles a SharedRateBudget should not pay for loading grid_db.
+    from grid_db.parallel import spawn_context, worker_pool
+
+    budget = SharedRateBudget(requests_per_second, context=spawn_context())
+    with worker_pool(
+        min(jobs, len(symbols)),
+        level=logging.DEBUG if debug else logging.INFO,
+        quiet_loggers=("urllib3",),
+        initializer=_init_worker,
+        initargs=(budget,),
+    ) as pool:
+        futures = [
+            (symbol, pool.submit(worker, *worker_args, symbol))
+            for symbol in symbols
+        ]
+        summaries = []
+        for symbol, future in futures:
+            try:
+                summaries.append(future.result())
+            except Exception:
+                logger.error("%s: worker failed", symbol, exc_info=True)
+                summaries.append(SymbolSummary(symbol=symbol))
+    return summaries
+
+
+def log_summary(summaries: Sequence[SymbolSummary]) -> None:
+    """Log one row per symbol: status, rows, elapsed, throughput, validation."""
+    width = max([len("symbol")] + [len(s.symbol) for s in summaries])
+    logger.info(
+        "%-*s  %-6s  %10s  %8s  %10s  %s",
+        width, "symbol", "status", "rows", "seconds", "rows/s", "validation",
+    )
+    for s in summaries:
+        validation = (
+            "skipped" if s.validation is None
+            else "passed" if s.validation
+            else "FAILED"
+        )
+        logger.info(
+            "%-*s  %-6s  %10d  %8.1f  %10.1f  %s",
+            width,
+            s.symbol,
+            "ok" if s.ok else "FAILED",
+            s.rows,
+            s.seconds,
+            s.rows_per_second,
+            validation,
+        )
@@ -32,6 +32,18 @@ class SourceTransport(Protocol):
         ...
 
 
+class RateBudget(Protocol):
+    """Request pacing shared between HTTP clients (see ``importer.parallel``)."""
+
+    def acquire(self) -> float:
+        """Block until the caller may send one request; returns seconds waited."""
+        ...
+
+    def pause(self, seconds: float) -> None:
+        """Hold every sharer's next request for at least ``seconds``."""
+        ...
+
+
 class HttpKlineSource(Protocol):
     """Narrow, already-validated HTTP kline contract used by validation."""
 
@@ -47,8 +59,15 @@ def make_source(
     url: str,
     batch_size: int = 10000,
     api_key: str | None = None,
+    pool_maxsize: int | None = None,
+    rate_budget: RateBudget | None = None,
 ) -> SourceTransport:
-    """Construct the transport named by ``--source``."""
+    """Construct the transport named by ``--source``.
+
+    ``pool_maxsize`` sizes the HTTP connection pool for concurrent window
+    fetches and ``rate_budget`` spaces HTTP requests across ``--jobs``
+    workers; the db transport opens one session per call and ignores both.
+    """
     if kind == "db":
         from importer.fetch_source_db import DbSource
 
@@ -56,5 +75,11 @@ def make_source(
     if kind == "http":
         from importer.fetch_source_http import HttpSource
 
-        return HttpSource(url, batch_size=batch_size, api_key=api_key)
+        return HttpSource(
+            url,
+            batch_size=batch_size,
+            api_key=api_key,
+            pool_maxsize=pool_maxsize,
+            rate_budget=rate_budget,
+        )
     raise ValueError(f"unknown source kind: {kind!r}")
@@ -1,11 +1,16 @@
 """Tests for the per-day density report — feature 0093."""
 
+import json
 from datetime import datetime, timedelta
 from decimal import Decimal
 
 from grid_db.models import TickerSnapshot
 
-from importer.density import compute_density, log_density_report
+from importer.density import (
+    compute_density,
+    density_cache_path,
+    log_density_report,
+)
 from importer.output_db import insert_batch, open_output_db
 
 _T0 = datetime(2026, 7, 1, 0, 0, 0)
@@ -88,3 +93,74 @@ class TestDensity:
         """No rows -> empty report."""
         db = open_output_db(tmp_path / "out.db")
         assert compute_density(db, "BTCUSDT") == []
+
+
+def _reference(timestamps):
+    """Per-tick Python reference: (day, count, gaps) tuples."""
+    timestamps = sorted(timestamps)
+    counts, gaps = {}, {}
+    for prev, ts in zip([None] + timestamps, timestamps):
+        counts[ts.date()] = counts.get(ts.date(), 0) + 1
+        if prev is not None and (ts - prev).total_seconds() > 60:
+            gaps.setdefault(prev.date(), []).append((prev, ts))
+    return [
+        (day, counts.get(day, 0), gaps.get(day, []))
+        for day in sorted(set(counts) | set(gaps))
+    ]
+
+
+def _summary(days):
+    return [(d.day, d.tick_count, d.gaps) for d in days]
+
+
+class TestIncrementalDensity:
+    def _ticks(self):
+        # Dense minutes, sub-second jitter, a gap across midnight, a silent day.
+        ticks = [_T0 + timedelta(seconds=37 * i, microseconds=i) for i in range(3000)]
+        ticks.append(_T0 + timedelta(days=1, hours=23, minutes=59, seconds=30))
+        ticks.append(_T0 + timedelta(days=3, seconds=5))
+        return ticks
+
+    def test_sql_aggregates_match_per_tick_reference(self, tmp_path):
+        ticks = self._ticks()
+        db = _seed(tmp_path, ticks)
+        assert _summary(compute_density(db, "BTCUSDT")) == _reference(ticks)
+
+    def test_resume_reuses_cached_days(self, tmp_path):
+        ticks = self._ticks()
+        db = _seed(tmp_path, ticks[:2400])
+        cache = density_cache_path(tmp_path / "out.db")
+        compute_density(db, "BTCUSDT", cache_path=cache)
+        assert cache.exists()
+
+        # Days before the resume day come from the cache, not the DB.
+        payload = json.loads(cache.read_text())
+        payload["days"][0]["tick_count"] = -1
+        cache.write_text(json.dumps(payload))
+
+        insert_batch(db, [_snapshot(ts) for ts in ticks[2400:]])
+        days = compute_density(db, "BTCUSDT", cache_path=cache)
+        expected = _reference(ticks)
+        assert days[0].tick_count == -1
+        assert _summary(days)[1:] == expected[1:]
+        # Covered span of the previously-last day grows with the new rows.
+        assert days[-1].covered_seconds == 5.0
+
+    def test_stale_or_corrupt_cache_recomputes(self, tmp_path):
+        ticks = self._ticks()
+        db = _seed(tmp_path, ticks)
+        cache = density_cache_path(tmp_path / "out.db")
+        compute_density(db, "BTCUSDT", cache_path=cache)
+        payload = json.loads(cache.read_text())
+        payload["days"][0]["tick_count"] = -1
+
+        payload["first"] = (_T0 - timedelta(days=1)).isoformat()
+        cache.write_text(json.dumps(payload))
+        assert _summary(compute_density(db, "BTCUSDT", cache_path=cache)) == (
+            _reference(ticks)
+        )
+
+        cache.write_text("{not json")
+        assert _summary(compute_density(db, "BTCUSDT", cache_path=cache)) == (
+            _reference(ticks)
+        )
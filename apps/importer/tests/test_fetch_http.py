@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import traceback
 from datetime import datetime, timedelta, timezone
 from email.utils import format_datetime
@@ -445,6 +446,53 @@ class TestErrorsAndRetries:
         with pytest.raises(HttpSourceError, match="exceeds"):
             list(source.fetch_batches("BTCUSDT", _T0, _T1))
 
+    def test_retry_after_pauses_other_workers(self, monkeypatch):
+        """A 429 seen by one fetch thread holds back requests from the others."""
+        sleeps = []
+        monkeypatch.setattr(
+            "importer.fetch_source_http.time.sleep", sleeps.append
+        )
+        source, session = _source(
+            [
+                _response(status=429, headers={"Retry-After": "5"}),
+                _response(payload={"rows": [], "next_cursor": None}),
+                _response(payload={"rows": [], "next_cursor": None}),
+            ]
+        )
+        list(source.fetch_batches("BTCUSDT", _T0, _T1))
+        assert sleeps == [5]
+
+        worker = threading.Thread(
+            target=lambda: list(source.fetch_batches("BTCUSDT", _T0, _T1))
+        )
+        worker.start()
+        worker.join()
+        assert len(sleeps) == 2 and 4 < sleeps[1] <= 5
+        assert len(session.sent) == 3
+
+    def test_rate_budget_paces_attempts_and_receives_pauses(self):
+        class RecordingBudget:
+            def __init__(self):
+                self.calls = []
+
+            def acquire(self):
+                self.calls.append("acquire")
+                return 0.0
+
+            def pause(self, seconds):
+                self.calls.append(("pause", seconds))
+
+        budget = RecordingBudget()
+        source, _ = _source(
+            [
+                _response(status=429, headers={"Retry-After": "2"}),
+                _response(payload={"rows": [], "next_cursor": None}),
+            ],
+            rate_budget=budget,
+        )
+        list(source.fetch_batches("BTCUSDT", _T0, _T1))
+        assert budget.calls == ["acquire", ("pause", 2), "acquire"]
+
     @pytest.mark.parametrize(
         "response,match",
         [
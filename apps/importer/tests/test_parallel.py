@@ -0,0 +1,125 @@
+"""Parallel multi-symbol driver tests (importer.parallel, ``--jobs``)."""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import importer.main as importer_main
+from importer.output_db import open_output_db, output_db_path
+from importer.parallel import SharedRateBudget, SymbolSummary, log_summary
+
+_T0 = datetime(2026, 7, 1, 0, 0, 0)
+_SYMBOLS = ("BTCUSDT", "ETHUSDT", "SOLUSDT")
+
+
+def _run_import(source_path, out_dir, symbols, extra=None) -> int:
+    argv = [
+        "--source", "db",
+        "--source-url", f"sqlite:///{source_path}",
+        "--symbols", ",".join(symbols),
+        "--out-dir", str(out_dir),
+    ] + (extra or [])
+    return importer_main.main(argv)
+
+
+def _row_count(out_dir, symbol):
+    db = open_output_db(output_db_path(str(out_dir), symbol))
+    with db.engine.connect() as conn:
+        return conn.exec_driver_sql(
+            "SELECT COUNT(*) FROM ticker_snapshots"
+        ).scalar()
+
+
+class TestSharedRateBudget:
+    def test_spaces_requests(self):
+        budget = SharedRateBudget(requests_per_second=20)
+        started = time.monotonic()
+        waits = [budget.acquire() for _ in range(5)]
+        assert waits[0] == 0
+        assert time.monotonic() - started >= 0.2 - 0.01
+
+    def test_pause_holds_next_request(self):
+        budget = SharedRateBudget()
+        assert budget.acquire() == 0
+        budget.pause(0.1)
+        assert budget.acquire() == pytest.approx(0.1, abs=0.03)
+
+    def test_budget_is_shared_across_processes(self):
+        ctx = multiprocessing.get_context("spawn")
+        budget = SharedRateBudget(requests_per_second=2, context=ctx)
+        workers = [ctx.Process(target=budget.acquire) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        # The children took two consecutive slots; ours is the third.
+        assert 0.3 < budget.acquire() <= 0.55
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            SharedRateBudget(requests_per_second=0)
+
+
+class TestJobs:
+    def test_parallel_matches_sequential_with_summary(
+        self, tmp_path, seed_source_db, src_row, capsys
+    ):
+        source = tmp_path / "source.db"
+        seed_source_db(
+            source,
+            [
+                src_row(n * 100 + i, _T0 + timedelta(minutes=i), symbol=symbol)
+                for n, symbol in enumerate(_SYMBOLS)
+                for i in range(10 + n)
+            ],
+        )
+        assert _run_import(source, tmp_path / "seq", _SYMBOLS) == 0
+        capsys.readouterr()
+        assert _run_import(source, tmp_path / "par", _SYMBOLS, ["--jobs", "3"]) == 0
+        out = capsys.readouterr().out
+        for n, symbol in enumerate(_SYMBOLS):
+            assert _row_count(tmp_path / "par", symbol) == 10 + n
+            assert _row_count(tmp_path / "seq", symbol) == 10 + n
+            # Worker log records reach the parent's console handler.
+            assert f"{symbol}: 0 new rows" not in out
+            assert f"{symbol}: {10 + n} new rows this session" in out
+        assert "rows/s" in out and "validation" in out
+
+    def test_failed_symbol_does_not_stop_others(
+        self, tmp_path, seed_source_db, src_row, capsys
+    ):
+        source = tmp_path / "source.db"
+        seed_source_db(
+            source,
+            [src_row(i, _T0 + timedelta(minutes=i)) for i in range(5)]
+            + [
+                src_row(100 + i, _T0 + timedelta(minutes=i), symbol="ETHUSDT",
+                        last_price=None)
+                for i in range(5)
+            ],
+        )
+        code = _run_import(
+            source, tmp_path / "out", ("BTCUSDT", "ETHUSDT"), ["--jobs", "2"]
+        )
+        assert code == 1
+        assert _row_count(tmp_path / "out", "BTCUSDT") == 5
+        assert "FAILED symbols: ETHUSDT" in capsys.readouterr().out
+
+
+def test_log_summary_table(caplog):
+    summaries = [
+        SymbolSummary("BTCUSDT", ok=True, rows=500, seconds=2.0, validation=True),
+        SymbolSummary("ETHUSDT", ok=False),
+    ]
+    with caplog.at_level("INFO", logger="importer.parallel"):
+        log_summary(summaries)
+    lines = [r.getMessage() for r in caplog.records]
+    assert lines[0].split() == [
+        "symbol", "status", "rows", "seconds", "rows/s", "validation",
+    ]
+    assert lines[1].split() == ["BTCUSDT", "ok", "500", "2.0", "250.0", "passed"]
+    assert lines[2].split() == ["ETHUSDT", "FAILED", "0", "0.0", "0.0", "skipped"]
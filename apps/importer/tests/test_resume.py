@@ -107,6 +107,57 @@ class TestResume:
         runs = _recording_runs(out)
         assert runs == [(_T0, _T0 + timedelta(minutes=8))]
 
+    def test_concurrent_windows_match_sequential_import(
+        self, tmp_path, seed_source_db, src_row
+    ):
+        source = tmp_path / "source.db"
+        seed_source_db(
+            source, [src_row(i, _T0 + timedelta(minutes=17 * i)) for i in range(30)]
+        )
+        assert _run_import(source, tmp_path / "seq", extra=["--batch-size", "4"]) == 0
+        assert _run_import(
+            source,
+            tmp_path / "par",
+            extra=["--batch-size", "4", "--fetch-workers", "3", "--fetch-window", "hour"],
+        ) == 0
+        assert _rows(tmp_path / "par") == _rows(tmp_path / "seq")
+        assert len(_rows(tmp_path / "par")) == 30
+        assert _recording_runs(tmp_path / "par") == _recording_runs(tmp_path / "seq")
+
+    def test_concurrent_crash_resume(
+        self, tmp_path, seed_source_db, src_row, monkeypatch
+    ):
+        """Windows commit in order, so a crash leaves a gap-free prefix."""
+        source = tmp_path / "source.db"
+        out = tmp_path / "out"
+        seed_source_db(
+            source, [src_row(i, _T0 + timedelta(minutes=20 * i)) for i in range(12)]
+        )
+        extra = ["--batch-size", "2", "--fetch-workers", "4", "--fetch-window", "hour"]
+
+        calls = {"n": 0}
+        real_insert = importer_main.insert_batch
+
+        def flaky_insert(db, snapshots):
+            calls["n"] += 1
+            if calls["n"] > 3:
+                raise RuntimeError("simulated crash mid-import")
+            return real_insert(db, snapshots)
+
+        monkeypatch.setattr(importer_main, "insert_batch", flaky_insert)
+        assert _run_import(source, out, extra=extra) == 1
+        monkeypatch.setattr(importer_main, "insert_batch", real_insert)
+
+        committed = _rows(out)
+        assert [ts for ts, _ in committed] == [
+            _T0 + timedelta(minutes=20 * i) for i in range(len(committed))
+        ]
+        assert _recording_runs(out) == []
+
+        assert _run_import(source, out, extra=extra) == 0
+        assert len(_rows(out)) == 12
+        assert _recording_runs(out) == [(_T0, _T0 + timedelta(minutes=220))]
+
     def test_single_run_row_across_appends(self, tmp_path, seed_source_db, src_row):
         """Append rerun keeps ONE recording row: start_ts fixed, end_ts advanced."""
         source = tmp_path / "source.db"
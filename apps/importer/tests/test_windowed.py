@@ -0,0 +1,90 @@
+"""Concurrent windowed fetch tests (importer.windowed)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from importer.windowed import fetch_windows, split_windows
+
+_T0 = datetime(2026, 7, 1, 0, 0)
+_HOUR = timedelta(hours=1)
+
+
+class TestSplitWindows:
+    def test_aligned_inclusive_windows(self):
+        start = _T0 + timedelta(minutes=20)
+        end = _T0 + timedelta(hours=2, minutes=5)
+        assert split_windows(start, end, _HOUR) == [
+            (start, _T0 + timedelta(minutes=59, seconds=59, microseconds=999999)),
+            (_T0 + _HOUR, _T0 + timedelta(hours=1, minutes=59, seconds=59, microseconds=999999)),
+            (_T0 + 2 * _HOUR, end),
+        ]
+
+    def test_single_point_and_empty_ranges(self):
+        assert split_windows(_T0, _T0, timedelta(days=1)) == [(_T0, _T0)]
+        assert split_windows(_T0 + _HOUR, _T0, _HOUR) == []
+
+    def test_windows_tile_the_range(self):
+        start, end = _T0 + timedelta(seconds=7), _T0 + timedelta(days=3, hours=4)
+        windows = split_windows(start, end, timedelta(days=1))
+        assert windows[0][0] == start and windows[-1][1] == end
+        for (_, upper), (lower, _) in zip(windows, windows[1:]):
+            assert lower - upper == timedelta(microseconds=1)
+
+
+class SlowSource:
+    """Rows every 10 minutes; later windows answer faster than earlier ones."""
+
+    def __init__(self, fail_at: datetime | None = None):
+        self.fail_at = fail_at
+        self.calls: list[datetime] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def fetch_batches(self, symbol, start, end):
+        with self._lock:
+            self.calls.append(start)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.02 if start.hour % 2 == 0 else 0.001)
+            if start == self.fail_at:
+                raise RuntimeError("window failed")
+            ts = start
+            while ts <= end:
+                yield [{"symbol": symbol, "timestamp": ts}]
+                ts += timedelta(minutes=10)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestFetchWindows:
+    def test_results_arrive_in_window_order(self):
+        source = SlowSource()
+        results = list(fetch_windows(source, "BTCUSDT", _T0, _T0 + 6 * _HOUR, _HOUR, 3))
+        assert [w for w, _ in results] == split_windows(_T0, _T0 + 6 * _HOUR, _HOUR)
+        stamps = [b[0]["timestamp"] for _, batches in results for b in batches]
+        assert stamps == sorted(stamps) and len(stamps) == 37
+        assert 1 < source.peak <= 3
+
+    def test_failure_stops_before_the_gap(self):
+        source = SlowSource(fail_at=_T0 + 2 * _HOUR)
+        seen = []
+        with pytest.raises(RuntimeError, match="window failed"):
+            for window, _ in fetch_windows(
+                source, "BTCUSDT", _T0, _T0 + 12 * _HOUR, _HOUR, 2
+            ):
+                seen.append(window[0])
+        assert seen == [_T0, _T0 + _HOUR]
+        # Only a bounded number of windows were ever requested ahead.
+        assert len(source.calls) <= 2 + 2 * 2
+
+    def test_rejects_zero_workers(self):
+        with pytest.raises(ValueError):
+            list(fetch_windows(SlowSource(), "BTCUSDT", _T0, _T0, _HOUR, 0))
@@ -5,6 +5,8 @@ Usage:
     uv run live-check --watch 10m      # rolling one-line ticks
     uv run live-check --per-fill --last 2h
     uv run live-check --curve
+    uv run live-check --profile profile.json --profiler sample
+    uv run live-check --jobs 4         # strat checks in 4 worker processes
 
 Exit codes (pinned so cron/automation never mistakes a zero-data window for
 success):
@@ -15,6 +17,7 @@ success):
 """
 
 import argparse
+import dataclasses
 import logging
 import sys
 import time
@@ -22,9 +25,16 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from grid_db import DatabaseFactory, DatabaseSettings, Run, RunRepository, redact_db_url
+from backtest.profiling import (
+    PhaseProfiler,
+    add_profile_arguments,
+    check_profile_arguments,
+    phase_scope,
+    profile_run,
+)
 from replay.snapshot_loader import SeedDataQualityError
 
-from live_check import ground_truth, render, runner, shared_wallet
+from live_check import ground_truth, parallel, render, runner, shared_wallet
 from live_check.config import LiveCheckConfig, StratCheckConfig, load_config
 from live_check.verdict import (
     evaluate,
@@ -78,9 +88,13 @@ def check_strat(
     account_id: str,
     db: DatabaseFactory,
     config: LiveCheckConfig,
+    profiler: Optional[PhaseProfiler] = None,
 ) -> tuple:
     """Run one strat's replay + ground truth + verdict for a window.
 
+    ``profiler`` (``--profile``) times the replay phases plus the
+    ground-truth load and verdict.
+
     Returns:
         ``("skip", reason)`` for empty-window / no-ticker / seed-miss, else
         ``("pass" | "fail", Verdict, ReplayResult)``.
@@ -100,18 +114,73 @@ def check_strat(
         return ("skip", "no ticker data")
 
     try:
-        result = runner.run_strat(strat, window, run_id, account_id, db)
+        result = runner.run_strat(
+            strat, window, run_id, account_id, db, profiler=profiler
+        )
     except SeedDataQualityError as e:
         return ("skip", f"seed miss at {window.start.isoformat()}: {e}")
 
-    with db.get_readonly_session() as session:
+    with phase_scope(profiler, "ground_truth"), db.get_readonly_session() as session:
         truth = ground_truth.collect(
             session, run_id, account_id, strat.symbol, window
         )
-    v = evaluate(result, truth, config.thresholds)
+    with phase_scope(profiler, "verdict"):
+        v = evaluate(result, truth, config.thresholds)
     return ("pass" if v.passed else "fail", v, result)
 
 
+def _check_worker(
+    config: LiveCheckConfig,
+    window: Window,
+    run_id: str,
+    account_id: str,
+    strat: StratCheckConfig,
+) -> tuple:
+    """``--jobs`` worker: ``check_strat`` on this process's own read-only DB.
+
+    The replay's finalized runner is dropped before the outcome is pickled
+    back to the parent; no verdict or report reads it.
+    """
+    db = DatabaseFactory(
+        DatabaseSettings(database_url=config.database_url, read_only=True)
+    )
+    try:
+        outcome = check_strat(strat, window, run_id, account_id, db, config)
+    finally:
+        db.engine.dispose()
+    if outcome[0] == "skip":
+        return outcome
+    status, verdict, result = outcome
+    return (status, verdict, dataclasses.replace(result, runner=None))
+
+
+def check_strats(
+    strats: list[StratCheckConfig],
+    window: Window,
+    run_id: str,
+    account_id: str,
+    db: DatabaseFactory,
+    config: LiveCheckConfig,
+    jobs: int = 1,
+    profiler: Optional[PhaseProfiler] = None,
+) -> list[tuple]:
+    """``check_strat`` for each strat, outcomes in ``strats`` order.
+
+    ``jobs > 1`` fans the checks out to worker processes (``--jobs``);
+    otherwise they run one after another in this process.
+    """
+    if jobs <= 1 or len(strats) <= 1:
+        return [
+            check_strat(strat, window, run_id, account_id, db, config, profiler=profiler)
+            for strat in strats
+        ]
+    logger.info("live_check: checking %d strats in %d worker processes",
+                len(strats), min(jobs, len(strats)))
+    return parallel.run_checks(
+        jobs, strats, _check_worker, (config, window, run_id, account_id)
+    )
+
+
 def _resolve_run(db: DatabaseFactory, run_id: Optional[str]):
     """Resolve (run_id, account_id, run_start) from config/CLI or discovery.
 
@@ -142,7 +211,12 @@ def _exit_code(outcomes: list[str]) -> int:
     return EXIT_PASS
 
 
-def run_single(config: LiveCheckConfig, args, db: DatabaseFactory) -> int:
+def run_single(
+    config: LiveCheckConfig,
+    args,
+    db: DatabaseFactory,
+    profiler: Optional[PhaseProfiler] = None,
+) -> int:
     """--once / --per-fill / --curve: one window, one report, exit."""
     run_id, account_id, run_start = _resolve_run(db, config.run_id)
     last = parse_duration(args.last)
@@ -158,17 +232,25 @@ def run_single(config: LiveCheckConfig, args, db: DatabaseFactory) -> int:
     )
     threshold = staleness_threshold(lag, override)
 
+    with db.get_readonly_session() as session:
+        stale_reasons = [
+            freshness_skip_reason(
+                ground_truth.latest_ticker_ts(session, strat.symbol), lag, threshold
+            )
+            for strat in config.strats
+        ]
+    fresh = [
+        strat for strat, reason in zip(config.strats, stale_reasons) if reason is None
+    ]
+    checked = iter(check_strats(
+        fresh, window, run_id, account_id, db, config,
+        jobs=args.jobs, profiler=profiler,
+    ))
+
     outcomes: list[str] = []
     results = []
-    for strat in config.strats:
-        with db.get_readonly_session() as session:
-            ticker_ts = ground_truth.latest_ticker_ts(session, strat.symbol)
-        reason = freshness_skip_reason(ticker_ts, lag, threshold)
-        if reason is not None:
-            outcomes.append("skip")
-            print(f"{strat.strat_id} ({strat.symbol}) — SKIP: {reason}")
-            continue
-        outcome = check_strat(strat, window, run_id, account_id, db, config)
+    for strat, reason in zip(config.strats, stale_reasons):
+        outcome = ("skip", reason) if reason is not None else next(checked)
         outcomes.append(outcome[0])
         if outcome[0] == "skip":
             print(f"{strat.strat_id} ({strat.symbol}) — SKIP: {outcome[1]}")
@@ -199,7 +281,12 @@ def run_single(config: LiveCheckConfig, args, db: DatabaseFactory) -> int:
     return _exit_code(outcomes)
 
 
-def run_shared_single(config: LiveCheckConfig, args, db: DatabaseFactory) -> int:
+def run_shared_single(
+    config: LiveCheckConfig,
+    args,
+    db: DatabaseFactory,
+    profiler: Optional[PhaseProfiler] = None,
+) -> int:
     """Run one shared-wallet replay and account-level reconciliation."""
     run_id, account_id, run_start = _resolve_run(db, config.run_id)
     last = parse_duration(args.last)
@@ -242,10 +329,12 @@ def run_shared_single(config: LiveCheckConfig, args, db: DatabaseFactory) -> int
                 print(f"{strat.strat_id} ({strat.symbol}) — SKIP: {reason}")
         return EXIT_SKIP
 
-    result = runner.run_shared(config.strats, window, run_id, account_id, db)
+    result = runner.run_shared(
+        config.strats, window, run_id, account_id, db, profiler=profiler
+    )
     per_strat = {}
     rendered = []
-    with db.get_readonly_session() as session:
+    with phase_scope(profiler, "verdict"), db.get_readonly_session() as session:
         for strat in config.strats:
             truth = ground_truth.collect(
                 session, run_id, account_id, strat.symbol, window
@@ -285,6 +374,7 @@ def watch_tick(
     lag,
     threshold,
     now: Optional[datetime] = None,
+    jobs: int = 1,
 ) -> list[str]:
     """One --watch tick: freshness gate + per-strat check, one line each.
 
@@ -296,15 +386,27 @@ def watch_tick(
     must survive them.
     """
     window = compute_window(last, lag, now=now)
+    with db.get_readonly_session() as session:
+        stale_reasons = [
+            freshness_skip_reason(
+                ground_truth.latest_ticker_ts(session, strat.symbol),
+                lag, threshold, now=now,
+            )
+            for strat in config.strats
+        ]
+    fresh = [
+        strat for strat, reason in zip(config.strats, stale_reasons) if reason is None
+    ]
+    checked = iter(
+        check_strats(fresh, window, run_id, account_id, db, config, jobs=jobs)
+    )
+
     lines: list[str] = []
-    for strat in config.strats:
-        with db.get_readonly_session() as session:
-            ticker_ts = ground_truth.latest_ticker_ts(session, strat.symbol)
-        reason = freshness_skip_reason(ticker_ts, lag, threshold, now=now)
+    for strat, reason in zip(config.strats, stale_reasons):
         if reason is not None:
             lines.append(f"{strat.strat_id} SKIP: {reason}")
             continue
-        outcome = check_strat(strat, window, run_id, account_id, db, config)
+        outcome = next(checked)
         if outcome[0] == "skip":
             lines.append(f"{strat.strat_id} SKIP: {outcome[1]}")
         else:
@@ -336,7 +438,7 @@ def run_watch(config: LiveCheckConfig, args, db: DatabaseFactory) -> int:
         check_post_0080_floors(window.start, run_start)
         tick_ts = to_naive_utc(datetime.now(timezone.utc))
         for line in watch_tick(
-            config, db, run_id, account_id, last, lag, threshold
+            config, db, run_id, account_id, last, lag, threshold, jobs=args.jobs
         ):
             print(f"{tick_ts:%H:%M:%S} {line}")
         time.sleep(interval.total_seconds())
@@ -372,9 +474,16 @@ def main(args) -> int:
     try:
         if args.watch:
             return run_watch(config, args, db)
-        if args.shared:
-            return run_shared_single(config, args, db)
-        return run_single(config, args, db)
+        with profile_run(
+            args.profile,
+            sampler=args.profiler,
+            command="live_check",
+            meta={"run_id": config.run_id, "last": args.last, "lag": args.lag,
+                  "shared": args.shared},
+        ) as profiler:
+            if args.shared:
+                return run_shared_single(config, args, db, profiler=profiler)
+            return run_single(config, args, db, profiler=profiler)
     except KeyboardInterrupt:
         # Ctrl-C out of the --watch sleep is a normal way to stop the loop —
         # exit cleanly (conventional SIGINT code) instead of a traceback.
@@ -439,10 +548,23 @@ def cli() -> None:
         "--run-id", type=str, default=None,
         help="Override recorder run_id",
     )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1, metavar="N",
+        help="Check up to N strats in parallel worker processes (default 1). "
+        "--shared replays its one shared-wallet group in a single process",
+    )
     parser.add_argument(
         "--debug", action="store_true", help="Enable debug logging",
     )
+    add_profile_arguments(parser)
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be >= 1")
+    if args.profile and args.watch:
+        parser.error("--profile profiles one run; it cannot be combined with --watch")
+    if args.profile and args.jobs > 1:
+        parser.error("--profile profiles one process; it cannot be combined with --jobs")
+    check_profile_arguments(parser, args)
     setup_logging(args.debug)
     sys.exit(main(args))
 
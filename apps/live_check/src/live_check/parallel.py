@@ -0,0 +1,46 @@
+"""``--jobs`` driver: independent strat checks in worker processes.
+
+Outside ``--shared``, each strat's check is its own seeded replay plus
+ground-truth reads against the read-only recorder DB, with nothing shared
+between strats, so the checks run in spawned worker processes. A worker
+cannot inherit the parent's ``DatabaseFactory`` (engines do not cross a
+process boundary); the worker function opens its own read-only one. The
+pool and its log forwarding are :func:`grid_db.parallel.worker_pool`.
+Outcomes are returned in ``strats`` order, so the report and exit code
+never depend on which worker finished first.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Sequence
+
+from grid_db.parallel import worker_pool
+
+from live_check.config import StratCheckConfig
+
+logger = logging.getLogger(__name__)
+
+
+def run_checks(
+    jobs: int,
+    strats: Sequence[StratCheckConfig],
+    worker: Callable[..., tuple],
+    worker_args: tuple,
+) -> list[tuple]:
+    """Run ``worker(*worker_args, strat)`` per strat in ``jobs`` processes.
+
+    ``worker`` must be a module-level function (see
+    :func:`grid_db.parallel.worker_pool`). A worker exception is re-raised
+    here for the first failing strat in ``strats`` order — the same
+    exception a sequential run would surface.
+    """
+    with worker_pool(
+        min(jobs, len(strats)), quiet_loggers=("sqlalchemy.engine",)
+    ) as pool:
+        futures = [pool.submit(worker, *worker_args, strat) for strat in strats]
+        try:
+            return [future.result() for future in futures]
+        except BaseException:
+            pool.shutdown(cancel_futures=True)
+            raise
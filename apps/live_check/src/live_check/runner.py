@@ -1,9 +1,11 @@
 """Replay orchestration for live_check — one seeded event_follower run per strat."""
 
 import logging
+from typing import Optional
 
 from grid_db import DatabaseFactory
 
+from backtest.profiling import PhaseProfiler
 from replay.config import FillSimulatorConfig, ReplayConfig, SeedConfig
 from replay.engine import ReplayEngine, ReplayResult
 from replay.multi_config import MultiReplayConfig, MultiSeedConfig
@@ -66,12 +68,13 @@ def run_strat(
     run_id: str,
     account_id: str,
     db: DatabaseFactory,
+    profiler: Optional[PhaseProfiler] = None,
 ) -> ReplayResult:
     """Run one seeded event_follower replay for a strat over the window.
 
     ``db`` is the READ-ONLY live recorder factory; snapshot emission is
     disabled so the engine never writes ``source='backtest'`` rows into it
-    (Phase 1B(b)).
+    (Phase 1B(b)). ``profiler`` times the replay phases for ``--profile``.
     """
     config = build_replay_config(
         strat=strat,
@@ -80,7 +83,9 @@ def run_strat(
         database_url=db.settings.get_database_url(),
         account_id=account_id,
     )
-    engine = ReplayEngine(config, db=db, emit_backtest_snapshots=False)
+    engine = ReplayEngine(
+        config, db=db, emit_backtest_snapshots=False, profiler=profiler
+    )
     logger.info(
         "%s: replaying %s window %s → %s (event_follower, seeded)",
         strat.strat_id, strat.symbol, window.start, window.end,
@@ -125,6 +130,7 @@ def run_shared(
     run_id: str,
     account_id: str,
     db: DatabaseFactory,
+    profiler: Optional[PhaseProfiler] = None,
 ) -> MultiReplayResult:
     """Run one seeded shared-wallet replay for all configured strats."""
     config = build_multi_replay_config(
@@ -134,7 +140,9 @@ def run_shared(
         database_url=db.settings.get_database_url(),
         account_id=account_id,
     )
-    engine = MultiReplayEngine(config, db=db, emit_backtest_snapshots=False)
+    engine = MultiReplayEngine(
+        config, db=db, emit_backtest_snapshots=False, profiler=profiler
+    )
     logger.info(
         "shared: replaying %d strats window %s → %s (event_follower, seeded)",
         len(strats), window.start, window.end,
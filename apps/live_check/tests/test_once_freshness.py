@@ -16,7 +16,7 @@ from live_check import main as lc_main
 
 
 def _args():
-    return SimpleNamespace(last="1h", lag="2m", per_fill=False, curve=False)
+    return SimpleNamespace(last="1h", lag="2m", per_fill=False, curve=False, jobs=1)
 
 
 def _add_ticker(db, exchange_ts):
@@ -0,0 +1,199 @@
+"""``--jobs``: strat checks in worker processes (live_check.parallel)."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from grid_db import (
+    DatabaseFactory,
+    DatabaseSettings,
+    GridStateSnapshot,
+    PositionSnapshot,
+    PrivateExecution,
+    Run,
+    TickerSnapshot,
+    WalletSnapshot,
+)
+from gridcore import Grid
+
+from live_check import main as lc_main
+from live_check.config import LiveCheckConfig
+from live_check.render import render_once
+from live_check.window import Window
+
+RUN_ID = "test-run-id"
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'recorder.db'}"
+
+
+@pytest.fixture
+def db(db_url):
+    """File-backed recorder DB: spawned workers open it themselves."""
+    database = DatabaseFactory(DatabaseSettings(database_url=db_url))
+    database.create_tables()
+    return database
+
+
+def _add_ticker(db, symbol, exchange_ts):
+    with db.get_session() as session:
+        session.add(TickerSnapshot(
+            symbol=symbol,
+            exchange_ts=exchange_ts,
+            local_ts=exchange_ts,
+            last_price=Decimal("80"),
+            mark_price=Decimal("80"),
+            bid1_price=Decimal("79.9"),
+            ask1_price=Decimal("80.1"),
+            funding_rate=Decimal("0.0001"),
+        ))
+
+
+def _seed_replayable(db, strat, ts, execs, unrealised_pnl=None):
+    """Everything a seeded replay of ``strat`` over ``[ts, ts + 10m)`` reads.
+
+    A live gridbot run's grid-state snapshot, flat positions for the
+    recorder run (the long leg reporting ``unrealised_pnl``), a falling
+    ticker path and ``execs`` as ``(minutes, side, price, qty)`` live
+    executions.
+    """
+    grid = Grid(tick_size=strat.tick_size, grid_count=strat.grid_count, grid_step=strat.grid_step)
+    grid.build_grid(80.0)
+    before = ts - timedelta(minutes=30)
+    with db.get_session() as session:
+        recording = session.get(Run, RUN_ID)
+        live_run = f"live-{strat.symbol}"
+        session.add(Run(
+            run_id=live_run,
+            user_id=recording.user_id,
+            account_id=recording.account_id,
+            strategy_id=recording.strategy_id,
+            run_type="live",
+            start_ts=ts - timedelta(days=1),
+        ))
+        session.flush()
+        session.add(GridStateSnapshot(
+            run_id=live_run,
+            account_id=recording.account_id,
+            strat_id=strat.strat_id,
+            symbol=strat.symbol,
+            exchange_ts=before,
+            local_ts=before,
+            grid_json=[{"side": str(g["side"]), "price": g["price"]} for g in grid.grid],
+            grid_step=Decimal(str(strat.grid_step)),
+            grid_count=strat.grid_count,
+        ))
+        for side in ("Buy", "Sell"):
+            session.add(PositionSnapshot(
+                run_id=RUN_ID, account_id=recording.account_id, symbol=strat.symbol,
+                exchange_ts=before, local_ts=before, side=side,
+                size=Decimal("0"), entry_price=Decimal("0"),
+                unrealised_pnl=(
+                    Decimal(unrealised_pnl) if side == "Buy" and unrealised_pnl else None
+                ),
+            ))
+        for minute in range(10):
+            price = Decimal("80") - Decimal("0.1") * minute * 5
+            tick_ts = ts + timedelta(minutes=minute)
+            session.add(TickerSnapshot(
+                symbol=strat.symbol, exchange_ts=tick_ts, local_ts=tick_ts,
+                last_price=price, mark_price=price,
+                bid1_price=price - Decimal("0.1"), ask1_price=price + Decimal("0.1"),
+                funding_rate=Decimal("0.0001"),
+            ))
+        for n, (minute, side, price, qty) in enumerate(execs):
+            exec_ts = ts + timedelta(minutes=minute, seconds=30)
+            session.add(PrivateExecution(
+                run_id=RUN_ID, account_id=recording.account_id, symbol=strat.symbol,
+                exec_id=f"{strat.symbol}-exec-{n}", order_id=f"{strat.symbol}-order-{n}",
+                exchange_ts=exec_ts, side=side, exec_price=Decimal(price),
+                exec_qty=Decimal(qty), exec_fee=Decimal("0"), closed_pnl=Decimal("0"),
+            ))
+
+
+class TestJobs:
+    def test_outcomes_in_config_order(self, db, db_url, seeded_run_account, strat, capsys):
+        """Worker checks and parent-side stale SKIPs report in config order."""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        sol = strat.model_copy(update={"strat_id": "solusdt_test", "symbol": "SOLUSDT"})
+        btc = strat.model_copy(update={"strat_id": "btcusdt_test", "symbol": "BTCUSDT"})
+        for symbol in ("LTCUSDT", "SOLUSDT"):
+            _add_ticker(db, symbol, now)
+        config = LiveCheckConfig(strats=[strat, btc, sol], run_id=RUN_ID, database_url=db_url)
+        ro_db = DatabaseFactory(DatabaseSettings(database_url=db_url, read_only=True))
+        args = SimpleNamespace(last="1h", lag="2m", per_fill=False, curve=False, jobs=2)
+
+        assert lc_main.run_single(config, args, ro_db) == lc_main.EXIT_SKIP
+        assert capsys.readouterr().out.splitlines() == [
+            "ltcusdt_test (LTCUSDT) — SKIP: no data in window (0 live executions)",
+            "btcusdt_test (BTCUSDT) — SKIP: no ticker data",
+            "solusdt_test (SOLUSDT) — SKIP: no data in window (0 live executions)",
+        ]
+
+    def test_worker_error_reaches_parent(self, tmp_path, strat):
+        """A worker that cannot open the DB fails the run as sequentially."""
+        missing = f"sqlite:///{tmp_path / 'missing.db'}"
+        config = LiveCheckConfig(strats=[strat, strat], run_id=RUN_ID, database_url=missing)
+        window = Window(start=datetime(2026, 7, 1, 11), end=datetime(2026, 7, 1, 12))
+        with pytest.raises(OperationalError):
+            lc_main.check_strats(
+                config.strats, window, RUN_ID, "acc", db=None, config=config, jobs=2,
+            )
+
+    def test_replay_results_through_pool_match_sequential(
+        self, db, db_url, seeded_run_account, strat, ts, tmp_path, monkeypatch,
+    ):
+        """Real seeded replays in workers: same outcomes and report as --jobs 1."""
+        sol = strat.model_copy(update={"strat_id": "solusdt_test", "symbol": "SOLUSDT"})
+        _seed_replayable(db, strat, ts, execs=[(2, "Buy", "79.4", "0.01")])
+        # Same fill, but live reports unrealised PnL the replay cannot: FAIL.
+        _seed_replayable(db, sol, ts, execs=[(2, "Buy", "79.4", "0.01")], unrealised_pnl="5")
+        with db.get_session() as session:
+            session.add(WalletSnapshot(
+                run_id=RUN_ID, account_id=seeded_run_account.account_id,
+                exchange_ts=ts - timedelta(minutes=30), local_ts=ts - timedelta(minutes=30),
+                coin="USDT", wallet_balance=Decimal("1000"), available_balance=Decimal("1000"),
+                total_equity=Decimal("1000"), total_available_balance=Decimal("1000"),
+                total_margin_balance=Decimal("1000"),
+            ))
+        # Workers are spawned in this cwd and read the same instrument cache.
+        monkeypatch.chdir(tmp_path)
+        cache = tmp_path / "conf" / "instruments_cache.json"
+        cache.parent.mkdir()
+        cache.write_text(json.dumps({
+            symbol: {
+                "symbol": symbol, "qty_step": "0.01", "tick_size": "0.1",
+                "min_qty": "0.01", "max_qty": "10000",
+                "cached_at": datetime.now(timezone.utc).isoformat(),
+            }
+            for symbol in ("LTCUSDT", "SOLUSDT")
+        }))
+        config = LiveCheckConfig(strats=[strat, sol], run_id=RUN_ID, database_url=db_url)
+        ro_db = DatabaseFactory(DatabaseSettings(database_url=db_url, read_only=True))
+        window = Window(start=ts, end=ts + timedelta(minutes=10))
+
+        def check(jobs):
+            return lc_main.check_strats(
+                config.strats, window, RUN_ID, seeded_run_account.account_id,
+                ro_db, config, jobs=jobs,
+            )
+
+        sequential = check(1)
+        parallel = check(2)
+
+        assert [o[0] for o in sequential] == ["pass", "fail"]
+        assert [o[0] for o in parallel] == ["pass", "fail"]
+        for seq, par in zip(sequential, parallel):
+            assert par[1] == seq[1]
+            assert par[2].session.trades == seq[2].session.trades
+        assert render_once(
+            [(s, o[1], o[2]) for s, o in zip(config.strats, parallel)]
+        ) == render_once(
+            [(s, o[1], o[2]) for s, o in zip(config.strats, sequential)]
+        )
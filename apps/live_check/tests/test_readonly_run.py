@@ -4,6 +4,8 @@ FILE-BACKED temp SQLite — mode=ro is skipped for :memory:, so only a file DB
 actually exercises the read-only open during a full engine run.
 """
 
+import dataclasses
+import pickle
 from datetime import datetime, timedelta
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
@@ -22,6 +24,7 @@ from replay.config import ReplayConfig, ReplayStrategyConfig
 from replay.engine import (
     ReplayEngine,
     _BatchPositionSnapshotWriter,
+    _InMemoryPositionSnapshotSink,
     _NoopPositionSnapshotWriter,
 )
 
@@ -135,19 +138,24 @@ class TestNoopWriterWiring:
         assert runner._position_writer.flush() == 0
         assert runner._position_writer.total_written == 0
 
-    def test_default_keeps_batch_writer(self, mock_instrument):
-        """Flag unset → existing callers keep the flushing batch writer."""
-        engine = ReplayEngine(_config(), db=MagicMock())
-        runner = engine._init_runner(
-            BacktestStrategyConfig(
-                strat_id="s", symbol="LTCUSDT", tick_size=Decimal("0.1")
-            ),
-            BacktestSession(initial_balance=Decimal("10000")),
-            instrument_info=_fake_instrument_info(),
-            run_id=RUN_ID,
-            account_id="acc1",
-        )
-        assert isinstance(runner._position_writer, _BatchPositionSnapshotWriter)
+    def test_default_keeps_snapshots_in_memory(self, mock_instrument):
+        """Flag unset → in-memory sink; DB export only when configured."""
+        for export in (False, True):
+            config = _config()
+            config.export_position_snapshots = export
+            engine = ReplayEngine(config, db=MagicMock())
+            runner = engine._init_runner(
+                BacktestStrategyConfig(
+                    strat_id="s", symbol="LTCUSDT", tick_size=Decimal("0.1")
+                ),
+                BacktestSession(initial_balance=Decimal("10000")),
+                instrument_info=_fake_instrument_info(),
+                run_id=RUN_ID,
+                account_id="acc1",
+            )
+            sink = runner._position_writer
+            assert isinstance(sink, _InMemoryPositionSnapshotSink)
+            assert isinstance(sink._export, _BatchPositionSnapshotWriter) is export
 
 
 class TestReadOnlyRun:
@@ -175,6 +183,9 @@ class TestReadOnlyRun:
         ]
         result = engine.run(data_provider=InMemoryDataProvider(ticks))
         assert result.run_id == RUN_ID
+        # --jobs workers pickle the result back, minus the runner.
+        shipped = pickle.loads(pickle.dumps(dataclasses.replace(result, runner=None)))
+        assert shipped.session.trades == result.session.trades
 
         with writer_db.get_session() as session:
             bt_rows = (
@@ -73,3 +73,38 @@ class TestBuildReplayConfig:
         assert s.increase_same_position_on_low_margin is True
         assert s.leverage == 10
         assert s.enable_risk_multipliers is True
+
+
+class TestProfilerWiring:
+    def test_run_strat_passes_profiler_to_engine(self, strat, monkeypatch):
+        """--profile: the read-only replay engine receives the profiler."""
+        from backtest.profiling import PhaseProfiler
+        from live_check import runner
+
+        captured = {}
+
+        class _Engine:
+            def __init__(self, config, **kwargs):
+                captured.update(kwargs)
+
+            def run(self):
+                return "result"
+
+        class _Db:
+            class settings:
+                @staticmethod
+                def get_database_url():
+                    return "sqlite:///recorder.db"
+
+        monkeypatch.setattr(runner, "ReplayEngine", _Engine)
+        start = datetime(2026, 7, 1, 8, 0, 0)
+        window = Window(start=start, end=start + timedelta(hours=4))
+        profiler = PhaseProfiler()
+
+        result = runner.run_strat(
+            strat, window, "test-run-id", "acc-uuid", _Db(), profiler=profiler
+        )
+
+        assert result == "result"
+        assert captured["profiler"] is profiler
+        assert captured["emit_backtest_snapshots"] is False
@@ -76,6 +76,7 @@ def main(config_path: str | None = None, tolerance: float | None = None, output_
         api_key=config.account.api_key,
         api_secret=config.account.api_secret,
         testnet=False,
+        rate_limit_caller="pnl_checker",
     )
 
     # Build risk config from YAML params
@@ -0,0 +1,373 @@
+"""Offline ticker_snapshots compaction (feature 0103).
+
+Usage:
+    recorder-compact --database-url sqlite:///recorder.db
+    recorder-compact --database-url sqlite:///recorder.db --rollup 1m --hot-days 7 --vacuum
+    recorder-compact --database-url postgresql://... --symbol BTCUSDT --cluster
+
+Two passes over each symbol's rows in ``exchange_ts`` order, fused into one
+keyset-paged scan:
+
+- **Dedupe** (default on): a row whose L1 state (last/mark/bid1/ask1 price,
+  funding rate) equals the previous surviving row is deleted, unless it is
+  the first row ``DEDUPE_HEARTBEAT_SECONDS`` after that row (the recorder's
+  live dedupe keeps the same heartbeat). Replay/backtest carry the last
+  state forward and see the same stream; the heartbeat keeps row spacing
+  within live_check's freshness gate and the importer's 60 s gap threshold.
+  Tick counts in the density report do drop.
+- **Rollup** (``--rollup 1s|1m``): rows older than the hot period are thinned
+  to the first, lowest-``last_price``, highest-``last_price`` and last row of
+  each bucket, kept verbatim. Any grid level the raw stream crossed inside a
+  bucket is still crossed (the path runs through both extremes), so fills
+  are preserved; only intra-bucket timing coarsens, and kept rows stay less
+  than one bucket apart. The range is recorded in ``ticker_rollups`` so the
+  data provider can report it.
+
+Each page commits on its own, so an interrupted run leaves a valid, partly
+compacted table and can simply be re-run. ``--vacuum`` / ``--cluster``
+reclaim space and rewrite rows in ``(symbol, exchange_ts)`` order; on SQLite
+both need exclusive access, so stop the recorder first.
+"""
+
+import argparse
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func, text
+
+from grid_db import (
+    DatabaseFactory,
+    DatabaseSettings,
+    TickerRollup,
+    TickerRollupRepository,
+    TickerSnapshot,
+    TickerSnapshotRepository,
+    redact_db_url,
+)
+
+from event_saver.writers.ticker_writer import DEDUPE_HEARTBEAT_SECONDS
+
+from recorder.main import setup_logging
+
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_BUCKETS = {"1s": 1, "1m": 60}
+
+# Ids per DELETE statement: below SQLite's historical 999 bound-parameter cap.
+_DELETE_CHUNK = 500
+
+_TICKER_COLUMNS = (
+    "symbol, exchange_ts, local_ts, last_price, mark_price, "
+    "bid1_price, ask1_price, funding_rate, raw_json"
+)
+
+
+@dataclass
+class CompactionStats:
+    """Per-symbol outcome of :func:`compact_symbol`."""
+
+    symbol: str
+    rows_scanned: int = 0
+    duplicates_removed: int = 0
+    rolled_up_removed: int = 0
+
+    @property
+    def rows_kept(self) -> int:
+        return self.rows_scanned - self.duplicates_removed - self.rolled_up_removed
+
+
+def _epoch(ts: datetime) -> float:
+    """Seconds since epoch; naive values (SQLite) are UTC."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=UTC)
+    return ts.timestamp()
+
+
+def _bucket_floor(ts: datetime, bucket_seconds: int) -> datetime:
+    epoch = int(_epoch(ts)) // bucket_seconds * bucket_seconds
+    return datetime.fromtimestamp(epoch, UTC)
+
+
+def _thin_bucket(rows: list) -> list[int]:
+    """Ids to delete from one bucket: all but first, low, high and last."""
+    keep = {
+        0,
+        len(rows) - 1,
+        min(range(len(rows)), key=lambda i: rows[i].last_price),
+        max(range(len(rows)), key=lambda i: rows[i].last_price),
+    }
+    return [row.id for i, row in enumerate(rows) if i not in keep]
+
+
+def compact_symbol(
+    db: DatabaseFactory,
+    symbol: str,
+    dedupe: bool = True,
+    rollup_seconds: Optional[int] = None,
+    rollup_before: Optional[datetime] = None,
+    batch_size: int = 5000,
+    heartbeat_seconds: float = DEDUPE_HEARTBEAT_SECONDS,
+) -> CompactionStats:
+    """Dedupe and/or roll up one symbol's ticker rows in place.
+
+    Args:
+        db: Database factory.
+        symbol: Symbol to compact.
+        dedupe: Delete rows whose L1 state repeats the previous row's.
+        heartbeat_seconds: With ``dedupe``, a repeated state at least this
+            long after the previous surviving row is kept.
+        rollup_seconds: Bucket width for the rollup pass; None disables it.
+        rollup_before: Rows before this instant (floored to a bucket
+            boundary) are rolled up; later rows are the raw hot period.
+            Required with ``rollup_seconds``.
+        batch_size: Rows per page.
+
+    Returns:
+        Row counts for the symbol.
+    """
+    if rollup_seconds is not None and rollup_before is None:
+        raise ValueError("rollup_before is required with rollup_seconds")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+
+    stats = CompactionStats(symbol=symbol)
+    rollup_end_epoch: Optional[float] = None
+    rollup: Optional[TickerRollup] = None
+
+    with db.get_session() as session:
+        if rollup_seconds is not None:
+            rollup_end = _bucket_floor(rollup_before, rollup_seconds)
+            first_ts = (
+                session.query(func.min(TickerSnapshot.exchange_ts))
+                .filter(TickerSnapshot.symbol == symbol)
+                .scalar()
+            )
+            if first_ts is not None and _epoch(first_ts) < _epoch(rollup_end):
+                rollup_end_epoch = _epoch(rollup_end)
+                # Recorded (and committed) before any row is thinned, so an
+                # interrupted run never leaves an unreported rolled-up range.
+                rollup = TickerRollupRepository(session).create(
+                    TickerRollup(
+                        symbol=symbol,
+                        start_ts=_bucket_floor(first_ts, rollup_seconds),
+                        end_ts=rollup_end,
+                        bucket_seconds=rollup_seconds,
+                        rows_before=0,
+                        rows_after=0,
+                    )
+                )
+                session.commit()
+
+        repo = TickerSnapshotRepository(session)
+        pending_deletes: list[int] = []
+
+        def _delete(ids: list[int]) -> None:
+            pending_deletes.extend(ids)
+            while len(pending_deletes) >= _DELETE_CHUNK:
+                repo.delete_by_ids(pending_deletes[:_DELETE_CHUNK])
+                del pending_deletes[:_DELETE_CHUNK]
+
+        def _flush_deletes() -> None:
+            # _delete leaves fewer than _DELETE_CHUNK ids behind.
+            repo.delete_by_ids(pending_deletes)
+            pending_deletes.clear()
+
+        last_state: Optional[tuple] = None
+        last_kept_epoch = 0.0
+        bucket_key: Optional[int] = None
+        bucket_rows: list = []
+        rollup_scanned = 0
+        rollup_removed = 0
+        cursor_ts: Optional[datetime] = None
+
+        while True:
+            query = session.query(
+                TickerSnapshot.id,
+                TickerSnapshot.exchange_ts,
+                TickerSnapshot.last_price,
+                TickerSnapshot.mark_price,
+                TickerSnapshot.bid1_price,
+                TickerSnapshot.ask1_price,
+                TickerSnapshot.funding_rate,
+            ).filter(TickerSnapshot.symbol == symbol)
+            if cursor_ts is not None:
+                query = query.filter(TickerSnapshot.exchange_ts > cursor_ts)
+            rows = query.order_by(TickerSnapshot.exchange_ts).limit(batch_size).all()
+            if not rows:
+                break
+
+            for row in rows:
+                stats.rows_scanned += 1
+                epoch = _epoch(row.exchange_ts)
+                in_rollup = rollup_end_epoch is not None and epoch < rollup_end_epoch
+                if in_rollup:
+                    rollup_scanned += 1
+                if dedupe:
+                    state = (
+                        row.last_price, row.mark_price, row.bid1_price,
+                        row.ask1_price, row.funding_rate,
+                    )
+                    if state == last_state and epoch - last_kept_epoch < heartbeat_seconds:
+                        stats.duplicates_removed += 1
+                        if in_rollup:
+                            rollup_removed += 1
+                        _delete([row.id])
+                        continue
+                    last_state, last_kept_epoch = state, epoch
+                if not in_rollup:
+                    continue
+                key = int(epoch) // rollup_seconds
+                if key != bucket_key:
+                    thinned = _thin_bucket(bucket_rows) if bucket_rows else []
+                    stats.rolled_up_removed += len(thinned)
+                    rollup_removed += len(thinned)
+                    _delete(thinned)
+                    bucket_key, bucket_rows = key, []
+                bucket_rows.append(row)
+
+            cursor_ts = rows[-1].exchange_ts
+            # The open bucket's rows are still undecided and stay put; the
+            # next page continues it.
+            _flush_deletes()
+            session.commit()
+            if len(rows) < batch_size:
+                break
+
+        if bucket_rows:
+            thinned = _thin_bucket(bucket_rows)
+            stats.rolled_up_removed += len(thinned)
+            rollup_removed += len(thinned)
+            _delete(thinned)
+            _flush_deletes()
+
+        if rollup is not None:
+            rollup.rows_before = rollup_scanned
+            rollup.rows_after = rollup_scanned - rollup_removed
+
+    logger.info(
+        "%s: scanned %d, removed %d duplicate and %d rolled-up rows, kept %d",
+        symbol, stats.rows_scanned, stats.duplicates_removed,
+        stats.rolled_up_removed, stats.rows_kept,
+    )
+    return stats
+
+
+def vacuum(db: DatabaseFactory) -> None:
+    """Return freed pages to the OS (SQLite) / refresh stats (PostgreSQL)."""
+    with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        if db.engine.dialect.name == "postgresql":
+            conn.execute(text("VACUUM (ANALYZE) ticker_snapshots"))
+        else:
+            conn.execute(text("VACUUM"))
+
+
+def recluster(db: DatabaseFactory) -> None:
+    """Rewrite ticker_snapshots in ``(symbol, exchange_ts)`` order.
+
+    PostgreSQL uses ``CLUSTER`` on the unique index. SQLite has no
+    equivalent, so the rows are copied out and re-inserted in order (ids are
+    reassigned; nothing references ticker ids); follow with :func:`vacuum`
+    for the new order to reach the file's page layout.
+    """
+    if db.engine.dialect.name == "postgresql":
+        with db.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("CLUSTER ticker_snapshots USING uq_ticker_symbol_ts"))
+            conn.execute(text("ANALYZE ticker_snapshots"))
+        return
+    with db.engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE TEMP TABLE ticker_recluster AS SELECT {_TICKER_COLUMNS} "
+            "FROM ticker_snapshots"
+        ))
+        conn.execute(text("DELETE FROM ticker_snapshots"))
+        conn.execute(text(
+            f"INSERT INTO ticker_snapshots ({_TICKER_COLUMNS}) "
+            f"SELECT {_TICKER_COLUMNS} FROM ticker_recluster ORDER BY symbol, exchange_ts"
+        ))
+        conn.execute(text("DROP TABLE ticker_recluster"))
+
+
+def main(args: argparse.Namespace) -> int:
+    """Run compaction for the parsed CLI arguments; returns the exit code."""
+    db = DatabaseFactory(DatabaseSettings(database_url=args.database_url))
+    # ticker_rollups may be missing on DBs created before feature 0103.
+    TickerRollup.__table__.create(db.engine, checkfirst=True)
+    logger.info("Compacting %s", redact_db_url(args.database_url))
+
+    symbols = args.symbol
+    if not symbols:
+        with db.get_session() as session:
+            symbols = [
+                s for (s,) in session.query(TickerSnapshot.symbol).distinct().order_by(
+                    TickerSnapshot.symbol
+                )
+            ]
+
+    rollup_seconds = ROLLUP_BUCKETS[args.rollup] if args.rollup else None
+    rollup_before = (
+        datetime.now(UTC) - timedelta(days=args.hot_days) if rollup_seconds else None
+    )
+    for symbol in symbols:
+        compact_symbol(
+            db,
+            symbol,
+            dedupe=not args.no_dedupe,
+            rollup_seconds=rollup_seconds,
+            rollup_before=rollup_before,
+        )
+
+    if args.cluster:
+        logger.info("Re-clustering ticker_snapshots by (symbol, exchange_ts)")
+        recluster(db)
+    if args.vacuum or (args.cluster and db.engine.dialect.name != "postgresql"):
+        logger.info("Vacuuming")
+        vacuum(db)
+    return 0
+
+
+def cli() -> None:
+    """Command-line interface entry point."""
+    parser = argparse.ArgumentParser(
+        description="Compact recorder ticker_snapshots (dedupe, rollup, vacuum)",
+    )
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument(
+        "--symbol", action="append",
+        help="Symbol to compact (repeatable; default: every recorded symbol)",
+    )
+    parser.add_argument(
+        "--no-dedupe", action="store_true",
+        help="Keep consecutive identical L1 states",
+    )
+    parser.add_argument(
+        "--rollup", choices=sorted(ROLLUP_BUCKETS),
+        help="Thin rows older than the hot period to first/low/high/last per bucket",
+    )
+    parser.add_argument(
+        "--hot-days", type=float, default=7.0,
+        help="Raw data kept un-rolled-up, in days before now (default: 7)",
+    )
+    parser.add_argument(
+        "--vacuum", action="store_true",
+        help="VACUUM afterwards (SQLite: needs exclusive access)",
+    )
+    parser.add_argument(
+        "--cluster", action="store_true",
+        help="Rewrite rows in (symbol, exchange_ts) order (SQLite: needs exclusive access)",
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    args = parser.parse_args()
+    if args.no_dedupe and not args.rollup:
+        parser.error("--no-dedupe without --rollup leaves nothing to do")
+    if args.hot_days < 0:
+        parser.error("--hot-days must be >= 0")
+    setup_logging(debug=args.debug)
+    sys.exit(main(args))
+
+
+if __name__ == "__main__":
+    cli()
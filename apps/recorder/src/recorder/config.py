@@ -77,6 +77,17 @@ class RecorderConfig(BaseModel):
         "Not needed for replay engine which uses ticker snapshots only.",
     )
 
+    dedupe_tickers: bool = Field(
+        default=False,
+        description=(
+            "Feature 0103: drop a ticker whose L1 state (last/mark/bid1/ask1 "
+            "price, funding rate) is unchanged from the previous one for its "
+            "symbol, still writing it every 30 s as a heartbeat. Replay/backtest "
+            "carry the last state forward and see the same stream; tick counts "
+            "drop. Older recordings can be compacted with recorder-compact."
+        ),
+    )
+
     database_url: str = Field(
         default="sqlite:///recorder.db",
         description="SQLite database path",
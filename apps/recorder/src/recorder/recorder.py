@@ -131,6 +131,7 @@ class Recorder:
                 api_key="",
                 api_secret="",
                 testnet=self._config.testnet,
+                rate_limit_caller="recorder",
             )
 
             # Initialize reconciler
@@ -182,7 +183,9 @@ class Recorder:
         # Replay engine needs a Run row to discover the recording time range.
         self._run_id = await asyncio.to_thread(self._seed_db_records)
 
-        self._ticker_writer = TickerWriter(**writer_kwargs)
+        self._ticker_writer = TickerWriter(
+            **writer_kwargs, dedupe_unchanged=self._config.dedupe_tickers,
+        )
         await self._ticker_writer.start_auto_flush()
 
         if self._config.capture_public_trades:
@@ -313,6 +316,7 @@ class Recorder:
                 api_key=self._config.account.api_key.get_secret_value(),
                 api_secret=self._config.account.api_secret.get_secret_value(),
                 testnet=self._config.testnet,
+                rate_limit_caller="recorder",
             )
         except Exception as e:
             logger.error(
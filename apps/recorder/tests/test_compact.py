@@ -0,0 +1,183 @@
+"""Tests for offline ticker compaction (recorder-compact)."""
+
+import argparse
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from grid_db import (
+    DatabaseFactory,
+    DatabaseSettings,
+    TickerRollup,
+    TickerSnapshot,
+    TickerSnapshotRepository,
+)
+
+from recorder import compact
+from recorder.compact import compact_symbol, main
+
+
+_BASE_TS = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def _ticker(seconds: float, last: str, mark: str = "100", symbol: str = "BTCUSDT"):
+    ts = _BASE_TS + timedelta(seconds=seconds)
+    return TickerSnapshot(
+        symbol=symbol,
+        exchange_ts=ts,
+        local_ts=ts,
+        last_price=Decimal(last),
+        mark_price=Decimal(mark),
+        bid1_price=Decimal(last) - 1,
+        ask1_price=Decimal(last) + 1,
+        funding_rate=Decimal("0.0001"),
+    )
+
+
+def _seed(db, rows):
+    with db.get_session() as session:
+        session.add_all(rows)
+
+
+def _prices(db, symbol="BTCUSDT") -> list[tuple[float, Decimal]]:
+    with db.get_session() as session:
+        rows = (
+            session.query(TickerSnapshot.exchange_ts, TickerSnapshot.last_price)
+            .filter(TickerSnapshot.symbol == symbol)
+            .order_by(TickerSnapshot.exchange_ts)
+            .all()
+        )
+    return [((ts - _BASE_TS).total_seconds(), price) for ts, price in rows]
+
+
+class TestDedupe:
+    def test_drops_consecutive_identical_states_only(self, db):
+        _seed(db, [
+            _ticker(0, "100"),
+            _ticker(1, "100"),
+            _ticker(2, "100", mark="101"),  # mark moved: kept
+            _ticker(3, "101"),
+            _ticker(4, "100", mark="101"),  # same as t=2, not consecutive: kept
+            _ticker(5, "100", mark="101"),
+            _ticker(6, "100", symbol="ETHUSDT"),
+        ])
+
+        stats = compact_symbol(db, "BTCUSDT", batch_size=2)
+
+        assert (stats.rows_scanned, stats.duplicates_removed, stats.rows_kept) == (6, 2, 4)
+        assert [t for t, _ in _prices(db)] == [0, 2, 3, 4]
+        assert len(_prices(db, "ETHUSDT")) == 1
+        with db.get_session() as session:
+            assert session.query(TickerRollup).count() == 0
+
+    def test_keeps_heartbeat_row_of_unchanged_state(self, db):
+        _seed(db, [_ticker(t, "100") for t in (0, 20, 29, 30, 50, 61, 62)])
+
+        stats = compact_symbol(db, "BTCUSDT", batch_size=3, heartbeat_seconds=30)
+
+        assert stats.duplicates_removed == 4
+        assert [t for t, _ in _prices(db)] == [0, 30, 61]
+
+
+class TestRollup:
+    def test_keeps_first_low_high_last_per_bucket_before_hot_period(self, db):
+        # Bucket [0, 60): path 100 -> 105 -> 95 -> 102 with noise between.
+        cold = ["100", "103", "105", "101", "95", "99", "102"]
+        rows = [_ticker(i * 5, p) for i, p in enumerate(cold)]
+        # Bucket [60, 120): a single row stays.
+        rows.append(_ticker(70, "104"))
+        # Hot period (>= 120 s): untouched.
+        rows += [_ticker(120 + i, p) for i, p in enumerate(["103", "104", "103"])]
+        _seed(db, rows)
+
+        stats = compact_symbol(
+            db, "BTCUSDT", dedupe=False, rollup_seconds=60,
+            rollup_before=_BASE_TS + timedelta(seconds=130), batch_size=3,
+        )
+
+        assert stats.rolled_up_removed == 3
+        assert _prices(db) == [
+            (0, Decimal("100")), (10, Decimal("105")), (20, Decimal("95")),
+            (30, Decimal("102")), (70, Decimal("104")),
+            (120, Decimal("103")), (121, Decimal("104")), (122, Decimal("103")),
+        ]
+        with db.get_session() as session:
+            rollup = session.query(TickerRollup).one()
+            assert (rollup.start_ts, rollup.end_ts) == (
+                _BASE_TS, _BASE_TS + timedelta(seconds=120)
+            )
+            assert (rollup.bucket_seconds, rollup.rows_before, rollup.rows_after) == (60, 8, 5)
+
+    def test_rerun_is_stable(self, db):
+        _seed(db, [_ticker(i, str(100 + i % 7)) for i in range(30)])
+        kwargs = dict(rollup_seconds=1, rollup_before=_BASE_TS + timedelta(hours=1))
+
+        compact_symbol(db, "BTCUSDT", **kwargs)
+        after_first = _prices(db)
+        stats = compact_symbol(db, "BTCUSDT", **kwargs)
+
+        assert _prices(db) == after_first
+        assert stats.duplicates_removed == stats.rolled_up_removed == 0
+
+    def test_nothing_before_cutoff_records_no_rollup(self, db):
+        _seed(db, [_ticker(0, "100"), _ticker(1, "101")])
+
+        compact_symbol(db, "BTCUSDT", rollup_seconds=60, rollup_before=_BASE_TS)
+
+        with db.get_session() as session:
+            assert session.query(TickerRollup).count() == 0
+
+    def test_final_bucket_delete_is_chunked(self, db, monkeypatch):
+        # One open bucket holding every row: thinned only after the scan.
+        _seed(db, [_ticker(i * 0.5, str(100 + (i + 3) % 7)) for i in range(25)])
+        monkeypatch.setattr(compact, "_DELETE_CHUNK", 4)
+        sizes = []
+        delete_by_ids = TickerSnapshotRepository.delete_by_ids
+
+        def spy(self, ids):
+            sizes.append(len(ids))
+            return delete_by_ids(self, ids)
+
+        monkeypatch.setattr(TickerSnapshotRepository, "delete_by_ids", spy)
+
+        stats = compact_symbol(
+            db, "BTCUSDT", dedupe=False, rollup_seconds=60,
+            rollup_before=_BASE_TS + timedelta(hours=1), batch_size=100,
+        )
+
+        assert stats.rolled_up_removed == 21
+        assert sum(sizes) == 21
+        assert max(sizes) <= 4
+        assert len(_prices(db)) == 4
+
+    def test_rollup_requires_cutoff(self, db):
+        with pytest.raises(ValueError, match="rollup_before"):
+            compact_symbol(db, "BTCUSDT", rollup_seconds=60)
+
+
+class TestMain:
+    def test_compacts_recluster_and_vacuums_file_db(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'recorder.db'}"
+        db = DatabaseFactory(DatabaseSettings(database_url=url))
+        db.create_tables()
+        # Interleaved insert order across symbols.
+        _seed(db, [
+            _ticker(i, "100" if i % 4 else "101", symbol=sym)
+            for i in range(8) for sym in ("ETHUSDT", "BTCUSDT")
+        ])
+
+        args = argparse.Namespace(
+            database_url=url, symbol=None, no_dedupe=False, rollup=None,
+            hot_days=7.0, vacuum=True, cluster=True,
+        )
+        assert main(args) == 0
+
+        with db.get_session() as session:
+            rows = session.query(TickerSnapshot).order_by(TickerSnapshot.id).all()
+            keys = [(r.symbol, r.exchange_ts) for r in rows]
+        assert keys == sorted(keys)
+        assert _prices(db) == [
+            (0, Decimal("101")), (1, Decimal("100")), (4, Decimal("101")),
+            (5, Decimal("100")),
+        ]
@@ -164,7 +164,8 @@ class SeedConfig(BaseModel):
     grid_state_path: Optional[str] = Field(
         default=None,
         description=(
-            "Path to legacy grid-state JSON file (feature 0021). With 0047 "
+            "Path to legacy grid-state JSON file (feature 0021), or to the "
+            "gridbot's ``.sqlite3`` grid-state store. With 0047 "
             "the engine prefers ``grid_state_snapshots`` in DB and only "
             "falls back to this file when a path is set AND no DB snapshot "
             "covers ``at_ts``. None disables the file fallback entirely."
@@ -336,6 +337,15 @@ class ReplayConfig(BaseModel):
         description="What to do with positions at end",
     )
 
+    export_position_snapshots: bool = Field(
+        default=False,
+        description=(
+            "Also insert backtest position snapshots into the recorder DB "
+            "(source='backtest'). The comparison reads them from memory "
+            "either way."
+        ),
+    )
+
     # Comparison parameters
     output_dir: str = Field(
         default="results/replay",
@@ -3,7 +3,7 @@
 Orchestrates:
 - HistoricalDataProvider (reads recorded TickerSnapshots)
 - BacktestRunner (GridEngine + simulated order book)
-- LiveTradeLoader (loads recorded executions as ground truth)
+- ReplayExecutionData (loads recorded executions once: event follower + ground truth)
 - TradeMatcher + calculate_metrics (comparison)
 - ComparatorReporter (output)
 """
@@ -12,6 +12,7 @@ import logging
 import uuid
 from dataclasses import dataclass, field, replace
 from decimal import Decimal
+from time import perf_counter_ns
 from typing import Optional
 
 from datetime import datetime, timedelta, timezone
@@ -22,7 +23,6 @@ from grid_db import (
     DatabaseFactory,
     PositionSnapshot,
     PositionSnapshotRepository,
-    PrivateExecutionRepository,
     Run,
     RunRepository,
     TickerSnapshot,
@@ -31,7 +31,7 @@ from grid_db import (
 )
 
 from gridcore import DirectionType, create_qty_calculator
-from gridcore.persistence import GridStateStore
+from gridcore.persistence import open_grid_state_store
 
 from backtest.config import BacktestStrategyConfig, WindDownMode
 from backtest.data_provider import HistoricalDataProvider, InMemoryDataProvider
@@ -40,7 +40,6 @@ from backtest.executor import BacktestExecutor
 from backtest.fill_simulator import (
     EventFollower,
     FillMode,
-    RecordedExecution,
     TradeThroughFillSimulator,
 )
 from backtest.instrument_info import (
@@ -50,12 +49,12 @@ from backtest.instrument_info import (
 )
 from backtest.order_manager import BacktestOrderManager
 from backtest.position_tracker import BacktestPositionTracker
+from backtest.profiling import PhaseProfiler
 from backtest.runner import BacktestRunner
 from backtest.session import BacktestSession, BacktestTrade
 
 from comparator import (
     BacktestTradeLoader,
-    LiveTradeLoader,
     TradeMatcher,
     calculate_metrics,
     MatchResult,
@@ -67,6 +66,7 @@ from comparator.position_loader import (
 from comparator.position_metrics import PositionComparator
 
 from replay.config import ReplayConfig, SeedConfig
+from replay.execution_data import ReplayExecutionData
 from replay.snapshot_loader import (
     ActiveOrderSeed,
     GridStateSeed,
@@ -292,13 +292,140 @@ class _BatchPositionSnapshotWriter:
         return self._total_written
 
 
+@dataclass(frozen=True, slots=True)
+class _PositionSnapshotRow:
+    """A backtest position snapshot materialized from the in-memory sink.
+
+    Carries the ``PositionSnapshot`` attributes ``PositionComparator`` and
+    the position-pairs CSV export read, without ORM instance state.
+    """
+
+    run_id: Optional[str]
+    account_id: Optional[str]
+    symbol: str
+    source: str
+    exchange_ts: datetime
+    side: str
+    size: Decimal
+    entry_price: Decimal
+    liq_price: Optional[Decimal]
+    unrealised_pnl: Optional[Decimal]
+    mark_price: Optional[Decimal]
+    position_im: Optional[Decimal]
+    position_mm: Optional[Decimal]
+    cum_realised_pnl: Optional[Decimal]
+    cur_realised_pnl: Optional[Decimal]
+    position_value: Optional[Decimal]
+
+    @property
+    def local_ts(self) -> datetime:
+        # The runner stamps local_ts == exchange_ts on every backtest row.
+        return self.exchange_ts
+
+
+_SNAPSHOT_VALUE_COLUMNS = (
+    "size",
+    "entry_price",
+    "liq_price",
+    "unrealised_pnl",
+    "mark_price",
+    "position_im",
+    "position_mm",
+    "cum_realised_pnl",
+    "cur_realised_pnl",
+    "position_value",
+)
+
+
+class _InMemoryPositionSnapshotSink:
+    """Keeps backtest position snapshots in memory for the step-11 pairing.
+
+    Replaces the write-then-read-back DB round trip: each snapshot the runner
+    emits is unpacked into one list per column (sides packed into a
+    bytearray) and the ORM instance is dropped, unless ``export`` — a
+    ``_BatchPositionSnapshotWriter`` — is set, in which case it is also
+    persisted as before. Timestamps are stored naive UTC, the same
+    normalization the recorder loaders apply.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        run_id: Optional[str],
+        account_id: Optional[str],
+        export: Optional[_BatchPositionSnapshotWriter] = None,
+    ):
+        self._symbol = symbol
+        self._run_id = run_id
+        self._account_id = account_id
+        self._export = export
+        self._exchange_ts: list[datetime] = []
+        self._is_long = bytearray()
+        self._columns: dict[str, list] = {name: [] for name in _SNAPSHOT_VALUE_COLUMNS}
+
+    def write(self, snapshot: PositionSnapshot) -> None:
+        """Append the snapshot's columns (and forward it to the export writer)."""
+        self._exchange_ts.append(_strip_tz(snapshot.exchange_ts))
+        self._is_long.append(snapshot.side == "Buy")
+        for name, column in self._columns.items():
+            column.append(getattr(snapshot, name))
+        if self._export is not None:
+            self._export.write(snapshot)
+
+    def flush(self) -> int:
+        """Flush the export writer, if any; returns rows inserted."""
+        return self._export.flush() if self._export is not None else 0
+
+    @property
+    def total_written(self) -> int:
+        """Rows exported to the DB (0 without an export writer)."""
+        return self._export.total_written if self._export is not None else 0
+
+    def __len__(self) -> int:
+        return len(self._exchange_ts)
+
+    def snapshots(
+        self,
+        start_ts: Optional[datetime] = None,
+        end_ts: Optional[datetime] = None,
+    ) -> list[_PositionSnapshotRow]:
+        """Rows inside the inclusive window, ordered by ``(side, exchange_ts)``.
+
+        Same filter and order as ``load_position_snapshots`` applies to the
+        DB copy, so ``PositionComparator.pair_and_compare`` sees identical
+        input either way.
+        """
+        lo = _strip_tz(start_ts) if start_ts is not None else None
+        hi = _strip_tz(end_ts) if end_ts is not None else None
+        ts = self._exchange_ts
+        indices = [
+            i for i in range(len(ts))
+            if (lo is None or ts[i] >= lo) and (hi is None or ts[i] <= hi)
+        ]
+        # Buy sorts before Sell, as in the DB query; stable for equal stamps.
+        indices.sort(key=lambda i: (not self._is_long[i], ts[i]))
+        columns = self._columns
+        return [
+            _PositionSnapshotRow(
+                run_id=self._run_id,
+                account_id=self._account_id,
+                symbol=self._symbol,
+                source="backtest",
+                exchange_ts=ts[i],
+                side="Buy" if self._is_long[i] else "Sell",
+                **{name: column[i] for name, column in columns.items()},
+            )
+            for i in indices
+        ]
+
+
 class _NoopPositionSnapshotWriter:
     """Discards backtest position snapshots (feature 0088).
 
-    Wired instead of ``_BatchPositionSnapshotWriter`` when the engine is
-    constructed with ``emit_backtest_snapshots=False`` — live_check runs
-    against a READ-ONLY recorder DB where any ``source='backtest'`` insert
-    would raise, and its verdicts never consume ``position_pairs``.
+    Wired instead of the in-memory sink when the engine is constructed with
+    ``emit_backtest_snapshots=False`` — live_check runs against a READ-ONLY
+    recorder DB where any ``source='backtest'`` insert would raise, and its
+    verdicts never consume ``position_pairs``.
     """
 
     def write(self, snapshot: PositionSnapshot) -> None:
@@ -312,6 +439,17 @@ class _NoopPositionSnapshotWriter:
     def total_written(self) -> int:
         return 0
 
+    def __len__(self) -> int:
+        return 0
+
+    def snapshots(
+        self,
+        start_ts: Optional[datetime] = None,
+        end_ts: Optional[datetime] = None,
+    ) -> list[_PositionSnapshotRow]:
+        """Nothing kept; returns an empty list."""
+        return []
+
 
 @dataclass
 class ReplayResult:
@@ -350,6 +488,7 @@ class ReplayEngine:
         config: ReplayConfig,
         db: DatabaseFactory,
         emit_backtest_snapshots: bool = True,
+        profiler: Optional[PhaseProfiler] = None,
     ):
         """Initialize the replay engine.
 
@@ -362,10 +501,13 @@ class ReplayEngine:
                 no-op writer instead of being inserted into ``db`` — required
                 when ``db`` is opened read-only. Default True keeps existing
                 callers byte-for-byte unchanged.
+            profiler: Phase profiler for ``--profile`` runs. None (default)
+                leaves the replay loop untimed.
         """
         self._config = config
         self._db = db
         self._emit_backtest_snapshots = emit_backtest_snapshots
+        self._profiler = profiler
         self._instrument_provider = InstrumentInfoProvider()
 
     def run(
@@ -381,6 +523,9 @@ class ReplayEngine:
             ReplayResult with session, metrics, and match result.
         """
         config = self._config
+        profiler = self._profiler
+        if profiler is not None:
+            t = perf_counter_ns()
 
         # 1. Resolve run_id, account_id and time range
         run_id, account_id, start_ts, end_ts = self._resolve_run(config)
@@ -494,55 +639,14 @@ class ReplayEngine:
             collateral_seed_marks=collateral_seed_marks,
         )
 
-        # 2b. 0072: event_follower fill source — load the recorded live
-        # execution stream for the window. ORM rows are materialized to
-        # plain RecordedExecution dataclasses INSIDE the session context
-        # (DetachedInstanceError on lazy access otherwise; cf. feature
-        # 0038). get_by_run_range filters run_id + time only (same as
-        # LiveTradeLoader), so other-symbol rows are skipped here.
+        # 2b. 0072: event_follower fill source — the recorded live
+        # execution stream for the window. ReplayExecutionData runs the one
+        # query shared with the step-8 ground truth and materializes plain
+        # RecordedExecution dataclasses for the follower.
+        execution_data = ReplayExecutionData(self._db, run_id, start_ts, end_ts)
         event_follower: Optional[EventFollower] = None
         if fill_mode == FillMode.EVENT_FOLLOWER:
-            recorded_execs: list[RecordedExecution] = []
-            skipped_other_symbol = 0
-            with self._db.get_session() as db_session:
-                exec_repo = PrivateExecutionRepository(db_session)
-                # Ordered (exchange_ts, exec_id) by the repository — the
-                # single sort site; not re-sorted here or in the follower.
-                for ex in exec_repo.get_by_run_range(run_id, start_ts, end_ts):
-                    if ex.symbol != config.symbol:
-                        skipped_other_symbol += 1
-                        continue
-                    recorded_execs.append(
-                        RecordedExecution(
-                            exec_id=ex.exec_id,
-                            order_link_id=ex.order_link_id,
-                            order_id=ex.order_id,
-                            side=ex.side,
-                            exec_price=ex.exec_price,
-                            exec_qty=ex.exec_qty,
-                            exec_fee=(
-                                ex.exec_fee
-                                if ex.exec_fee is not None
-                                else Decimal("0")
-                            ),
-                            closed_pnl=(
-                                ex.closed_pnl
-                                if ex.closed_pnl is not None
-                                else Decimal("0")
-                            ),
-                            exchange_ts=_strip_tz(ex.exchange_ts),
-                        )
-                    )
-            event_follower = EventFollower(
-                recorded_execs,
-                symbol=config.symbol,
-                start_ts=_strip_tz(start_ts),
-            )
-            logger.info(
-                "event_follower: loaded %d recorded executions for %s "
-                "(%d other-symbol rows skipped)",
-                len(recorded_execs), config.symbol, skipped_other_symbol,
-            )
+            event_follower = execution_data.event_follower(config.symbol)
 
         runner = self._init_runner(
             strategy_config,
@@ -625,7 +729,15 @@ class ReplayEngine:
         # the whole window (almost always a missing recorder.collateral_symbols).
         collateral_marked_coins: set[str] = set()
 
-        for tick in provider:
+        ticks = provider
+        if profiler is not None:
+            profiler.lap("setup", t)
+            # Time DB paging (HistoricalDataProvider fetches per page).
+            ticks = profiler.timed_iter(provider, "data")
+
+        for tick in ticks:
+            if profiler is not None:
+                t = perf_counter_ns()
             last_price = tick.last_price
             last_timestamp = tick.exchange_ts
 
@@ -641,6 +753,8 @@ class ReplayEngine:
                     if mark is not None:
                         session.update_collateral_mark(coin, mark)
                         collateral_marked_coins.add(coin)
+            if profiler is not None:
+                t = profiler.lap("collateral", t)
 
             # Funding
             if funding_simulator and funding_simulator.should_apply_funding(tick.exchange_ts):
@@ -648,9 +762,13 @@ class ReplayEngine:
                 if funding != 0:
                     logger.debug(f"Funding payment: {funding:.4f}")
                 funding_simulator.mark_funding_applied(tick.exchange_ts)
+            if profiler is not None:
+                t = profiler.lap("funding", t)
 
             # Phase 1: process fills
             runner.process_fills(tick)
+            if profiler is not None:
+                t = profiler.lap("fills", t)
 
             # Update equity
             unrealized = (
@@ -658,15 +776,22 @@ class ReplayEngine:
                 + runner.short_tracker.calculate_unrealized_pnl(tick.last_price)
             )
             session.update_equity(tick.exchange_ts, unrealized)
+            if profiler is not None:
+                t = profiler.lap("equity", t)
 
             # Phase 2: execute tick intents
             runner.execute_tick(tick)
+            if profiler is not None:
+                profiler.lap("execute_tick", t)
+                profiler.ticks += 1
 
             tick_count += 1
             if tick_count % 10000 == 0:
                 logger.info(f"Processed {tick_count} ticks...")
 
         logger.info(f"Replay complete: {tick_count} ticks processed")
+        if profiler is not None:
+            t = perf_counter_ns()
 
         # 0072: trigger-4 end-of-replay sweep of remaining partial-fill
         # rollups. MUST run before wind-down, position-writer flush, and
@@ -699,16 +824,21 @@ class ReplayEngine:
         # for #3a (see docs/features/0065_PLAN.md Phase 2B wind-down note).
         if config.wind_down_mode == WindDownMode.CLOSE_ALL and last_price > 0:
             self._wind_down(runner, session, last_price, last_timestamp)
+        if profiler is not None:
+            t = profiler.lap("wind_down", t)
 
-        # 6b. 0034: flush buffered backtest position snapshots so the
-        # comparator (and the pair_and_compare call below) can read them.
+        # 6b. 0034: flush any exported backtest position snapshots. The
+        # pair_and_compare call below reads the in-memory copy.
         position_writer = getattr(runner, "_position_writer", None)
         if position_writer is not None:
             position_writer.flush()
             logger.info(
-                "Position telemetry: wrote %d backtest snapshots to DB",
-                position_writer.total_written,
+                "Position telemetry: %d backtest snapshots kept in memory, "
+                "%d exported to DB",
+                len(position_writer), position_writer.total_written,
             )
+        if profiler is not None:
+            t = profiler.lap("position_flush", t)
 
         # 7. Finalize session
         final_unrealized = (
@@ -716,18 +846,16 @@ class ReplayEngine:
             + runner.short_tracker.calculate_unrealized_pnl(last_price)
         ) if last_price > 0 else Decimal("0")
         session.finalize(final_unrealized)
+        if profiler is not None:
+            t = profiler.lap("finalize", t)
 
-        # 8. Load ground truth (recorded executions)
-        with self._db.get_session() as db_session:
-            live_loader = LiveTradeLoader(db_session)
-            recorded_trades = live_loader.load(
-                run_id=run_id,
-                start_ts=start_ts,
-                end_ts=end_ts,
-                symbol=config.symbol,
-            )
+        # 8. Load ground truth (recorded executions; already in memory when
+        # the event follower consumed them)
+        recorded_trades = execution_data.live_trades(config.symbol)
 
         logger.info(f"Loaded {len(recorded_trades)} recorded trades (ground truth)")
+        if profiler is not None:
+            t = profiler.lap("compare.ground_truth", t)
 
         # 9. Convert simulated trades
         bt_loader = BacktestTradeLoader()
@@ -760,6 +888,8 @@ class ReplayEngine:
             metrics.collateral_switch_off_coins = list(
                 wallet_seed.collateral_switch_off_coins
             )
+        if profiler is not None:
+            t = profiler.lap("compare.match", t)
 
         # 11. 0034: pair live/backtest position snapshots and fold telemetry
         # parity metrics into the same ValidationMetrics object. 0038:
@@ -768,7 +898,12 @@ class ReplayEngine:
         # rows are still attached; `expunge_all()` then detaches the rows so
         # `commit()`'s expiration sweep on __exit__ leaves them readable for
         # downstream consumers (ComparatorReporter CSV export).
+        # Backtest rows come straight from the runner's in-memory sink.
         position_pairs: list = []
+        bt_snaps = (
+            position_writer.snapshots(start_ts, end_ts)
+            if position_writer is not None else []
+        )
         with self._db.get_session() as db_session:
             live_snaps = load_position_snapshot_rows(
                 db_session,
@@ -778,14 +913,6 @@ class ReplayEngine:
                 start_ts=start_ts,
                 end_ts=end_ts,
             )
-            bt_snaps = load_position_snapshot_rows(
-                db_session,
-                run_id=run_id,
-                symbol=config.symbol,
-                source="backtest",
-                start_ts=start_ts,
-                end_ts=end_ts,
-            )
             if live_snaps and bt_snaps:
                 pc = PositionComparator()
                 position_pairs = pc.pair_and_compare(live_snaps, bt_snaps)
@@ -804,6 +931,8 @@ class ReplayEngine:
                     len(live_snaps), len(bt_snaps),
                 )
             db_session.expunge_all()
+        if profiler is not None:
+            profiler.lap("compare.positions", t)
 
         return ReplayResult(
             session=session,
@@ -818,6 +947,49 @@ class ReplayEngine:
             runner=runner,
         )
 
+    def _position_writer(
+        self,
+        symbol: str,
+        run_id: str,
+        account_id: Optional[str],
+    ):
+        """Build the sink the runner's position snapshots are emitted into.
+
+        Feature 0088: live_check runs against a read-only recorder DB and
+        never consumes position_pairs, so emission disabled → discard.
+        Otherwise snapshots stay in memory for the step-11 pairing and are
+        also inserted as ``source='backtest'`` rows only when the config
+        opts into ``export_position_snapshots``.
+        """
+        if not self._emit_backtest_snapshots:
+            return _NoopPositionSnapshotWriter()
+        export = None
+        if self._config.export_position_snapshots:
+            export = self._position_export_writer(run_id, account_id)
+        return _InMemoryPositionSnapshotSink(symbol, run_id, account_id, export=export)
+
+    def _position_export_writer(
+        self, run_id: str, account_id: Optional[str]
+    ) -> _BatchPositionSnapshotWriter:
+        """DB writer for exported ``source='backtest'`` position snapshots."""
+        if account_id is None:
+            # Pre-0029 legacy data: Run.account_id is NULL. Don't
+            # silently fall back — surface the issue so the operator
+            # re-records with the current writer. A broken pre-0029
+            # run would otherwise look identical to a healthy empty
+            # data run (comparator would just see zero backtest rows).
+            raise ValueError(
+                f"Run {run_id} has no account_id; cannot emit backtest "
+                "position snapshots. Re-record after the 0029+0034 "
+                "migrations to populate Run.account_id."
+            )
+        return _BatchPositionSnapshotWriter(
+            db=self._db,
+            run_id=run_id,
+            account_id=account_id,
+            source="backtest",
+        )
+
     def _resolve_run(self, config: ReplayConfig):
         """Resolve run_id, account_id and time range from config or database.
 
@@ -979,35 +1151,19 @@ class ReplayEngine:
             seeded_active_orders=order_seeds,
         )
 
-        # 0034: wire the position telemetry writer. Replay always emits to
-        # the recorder DB so the comparator can read both live and backtest
-        # rows from the same table (filtered by `source`).
+        # 0034: wire the position telemetry sink. The step-11 comparison
+        # reads backtest snapshots from memory; the DB copy is opt-in.
         if run_id is not None:
-            if not self._emit_backtest_snapshots:
-                # Feature 0088: live_check runs against a read-only recorder
-                # DB and never consumes position_pairs — discard snapshots
-                # instead of writing them.
-                position_writer = _NoopPositionSnapshotWriter()
-            else:
-                if account_id is None:
-                    # Pre-0029 legacy data: Run.account_id is NULL. Don't
-                    # silently fall back — surface the issue so the operator
-                    # re-records with the current writer. A broken pre-0029
-                    # run would otherwise look identical to a healthy empty
-                    # data run (comparator would just see zero backtest rows).
-                    raise ValueError(
-                        f"Run {run_id} has no account_id; cannot emit backtest "
-                        "position snapshots. Re-record after the 0029+0034 "
-                        "migrations to populate Run.account_id."
-                    )
-                position_writer = _BatchPositionSnapshotWriter(
-                    db=self._db,
-                    run_id=run_id,
-                    account_id=account_id,
-                    source="backtest",
-                )
+            position_writer = self._position_writer(
+                strategy_config.symbol, run_id, account_id
+            )
             runner.position_snapshot_callback = position_writer.write
-            # Stash on runner so the engine can call .flush() at end-of-run.
+            if self._profiler is not None:
+                runner.position_snapshot_callback = self._profiler.timed(
+                    position_writer.write, "fills.position_snapshot"
+                )
+            # Stash on runner so the engine can flush the export and read
+            # the snapshots back at end-of-run.
             runner._position_writer = position_writer  # type: ignore[attr-defined]
 
         # 0072: stash the recorded-execution fill source. process_fills
@@ -1015,6 +1171,7 @@ class ReplayEngine:
         if event_follower is not None:
             runner._event_follower = event_follower
 
+        runner.profiler = self._profiler
         return runner
 
     def _load_seed(
@@ -1097,12 +1254,22 @@ class ReplayEngine:
                 if grid_seed is not None:
                     grid_source = "db"
             if grid_seed is None and seed.grid_state_path is not None:
-                grid_seed = load_grid_state(
-                    GridStateStore(file_path=seed.grid_state_path),
-                    seed.strat_id,
-                    expected_step=config.strategy.grid_step,
-                    expected_count=config.strategy.grid_count,
-                )
+                # Read-only: a missing .sqlite3 seed must fail like a missing
+                # JSON file, not be created empty next to the requested path.
+                try:
+                    store = open_grid_state_store(seed.grid_state_path, read_only=True)
+                except FileNotFoundError:
+                    store = None
+                if store is not None:
+                    try:
+                        grid_seed = load_grid_state(
+                            store,
+                            seed.strat_id,
+                            expected_step=config.strategy.grid_step,
+                            expected_count=config.strategy.grid_count,
+                        )
+                    finally:
+                        store.close()
                 grid_source = "file" if grid_seed is not None else None
 
             if grid_source is None:
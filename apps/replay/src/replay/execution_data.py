@@ -0,0 +1,112 @@
+"""Recorded execution stream for one replay window, loaded once.
+
+Both consumers of ``private_executions`` in a replay — the event_follower fill
+source (feature 0072) and the ground-truth ``LiveTradeLoader`` — used to query
+the same ``(run_id, start_ts, end_ts)`` window independently, and the
+multi-symbol engine did so once per symbol for each. ``ReplayExecutionData``
+issues that query once per replay and hands each consumer its symbol's slice.
+
+Rows keep the repository's ``(exchange_ts, exec_id)`` order (the single sort
+site; partitioning is a stable filter, so consumers never re-sort) and are
+expunged before the session closes: every column is loaded eagerly, so
+attribute access on the detached rows is safe (cf. feature 0038).
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from grid_db import DatabaseFactory, PrivateExecution, PrivateExecutionRepository
+
+from backtest.fill_simulator import EventFollower, RecordedExecution
+from comparator import LiveTradeLoader, NormalizedTrade
+
+from replay.snapshot_loader import _strip_tz
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayExecutionData:
+    """Symbol-partitioned recorded executions for one run window.
+
+    The query runs lazily on first access, so a replay that never needs the
+    stream never pays for it, and at most once however many symbols ask.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseFactory,
+        run_id: str,
+        start_ts: datetime,
+        end_ts: datetime,
+    ):
+        self._db = db
+        self._run_id = run_id
+        self._start_ts = start_ts
+        self._end_ts = end_ts
+        self._by_symbol: Optional[dict[str, list[PrivateExecution]]] = None
+        self._total = 0
+
+    def _partitions(self) -> dict[str, list[PrivateExecution]]:
+        if self._by_symbol is None:
+            by_symbol: dict[str, list[PrivateExecution]] = defaultdict(list)
+            with self._db.get_session() as db_session:
+                rows = PrivateExecutionRepository(db_session).get_by_run_range(
+                    self._run_id, self._start_ts, self._end_ts
+                )
+                db_session.expunge_all()
+            for row in rows:
+                by_symbol[row.symbol].append(row)
+            self._by_symbol = dict(by_symbol)
+            self._total = len(rows)
+            logger.info(
+                "Loaded %d recorded executions for run %s across %d symbol(s)",
+                self._total, self._run_id, len(self._by_symbol),
+            )
+        return self._by_symbol
+
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols with at least one execution in the window, sorted."""
+        return sorted(self._partitions())
+
+    def executions(self, symbol: str) -> list[PrivateExecution]:
+        """Detached execution rows for ``symbol``, in ``(exchange_ts, exec_id)`` order."""
+        return self._partitions().get(symbol, [])
+
+    def recorded_executions(self, symbol: str) -> list[RecordedExecution]:
+        """``symbol``'s rows as the follower's plain dataclasses.
+
+        ``exchange_ts`` is tz-stripped and NULL ``exec_fee`` / ``closed_pnl``
+        become ``Decimal("0")``, per ``RecordedExecution``'s contract.
+        """
+        return [
+            RecordedExecution(
+                exec_id=ex.exec_id,
+                order_link_id=ex.order_link_id,
+                order_id=ex.order_id,
+                side=ex.side,
+                exec_price=ex.exec_price,
+                exec_qty=ex.exec_qty,
+                exec_fee=ex.exec_fee if ex.exec_fee is not None else Decimal("0"),
+                closed_pnl=ex.closed_pnl if ex.closed_pnl is not None else Decimal("0"),
+                exchange_ts=_strip_tz(ex.exchange_ts),
+            )
+            for ex in self.executions(symbol)
+        ]
+
+    def event_follower(self, symbol: str) -> EventFollower:
+        """An ``EventFollower`` over ``symbol``'s recorded executions."""
+        recorded = self.recorded_executions(symbol)
+        logger.info(
+            "event_follower: loaded %d recorded executions for %s "
+            "(%d other-symbol rows skipped)",
+            len(recorded), symbol, self._total - len(recorded),
+        )
+        return EventFollower(recorded, symbol=symbol, start_ts=_strip_tz(self._start_ts))
+
+    def live_trades(self, symbol: str) -> list[NormalizedTrade]:
+        """``symbol``'s ground-truth trades, normalized by ``LiveTradeLoader``."""
+        return LiveTradeLoader.normalize(self.executions(symbol))
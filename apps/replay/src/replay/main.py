@@ -4,6 +4,7 @@ Usage:
     uv run python -m replay.main --config conf/replay.yaml
     uv run python -m replay.main --config conf/replay.yaml --run-id UUID
     uv run python -m replay.main --config conf/replay.yaml --start 2025-02-20 --end 2025-02-23
+    uv run python -m replay.main --config conf/replay.yaml --profile profile.json --profiler cprofile
 """
 
 import argparse
@@ -15,6 +16,11 @@ from pathlib import Path
 
 from grid_db import DatabaseFactory, DatabaseSettings, redact_db_url
 
+from backtest.profiling import (
+    add_profile_arguments,
+    check_profile_arguments,
+    profile_run,
+)
 from comparator import ComparatorReporter
 
 from replay.config import load_config
@@ -83,13 +89,23 @@ def parse_args(argv=None) -> argparse.Namespace:
         help="Output directory for reports (default: results/replay)",
     )
 
+    parser.add_argument(
+        "--export-position-snapshots",
+        action="store_true",
+        help="Also insert backtest position snapshots into the recorder DB",
+    )
+
     parser.add_argument(
         "--debug",
         action="store_true",
         help="Enable debug logging",
     )
 
-    return parser.parse_args(argv)
+    add_profile_arguments(parser)
+
+    args = parser.parse_args(argv)
+    check_profile_arguments(parser, args)
+    return args
 
 
 def parse_datetime(s: str) -> datetime:
@@ -140,6 +156,8 @@ def main(argv=None) -> int:
         config.symbol = args.symbol
     if args.output:
         config.output_dir = args.output
+    if args.export_position_snapshots:
+        config.export_position_snapshots = True
 
     logger.info(f"Replay config: symbol={config.symbol}, db={redact_db_url(config.database_url)}")
 
@@ -157,8 +175,15 @@ def main(argv=None) -> int:
         # Run replay
         from replay.engine import ReplayEngine
 
-        engine = ReplayEngine(config=config, db=db)
-        result = engine.run()
+        with profile_run(
+            args.profile,
+            sampler=args.profiler,
+            command="replay",
+            meta={"run_id": config.run_id, "symbol": config.symbol,
+                  "fill_mode": config.fill_simulator.mode},
+        ) as profiler:
+            engine = ReplayEngine(config=config, db=db, profiler=profiler)
+            result = engine.run()
 
         # Print session summary
         print(result.session.get_summary())
@@ -90,6 +90,7 @@ class MultiReplayConfig(BaseModel):
     enable_funding: bool = Field(default=True)
     funding_rate: Decimal = Field(default=Decimal("0.0001"))
     wind_down_mode: WindDownMode = Field(default=WindDownMode.LEAVE_OPEN)
+    export_position_snapshots: bool = Field(default=False)
     output_dir: str = Field(default="results/replay_multi")
     price_tolerance: Decimal = Field(default=Decimal("0"))
     qty_tolerance: Decimal = Field(default=Decimal("0.001"))
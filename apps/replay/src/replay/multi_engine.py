@@ -8,13 +8,13 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from decimal import Decimal
+from time import perf_counter_ns
 from typing import Iterable, Iterator, Optional
 
 from sqlalchemy import desc
 
 from grid_db import (
     DatabaseFactory,
-    PrivateExecutionRepository,
     Run,
     RunRepository,
     TickerSnapshot,
@@ -24,13 +24,13 @@ from grid_db import (
 from backtest.config import BacktestStrategyConfig, WindDownMode
 from backtest.data_provider import HistoricalDataProvider, InMemoryDataProvider
 from backtest.engine import FundingSimulator
-from backtest.fill_simulator import EventFollower, FillMode, RecordedExecution
+from backtest.fill_simulator import EventFollower, FillMode
+from backtest.profiling import PhaseProfiler
 from backtest.runner import BacktestRunner
 from backtest.session import BacktestSession
 
 from comparator import (
     BacktestTradeLoader,
-    LiveTradeLoader,
     MatchResult,
     TradeMatcher,
     ValidationMetrics,
@@ -43,6 +43,7 @@ from replay.engine import (
     _NoopPositionSnapshotWriter,
     _to_naive_utc,
 )
+from replay.execution_data import ReplayExecutionData
 from replay.multi_config import MultiReplayConfig, MultiReplayStrategyConfig
 from replay.snapshot_loader import (
     ActiveOrderSeed,
@@ -225,10 +226,12 @@ class MultiReplayEngine(ReplayEngine):
         config: MultiReplayConfig,
         db: DatabaseFactory,
         emit_backtest_snapshots: bool = True,
+        profiler: Optional[PhaseProfiler] = None,
     ):
         self._multi_config = config
         self._db = db
         self._emit_backtest_snapshots = emit_backtest_snapshots
+        self._profiler = profiler
         from backtest.instrument_info import InstrumentInfoProvider
 
         self._instrument_provider = InstrumentInfoProvider()
@@ -246,6 +249,9 @@ class MultiReplayEngine(ReplayEngine):
             Shared-wallet replay result with per-strategy comparisons.
         """
         config = self._multi_config
+        profiler = self._profiler
+        if profiler is not None:
+            t = perf_counter_ns()
         run_id, account_id, start_ts, end_ts = self._resolve_run_multi(config)
         fill_mode = FillMode(config.fill_simulator.mode)
         wallet_seed, seed_data = self._load_multi_seed(config, run_id)
@@ -269,6 +275,9 @@ class MultiReplayEngine(ReplayEngine):
 
         bundles: dict[str, _RunnerBundle] = {}
         last_prices = self._startup_mark_cache(config, start_ts, data_providers)
+        # One execution query for the whole run, shared by every symbol's
+        # follower and ground-truth comparison.
+        execution_data = ReplayExecutionData(self._db, run_id, start_ts, end_ts)
         for strat in config.strategies:
             yaml_tick = strat.tick_size
             instrument_info = self._instrument_provider.get(
@@ -282,7 +291,7 @@ class MultiReplayEngine(ReplayEngine):
             )
             long_seed, short_seed, grid_seed, order_seeds = seed_data[strat.symbol]
             event_follower = self._event_follower(
-                run_id, strat.symbol, start_ts, end_ts, fill_mode
+                execution_data, strat.symbol, fill_mode
             )
             runner = self._init_runner(
                 strategy_config,
@@ -297,8 +306,6 @@ class MultiReplayEngine(ReplayEngine):
                 account_id=account_id,
                 event_follower=event_follower,
             )
-            if not self._emit_backtest_snapshots:
-                runner._position_writer = _NoopPositionSnapshotWriter()  # type: ignore[attr-defined]
             bundles[strat.symbol] = _RunnerBundle(
                 config=strat,
                 runner=runner,
@@ -326,7 +333,14 @@ class MultiReplayEngine(ReplayEngine):
         account_curve: list[AccountCurveSample] = []
         tick_count = 0
 
-        for symbol, tick in self._merge_ticks(providers):
+        merged = self._merge_ticks(providers)
+        if profiler is not None:
+            profiler.lap("setup", t)
+            merged = profiler.timed_iter(merged, "data")
+
+        for symbol, tick in merged:
+            if profiler is not None:
+                t = perf_counter_ns()
             last_prices[symbol] = tick.last_price
             if collateral_feed is not None:
                 for coin in session.collateral_balances:
@@ -334,6 +348,8 @@ class MultiReplayEngine(ReplayEngine):
                     if mark is not None:
                         session.update_collateral_mark(coin, mark)
                         collateral_marked.add(coin)
+            if profiler is not None:
+                t = profiler.lap("collateral", t)
 
             bundle = bundles[symbol]
             if (
@@ -346,9 +362,13 @@ class MultiReplayEngine(ReplayEngine):
                 if funding != 0:
                     logger.debug("%s funding payment: %s", symbol, funding)
                 bundle.funding.mark_funding_applied(tick.exchange_ts)
+            if profiler is not None:
+                t = profiler.lap("funding", t)
 
             with coordinator.active(symbol):
                 bundle.runner.process_fills(tick)
+            if profiler is not None:
+                t = profiler.lap("fills", t)
 
             unrealized = coordinator.total_unrealized()
             total_im, total_mm = coordinator.total_im_mm()
@@ -356,15 +376,22 @@ class MultiReplayEngine(ReplayEngine):
             account_curve.append(
                 self._account_sample(tick.exchange_ts, session, total_mm)
             )
+            if profiler is not None:
+                t = profiler.lap("equity", t)
 
             with coordinator.active(symbol):
                 bundle.runner.execute_tick(tick)
+            if profiler is not None:
+                profiler.lap("execute_tick", t)
+                profiler.ticks += 1
 
             tick_count += 1
             if tick_count % 10000 == 0:
                 logger.info("Processed %d merged ticks...", tick_count)
 
         logger.info("Multi replay complete: %d merged ticks processed", tick_count)
+        if profiler is not None:
+            t = perf_counter_ns()
         self._warn_unmarked_collateral(session, collateral_feed, collateral_marked)
 
         for symbol, bundle in bundles.items():
@@ -377,10 +404,15 @@ class MultiReplayEngine(ReplayEngine):
                 if price > 0:
                     self._wind_down(bundle.runner, session, price, end_ts)
 
+        if profiler is not None:
+            t = profiler.lap("wind_down", t)
+
         for bundle in bundles.values():
             writer = getattr(bundle.runner, "_position_writer", None)
             if writer is not None:
                 writer.flush()
+        if profiler is not None:
+            t = profiler.lap("position_flush", t)
 
         final_unrealized_by_symbol = {
             symbol: self._runner_unrealized(bundle.runner, last_prices)
@@ -389,20 +421,22 @@ class MultiReplayEngine(ReplayEngine):
         session.finalize(
             sum(final_unrealized_by_symbol.values(), Decimal("0"))
         )
+        if profiler is not None:
+            t = profiler.lap("finalize", t)
 
         per_strategy = {
             symbol: self._compare_symbol(
                 bundle.config,
                 bundle.runner,
                 session,
-                run_id,
-                start_ts,
-                end_ts,
+                execution_data,
                 fill_mode,
                 final_unrealized_by_symbol[symbol],
             )
             for symbol, bundle in bundles.items()
         }
+        if profiler is not None:
+            profiler.lap("compare", t)
 
         return MultiReplayResult(
             session=session,
@@ -649,46 +683,27 @@ class MultiReplayEngine(ReplayEngine):
             leverage=strat.leverage,
         )
 
-    def _event_follower(
+    def _position_writer(
         self,
+        symbol: str,
         run_id: str,
+        account_id: Optional[str],
+    ):
+        """Multi-symbol replay does no position pairing: export or discard."""
+        if self._emit_backtest_snapshots and self._multi_config.export_position_snapshots:
+            return self._position_export_writer(run_id, account_id)
+        return _NoopPositionSnapshotWriter()
+
+    def _event_follower(
+        self,
+        execution_data: ReplayExecutionData,
         symbol: str,
-        start_ts: datetime,
-        end_ts: datetime,
         fill_mode: FillMode,
     ) -> Optional[EventFollower]:
-        """Load a per-symbol EventFollower when requested."""
+        """Build a per-symbol EventFollower when requested."""
         if fill_mode != FillMode.EVENT_FOLLOWER:
             return None
-        recorded_execs: list[RecordedExecution] = []
-        skipped = 0
-        with self._db.get_session() as db_session:
-            repo = PrivateExecutionRepository(db_session)
-            for ex in repo.get_by_run_range(run_id, start_ts, end_ts):
-                if ex.symbol != symbol:
-                    skipped += 1
-                    continue
-                recorded_execs.append(
-                    RecordedExecution(
-                        exec_id=ex.exec_id,
-                        order_link_id=ex.order_link_id,
-                        order_id=ex.order_id,
-                        side=ex.side,
-                        exec_price=ex.exec_price,
-                        exec_qty=ex.exec_qty,
-                        exec_fee=ex.exec_fee if ex.exec_fee is not None else Decimal("0"),
-                        closed_pnl=(
-                            ex.closed_pnl if ex.closed_pnl is not None else Decimal("0")
-                        ),
-                        exchange_ts=_strip_tz(ex.exchange_ts),
-                    )
-                )
-        logger.info(
-            "event_follower: loaded %d recorded executions for %s "
-            "(%d other-symbol rows skipped)",
-            len(recorded_execs), symbol, skipped,
-        )
-        return EventFollower(recorded_execs, symbol=symbol, start_ts=_strip_tz(start_ts))
+        return execution_data.event_follower(symbol)
 
     def _startup_mark_cache(
         self,
@@ -793,21 +808,12 @@ class MultiReplayEngine(ReplayEngine):
         strat: MultiReplayStrategyConfig,
         runner: BacktestRunner,
         session: BacktestSession,
-        run_id: str,
-        start_ts: datetime,
-        end_ts: datetime,
+        execution_data: ReplayExecutionData,
         fill_mode: FillMode,
         final_unrealized: Decimal,
     ) -> MultiStrategyReplayResult:
         """Run per-symbol trade matching and metrics under a shared session."""
-        with self._db.get_session() as db_session:
-            live_loader = LiveTradeLoader(db_session)
-            recorded_trades = live_loader.load(
-                run_id=run_id,
-                start_ts=start_ts,
-                end_ts=end_ts,
-                symbol=strat.symbol,
-            )
+        recorded_trades = execution_data.live_trades(strat.symbol)
         bt_loader = BacktestTradeLoader()
         simulated = [
             trade for trade in bt_loader.load_from_session(session.trades)
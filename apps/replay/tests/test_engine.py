@@ -12,9 +12,10 @@ from grid_db.models import PositionSnapshot
 
 from backtest.data_provider import InMemoryDataProvider
 from backtest.fill_simulator import FillMode
+from backtest.profiling import PhaseProfiler
 
 from replay.config import ReplayConfig, ReplayStrategyConfig
-from replay.engine import ReplayEngine, ReplayResult
+from replay.engine import ReplayEngine, ReplayResult, _InMemoryPositionSnapshotSink
 
 
 def _make_tick(price: Decimal, ts: datetime) -> TickerEvent:
@@ -184,6 +185,37 @@ class TestReplayEngine:
         assert len(result.session.equity_curve) == len(ticker_events)
 
 
+class TestReplayProfiling:
+    """--profile: phase timings cover the replay loop and comparison."""
+
+    @patch("replay.engine.InstrumentInfoProvider")
+    def test_profiler_records_replay_phases(
+        self, mock_provider_cls, db, seeded_run_account, replay_config, ticker_events,
+    ):
+        mock_info = MagicMock()
+        mock_info.qty_step = Decimal("0.001")
+        mock_info.tick_size = Decimal("0.1")
+        mock_info.round_qty = lambda q: max(Decimal("0.001"), q.quantize(Decimal("0.001")))
+        mock_provider_cls.return_value.get.return_value = mock_info
+
+        profiler = PhaseProfiler()
+        engine = ReplayEngine(config=replay_config, db=db, profiler=profiler)
+        result = engine.run(data_provider=InMemoryDataProvider(ticker_events))
+
+        phases = profiler.phases
+        assert profiler.ticks == len(ticker_events)
+        for name in (
+            "setup", "data", "collateral", "funding", "fills", "equity",
+            "execute_tick", "execute_tick.on_event", "execute_tick.dispatch_intents",
+            "wind_down", "position_flush", "finalize",
+            "compare.ground_truth", "compare.match", "compare.positions",
+        ):
+            assert name in phases, name
+        assert phases["fills"].calls == len(ticker_events)
+        if result.session.trades:
+            assert phases["fills.position_snapshot"].calls > 0
+
+
 class TestResolveRun:
     """Tests for run auto-discovery."""
 
@@ -466,13 +498,41 @@ class TestWindDown:
 
 
 class TestPositionTelemetryWriter0034:
-    """Feature 0034 — replay writes backtest position_snapshots to DB."""
+    """Feature 0034 — backtest position snapshots: in memory, DB export opt-in."""
+
+    @patch("replay.engine.InstrumentInfoProvider")
+    def test_default_keeps_snapshots_out_of_db(
+        self, mock_provider_cls, db, seeded_run_account, replay_config, ticker_events,
+    ):
+        """No export by default: snapshots stay in the runner's sink only."""
+        from grid_db.models import PositionSnapshot
+
+        mock_info = MagicMock()
+        mock_info.qty_step = Decimal("0.001")
+        mock_info.tick_size = Decimal("0.1")
+        mock_info.round_qty = lambda q: max(Decimal("0.001"), q.quantize(Decimal("0.001")))
+        mock_provider_cls.return_value.get.return_value = mock_info
+
+        engine = ReplayEngine(config=replay_config, db=db)
+        result = engine.run(data_provider=InMemoryDataProvider(ticker_events))
+
+        # ticker_events crosses grid levels both ways under the default
+        # last_cross simulator, so the sink always has snapshots to hold.
+        assert result.session.trades
+        with db.get_session() as session:
+            assert session.query(PositionSnapshot).count() == 0
+        sink = result.runner._position_writer
+        assert sink.total_written == 0
+        rows = sink.snapshots()
+        assert len(rows) == len(sink) > 0
+        assert {row.source for row in rows} == {"backtest"}
+        assert rows[0].account_id == seeded_run_account.account_id
 
     @patch("replay.engine.InstrumentInfoProvider")
     def test_writes_backtest_source_rows(
         self, mock_provider_cls, db, seeded_run_account, replay_config, ticker_events,
     ):
-        """End-to-end: replay produces position_snapshots with source='backtest'."""
+        """End-to-end: export enabled → position_snapshots with source='backtest'."""
         from grid_db.models import PositionSnapshot
 
         mock_info = MagicMock()
@@ -481,6 +541,7 @@ class TestPositionTelemetryWriter0034:
         mock_info.round_qty = lambda q: max(Decimal("0.001"), q.quantize(Decimal("0.001")))
         mock_provider_cls.return_value.get.return_value = mock_info
 
+        replay_config.export_position_snapshots = True
         engine = ReplayEngine(config=replay_config, db=db)
         provider = InMemoryDataProvider(ticker_events)
         result = engine.run(data_provider=provider)
@@ -510,7 +571,6 @@ class TestPositionTelemetryWriter0034:
         self, mock_provider_cls, db, seeded_run_account, replay_config, ticker_events,
     ):
         """Wind-down close_all path emits a backtest snapshot for each direction closed."""
-        from grid_db.models import PositionSnapshot
 
         mock_info = MagicMock()
         mock_info.qty_step = Decimal("0.001")
@@ -530,20 +590,14 @@ class TestPositionTelemetryWriter0034:
             pytest.skip("No positions to wind down in this ticker fixture.")
 
         # Each wind-down trade should have a matching backtest snapshot
-        # written at its timestamp (engine._wind_down explicitly emits).
-        with db.get_session() as session:
-            bt_row_count = (
-                session.query(PositionSnapshot)
-                .filter(PositionSnapshot.source == "backtest")
-                .count()
-            )
-        assert bt_row_count >= len(wind_down_trades)
+        # emitted at its timestamp (engine._wind_down explicitly emits).
+        assert len(result.runner._position_writer) >= len(wind_down_trades)
 
     @patch("replay.engine.InstrumentInfoProvider")
     def test_raises_on_null_run_account_id(
         self, mock_provider_cls, db, seeded_run_account, replay_config,
     ):
-        """Plan-mandated: a resolved run with NULL account_id must fail loudly.
+        """Plan-mandated: exporting for a run with NULL account_id must fail loudly.
 
         The current schema enforces ``Run.account_id NOT NULL``, so to exercise
         the protective path we mock ``_resolve_run`` to return ``account_id=None``
@@ -560,6 +614,7 @@ class TestPositionTelemetryWriter0034:
         mock_info.round_qty = lambda q: max(Decimal("0.001"), q.quantize(Decimal("0.001")))
         mock_provider_cls.return_value.get.return_value = mock_info
 
+        replay_config.export_position_snapshots = True
         engine = ReplayEngine(config=replay_config, db=db)
         strategy_config = BacktestStrategyConfig(
             strat_id="replay_btcusdt",
@@ -596,10 +651,11 @@ class TestPositionPairsSurviveSessionClose:
     ):
         """Column attributes on returned pairs must remain readable.
 
-        Seeds one live/backtest pair at matching exchange_ts so step 11
-        produces a non-empty `result.position_pairs`. Asserting any column
-        attribute access on the pair (`.live.side`, `.backtest.entry_price`)
-        is sufficient — the regression is a thrown `DetachedInstanceError`,
+        Seeds one live row near the fixture's first backtest fill so step 11
+        produces a non-empty `result.position_pairs` (the backtest side comes
+        from the runner's in-memory sink). Asserting any column attribute
+        access on the pair (`.live.side`, `.backtest.entry_price`) is
+        sufficient — the regression is a thrown `DetachedInstanceError`,
         not a wrong value.
         """
         mock_info = MagicMock()
@@ -627,23 +683,6 @@ class TestPositionPairsSurviveSessionClose:
                 position_mm=Decimal("0"),
                 cum_realised_pnl=Decimal("0"),
             ))
-            session.add(PositionSnapshot(
-                run_id="test-run-id",
-                account_id=seeded_run_account.account_id,
-                symbol="BTCUSDT",
-                exchange_ts=snap_ts,
-                local_ts=snap_ts,
-                side="Buy",
-                size=Decimal("0.001"),
-                entry_price=Decimal("100000"),
-                liq_price=Decimal("0"),
-                unrealised_pnl=Decimal("0"),
-                source="backtest",
-                mark_price=Decimal("100000"),
-                position_im=Decimal("0"),
-                position_mm=Decimal("0"),
-                cum_realised_pnl=Decimal("0"),
-            ))
             session.commit()
 
         engine = ReplayEngine(config=replay_config, db=db)
@@ -652,8 +691,8 @@ class TestPositionPairsSurviveSessionClose:
         result = engine.run(data_provider=provider)
 
         assert len(result.position_pairs) > 0, (
-            "Seeded a matching live/backtest pair; expected pair_and_compare "
-            "to produce at least one pair."
+            "Seeded a live row beside a backtest fill; expected "
+            "pair_and_compare to produce at least one pair."
         )
         pair = result.position_pairs[0]
         # If the regression returns, these attribute reads raise
@@ -661,7 +700,7 @@ class TestPositionPairsSurviveSessionClose:
         assert pair.live.side == "Buy"
         assert pair.backtest.side == "Buy"
         assert pair.live.entry_price == Decimal("100000")
-        assert pair.backtest.entry_price == Decimal("100000")
+        assert pair.backtest.entry_price > 0
 
 
 def _real_info(tick: Decimal):
@@ -778,3 +817,48 @@ class TestTickSizeResolution:
 
         assert levels_a == levels_b
         assert len(levels_a) > 0
+
+
+class TestInMemoryPositionSnapshotSink:
+    """Backtest position snapshots handed to the comparator without the DB."""
+
+    @staticmethod
+    def _snapshot(side: str, ts: datetime, size: str) -> PositionSnapshot:
+        return PositionSnapshot(
+            symbol="BTCUSDT", exchange_ts=ts, local_ts=ts, side=side,
+            size=Decimal(size), entry_price=Decimal("100000"),
+            liq_price=Decimal("0"), unrealised_pnl=Decimal("0"),
+            mark_price=Decimal("100000"), position_im=Decimal("1"),
+            position_mm=Decimal("0.5"), cum_realised_pnl=Decimal("0"),
+            cur_realised_pnl=None, position_value=Decimal("100"),
+        )
+
+    def test_snapshots_windowed_and_ordered_like_the_db_query(self, ts):
+        sink = _InMemoryPositionSnapshotSink("BTCUSDT", "run-1", "acc-1")
+        sink.write(self._snapshot("Sell", ts + timedelta(seconds=1), "0.002"))
+        sink.write(self._snapshot("Buy", ts + timedelta(seconds=2), "0.001"))
+        sink.write(self._snapshot("Buy", ts + timedelta(minutes=5), "0.003"))
+
+        rows = sink.snapshots(ts, ts + timedelta(minutes=1))
+
+        assert len(sink) == 3 and sink.flush() == 0
+        assert [(r.side, r.size) for r in rows] == [
+            ("Buy", Decimal("0.001")), ("Sell", Decimal("0.002")),
+        ]
+        assert rows[0].exchange_ts == datetime(2025, 2, 20, 12, 0, 2)
+        assert rows[0].cur_realised_pnl is None
+        assert (rows[0].run_id, rows[0].account_id, rows[0].source) == (
+            "run-1", "acc-1", "backtest",
+        )
+
+    def test_export_forwards_to_batch_writer(self, ts):
+        export = MagicMock()
+        export.flush.return_value = 1
+        export.total_written = 1
+        sink = _InMemoryPositionSnapshotSink("BTCUSDT", "run-1", "acc-1", export=export)
+        snapshot = self._snapshot("Buy", ts, "0.001")
+        sink.write(snapshot)
+
+        export.write.assert_called_once_with(snapshot)
+        assert sink.flush() == 1
+        assert sink.total_written == 1
@@ -897,6 +897,44 @@ class TestReplayEngineSeedFailLoud:
         with pytest.raises(SeedDataQualityError):
             engine._load_seed(replay_config, run_id)
 
+    def test_load_seed_raises_when_sqlite_file_missing_and_creates_nothing(
+        self, seeded_db, seed_ts, tmp_path, mock_instrument,
+    ):
+        """A missing ``.sqlite3`` seed opens read-only → SeedDataQualityError,
+        and no empty DB / ``-wal`` / ``-shm`` file is left behind."""
+        seed_dir = tmp_path / "seed"
+        seed_dir.mkdir()
+        seed_config = SeedConfig(
+            enabled=True,
+            at_ts=seed_ts,
+            account_id="acc-1",
+            strat_id=STRAT_ID,
+            grid_state_path=str(seed_dir / "grid_anchor.sqlite3"),
+            wallet_coin="USDT",
+        )
+        replay_config = ReplayConfig(
+            database_url="sqlite:///:memory:",
+            run_id="seed-run",
+            symbol=SYMBOL,
+            start_ts=seed_ts,
+            end_ts=seed_ts + timedelta(hours=1),
+            strategy=ReplayStrategyConfig(
+                tick_size=Decimal("0.1"),
+                grid_count=4,
+                grid_step=0.2,
+                enable_risk_multipliers=True,
+            ),
+            initial_balance=Decimal("10000"),
+            enable_funding=False,
+            seed=seed_config,
+        )
+        engine = ReplayEngine(config=replay_config, db=seeded_db)
+        run_id, *_ = engine._resolve_run(replay_config)
+
+        with pytest.raises(SeedDataQualityError, match="grid_anchor.sqlite3"):
+            engine._load_seed(replay_config, run_id)
+        assert list(seed_dir.iterdir()) == []
+
     def test_load_seed_raises_when_grid_step_count_mismatch(
         self, seeded_db, seed_ts, snapshot_ts, mock_instrument,
     ):
@@ -0,0 +1,88 @@
+"""Tests for the shared per-replay recorded execution stream."""
+
+from datetime import timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from grid_db import PrivateExecutionRepository
+from grid_db.models import PrivateExecution
+
+from replay.execution_data import ReplayExecutionData
+
+
+@pytest.fixture
+def executions(db, seeded_run_account, ts):
+    """Interleaved SOL/LTC rows; the SOL pair shares a timestamp."""
+    rows = [
+        ("SOLUSDT", "sol-b", "sol-oid-1", ts, Decimal("0.01"), None),
+        ("LTCUSDT", "ltc-a", "ltc-oid-1", ts, Decimal("0.02"), Decimal("0")),
+        ("SOLUSDT", "sol-a", "sol-oid-1", ts, None, Decimal("0")),
+        ("SOLUSDT", "sol-c", "sol-oid-2", ts + timedelta(seconds=5),
+         Decimal("0.01"), Decimal("1.5")),
+    ]
+    with db.get_session() as session:
+        for symbol, exec_id, order_id, exchange_ts, fee, pnl in rows:
+            session.add(
+                PrivateExecution(
+                    run_id="test-run-id",
+                    account_id=seeded_run_account.account_id,
+                    symbol=symbol,
+                    exec_id=exec_id,
+                    order_id=order_id,
+                    order_link_id=f"{order_id}-link",
+                    exchange_ts=exchange_ts,
+                    side="Buy",
+                    exec_price=Decimal("10"),
+                    exec_qty=Decimal("1"),
+                    exec_fee=fee,
+                    closed_pnl=pnl,
+                )
+            )
+
+
+@pytest.fixture
+def data(db, executions, ts):
+    return ReplayExecutionData(
+        db, "test-run-id", ts - timedelta(seconds=1), ts + timedelta(seconds=10)
+    )
+
+
+class TestReplayExecutionData:
+    def test_partitions_by_symbol_in_repository_order(self, data):
+        assert data.symbols == ["LTCUSDT", "SOLUSDT"]
+        assert [e.exec_id for e in data.executions("SOLUSDT")] == [
+            "sol-a", "sol-b", "sol-c",
+        ]
+        assert data.executions("BTCUSDT") == []
+
+    def test_recorded_executions_default_null_amounts(self, data):
+        recorded = data.recorded_executions("SOLUSDT")
+        assert recorded[0].exec_fee == Decimal("0")
+        assert recorded[1].closed_pnl == Decimal("0")
+        assert recorded[0].exchange_ts.tzinfo is None
+
+    def test_one_query_serves_follower_and_ground_truth(self, data, ts):
+        with patch.object(
+            PrivateExecutionRepository, "get_by_run_range",
+            autospec=True, side_effect=PrivateExecutionRepository.get_by_run_range,
+        ) as query:
+            for symbol in ("SOLUSDT", "LTCUSDT"):
+                follower = data.event_follower(symbol)
+                trades = data.live_trades(symbol)
+        assert query.call_count == 1
+
+        # Partial fills of sol-oid-1 aggregate into one trade.
+        assert [(t.qty, t.realized_pnl) for t in data.live_trades("SOLUSDT")] == [
+            (Decimal("2"), Decimal("0")), (Decimal("1"), Decimal("1.5")),
+        ]
+        assert len(trades) == 1
+        assert [r.exec_id for r in follower.drain(ts - timedelta(seconds=1), ts)] == [
+            "ltc-a",
+        ]
+
+    def test_query_is_lazy(self, db, ts):
+        with patch.object(PrivateExecutionRepository, "get_by_run_range") as query:
+            ReplayExecutionData(db, "test-run-id", ts, ts)
+        query.assert_not_called()
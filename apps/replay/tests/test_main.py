@@ -42,6 +42,15 @@ class TestParseArgs:
         assert args.output == "results/custom"
         assert args.debug is True
 
+    def test_profile_args(self):
+        args = parse_args(["--profile", "profile.json", "--profiler", "cprofile"])
+        assert args.profile == "profile.json"
+        assert args.profiler == "cprofile"
+
+    def test_profiler_without_profile_rejected(self):
+        with pytest.raises(SystemExit):
+            parse_args(["--profiler", "sample"])
+
 
 class TestParseDatetime:
     """Tests for datetime parsing."""
@@ -13,6 +13,7 @@ from backtest.data_provider import InMemoryDataProvider
 from backtest.fill_simulator import FillMode
 from backtest.session import BacktestSession, BacktestTrade
 
+from replay.execution_data import ReplayExecutionData
 from replay.multi_config import MultiReplayConfig
 from replay.multi_engine import (
     MultiReplayEngine,
@@ -282,12 +283,11 @@ class TestEventFollowerLoading:
                 )
         engine = MultiReplayEngine.__new__(MultiReplayEngine)
         engine._db = db
+        execution_data = ReplayExecutionData(
+            db, "test-run-id", TS - timedelta(seconds=1), TS + timedelta(seconds=1)
+        )
         follower = engine._event_follower(
-            "test-run-id",
-            "SOLUSDT",
-            TS - timedelta(seconds=1),
-            TS + timedelta(seconds=1),
-            FillMode.EVENT_FOLLOWER,
+            execution_data, "SOLUSDT", FillMode.EVENT_FOLLOWER
         )
         rows = follower.drain(TS - timedelta(seconds=1), TS)
         assert [row.exec_id for row in rows] == ["SOLUSDT-exec"]
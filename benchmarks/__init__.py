@@ -0,0 +1,4 @@
+"""Hot-path micro-benchmarks with JSON results and baseline regression gating.
+
+Run with ``make bench`` (or ``python -m benchmarks``); see ``benchmarks/README.md``.
+"""
@@ -0,0 +1,7 @@
+"""``python -m benchmarks`` entry point."""
+
+import sys
+
+from benchmarks.runner import main
+
+sys.exit(main())
@@ -0,0 +1,81 @@
+"""Benchmark: incremental vs from-scratch pair IM/MM evaluation per tick.
+
+Simulates the multi-replay shared-wallet path, which asks each runner for its
+hedge-aware pair IM/MM on every tick while positions only change on fills.
+The from-scratch side uses a fresh ``IncrementalMarginEvaluator`` per call
+(no reusable state, i.e. the pre-cache cost: full term derivation plus two
+tier bisections); the incremental side reuses one evaluator. Outputs are
+asserted identical and throughput is printed.
+
+Usage:
+    uv run python benchmarks/bench_backtest_margin.py [--ticks N] [--ticks-per-fill K]
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+
+from gridcore.pnl import MM_TIERS_BTCUSDT
+
+from backtest.margin_evaluator import IncrementalMarginEvaluator
+
+_KWARGS = dict(
+    leverage=10,
+    taker_fee_rate=Decimal("0.00055"),
+    hedge_factor=Decimal("5.657"),
+    tiers=MM_TIERS_BTCUSDT,
+)
+
+
+def _scenario(ticks: int, ticks_per_fill: int, seed: int = 7):
+    """Yield (long_state, short_state, mark) with a fill every ticks_per_fill ticks."""
+    rng = random.Random(seed)
+    long_state = SimpleNamespace(size=Decimal("0.5"), avg_entry_price=Decimal("100000"))
+    short_state = SimpleNamespace(size=Decimal("0.3"), avg_entry_price=Decimal("100400"))
+    mark = Decimal("100000")
+    for i in range(ticks):
+        if i % ticks_per_fill == 0:
+            leg = rng.choice((long_state, short_state))
+            leg.size = Decimal(rng.randint(1, 20)) / Decimal("10")
+            leg.avg_entry_price = mark + Decimal(rng.randint(-500, 500))
+        mark += Decimal(rng.randint(-50, 50)) / Decimal("10")
+        yield long_state, short_state, mark
+
+
+def _run(ticks: int, ticks_per_fill: int, incremental: bool) -> list[tuple]:
+    shared = IncrementalMarginEvaluator()
+    out = []
+    for long_state, short_state, mark in _scenario(ticks, ticks_per_fill):
+        evaluator = shared if incremental else IncrementalMarginEvaluator()
+        out.append(evaluator.pair_im_mm(long_state, short_state, mark, **_KWARGS))
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=100_000)
+    parser.add_argument("--ticks-per-fill", type=int, default=200)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    scratch = _run(args.ticks, args.ticks_per_fill, incremental=False)
+    scratch_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    incremental = _run(args.ticks, args.ticks_per_fill, incremental=True)
+    incremental_s = time.perf_counter() - start
+
+    if incremental != scratch:
+        raise SystemExit("pair IM/MM mismatch between incremental and from-scratch paths")
+
+    print(
+        f"ticks={args.ticks}  from_scratch={args.ticks / scratch_s:,.0f} ticks/s  "
+        f"incremental={args.ticks / incremental_s:,.0f} ticks/s  "
+        f"speedup={scratch_s / incremental_s:5.2f}x  identical=yes"
+    )
+
+
+if __name__ == "__main__":
+    main()
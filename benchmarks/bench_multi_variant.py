@@ -0,0 +1,115 @@
+"""Benchmark: N sequential backtests vs one single-pass multi-variant run.
+
+Seeds a temporary SQLite database with synthetic ``TickerSnapshot`` rows, then
+runs every fill mode once as a separate ``BacktestEngine`` (each re-reading
+and re-decoding the ticks) and once through ``MultiVariantBacktestEngine``
+(one read, N runner stacks). Per-variant results are asserted identical and
+wall time for both is printed, together with the cost of one bare data pass
+(read + decode only) — the part a single-pass run saves N-1 times. With real
+strategies the per-tick GridEngine work usually dominates, so the end-to-end
+gain grows with cheaper strategies and slower storage.
+
+Usage:
+    uv run python benchmarks/bench_multi_variant.py [--ticks N]
+"""
+
+import argparse
+import logging
+import math
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+from grid_db import DatabaseFactory, DatabaseSettings
+from grid_db.models import TickerSnapshot
+
+from backtest.config import BacktestConfig, BacktestStrategyConfig, WindDownMode
+from backtest.data_provider import HistoricalDataProvider
+from backtest.engine import BacktestEngine
+from backtest.fill_simulator import FillMode
+from backtest.multi_variant import MultiVariantBacktestEngine, variants_for_fill_modes
+
+FILL_MODES = [
+    FillMode.STRICT_CROSS,
+    FillMode.BOOK_TOUCH,
+    FillMode.TRADE_THROUGH_AT_LIMIT,
+    FillMode.LAST_CROSS,
+]
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _seed(db: DatabaseFactory, ticks: int) -> None:
+    rows = []
+    for i in range(ticks):
+        price = Decimal(str(round(100000.0 + 2000.0 * math.sin(2 * math.pi * i / 3000), 1)))
+        ts = T0 + timedelta(seconds=i)
+        rows.append(TickerSnapshot(
+            symbol="BTCUSDT", exchange_ts=ts, local_ts=ts,
+            last_price=price, mark_price=price,
+            bid1_price=price - Decimal("0.5"), ask1_price=price + Decimal("0.5"),
+            funding_rate=Decimal("0.0001"),
+        ))
+    with db.get_session() as session:
+        session.add_all(rows)
+
+
+def _fingerprint(session):
+    return [(t.side, t.price, t.qty, t.timestamp) for t in session.trades], session.equity_curve
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=1_000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    config = BacktestConfig(
+        strategies=[BacktestStrategyConfig(
+            strat_id="bench", symbol="BTCUSDT", tick_size="0.1",
+            grid_count=50, grid_step=0.2, amount="1000",
+        )],
+        initial_balance=100000,
+        wind_down_mode=WindDownMode.CLOSE_ALL,
+    )
+    end_ts = T0 + timedelta(seconds=args.ticks)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseFactory(DatabaseSettings(
+            db_type="sqlite", db_name=str(Path(tmp) / "bench.db"), _env_file=None,
+        ))
+        db.create_tables()
+        _seed(db, args.ticks)
+
+        start = time.perf_counter()
+        for _ in HistoricalDataProvider(db, "BTCUSDT", T0, end_ts):
+            pass
+        read_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        separate = {
+            mode.value: BacktestEngine(config, db=db, fill_mode=mode).run("BTCUSDT", T0, end_ts)
+            for mode in FILL_MODES
+        }
+        separate_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        combined = MultiVariantBacktestEngine(
+            config, variants=variants_for_fill_modes(FILL_MODES), db=db,
+        ).run("BTCUSDT", T0, end_ts)
+        combined_s = time.perf_counter() - start
+
+    for name, session in separate.items():
+        if _fingerprint(combined[name]) != _fingerprint(session):
+            raise SystemExit(f"parity failure for variant {name}")
+
+    print(
+        f"ticks={args.ticks}  variants={len(FILL_MODES)}  data_pass={read_s:.3f}s  "
+        f"separate={separate_s:.2f}s  single_pass={combined_s:.2f}s  "
+        f"speedup={separate_s / combined_s:5.2f}x  parity=yes"
+    )
+
+
+if __name__ == "__main__":
+    main()
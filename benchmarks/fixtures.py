@@ -0,0 +1,148 @@
+"""Synthetic but realistic fixtures for the benchmark suite.
+
+Prices follow a seeded random walk on a BTCUSDT-like tick grid (tick 0.1,
+qty step 0.001, 1-second ticker cadence, 1-tick spread), so grid, fill and
+normalizer paths see the same shapes they see on recorded data. Everything is
+deterministic for a given ``seed``.
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from gridcore import EventType, TickerEvent
+
+SYMBOL = "BTCUSDT"
+TICK = Decimal("0.1")
+QTY_STEP = Decimal("0.001")
+START_PRICE = Decimal("100000.0")
+T0 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def price_walk(n: int, seed: int = 1, max_step_ticks: int = 40) -> list[Decimal]:
+    """``n`` tick-aligned prices from a bounded random walk."""
+    rng = random.Random(seed)
+    price = START_PRICE
+    prices = []
+    for _ in range(n):
+        price += Decimal(rng.randint(-max_step_ticks, max_step_ticks)) * TICK
+        prices.append(price)
+    return prices
+
+
+def ticker_events(n: int, seed: int = 1, symbol: str = SYMBOL) -> list[TickerEvent]:
+    """``n`` TickerEvents one second apart with a one-tick spread."""
+    events = []
+    for i, price in enumerate(price_walk(n, seed)):
+        ts = T0 + timedelta(seconds=i)
+        events.append(TickerEvent(
+            event_type=EventType.TICKER, symbol=symbol, exchange_ts=ts, local_ts=ts,
+            last_price=price, mark_price=price,
+            bid1_price=price - TICK, ask1_price=price + TICK,
+            funding_rate=Decimal("0.0001"),
+        ))
+    return events
+
+
+def _ms(i: int) -> int:
+    return int((T0 + timedelta(seconds=i)).timestamp() * 1000)
+
+
+def ticker_messages(n: int, seed: int = 1) -> list[dict]:
+    """Raw Bybit ``tickers.{symbol}`` WebSocket messages."""
+    return [
+        {
+            "topic": f"tickers.{SYMBOL}",
+            "type": "snapshot",
+            "ts": _ms(i),
+            "data": {
+                "symbol": SYMBOL,
+                "lastPrice": str(price),
+                "markPrice": str(price),
+                "bid1Price": str(price - TICK),
+                "ask1Price": str(price + TICK),
+                "fundingRate": "0.0001",
+            },
+        }
+        for i, price in enumerate(price_walk(n, seed))
+    ]
+
+
+def public_trade_message(trades: int, seed: int = 1) -> dict:
+    """One raw ``publicTrade.{symbol}`` message carrying ``trades`` prints."""
+    rng = random.Random(seed)
+    return {
+        "topic": f"publicTrade.{SYMBOL}",
+        "type": "snapshot",
+        "ts": _ms(0),
+        "data": [
+            {
+                "i": f"trade-{i}",
+                "T": _ms(0) + i,
+                "p": str(price),
+                "v": str(Decimal(rng.randint(1, 900)) * QTY_STEP),
+                "S": rng.choice(("Buy", "Sell")),
+                "s": SYMBOL,
+                "L": "PlusTick",
+                "BT": False,
+            }
+            for i, price in enumerate(price_walk(trades, seed))
+        ],
+    }
+
+
+def execution_message(fills: int, seed: int = 1) -> dict:
+    """One raw private ``execution`` message with ``fills`` linear trades."""
+    rng = random.Random(seed)
+    return {
+        "topic": "execution",
+        "id": "bench",
+        "creationTime": _ms(0),
+        "data": [
+            {
+                "category": "linear",
+                "symbol": SYMBOL,
+                "execId": f"exec-{i}",
+                "orderId": f"order-{i}",
+                "orderLinkId": f"bench{i:016x}",
+                "execPrice": str(price),
+                "execQty": "0.010",
+                "execFee": "0.2",
+                "execType": "Trade",
+                "execTime": str(_ms(i)),
+                "side": rng.choice(("Buy", "Sell")),
+                "leavesQty": "0",
+                "closedPnl": "0",
+                "closedSize": "0",
+                "isMaker": True,
+            }
+            for i, price in enumerate(price_walk(fills, seed))
+        ],
+    }
+
+
+def order_message(orders: int, seed: int = 1) -> dict:
+    """One raw private ``order`` message with ``orders`` limit-order updates."""
+    rng = random.Random(seed)
+    return {
+        "topic": "order",
+        "id": "bench",
+        "creationTime": _ms(0),
+        "data": [
+            {
+                "category": "linear",
+                "symbol": SYMBOL,
+                "orderId": f"order-{i}",
+                "orderLinkId": f"bench{i:016x}",
+                "orderType": "Limit",
+                "orderStatus": rng.choice(("New", "Filled", "Cancelled")),
+                "side": rng.choice(("Buy", "Sell")),
+                "price": str(price),
+                "qty": "0.010",
+                "leavesQty": "0.010",
+                "updatedTime": str(_ms(i)),
+                "reduceOnly": False,
+            }
+            for i, price in enumerate(price_walk(orders, seed))
+        ],
+    }
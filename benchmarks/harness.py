@@ -0,0 +1,241 @@
+"""Timing, result recording and baseline comparison for the benchmark suite.
+
+A benchmark *case* is registered with ``@bench(name, group)`` on a setup
+function. The setup builds its fixtures and returns a zero-argument callable;
+only that callable is timed. Timing follows ``timeit``: the number of calls
+per repeat is auto-ranged so one repeat lasts at least ``min_time`` seconds,
+and the best and median per-call times over ``repeat`` repeats are recorded.
+
+Results are written as JSON (``write_results``) and compared against a stored
+baseline (``compare``). Comparison uses the best per-call time, which is the
+least noisy statistic for CPU-bound micro-benchmarks; a case is a regression
+when it is more than ``threshold`` slower than the baseline.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+SCHEMA_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+
+Setup = Callable[[], Callable[[], Any]]
+
+
+@dataclass(frozen=True)
+class Case:
+    """A registered benchmark case."""
+
+    name: str
+    group: str
+    setup: Setup
+    description: str = ""
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.group}.{self.name}"
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Timing of one case: per-call times in nanoseconds."""
+
+    name: str
+    number: int
+    repeat: int
+    best_ns: float
+    median_ns: float
+
+    @property
+    def ops_per_s(self) -> float:
+        return 1e9 / self.best_ns if self.best_ns else float("inf")
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """One case compared against the baseline.
+
+    ``ratio`` is current / baseline best time (> 1 means slower). ``status``
+    is one of ``regression``, ``improvement``, ``ok``, ``new`` (no baseline
+    entry) or ``missing`` (in the baseline but not run).
+    """
+
+    name: str
+    status: str
+    current_ns: Optional[float]
+    baseline_ns: Optional[float]
+    ratio: Optional[float]
+
+
+CASES: dict[str, Case] = {}
+
+
+def bench(name: str, group: str, description: str = "") -> Callable[[Setup], Setup]:
+    """Register ``setup`` as the benchmark case ``group.name``."""
+
+    def decorator(setup: Setup) -> Setup:
+        case = Case(name=name, group=group, setup=setup, description=description)
+        if case.full_name in CASES:
+            raise ValueError(f"Duplicate benchmark case: {case.full_name}")
+        CASES[case.full_name] = case
+        return setup
+
+    return decorator
+
+
+def select(cases: dict[str, Case], patterns: Optional[list[str]]) -> list[Case]:
+    """Cases whose full name matches any glob in ``patterns`` (all when empty)."""
+    if not patterns:
+        return list(cases.values())
+    return [
+        case for name, case in cases.items()
+        if any(fnmatch(name, p) or p in name for p in patterns)
+    ]
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5, min_time: float = 0.2) -> tuple[int, list[float]]:
+    """Time ``fn``; returns ``(number, per-call seconds for each repeat)``."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        # Aim straight for min_time (bounded growth keeps slow cases cheap).
+        number = max(number + 1, min(number * 10, int(number * min_time / max(elapsed, 1e-9)) + 1))
+
+    timings = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) / number)
+    return number, timings
+
+
+def run_case(case: Case, repeat: int = 5, min_time: float = 0.2) -> BenchResult:
+    """Set up and time one case."""
+    fn = case.setup()
+    number, timings = measure(fn, repeat=repeat, min_time=min_time)
+    return BenchResult(
+        name=case.full_name,
+        number=number,
+        repeat=len(timings),
+        best_ns=min(timings) * 1e9,
+        median_ns=statistics.median(timings) * 1e9,
+    )
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> dict[str, Any]:
+    """Machine/interpreter metadata stored next to the results."""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "commit": _git_commit(),
+    }
+
+
+def write_results(path: Path, results: list[BenchResult], env: Optional[dict] = None) -> None:
+    """Write results as JSON (creating parent directories)."""
+    payload = {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": env if env is not None else environment(),
+        "results": [asdict(r) | {"ops_per_s": r.ops_per_s} for r in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def load_results(path: Path) -> dict[str, BenchResult]:
+    """Load a results file as ``{case name: BenchResult}``.
+
+    Raises:
+        ValueError: If the file has an unsupported schema version.
+    """
+    payload = json.loads(path.read_text())
+    if payload.get("schema") != SCHEMA_VERSION:
+        raise ValueError(
+            f"{path}: unsupported benchmark schema {payload.get('schema')!r} "
+            f"(expected {SCHEMA_VERSION})"
+        )
+    return {
+        r["name"]: BenchResult(
+            name=r["name"], number=r["number"], repeat=r["repeat"],
+            best_ns=r["best_ns"], median_ns=r["median_ns"],
+        )
+        for r in payload["results"]
+    }
+
+
+def compare(
+    current: list[BenchResult],
+    baseline: dict[str, BenchResult],
+    threshold: float = DEFAULT_THRESHOLD,
+    include_missing: bool = False,
+) -> list[Comparison]:
+    """Compare ``current`` results against ``baseline``.
+
+    Args:
+        current: Results of this run.
+        baseline: Stored baseline keyed by case name.
+        threshold: Relative slowdown (0.10 = 10%) above which a case is a
+            regression; the same margin below counts as an improvement.
+        include_missing: Also report baseline cases that were not run
+            (off for filtered runs).
+    """
+    if threshold < 0:
+        raise ValueError(f"threshold must be >= 0, got {threshold}")
+    comparisons: list[Comparison] = []
+    for result in current:
+        base = baseline.get(result.name)
+        if base is None:
+            comparisons.append(Comparison(result.name, "new", result.best_ns, None, None))
+            continue
+        ratio = result.best_ns / base.best_ns
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        comparisons.append(Comparison(result.name, status, result.best_ns, base.best_ns, ratio))
+    if include_missing:
+        run_names = {r.name for r in current}
+        for name, base in baseline.items():
+            if name not in run_names:
+                comparisons.append(Comparison(name, "missing", None, base.best_ns, None))
+    return comparisons
+
+
+def format_ns(ns: Optional[float]) -> str:
+    """Human-readable duration for a per-call time in nanoseconds."""
+    if ns is None:
+        return "-"
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
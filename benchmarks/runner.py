@@ -0,0 +1,136 @@
+"""CLI for the benchmark suite.
+
+Usage:
+    uv run python -m benchmarks                      # run all, compare to baseline
+    uv run python -m benchmarks -k gridcore -k check_fills
+    uv run python -m benchmarks --save-baseline      # record a new baseline
+    uv run python -m benchmarks --threshold 0.05 --quick
+    uv run python -m benchmarks --list
+
+Exit codes: 0 = no regression (or no baseline), 1 = at least one case is
+slower than the baseline by more than ``--threshold``, 2 = usage error.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional
+
+from benchmarks.harness import (
+    CASES,
+    DEFAULT_THRESHOLD,
+    Comparison,
+    compare,
+    format_ns,
+    load_results,
+    run_case,
+    select,
+    write_results,
+)
+from benchmarks.suites import load_all
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_OUTPUT = RESULTS_DIR / "latest.json"
+DEFAULT_BASELINE = RESULTS_DIR / "baseline.json"
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run hot-path micro-benchmarks and compare against a baseline",
+    )
+    parser.add_argument(
+        "-k", "--filter", action="append", default=None, metavar="PATTERN",
+        help="Run only cases whose name contains PATTERN or matches it as a glob (repeatable)",
+    )
+    parser.add_argument("--list", action="store_true", help="List cases and exit")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed repeats per case (default: 5)",
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2,
+        help="Minimum seconds per repeat; calls per repeat are auto-ranged (default: 0.2)",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Smoke run: --repeat 3 --min-time 0.05",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=DEFAULT_OUTPUT,
+        help="Results JSON path (default: benchmarks/results/latest.json)",
+    )
+    parser.add_argument(
+        "--baseline", type=Path, default=DEFAULT_BASELINE,
+        help="Baseline JSON to compare against, skipped if missing "
+        "(default: benchmarks/results/baseline.json)",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help=f"Relative slowdown counted as a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true",
+        help="Also write this run's results to --baseline",
+    )
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.repeat, args.min_time = 3, 0.05
+    if args.repeat < 1 or args.min_time <= 0 or args.threshold < 0:
+        parser.error("--repeat must be >= 1, --min-time > 0 and --threshold >= 0")
+    return args
+
+
+def _print_comparisons(comparisons: list[Comparison], threshold: float) -> None:
+    print(f"\nvs baseline (threshold {threshold:.0%}):")
+    for c in comparisons:
+        ratio = f"{c.ratio:6.2f}x" if c.ratio is not None else "      -"
+        print(
+            f"  {c.status:<11} {ratio}  {format_ns(c.baseline_ns):>10} -> "
+            f"{format_ns(c.current_ns):>10}  {c.name}"
+        )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Main entry point."""
+    args = parse_args(argv)
+    load_all()
+    cases = select(CASES, args.filter)
+    if not cases:
+        print(f"No benchmark cases match {args.filter}", file=sys.stderr)
+        return 2
+
+    if args.list:
+        for case in cases:
+            print(f"{case.full_name:<55} {case.description}")
+        return 0
+
+    results = []
+    for case in cases:
+        result = run_case(case, repeat=args.repeat, min_time=args.min_time)
+        results.append(result)
+        print(
+            f"{case.full_name:<55} {format_ns(result.best_ns):>10}/call  "
+            f"(median {format_ns(result.median_ns)}, {result.ops_per_s:,.0f}/s)"
+        )
+
+    write_results(args.output, results)
+    print(f"\nWrote {len(results)} results to {args.output}")
+
+    status = 0
+    if args.baseline.exists() and not args.save_baseline:
+        comparisons = compare(
+            results, load_results(args.baseline), args.threshold,
+            include_missing=not args.filter,
+        )
+        _print_comparisons(comparisons, args.threshold)
+        regressions = [c for c in comparisons if c.status == "regression"]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+            status = 1
+    elif not args.save_baseline:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+
+    if args.save_baseline:
+        write_results(args.baseline, results)
+        print(f"Saved baseline to {args.baseline}")
+    return status
@@ -0,0 +1,16 @@
+"""Benchmark case modules; importing one registers its cases in ``harness.CASES``."""
+
+import importlib
+
+SUITES = (
+    "benchmarks.suites.bench_gridcore",
+    "benchmarks.suites.bench_backtest",
+    "benchmarks.suites.bench_bybit_adapter",
+    "benchmarks.suites.bench_grid_db",
+)
+
+
+def load_all() -> None:
+    """Import every suite module (idempotent)."""
+    for module in SUITES:
+        importlib.import_module(module)
@@ -0,0 +1,134 @@
+"""backtest hot paths: fill checks, order-book scans, position/margin tracking."""
+
+import itertools
+from decimal import Decimal
+from types import SimpleNamespace
+
+from gridcore.pnl import MM_TIERS_BTCUSDT
+
+from backtest.fill_simulator import FillMode, TradeThroughFillSimulator
+from backtest.margin_evaluator import IncrementalMarginEvaluator
+from backtest.order_manager import BacktestOrderManager, SimulatedOrder
+from backtest.position_tracker import BacktestPositionTracker
+
+from benchmarks.fixtures import QTY_STEP, SYMBOL, T0, price_walk, ticker_events
+from benchmarks.harness import bench
+
+GROUP = "backtest"
+
+LADDER_LEVELS = 25
+LADDER_STEP = Decimal("200.0")
+
+
+def _ladder_orders(center: Decimal = Decimal("100000.0")) -> list[SimulatedOrder]:
+    """A 50-order grid book: 25 buys below and 25 sells above ``center``."""
+    orders = []
+    for i in range(1, LADDER_LEVELS + 1):
+        for side, sign, direction in (("Buy", -1, "long"), ("Sell", 1, "short")):
+            orders.append(SimulatedOrder(
+                order_id=f"{side}{i}", client_order_id=f"{side}{i}", symbol=SYMBOL,
+                side=side, price=center + sign * i * LADDER_STEP, qty=Decimal("0.010"),
+                direction=direction, grid_level=i, created_ts=T0,
+            ))
+    return orders
+
+
+def _check_fill_case(mode: FillMode):
+    simulator = TradeThroughFillSimulator(mode=mode)
+    pairs = itertools.cycle(list(zip(itertools.cycle(_ladder_orders()), ticker_events(4096))))
+
+    def run():
+        order, tick = next(pairs)
+        simulator.check_fill(order, tick)
+
+    return run
+
+
+@bench("fill_simulator.check_fill.strict_cross", GROUP, "One order vs one ticker")
+def check_fill_strict_cross():
+    return _check_fill_case(FillMode.STRICT_CROSS)
+
+
+@bench("fill_simulator.check_fill.book_touch", GROUP, "One order vs one ticker (L1)")
+def check_fill_book_touch():
+    return _check_fill_case(FillMode.BOOK_TOUCH)
+
+
+@bench("order_manager.check_fills", GROUP, "Scan a 50-order book per tick, refilling fills")
+def order_manager_check_fills():
+    manager = BacktestOrderManager(fill_simulator=TradeThroughFillSimulator())
+    counter = itertools.count()
+
+    def place(side: str, price: Decimal, qty: Decimal) -> None:
+        manager.place_order(
+            client_order_id=f"c{next(counter)}", symbol=SYMBOL, side=side,
+            price=price, qty=qty, direction="long" if side == "Buy" else "short",
+            grid_level=0, timestamp=T0,
+        )
+
+    for order in _ladder_orders():
+        place(order.side, order.price, order.qty)
+    ticks = itertools.cycle(ticker_events(4096))
+
+    def run():
+        for fill in manager.check_fills(next(ticks)):
+            # Keep the book at steady depth, as the grid would re-place it.
+            place(fill.side, fill.price, fill.qty)
+
+    return run
+
+
+def _margin_states():
+    prices = price_walk(4096, seed=7)
+    long_state = SimpleNamespace(size=Decimal("0.5"), avg_entry_price=Decimal("100000"))
+    short_state = SimpleNamespace(size=Decimal("0.3"), avg_entry_price=Decimal("100400"))
+    return long_state, short_state, itertools.cycle(prices)
+
+
+_MARGIN_KWARGS = dict(
+    leverage=10,
+    taker_fee_rate=Decimal("0.00055"),
+    hedge_factor=Decimal("5.657"),
+    tiers=MM_TIERS_BTCUSDT,
+)
+
+
+@bench("margin_evaluator.pair_im_mm", GROUP, "Hedge-aware pair IM/MM, positions unchanged")
+def pair_im_mm_incremental():
+    long_state, short_state, marks = _margin_states()
+    evaluator = IncrementalMarginEvaluator()
+    return lambda: evaluator.pair_im_mm(long_state, short_state, next(marks), **_MARGIN_KWARGS)
+
+
+@bench("margin_evaluator.pair_im_mm.scratch", GROUP, "Hedge-aware pair IM/MM from scratch")
+def pair_im_mm_scratch():
+    long_state, short_state, marks = _margin_states()
+    return lambda: IncrementalMarginEvaluator().pair_im_mm(
+        long_state, short_state, next(marks), **_MARGIN_KWARGS
+    )
+
+
+def _tracker_ticks():
+    """Per-tick marks, every 50th also a fill (side, qty, price) at that mark."""
+    ticks = []
+    sides = itertools.cycle(("Buy", "Buy", "Sell"))
+    sizes = itertools.cycle(Decimal(n) * QTY_STEP for n in (10, 25, 40))
+    for i, price in enumerate(price_walk(4096, seed=3)):
+        fill = (next(sides), next(sizes), price) if i % 50 == 0 else None
+        ticks.append((price, fill))
+    return itertools.cycle(ticks)
+
+
+@bench("position_tracker.tick", GROUP, "Unrealized PnL/margin per tick, periodic fills")
+def position_tracker_tick():
+    tracker = BacktestPositionTracker(direction="long", tiers=MM_TIERS_BTCUSDT, symbol=SYMBOL)
+    ticks = _tracker_ticks()
+
+    def run():
+        price, fill = next(ticks)
+        if fill is not None:
+            side, qty, fill_price = fill
+            tracker.process_fill(side=side, qty=qty, price=fill_price)
+        tracker.calculate_unrealized_pnl(price)
+
+    return run
@@ -0,0 +1,38 @@
+"""bybit_adapter hot paths: WebSocket message normalization."""
+
+import itertools
+
+from bybit_adapter import BybitNormalizer
+
+from benchmarks.fixtures import execution_message, order_message, public_trade_message, ticker_messages
+from benchmarks.harness import bench
+
+GROUP = "bybit_adapter"
+
+
+@bench("normalizer.normalize_ticker", GROUP, "One tickers.{symbol} message")
+def normalize_ticker():
+    normalizer = BybitNormalizer()
+    messages = itertools.cycle(ticker_messages(1024))
+    return lambda: normalizer.normalize_ticker(next(messages))
+
+
+@bench("normalizer.normalize_public_trade", GROUP, "One publicTrade message with 50 prints")
+def normalize_public_trade():
+    normalizer = BybitNormalizer()
+    message = public_trade_message(50)
+    return lambda: normalizer.normalize_public_trade(message)
+
+
+@bench("normalizer.normalize_execution", GROUP, "One execution message with 10 fills")
+def normalize_execution():
+    normalizer = BybitNormalizer()
+    message = execution_message(10)
+    return lambda: normalizer.normalize_execution(message)
+
+
+@bench("normalizer.normalize_order", GROUP, "One order message with 10 updates")
+def normalize_order():
+    normalizer = BybitNormalizer()
+    message = order_message(10)
+    return lambda: normalizer.normalize_order(message)
@@ -0,0 +1,78 @@
+"""grid_db hot paths: repository bulk inserts (in-memory SQLite).
+
+Each call inserts a batch of fresh rows (timestamps/ids keep advancing), so
+the measured cost is row building plus the ON CONFLICT DO NOTHING insert and
+flush, as on the importer and event_saver write paths.
+"""
+
+import itertools
+from datetime import timedelta
+from decimal import Decimal
+
+from grid_db import (
+    DatabaseFactory,
+    DatabaseSettings,
+    PublicTrade,
+    PublicTradeRepository,
+    TickerSnapshot,
+    TickerSnapshotRepository,
+)
+
+from benchmarks.fixtures import SYMBOL, T0, TICK, price_walk
+from benchmarks.harness import bench
+
+GROUP = "grid_db"
+BATCH = 500
+
+
+def _session():
+    db = DatabaseFactory(DatabaseSettings(db_type="sqlite", db_name=":memory:", _env_file=None))
+    db.create_tables()
+    return db.session_factory()
+
+
+@bench(f"TickerSnapshotRepository.bulk_insert.{BATCH}", GROUP, "Insert a batch of ticker rows")
+def ticker_bulk_insert():
+    session = _session()
+    repo = TickerSnapshotRepository(session)
+    prices = price_walk(BATCH)
+    batches = itertools.count()
+
+    def run():
+        base = next(batches) * BATCH
+        repo.bulk_insert([
+            TickerSnapshot(
+                symbol=SYMBOL, exchange_ts=T0 + timedelta(seconds=base + i),
+                local_ts=T0 + timedelta(seconds=base + i),
+                last_price=price, mark_price=price,
+                bid1_price=price - TICK, ask1_price=price + TICK,
+                funding_rate=Decimal("0.0001"),
+            )
+            for i, price in enumerate(prices)
+        ])
+        session.commit()
+
+    return run
+
+
+@bench(f"PublicTradeRepository.bulk_insert.{BATCH}", GROUP, "Insert a batch of public trades")
+def trade_bulk_insert():
+    session = _session()
+    repo = PublicTradeRepository(session)
+    prices = price_walk(BATCH)
+    batches = itertools.count()
+
+    def run():
+        base = next(batches) * BATCH
+        repo.bulk_insert([
+            PublicTrade(
+                symbol=SYMBOL, trade_id=f"t{base + i}",
+                exchange_ts=T0 + timedelta(milliseconds=base + i),
+                local_ts=T0 + timedelta(milliseconds=base + i),
+                side="Buy" if i % 2 else "Sell", price=price, size=Decimal("0.010"),
+            )
+            for i, price in enumerate(prices)
+        ])
+        session.commit()
+
+    return run
@@ -0,0 +1,123 @@
+"""gridcore hot paths: grid construction/update, engine ticks, intents, margin math."""
+
+import itertools
+from decimal import Decimal
+
+from gridcore import ClientOrderIdCache, GridConfig, GridEngine, PlaceLimitIntent
+from gridcore.grid import Grid
+from gridcore.pnl import MM_TIERS_BTCUSDT, calc_initial_margin, calc_maintenance_margin
+
+from benchmarks.fixtures import SYMBOL, TICK, price_walk, ticker_events
+from benchmarks.harness import bench
+
+GROUP = "gridcore"
+
+
+@bench("grid.build_grid", GROUP, "Build a 50-level ladder around walking prices")
+def build_grid():
+    grid = Grid(tick_size=TICK, grid_count=50, grid_step=0.2)
+    prices = itertools.cycle([float(p) for p in price_walk(4096)])
+    return lambda: grid.build_grid(next(prices))
+
+
+@bench("grid.update_grid", GROUP, "Re-side and re-center the ladder after a fill")
+def update_grid():
+    grid = Grid(tick_size=TICK, grid_count=50, grid_step=0.2)
+    grid.build_grid(100000.0)
+    # Fills alternate one level either side of a small price oscillation, so
+    # the ladder stays in bounds and every call takes the re-side path.
+    steps = itertools.cycle([(99800.0, 99850.0), (100200.0, 100150.0)])
+
+    def run():
+        fill, close = next(steps)
+        grid.update_grid(fill, close)
+
+    return run
+
+
+def _engine() -> GridEngine:
+    return GridEngine(
+        symbol=SYMBOL, tick_size=TICK,
+        config=GridConfig(grid_count=50, grid_step=0.2), strat_id="bench",
+    )
+
+
+@bench("engine.on_event.cold", GROUP, "Ticker with an empty book: full ladder placement")
+def engine_on_event_cold():
+    engine = _engine()
+    ticks = itertools.cycle(ticker_events(4096))
+    empty = {"long": [], "short": []}
+    return lambda: engine.on_event(next(ticks), empty)
+
+
+@bench("engine.on_event.steady", GROUP, "Ticker with the ladder already resting")
+def engine_on_event_steady():
+    engine = _engine()
+    ticks = ticker_events(4096)
+    intents = engine.on_event(ticks[0], {"long": [], "short": []})
+    limits: dict[str, list[dict]] = {"long": [], "short": []}
+    for i, intent in enumerate(intents):
+        limits[intent.direction].append({
+            "price": str(intent.price), "qty": str(intent.qty), "side": intent.side,
+            "orderId": f"o{i}", "orderLinkId": intent.client_order_id,
+        })
+    # Small oscillation around the build price keeps the ladder valid.
+    stream = itertools.cycle(ticks[:64])
+    return lambda: engine.on_event(next(stream), limits)
+
+
+def _intent_args():
+    prices = [Decimal("100000.0") + Decimal(i) * Decimal("200.0") for i in range(-25, 26)]
+    return itertools.cycle(
+        (price, "Buy" if price < Decimal("100000") else "Sell", level)
+        for level, price in enumerate(prices)
+    )
+
+
+@bench("PlaceLimitIntent.create", GROUP, "Intent with a freshly hashed client_order_id")
+def place_limit_intent_create():
+    args = _intent_args()
+
+    def run():
+        price, side, level = next(args)
+        PlaceLimitIntent.create(
+            symbol=SYMBOL, side=side, price=price, qty=Decimal("0.010"),
+            grid_level=level, direction="long", strat_id="bench",
+        )
+
+    return run
+
+
+@bench("PlaceLimitIntent.create.cached", GROUP, "Intent with a memoized client_order_id")
+def place_limit_intent_create_cached():
+    args = _intent_args()
+    cache = ClientOrderIdCache(maxsize=256)
+
+    def run():
+        price, side, level = next(args)
+        PlaceLimitIntent.create(
+            symbol=SYMBOL, side=side, price=price, qty=Decimal("0.010"),
+            grid_level=level, direction="long", strat_id="bench", id_cache=cache,
+        )
+
+    return run
+
+
+def _position_values():
+    # Spread across the BTCUSDT tier boundaries.
+    return itertools.cycle(
+        Decimal(v) for v in ("850.5", "125000", "1999999.9", "2500000", "7400000.25")
+    )
+
+
+@bench("pnl.calc_initial_margin", GROUP, "Tiered IM for a position value")
+def pnl_calc_initial_margin():
+    values = _position_values()
+    leverage = Decimal("10")
+    return lambda: calc_initial_margin(next(values), leverage, tiers=MM_TIERS_BTCUSDT)
+
+
+@bench("pnl.calc_maintenance_margin", GROUP, "Tiered MM for a position value")
+def pnl_calc_maintenance_margin():
+    values = _position_values()
+    return lambda: calc_maintenance_margin(next(values), tiers=MM_TIERS_BTCUSDT)
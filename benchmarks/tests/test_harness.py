@@ -0,0 +1,137 @@
+"""Tests for the benchmark harness and a smoke run of every registered case."""
+
+import json
+
+import pytest
+
+from benchmarks import harness
+from benchmarks.harness import (
+    BenchResult,
+    Case,
+    compare,
+    format_ns,
+    load_results,
+    measure,
+    select,
+    write_results,
+)
+from benchmarks.runner import main
+from benchmarks.suites import load_all
+
+
+def _result(name: str, best_ns: float) -> BenchResult:
+    return BenchResult(name=name, number=10, repeat=3, best_ns=best_ns, median_ns=best_ns * 1.1)
+
+
+class TestMeasure:
+    def test_autoranges_to_min_time(self):
+        calls = []
+        number, timings = measure(lambda: calls.append(1), repeat=3, min_time=0.01)
+        assert number > 1
+        assert len(timings) == 3
+        assert len(calls) >= 3 * number
+
+    def test_slow_call_runs_once_per_repeat(self):
+        number, timings = measure(lambda: sum(range(200_000)), repeat=2, min_time=1e-6)
+        assert number == 1
+        assert len(timings) == 2
+
+
+class TestCompare:
+    def test_statuses(self):
+        baseline = {
+            "a": _result("a", 100.0),
+            "b": _result("b", 100.0),
+            "c": _result("c", 100.0),
+            "gone": _result("gone", 100.0),
+        }
+        current = [_result("a", 115.0), _result("b", 85.0), _result("c", 105.0), _result("new", 1.0)]
+
+        by_name = {c.name: c for c in compare(current, baseline, threshold=0.10, include_missing=True)}
+
+        assert by_name["a"].status == "regression"
+        assert by_name["a"].ratio == pytest.approx(1.15)
+        assert by_name["b"].status == "improvement"
+        assert by_name["c"].status == "ok"
+        assert by_name["new"].status == "new"
+        assert by_name["gone"].status == "missing"
+
+    def test_threshold_is_configurable(self):
+        baseline = {"a": _result("a", 100.0)}
+        assert compare([_result("a", 115.0)], baseline, threshold=0.20)[0].status == "ok"
+        assert compare([_result("a", 115.0)], baseline, threshold=0.05)[0].status == "regression"
+
+    def test_missing_omitted_by_default(self):
+        assert compare([], {"a": _result("a", 1.0)}) == []
+
+    def test_negative_threshold_rejected(self):
+        with pytest.raises(ValueError):
+            compare([], {}, threshold=-0.1)
+
+
+class TestResultsFile:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "out" / "results.json"
+        results = [_result("g.a", 1234.5), _result("g.b", 10.0)]
+
+        write_results(path, results, env={"python": "3.x"})
+
+        payload = json.loads(path.read_text())
+        assert payload["schema"] == harness.SCHEMA_VERSION
+        assert payload["environment"] == {"python": "3.x"}
+        assert payload["results"][0]["ops_per_s"] == pytest.approx(1e9 / 1234.5)
+        assert load_results(path) == {r.name: r for r in results}
+
+    def test_unknown_schema_rejected(self, tmp_path):
+        path = tmp_path / "old.json"
+        path.write_text(json.dumps({"schema": 999, "results": []}))
+        with pytest.raises(ValueError, match="unsupported benchmark schema"):
+            load_results(path)
+
+
+def test_select_by_substring_and_glob():
+    cases = {
+        "gridcore.grid.build_grid": Case("grid.build_grid", "gridcore", lambda: None),
+        "backtest.order_manager.check_fills": Case("order_manager.check_fills", "backtest", lambda: None),
+    }
+    assert [c.name for c in select(cases, ["build"])] == ["grid.build_grid"]
+    assert [c.name for c in select(cases, ["backtest.*"])] == ["order_manager.check_fills"]
+    assert len(select(cases, None)) == 2
+
+
+def test_format_ns():
+    assert format_ns(None) == "-"
+    assert format_ns(512) == "512 ns"
+    assert format_ns(2500) == "2.50 us"
+    assert format_ns(3.2e6) == "3.20 ms"
+
+
+def test_every_registered_case_runs():
+    """Each case's setup builds and its timed callable executes (suite cannot rot)."""
+    load_all()
+    assert harness.CASES
+    for case in harness.CASES.values():
+        fn = case.setup()
+        fn()
+        fn()
+
+
+class TestRunner:
+    def test_regression_exit_code(self, tmp_path, capsys):
+        baseline = tmp_path / "baseline.json"
+        output = tmp_path / "latest.json"
+        args = ["-k", "pnl.calc_initial_margin", "--repeat", "1", "--min-time", "0.001",
+                "--output", str(output), "--baseline", str(baseline)]
+
+        assert main(args + ["--save-baseline"]) == 0
+        assert load_results(baseline).keys() == {"gridcore.pnl.calc_initial_margin"}
+
+        # Make the stored baseline impossibly fast: the next run must regress.
+        payload = json.loads(baseline.read_text())
+        payload["results"][0]["best_ns"] = 1e-3
+        baseline.write_text(json.dumps(payload))
+        assert main(args) == 1
+        assert "regression" in capsys.readouterr().out
+
+    def test_no_match(self, tmp_path):
+        assert main(["-k", "no-such-case", "--output", str(tmp_path / "x.json")]) == 2
@@ -4,7 +4,8 @@ This package provides:
 - Event normalization from Bybit WebSocket messages to gridcore events
 - WebSocket client management for public and private streams
 - REST API client for gap reconciliation
-- Per-account rate limiting
+- WebSocket order entry, as a lower-latency alternative to REST placement
+- Per-account rate limiting, optionally shared across processes
 """
 
 from bybit_adapter.normalizer import BybitNormalizer
@@ -13,8 +14,10 @@ from bybit_adapter.ws_client import (
     PublicWebSocketClient,
     PrivateWebSocketClient,
 )
+from bybit_adapter.ws_trade_client import TradeSocketUnavailableError, WebSocketTradeClient
 from bybit_adapter.rest_client import BybitRestClient
 from bybit_adapter.rate_limiter import RateLimiter, RateLimitConfig
+from bybit_adapter.shared_rate_limiter import SharedRateLimiter
 from bybit_adapter.error_codes import ORDER_QTY_TRUNCATED_TO_ZERO
 
 __all__ = [
@@ -22,8 +25,11 @@ __all__ = [
     "ConnectionState",
     "PublicWebSocketClient",
     "PrivateWebSocketClient",
+    "WebSocketTradeClient",
+    "TradeSocketUnavailableError",
     "BybitRestClient",
     "RateLimiter",
     "RateLimitConfig",
+    "SharedRateLimiter",
     "ORDER_QTY_TRUNCATED_TO_ZERO",
 ]
@@ -16,15 +16,18 @@ Reference:
 - Risk Limit: https://bybit-exchange.github.io/docs/v5/market/risk-limit
 """
 
+import os
 import re
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 import logging
 
 from pybit.unified_trading import HTTP
 
 from bybit_adapter.rate_limiter import RateLimiter, RateLimitConfig, RequestType
+from bybit_adapter.shared_rate_limiter import SHARED_RATE_LIMIT_DIR_ENV, SharedRateLimiter
 
 
 logger = logging.getLogger(__name__)
@@ -81,9 +84,21 @@ class BybitRestClient:
     natively, so sub-second precision (e.g. 10.5) is preserved end-to-end.
     """
     rate_limit_config: RateLimitConfig = field(default_factory=lambda: RateLimitConfig(query_rate=10))
+    session_factory: Optional[Callable[..., HTTP]] = field(default=None, repr=False)
+    """Replacement for pybit's ``HTTP`` (same constructor kwargs), e.g. the
+    local stand-in exchange (``bybit_adapter.standin``). None = real Bybit."""
+    shared_rate_limiter: Optional[SharedRateLimiter] = field(default=None, repr=False)
+    """Cross-process limiter shared with other processes using this API key.
+
+    None = use one from ``$BYBIT_SHARED_RATE_LIMIT_DIR`` when that is set,
+    else the per-client in-process ``RateLimiter``."""
+    rate_limit_caller: str = "default"
+    """Name this client's waits are reported under in the shared limiter."""
 
     _session: Optional[HTTP] = field(default=None, init=False, repr=False)
     _rate_limiter: RateLimiter = field(default=None, init=False, repr=False)
+    _rate_limit_waits: int = field(default=0, init=False, repr=False)
+    _rate_limit_wait_seconds: float = field(default=0.0, init=False, repr=False)
 
     def __post_init__(self):
         """Initialize HTTP session and rate limiter.
@@ -99,34 +114,82 @@ class BybitRestClient:
                 "A non-positive timeout disables the per-request cap and "
                 "allows a single hung socket to block the main polling loop."
             )
-        self._session = HTTP(
+        self._session = (self.session_factory or HTTP)(
             testnet=self.testnet,
             api_key=self.api_key,
             api_secret=self.api_secret,
             timeout=self.timeout,
         )
         self._rate_limiter = RateLimiter(config=self.rate_limit_config)
+        if self.shared_rate_limiter is None and os.environ.get(SHARED_RATE_LIMIT_DIR_ENV):
+            self.shared_rate_limiter = SharedRateLimiter(
+                api_key=self.api_key,
+                config=self.rate_limit_config,
+                directory=os.environ[SHARED_RATE_LIMIT_DIR_ENV],
+            )
+        self._request_context = threading.local()
+        if self.shared_rate_limiter is not None:
+            # pybit only returns response headers if asked to, which changes
+            # every call's return shape; a requests hook sees them instead.
+            http_session = getattr(self._session, "client", None)
+            hooks = getattr(http_session, "hooks", None)
+            if isinstance(hooks, dict):
+                hooks.setdefault("response", []).append(self._observe_rate_limit_headers)
 
     def get_rate_limit_status(self) -> dict[str, int | float]:
         """Return current rate limit status for debugging/monitoring.
 
         Returns:
-            Dict with available capacity per request type and backoff remaining.
+            Dict with available capacity per request type, backoff remaining,
+            and how often / how long this client has blocked on the limiter.
+            With a shared limiter, capacity and backoff are the shared
+            buckets' and ``callers`` holds per-caller waits in this process.
         """
-        return {
-            "query_available": self._rate_limiter.get_available_capacity("query"),
-            "order_available": self._rate_limiter.get_available_capacity("order"),
-            "backoff_remaining": self._rate_limiter.get_backoff_remaining(),
+        limiter = self.shared_rate_limiter or self._rate_limiter
+        status = {
+            "query_available": limiter.get_available_capacity("query"),
+            "order_available": limiter.get_available_capacity("order"),
+            "backoff_remaining": limiter.get_backoff_remaining(),
+            "waits": self._rate_limit_waits,
+            "wait_seconds": self._rate_limit_wait_seconds,
         }
+        if self.shared_rate_limiter is not None:
+            status["callers"] = self.shared_rate_limiter.wait_stats()
+        return status
+
+    def _observe_rate_limit_headers(self, response, *args, **kwargs):
+        """requests response hook: feed Bybit limit headers to the shared limiter."""
+        request_type = getattr(self._request_context, "request_type", None)
+        if request_type is not None:
+            self.shared_rate_limiter.observe_headers(request_type, response.headers)
+        return response
 
     def _wait_for_rate_limit(self, request_type: RequestType = "query") -> None:
         """Block until a request slot is available, then record the request."""
+        if self.shared_rate_limiter is not None:
+            self._request_context.request_type = request_type
+            wait = self.shared_rate_limiter.acquire(request_type, caller=self.rate_limit_caller)
+            if wait > 0:
+                logger.debug(f"Shared rate limit: waited {wait:.3f}s before {request_type} request")
+                self._rate_limit_waits += 1
+                self._rate_limit_wait_seconds += wait
+            return
         wait = self._rate_limiter.wait_time(request_type)
         if wait > 0:
             logger.debug(f"Rate limit: waiting {wait:.3f}s before {request_type} request")
+            self._rate_limit_waits += 1
+            self._rate_limit_wait_seconds += wait
             time.sleep(wait)
         self._rate_limiter.record_request(request_type)
 
+    def wait_for_order_slot(self) -> None:
+        """Take an order-entry slot from this client's limiter.
+
+        For order entry that bypasses REST (``WebSocketTradeClient``) but
+        shares the account's order rate limit.
+        """
+        self._wait_for_rate_limit("order")
+
     def get_recent_trades(
         self,
         symbol: str,
@@ -596,6 +659,66 @@ class BybitRestClient:
         logger.error(f"Cancel order failed (unexpected): [{ret_code}] {ret_msg}")
         return False
 
+    def amend_order(
+        self,
+        symbol: str,
+        order_id: Optional[str] = None,
+        order_link_id: Optional[str] = None,
+        qty: Optional[str] = None,
+        price: Optional[str] = None,
+    ) -> dict:
+        """Change the price and/or qty of an open order in place.
+
+        Either order_id or order_link_id must be provided. The order keeps its
+        orderId and orderLinkId; side, reduceOnly and timeInForce cannot be
+        amended. Costs one "order" rate slot, versus two for cancel + place.
+
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT")
+            order_id: Exchange order ID
+            order_link_id: Custom order ID (client_order_id)
+            qty: New order quantity as string (None = unchanged)
+            price: New limit price as string (None = unchanged)
+
+        Returns:
+            Order response dict with keys: orderId, orderLinkId
+
+        Raises:
+            Exception: If API call fails (e.g. 110001 order not exists)
+            ValueError: If neither order_id nor order_link_id provided
+
+        Reference:
+            https://bybit-exchange.github.io/docs/v5/order/amend-order
+        """
+        if order_id is None and order_link_id is None:
+            raise ValueError("Either order_id or order_link_id must be provided")
+
+        logger.info(
+            f"Amending order: {symbol} order_id={order_id} "
+            f"order_link_id={order_link_id} qty={qty} price={price}"
+        )
+        self._wait_for_rate_limit("order")
+
+        params = {
+            "category": "linear",
+            "symbol": symbol,
+        }
+        if order_id is not None:
+            params["orderId"] = order_id
+        if order_link_id is not None:
+            params["orderLinkId"] = order_link_id
+        if qty is not None:
+            params["qty"] = qty
+        if price is not None:
+            params["price"] = price
+
+        response = self._session.amend_order(**params)
+        self._check_response(response, "amend_order")
+
+        result = response.get("result", {})
+        logger.info(f"Order amended successfully: {result.get('orderId', '')}")
+        return result
+
     def cancel_all_orders(self, symbol: str) -> int:
         """Cancel all open orders for a symbol.
 
@@ -0,0 +1,233 @@
+"""Cross-process rate limiting for Bybit API keys.
+
+``RateLimiter`` only sees the requests of one client object. The gridbot,
+the recorder's REST snapshots, ``pnl_checker`` and ``live_check`` all use
+the same keys from separate processes, so together they can overrun a limit
+that none of them reaches alone (Bybit ``retCode`` 10006).
+
+``SharedRateLimiter`` keeps one token bucket per (API key, request type) in
+a small file under a shared-memory directory (``/dev/shm`` when present).
+Every process using the same key and directory reads and updates the same
+bucket under ``flock``; threads of one instance share its bucket files, so
+they are serialized by an instance lock first. Bucket times are ``time.monotonic()`` values. That
+clock is system-wide on Linux, so they compare correctly across processes.
+Bybit's ``X-Bapi-Limit-Status`` / ``X-Bapi-Limit-Reset-Timestamp`` response
+headers correct the bucket when other traffic (another host, the web UI)
+has used up capacity we did not see.
+
+Unix only: buckets are locked with ``fcntl.flock``.
+
+Reference: https://bybit-exchange.github.io/docs/v5/rate-limit
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Mapping, Optional
+
+from bybit_adapter.rate_limiter import RateLimitConfig, RequestType
+
+
+SHARED_RATE_LIMIT_DIR_ENV = "BYBIT_SHARED_RATE_LIMIT_DIR"
+"""When set, ``BybitRestClient`` uses a ``SharedRateLimiter`` rooted here."""
+
+# tokens, last refill (monotonic s), blocked until (monotonic s)
+_BUCKET = struct.Struct("<ddd")
+
+
+def default_directory() -> Path:
+    """Bucket directory: tmpfs-backed ``/dev/shm`` when available."""
+    shm = Path("/dev/shm")
+    base = shm if shm.is_dir() else Path(tempfile.gettempdir())
+    return base / "bybit-rate-limit"
+
+
+@contextmanager
+def _locked(fd: int) -> Iterator[None]:
+    import fcntl
+
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@dataclass
+class SharedRateLimiter:
+    """Token buckets shared by every process using the same API key.
+
+    Each request type refills at ``limit / window_seconds`` tokens per
+    second, up to ``limit`` tokens (the ``RateLimitConfig`` rates). A
+    request takes one token. When no token is available, ``acquire`` sleeps
+    outside the lock until one is due. Rate-limit hits and exhausted
+    ``X-Bapi-Limit-Status`` headers block the bucket for every process
+    until the advertised reset.
+
+    Wait time is tracked per caller name (``wait_stats``) so each process
+    can report how much it was held back.
+
+    Example:
+        limiter = SharedRateLimiter(api_key="xxx")
+        limiter.acquire("order", caller="gridbot")
+        # make the request, then:
+        limiter.observe_headers("order", response.headers)
+    """
+
+    api_key: str = field(repr=False)
+    config: RateLimitConfig = field(default_factory=RateLimitConfig)
+    directory: Optional[Path] = None
+    _fds: dict = field(default_factory=dict, init=False, repr=False)
+    # flock locks belong to the open file description, which every thread
+    # of this instance shares: it cannot keep them apart, this lock does.
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _stats: dict = field(default_factory=dict, init=False, repr=False)
+    _stats_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        self.directory = Path(self.directory) if self.directory is not None else default_directory()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Never put the key itself in a file name.
+        self._key_id = hashlib.sha256(self.api_key.encode()).hexdigest()[:16]
+
+    def acquire(self, request_type: RequestType, caller: str = "default") -> float:
+        """Block until a token is available and take it.
+
+        Args:
+            request_type: "order" or "query"
+            caller: Name recorded in ``wait_stats`` (e.g. "gridbot")
+
+        Returns:
+            Seconds spent waiting (0.0 if a token was available)
+        """
+        waited = 0.0
+        while True:
+            with self._bucket(request_type) as fd:
+                tokens, now, blocked_until = self._refill(fd, request_type)
+                if now >= blocked_until and tokens >= 1.0:
+                    self._write(fd, tokens - 1.0, now, blocked_until)
+                    break
+                if now < blocked_until:
+                    wait = blocked_until - now
+                else:
+                    wait = (1.0 - tokens) / self._rate(request_type)
+            time.sleep(wait)
+            waited += wait
+        if waited > 0:
+            with self._stats_lock:
+                count, seconds = self._stats.get(caller, (0, 0.0))
+                self._stats[caller] = (count + 1, seconds + waited)
+        return waited
+
+    def observe_headers(self, request_type: RequestType, headers: Mapping[str, str]) -> None:
+        """Correct the bucket from Bybit's rate limit response headers.
+
+        ``X-Bapi-Limit-Status`` is the remaining quota for the endpoint just
+        called, so the bucket never holds more tokens than that. When it
+        reaches zero, the bucket is blocked until
+        ``X-Bapi-Limit-Reset-Timestamp`` (epoch ms).
+        """
+        try:
+            remaining = int(headers["X-Bapi-Limit-Status"])
+        except (KeyError, TypeError, ValueError):
+            return
+        reset_in: Optional[float] = None
+        try:
+            reset_in = int(headers["X-Bapi-Limit-Reset-Timestamp"]) / 1000 - time.time()
+        except (KeyError, TypeError, ValueError):
+            pass
+        with self._bucket(request_type) as fd:
+            tokens, now, blocked_until = self._refill(fd, request_type)
+            tokens = min(tokens, float(max(remaining, 0)))
+            if remaining <= 0 and reset_in is not None and reset_in > 0:
+                blocked_until = max(blocked_until, now + min(reset_in, self.config.max_backoff))
+            self._write(fd, tokens, now, blocked_until)
+
+    def record_rate_limit_hit(self, request_type: RequestType, retry_after: Optional[float] = None) -> None:
+        """Empty the bucket and block it after a 10006 / HTTP 429.
+
+        Args:
+            request_type: "order" or "query"
+            retry_after: Seconds until the limit resets, if known
+                (default: ``config.backoff_base``)
+        """
+        delay = self.config.backoff_base if retry_after is None else retry_after
+        delay = min(max(delay, 0.0), self.config.max_backoff)
+        with self._bucket(request_type) as fd:
+            _, now, blocked_until = self._refill(fd, request_type)
+            self._write(fd, 0.0, now, max(blocked_until, now + delay))
+
+    def get_available_capacity(self, request_type: RequestType) -> int:
+        """Whole tokens available right now across all processes."""
+        with self._bucket(request_type) as fd:
+            tokens, now, blocked_until = self._refill(fd, request_type)
+            self._write(fd, tokens, now, blocked_until)
+        return 0 if now < blocked_until else int(tokens)
+
+    def get_backoff_remaining(self) -> float:
+        """Seconds until the most-blocked request type is usable again."""
+        remaining = 0.0
+        for request_type in ("order", "query"):
+            with self._bucket(request_type) as fd:
+                _, now, blocked_until = self._refill(fd, request_type)
+            remaining = max(remaining, blocked_until - now)
+        return remaining
+
+    def wait_stats(self) -> dict[str, dict[str, int | float]]:
+        """Per-caller waits in this process: ``{caller: {"waits", "wait_seconds"}}``."""
+        with self._stats_lock:
+            return {
+                caller: {"waits": count, "wait_seconds": seconds}
+                for caller, (count, seconds) in self._stats.items()
+            }
+
+    def close(self) -> None:
+        """Close the bucket files (the shared state stays on disk)."""
+        with self._lock:
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+
+    def _rate(self, request_type: RequestType) -> float:
+        return self._limit(request_type) / self.config.window_seconds
+
+    def _limit(self, request_type: RequestType) -> int:
+        if request_type == "order":
+            return self.config.order_rate
+        return self.config.query_rate
+
+    @contextmanager
+    def _bucket(self, request_type: RequestType) -> Iterator[int]:
+        """The bucket file's fd, locked against other threads and processes."""
+        with self._lock:
+            fd = self._fds.get(request_type)
+            if fd is None:
+                path = self.directory / f"{self._key_id}-{request_type}.bucket"
+                fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+                self._fds[request_type] = fd
+            with _locked(fd):
+                yield fd
+
+    def _refill(self, fd: int, request_type: RequestType) -> tuple[float, float, float]:
+        """Read the bucket (lock held) and add tokens earned since last refill."""
+        now = time.monotonic()
+        raw = os.pread(fd, _BUCKET.size, 0)
+        limit = float(self._limit(request_type))
+        if len(raw) < _BUCKET.size:
+            return limit, now, 0.0
+        tokens, updated, blocked_until = _BUCKET.unpack(raw)
+        if updated > now:
+            # Written before a reboot (monotonic clock restarted): stale.
+            return limit, now, 0.0
+        tokens = min(limit, tokens + (now - updated) * self._rate(request_type))
+        return tokens, now, blocked_until
+
+    @staticmethod
+    def _write(fd: int, tokens: float, now: float, blocked_until: float) -> None:
+        os.pwrite(fd, _BUCKET.pack(tokens, now, blocked_until), 0)
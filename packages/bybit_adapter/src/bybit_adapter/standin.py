@@ -0,0 +1,988 @@
+"""Local stand-in for the Bybit v5 API, for load tests without mainnet.
+
+``StandInExchange`` keeps per-account open orders, hedge-mode positions and a
+USDT wallet in memory. It matches resting limit orders against published
+prices and answers through drop-in replacements for the two pybit classes the
+adapter wraps:
+
+- ``exchange.http`` takes pybit ``HTTP``'s constructor kwargs and returns a
+  session that serves the REST subset ``BybitRestClient`` uses (place, amend,
+  cancel, open orders, order history, executions, positions, wallet, account info,
+  instruments, tickers, risk limit);
+- ``exchange.websocket`` takes pybit ``WebSocket``'s kwargs and returns a
+  stream that serves the ``tickers``/``publicTrade`` and
+  ``execution``/``order``/``position``/``wallet`` topics;
+- ``exchange.trade_websocket`` takes pybit ``WebSocketTrading``'s kwargs and
+  returns a trade socket that answers ``order.create``/``order.amend``/
+  ``order.cancel`` requests.
+
+Pass them as ``session_factory`` / ``ws_factory`` to ``BybitRestClient``, the
+WebSocket clients and ``WebSocketTradeClient``, or to gridbot's
+``Orchestrator``. Responses and messages use
+the Bybit v5 wire shapes, so the normalizer, reconciler and position fetcher
+run unmodified. As with pybit, stream callbacks run on a separate thread: one
+dispatcher thread per exchange, started by ``start()``.
+
+Matching is deliberately simple:
+
+- A resting limit order fills in full at its own price (maker) once a
+  published last price trades through it (buy: last <= price, sell:
+  last >= price).
+- An order that crosses on arrival fills at once at the last price (taker).
+  A ``PostOnly`` order that crosses is cancelled instead.
+- Only hedge mode is supported: ``positionIdx`` 1 is long and 2 is short.
+- Closing orders are truncated to the position size when they fill.
+- There is no funding, liquidation or partial fill.
+
+Example:
+    exchange = StandInExchange()
+    exchange.add_instrument("BTCUSDT", tick_size="0.1", qty_step="0.001")
+    exchange.start()
+    client = BybitRestClient("key", "secret", session_factory=exchange.http)
+    exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+"""
+
+import logging
+import queue
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Optional
+
+from bybit_adapter.error_codes import (
+    INSUFFICIENT_BALANCE,
+    ORDER_LINK_ID_DUPLICATE,
+    ORDER_QTY_TRUNCATED_TO_ZERO,
+)
+
+
+logger = logging.getLogger(__name__)
+
+PARAMS_ERROR = 10001
+ORDER_NOT_EXISTS = 110001
+
+LONG_IDX = 1
+SHORT_IDX = 2
+
+DEFAULT_MAINTENANCE_MARGIN_RATE = Decimal("0.005")
+DEFAULT_RISK_LIMIT_VALUE = Decimal("2000000")
+
+_ZERO = Decimal("0")
+_STOP = object()
+
+Callback = Callable[[dict], None]
+
+
+def _s(value: Decimal) -> str:
+    """Bybit-style decimal string (plain notation, no exponent)."""
+    return format(value, "f")
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+@dataclass(frozen=True)
+class StandInInstrument:
+    """Trading parameters of one linear perpetual."""
+
+    symbol: str
+    tick_size: Decimal
+    qty_step: Decimal
+    min_qty: Decimal
+    max_qty: Decimal
+
+    def as_bybit(self) -> dict:
+        """Row of ``/v5/market/instruments-info``."""
+        return {
+            "symbol": self.symbol,
+            "contractType": "LinearPerpetual",
+            "status": "Trading",
+            "quoteCoin": "USDT",
+            "settleCoin": "USDT",
+            "priceFilter": {
+                "tickSize": _s(self.tick_size),
+                "minPrice": _s(self.tick_size),
+                "maxPrice": "9999999",
+            },
+            "lotSizeFilter": {
+                "qtyStep": _s(self.qty_step),
+                "minOrderQty": _s(self.min_qty),
+                "maxOrderQty": _s(self.max_qty),
+            },
+        }
+
+
+@dataclass
+class _Order:
+    order_id: str
+    order_link_id: str
+    symbol: str
+    side: str
+    order_type: str
+    price: Decimal
+    qty: Decimal
+    position_idx: int
+    reduce_only: bool
+    time_in_force: str
+    created_ms: int
+    updated_ms: int
+    status: str = "New"
+    cum_exec_qty: Decimal = _ZERO
+    avg_price: Decimal = _ZERO
+
+    @property
+    def closing(self) -> bool:
+        """Hedge mode: sell on the long side or buy on the short side."""
+        return self.reduce_only or (self.side == "Sell") == (self.position_idx == LONG_IDX)
+
+    def as_bybit(self) -> dict:
+        return {
+            "category": "linear",
+            "symbol": self.symbol,
+            "orderId": self.order_id,
+            "orderLinkId": self.order_link_id,
+            "side": self.side,
+            "orderType": self.order_type,
+            "price": _s(self.price),
+            "qty": _s(self.qty),
+            "leavesQty": _s(self.qty - self.cum_exec_qty) if self.status == "New" else "0",
+            "cumExecQty": _s(self.cum_exec_qty),
+            "cumExecValue": _s(self.cum_exec_qty * self.avg_price),
+            "avgPrice": _s(self.avg_price),
+            "orderStatus": self.status,
+            "timeInForce": self.time_in_force,
+            "reduceOnly": self.reduce_only,
+            "positionIdx": self.position_idx,
+            "createdTime": str(self.created_ms),
+            "updatedTime": str(self.updated_ms),
+        }
+
+
+@dataclass
+class _Position:
+    size: Decimal = _ZERO
+    avg_price: Decimal = _ZERO
+    cum_realised: Decimal = _ZERO
+    cur_realised: Decimal = _ZERO
+    updated_ms: int = 0
+
+
+@dataclass
+class _Account:
+    api_key: str
+    balance: Decimal
+    orders: dict[str, _Order] = field(default_factory=dict)
+    history: deque = field(default_factory=deque)
+    executions: deque = field(default_factory=deque)
+    positions: dict[tuple[str, int], _Position] = field(default_factory=dict)
+
+    def position(self, symbol: str, idx: int) -> _Position:
+        pos = self.positions.get((symbol, idx))
+        if pos is None:
+            pos = self.positions[(symbol, idx)] = _Position()
+        return pos
+
+
+class StandInError(Exception):
+    """A request the stand-in answers with a non-zero Bybit ``retCode``."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"[{code}] {message}")
+        self.code = code
+        self.message = message
+
+
+@dataclass
+class StandInStats:
+    """Counters for load-test reports."""
+
+    rest_calls: Counter = field(default_factory=Counter)
+    ws_trade_calls: Counter = field(default_factory=Counter)
+    rejects: Counter = field(default_factory=Counter)  # retCode -> count
+    orders_placed: int = 0
+    orders_amended: int = 0
+    orders_cancelled: int = 0
+    orders_filled: int = 0
+    tickers_published: int = 0
+    ws_messages: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "rest_calls": dict(self.rest_calls),
+            "ws_trade_calls": dict(self.ws_trade_calls),
+            "rejects": {str(code): n for code, n in self.rejects.items()},
+            "orders_placed": self.orders_placed,
+            "orders_amended": self.orders_amended,
+            "orders_cancelled": self.orders_cancelled,
+            "orders_filled": self.orders_filled,
+            "tickers_published": self.tickers_published,
+            "ws_messages": self.ws_messages,
+        }
+
+
+class StandInExchange:
+    """In-memory Bybit stand-in: matching engine, REST sessions, WS streams.
+
+    Args:
+        initial_balance: USDT wallet balance of every new account. Accounts
+            are created on first use of an API key.
+        maker_fee: Fee rate charged on resting fills.
+        taker_fee: Fee rate charged on fills on arrival.
+        leverage: Leverage used for initial margin and the balance check.
+        rest_latency: Seconds every REST call sleeps before it is served, to
+            stand in for the network round trip.
+        ws_trade_latency: The same for trade socket requests.
+        history_limit: Closed orders and executions kept per account for
+            ``get_order_history`` / ``get_executions``.
+    """
+
+    def __init__(
+        self,
+        initial_balance: Decimal = Decimal("10000"),
+        maker_fee: Decimal = Decimal("0.0002"),
+        taker_fee: Decimal = Decimal("0.00055"),
+        leverage: Decimal = Decimal("10"),
+        rest_latency: float = 0.0,
+        history_limit: int = 10_000,
+        ws_trade_latency: float = 0.0,
+    ):
+        if rest_latency < 0:
+            raise ValueError(f"rest_latency must be >= 0, got {rest_latency}")
+        if ws_trade_latency < 0:
+            raise ValueError(f"ws_trade_latency must be >= 0, got {ws_trade_latency}")
+        self.initial_balance = Decimal(initial_balance)
+        self.maker_fee = Decimal(maker_fee)
+        self.taker_fee = Decimal(taker_fee)
+        self.leverage = Decimal(leverage)
+        self.rest_latency = rest_latency
+        self.ws_trade_latency = ws_trade_latency
+        self.history_limit = history_limit
+        self.stats = StandInStats()
+
+        self._lock = threading.RLock()
+        self._instruments: dict[str, StandInInstrument] = {}
+        self._accounts: dict[str, _Account] = {}
+        self._last_price: dict[str, Decimal] = {}
+        self._tickers: dict[str, dict] = {}
+        # (api_key or "" for public, topic) -> subscribed (stream, callback)
+        self._subscriptions: dict[tuple[str, str], list[tuple["StandInWebSocket", Callback]]] = {}
+        self._outbox: queue.SimpleQueue = queue.SimpleQueue()
+        self._dispatcher: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Setup and lifecycle
+    # ------------------------------------------------------------------
+
+    def add_instrument(
+        self,
+        symbol: str,
+        tick_size: Decimal | str,
+        qty_step: Decimal | str,
+        min_qty: Decimal | str | None = None,
+        max_qty: Decimal | str = "1000000",
+    ) -> StandInInstrument:
+        """List a linear perpetual (``min_qty`` defaults to ``qty_step``)."""
+        instrument = StandInInstrument(
+            symbol=symbol,
+            tick_size=Decimal(tick_size),
+            qty_step=Decimal(qty_step),
+            min_qty=Decimal(min_qty if min_qty is not None else qty_step),
+            max_qty=Decimal(max_qty),
+        )
+        with self._lock:
+            self._instruments[symbol] = instrument
+        return instrument
+
+    def add_account(self, api_key: str, balance: Optional[Decimal] = None) -> None:
+        """Create (or reset) the account behind ``api_key``."""
+        with self._lock:
+            self._accounts[api_key] = _Account(
+                api_key=api_key,
+                balance=Decimal(balance) if balance is not None else self.initial_balance,
+            )
+
+    def start(self) -> None:
+        """Start the stream dispatcher thread."""
+        if self._dispatcher is not None:
+            return
+        self._dispatcher = threading.Thread(
+            target=self._dispatch_loop, name="standin-dispatcher", daemon=True
+        )
+        self._dispatcher.start()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Deliver queued stream messages, then stop the dispatcher."""
+        if self._dispatcher is None:
+            return
+        self._outbox.put(_STOP)
+        self._dispatcher.join(timeout)
+        self._dispatcher = None
+
+    def __enter__(self) -> "StandInExchange":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def http(self, api_key: Optional[str] = None, **_kwargs: Any) -> "StandInHTTP":
+        """pybit ``HTTP`` replacement (``BybitRestClient.session_factory``)."""
+        return StandInHTTP(self, api_key or "")
+
+    def websocket(
+        self, channel_type: str = "linear", api_key: Optional[str] = None, **_kwargs: Any
+    ) -> "StandInWebSocket":
+        """pybit ``WebSocket`` replacement (WS clients' ``ws_factory``)."""
+        return StandInWebSocket(self, channel_type, api_key or "")
+
+    def trade_websocket(
+        self, api_key: Optional[str] = None, **_kwargs: Any
+    ) -> "StandInTradeWebSocket":
+        """pybit ``WebSocketTrading`` replacement (``WebSocketTradeClient.ws_factory``)."""
+        return StandInTradeWebSocket(self, api_key or "")
+
+    # ------------------------------------------------------------------
+    # Market data and matching
+    # ------------------------------------------------------------------
+
+    def publish_ticker(
+        self,
+        symbol: str,
+        last_price: Decimal,
+        mark_price: Optional[Decimal] = None,
+        funding_rate: Decimal = Decimal("0.0001"),
+    ) -> None:
+        """Set the last price, match resting orders and publish the ticker.
+
+        The ticker is stamped with the current wall clock, so the bot's
+        exchange-to-receive latency measures the stand-in's delivery delay.
+        """
+        last_price = Decimal(last_price)
+        with self._lock:
+            instrument = self._instruments.get(symbol)
+            if instrument is None:
+                raise KeyError(f"Unknown instrument {symbol}; call add_instrument() first")
+            ts = _now_ms()
+            self._last_price[symbol] = last_price
+            data = {
+                "symbol": symbol,
+                "lastPrice": _s(last_price),
+                "markPrice": _s(mark_price if mark_price is not None else last_price),
+                "bid1Price": _s(last_price - instrument.tick_size),
+                "ask1Price": _s(last_price + instrument.tick_size),
+                "fundingRate": _s(funding_rate),
+            }
+            self._tickers[symbol] = data
+            self.stats.tickers_published += 1
+            self._publish("", f"tickers.{symbol}", {
+                "topic": f"tickers.{symbol}", "type": "snapshot", "ts": ts, "data": data,
+            })
+            self._publish("", f"publicTrade.{symbol}", {
+                "topic": f"publicTrade.{symbol}", "type": "snapshot", "ts": ts,
+                "data": [{
+                    "T": ts, "s": symbol, "S": "Buy", "v": _s(instrument.min_qty),
+                    "p": _s(last_price), "i": str(uuid.uuid4()), "BT": False,
+                }],
+            })
+            for account in self._accounts.values():
+                self._match_resting(account, symbol, last_price)
+
+    def _match_resting(self, account: _Account, symbol: str, last_price: Decimal) -> None:
+        crossed = [
+            order for order in account.orders.values()
+            if order.symbol == symbol and self._crosses(order, last_price)
+        ]
+        for order in crossed:
+            self._fill(account, order, order.price, maker=True)
+
+    @staticmethod
+    def _crosses(order: _Order, last_price: Decimal) -> bool:
+        if order.side == "Buy":
+            return last_price <= order.price
+        return last_price >= order.price
+
+    def _fill(self, account: _Account, order: _Order, price: Decimal, maker: bool) -> None:
+        pos = account.position(order.symbol, order.position_idx)
+        qty = min(order.qty, pos.size) if order.closing else order.qty
+        if qty <= 0:
+            # Closing order outlived its position: Bybit cancels it.
+            self._close_order(account, order, "Cancelled")
+            return
+
+        ts = _now_ms()
+        fee_rate = self.maker_fee if maker else self.taker_fee
+        value = price * qty
+        fee = value * fee_rate
+        closed_pnl = _ZERO
+        if order.closing:
+            sign = 1 if order.position_idx == LONG_IDX else -1
+            closed_pnl = (price - pos.avg_price) * qty * sign
+            pos.size -= qty
+            if pos.size == 0:
+                pos.avg_price = _ZERO
+        else:
+            pos.avg_price = (pos.avg_price * pos.size + value) / (pos.size + qty)
+            pos.size += qty
+        pos.cum_realised += closed_pnl - fee
+        pos.cur_realised += closed_pnl - fee
+        pos.updated_ms = ts
+        account.balance += closed_pnl - fee
+
+        order.cum_exec_qty = qty
+        order.avg_price = price
+        execution = {
+            "category": "linear",
+            "symbol": order.symbol,
+            "execId": str(uuid.uuid4()),
+            "orderId": order.order_id,
+            "orderLinkId": order.order_link_id,
+            "side": order.side,
+            "orderType": order.order_type,
+            "orderPrice": _s(order.price),
+            "orderQty": _s(order.qty),
+            "execPrice": _s(price),
+            "execQty": _s(qty),
+            "execValue": _s(value),
+            "execFee": _s(fee),
+            "feeRate": _s(fee_rate),
+            "execType": "Trade",
+            "isMaker": maker,
+            "closedSize": _s(qty if order.closing else _ZERO),
+            "closedPnl": _s(closed_pnl),
+            "leavesQty": "0",
+            "execTime": str(ts),
+        }
+        self._remember(account.executions, execution)
+        self.stats.orders_filled += 1
+        self._publish(account.api_key, "execution", {
+            "topic": "execution", "creationTime": ts, "data": [execution],
+        })
+        self._close_order(account, order, "Filled")
+        self._publish(account.api_key, "position", {
+            "topic": "position", "creationTime": ts,
+            "data": [self._position_row(account, order.symbol, order.position_idx)],
+        })
+        self._publish(account.api_key, "wallet", {
+            "topic": "wallet", "creationTime": ts, "data": [self._wallet_row(account)],
+        })
+
+    def _close_order(self, account: _Account, order: _Order, status: str) -> None:
+        order.status = status
+        order.updated_ms = _now_ms()
+        account.orders.pop(order.order_id, None)
+        self._remember(account.history, order)
+        if status == "Cancelled":
+            self.stats.orders_cancelled += 1
+        self._publish_order(account, order)
+
+    def _publish_order(self, account: _Account, order: _Order) -> None:
+        self._publish(account.api_key, "order", {
+            "topic": "order", "creationTime": order.updated_ms, "data": [order.as_bybit()],
+        })
+
+    def _remember(self, log: deque, item: Any) -> None:
+        log.append(item)
+        if len(log) > self.history_limit:
+            log.popleft()
+
+    # ------------------------------------------------------------------
+    # Account views (Bybit v5 rows)
+    # ------------------------------------------------------------------
+
+    def _account(self, api_key: str) -> _Account:
+        account = self._accounts.get(api_key)
+        if account is None:
+            account = self._accounts[api_key] = _Account(
+                api_key=api_key, balance=self.initial_balance
+            )
+        return account
+
+    def _margins(self, account: _Account) -> tuple[Decimal, Decimal, Decimal]:
+        """(unrealised PnL, initial margin, maintenance margin) of ``account``."""
+        unrealised = initial = maintenance = _ZERO
+        for (symbol, idx), pos in account.positions.items():
+            if pos.size == 0:
+                continue
+            mark = self._last_price.get(symbol, pos.avg_price)
+            sign = 1 if idx == LONG_IDX else -1
+            unrealised += (mark - pos.avg_price) * pos.size * sign
+            value = mark * pos.size
+            initial += value / self.leverage
+            maintenance += value * DEFAULT_MAINTENANCE_MARGIN_RATE
+        for order in account.orders.values():
+            if not order.closing:
+                initial += order.price * order.qty / self.leverage
+        return unrealised, initial, maintenance
+
+    def _available(self, account: _Account) -> Decimal:
+        unrealised, initial, _ = self._margins(account)
+        return account.balance + min(unrealised, _ZERO) - initial
+
+    def _position_row(self, account: _Account, symbol: str, idx: int) -> dict:
+        pos = account.position(symbol, idx)
+        mark = self._last_price.get(symbol, pos.avg_price)
+        sign = 1 if idx == LONG_IDX else -1
+        value = mark * pos.size
+        return {
+            "category": "linear",
+            "symbol": symbol,
+            "side": "Buy" if idx == LONG_IDX else "Sell",
+            "positionIdx": idx,
+            "size": _s(pos.size),
+            "avgPrice": _s(pos.avg_price),
+            "markPrice": _s(mark),
+            "positionValue": _s(value),
+            "leverage": _s(self.leverage),
+            "liqPrice": "",
+            "unrealisedPnl": _s((mark - pos.avg_price) * pos.size * sign),
+            "cumRealisedPnl": _s(pos.cum_realised),
+            "curRealisedPnl": _s(pos.cur_realised),
+            "positionIM": _s(value / self.leverage),
+            "positionMM": _s(value * DEFAULT_MAINTENANCE_MARGIN_RATE),
+            "positionStatus": "Normal",
+            "updatedTime": str(pos.updated_ms),
+        }
+
+    def _wallet_row(self, account: _Account) -> dict:
+        unrealised, initial, maintenance = self._margins(account)
+        equity = account.balance + unrealised
+        available = account.balance + min(unrealised, _ZERO) - initial
+        return {
+            "accountType": "UNIFIED",
+            "totalEquity": _s(equity),
+            "totalWalletBalance": _s(account.balance),
+            "totalMarginBalance": _s(equity),
+            "totalAvailableBalance": _s(available),
+            "totalInitialMargin": _s(initial),
+            "totalMaintenanceMargin": _s(maintenance),
+            "coin": [{
+                "coin": "USDT",
+                "equity": _s(equity),
+                "walletBalance": _s(account.balance),
+                "availableToWithdraw": _s(max(available, _ZERO)),
+                "unrealisedPnl": _s(unrealised),
+                "totalPositionIM": _s(initial),
+                "totalPositionMM": _s(maintenance),
+            }],
+        }
+
+    # ------------------------------------------------------------------
+    # REST handlers (called by StandInHTTP under the lock)
+    # ------------------------------------------------------------------
+
+    def _place_order(self, api_key: str, params: dict) -> dict:
+        symbol = params.get("symbol", "")
+        instrument = self._instruments.get(symbol)
+        if instrument is None:
+            raise StandInError(PARAMS_ERROR, f"params error: symbol invalid {symbol!r}")
+        position_idx = int(params.get("positionIdx", 0))
+        if position_idx not in (LONG_IDX, SHORT_IDX):
+            raise StandInError(PARAMS_ERROR, "position idx not match position mode")
+        side = params.get("side")
+        if side not in ("Buy", "Sell"):
+            raise StandInError(PARAMS_ERROR, f"params error: side invalid {side!r}")
+        order_type = params.get("orderType", "Limit")
+        qty = Decimal(str(params.get("qty", "0")))
+        if qty < instrument.min_qty or qty > instrument.max_qty or qty % instrument.qty_step:
+            raise StandInError(PARAMS_ERROR, f"params error: qty invalid {qty}")
+
+        last_price = self._last_price.get(symbol)
+        if order_type == "Market":
+            if last_price is None:
+                raise StandInError(PARAMS_ERROR, "params error: no market price")
+            price = last_price
+        else:
+            price = Decimal(str(params.get("price", "0")))
+            if price <= 0 or price % instrument.tick_size:
+                raise StandInError(PARAMS_ERROR, f"params error: price invalid {price}")
+
+        account = self._account(api_key)
+        link_id = params.get("orderLinkId") or str(uuid.uuid4())
+        recent = (o.order_link_id for o in account.history)
+        if any(o.order_link_id == link_id for o in account.orders.values()) or link_id in recent:
+            raise StandInError(ORDER_LINK_ID_DUPLICATE, "OrderLinkedID is duplicate")
+
+        ts = _now_ms()
+        order = _Order(
+            order_id=str(uuid.uuid4()),
+            order_link_id=link_id,
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            price=price,
+            qty=qty,
+            position_idx=position_idx,
+            reduce_only=bool(params.get("reduceOnly", False)),
+            time_in_force=params.get("timeInForce", "GTC"),
+            created_ms=ts,
+            updated_ms=ts,
+        )
+        if order.closing:
+            if account.position(symbol, position_idx).size == 0:
+                raise StandInError(
+                    ORDER_QTY_TRUNCATED_TO_ZERO, "orderQty will be truncated to zero"
+                )
+        elif price * qty / self.leverage > self._available(account):
+            raise StandInError(INSUFFICIENT_BALANCE, "ab not enough for new order")
+
+        account.orders[order.order_id] = order
+        self.stats.orders_placed += 1
+        self._publish_order(account, order)
+        if order_type == "Market":
+            self._fill(account, order, price, maker=False)
+        elif last_price is not None and self._crosses(order, last_price):
+            if order.time_in_force == "PostOnly":
+                self._close_order(account, order, "Cancelled")
+            else:
+                self._fill(account, order, last_price, maker=False)
+        return {"orderId": order.order_id, "orderLinkId": order.order_link_id}
+
+    def _find_open(self, account: _Account, params: dict) -> Optional[_Order]:
+        order_id = params.get("orderId")
+        if order_id is not None:
+            return account.orders.get(order_id)
+        link_id = params.get("orderLinkId")
+        return next(
+            (o for o in account.orders.values() if o.order_link_id == link_id), None
+        )
+
+    def _amend_order(self, api_key: str, params: dict) -> dict:
+        account = self._account(api_key)
+        order = self._find_open(account, params)
+        if order is None or order.symbol != params.get("symbol"):
+            raise StandInError(ORDER_NOT_EXISTS, "order not exists or too late to amend")
+        instrument = self._instruments[order.symbol]
+        qty = Decimal(str(params.get("qty", order.qty)))
+        if qty < instrument.min_qty or qty > instrument.max_qty or qty % instrument.qty_step:
+            raise StandInError(PARAMS_ERROR, f"params error: qty invalid {qty}")
+        price = Decimal(str(params.get("price", order.price)))
+        if price <= 0 or price % instrument.tick_size:
+            raise StandInError(PARAMS_ERROR, f"params error: price invalid {price}")
+
+        order.qty = qty
+        order.price = price
+        order.updated_ms = _now_ms()
+        self.stats.orders_amended += 1
+        self._publish_order(account, order)
+        last_price = self._last_price.get(order.symbol)
+        if last_price is not None and self._crosses(order, last_price):
+            if order.time_in_force == "PostOnly":
+                self._close_order(account, order, "Cancelled")
+            else:
+                self._fill(account, order, last_price, maker=False)
+        return {"orderId": order.order_id, "orderLinkId": order.order_link_id}
+
+    def _cancel_order(self, api_key: str, params: dict) -> dict:
+        account = self._account(api_key)
+        order = self._find_open(account, params)
+        if order is None or order.symbol != params.get("symbol"):
+            raise StandInError(ORDER_NOT_EXISTS, "order not exists or too late to cancel")
+        self._close_order(account, order, "Cancelled")
+        return {"orderId": order.order_id, "orderLinkId": order.order_link_id}
+
+    def _cancel_all_orders(self, api_key: str, params: dict) -> dict:
+        account = self._account(api_key)
+        symbol = params.get("symbol")
+        cancelled = []
+        for order in list(account.orders.values()):
+            if symbol is None or order.symbol == symbol:
+                self._close_order(account, order, "Cancelled")
+                cancelled.append({"orderId": order.order_id, "orderLinkId": order.order_link_id})
+        return {"list": cancelled, "success": "1"}
+
+    @staticmethod
+    def _page(rows: list, params: dict, default_limit: int) -> dict:
+        """Offset pagination; the cursor is the next offset as a string."""
+        offset = int(params.get("cursor") or 0)
+        limit = int(params.get("limit") or default_limit)
+        page = rows[offset:offset + limit]
+        next_offset = offset + len(page)
+        return {
+            "category": "linear",
+            "list": page,
+            "nextPageCursor": str(next_offset) if next_offset < len(rows) else "",
+        }
+
+    @staticmethod
+    def _in_window(ts_ms: int, params: dict) -> bool:
+        start, end = params.get("startTime"), params.get("endTime")
+        return (start is None or ts_ms >= int(start)) and (end is None or ts_ms <= int(end))
+
+    def _get_open_orders(self, api_key: str, params: dict) -> dict:
+        symbol = params.get("symbol")
+        rows = [
+            o.as_bybit() for o in self._account(api_key).orders.values()
+            if symbol is None or o.symbol == symbol
+        ]
+        return self._page(rows, params, default_limit=20)
+
+    def _get_order_history(self, api_key: str, params: dict) -> dict:
+        symbol = params.get("symbol")
+        rows = [
+            o.as_bybit() for o in reversed(self._account(api_key).history)
+            if (symbol is None or o.symbol == symbol) and self._in_window(o.updated_ms, params)
+        ]
+        return self._page(rows, params, default_limit=20)
+
+    def _get_executions(self, api_key: str, params: dict) -> dict:
+        symbol = params.get("symbol")
+        rows = [
+            e for e in reversed(self._account(api_key).executions)
+            if (symbol is None or e["symbol"] == symbol)
+            and self._in_window(int(e["execTime"]), params)
+        ]
+        return self._page(rows, params, default_limit=50)
+
+    def _get_positions(self, api_key: str, params: dict) -> dict:
+        account = self._account(api_key)
+        symbols = [params["symbol"]] if params.get("symbol") else list(self._instruments)
+        rows = [
+            self._position_row(account, symbol, idx)
+            for symbol in symbols
+            for idx in (LONG_IDX, SHORT_IDX)
+        ]
+        return {"category": "linear", "list": rows, "nextPageCursor": ""}
+
+    def _get_wallet_balance(self, api_key: str, params: dict) -> dict:
+        return {"list": [self._wallet_row(self._account(api_key))]}
+
+    def _get_account_info(self, api_key: str, params: dict) -> dict:
+        return {"marginMode": "REGULAR_MARGIN", "unifiedMarginStatus": 4}
+
+    def _get_instruments_info(self, api_key: str, params: dict) -> dict:
+        instrument = self._instruments.get(params.get("symbol", ""))
+        return {
+            "category": "linear",
+            "list": [instrument.as_bybit()] if instrument is not None else [],
+            "nextPageCursor": "",
+        }
+
+    def _get_tickers(self, api_key: str, params: dict) -> dict:
+        ticker = self._tickers.get(params.get("symbol", ""))
+        return {"category": "linear", "list": [dict(ticker)] if ticker else []}
+
+    def _get_risk_limit(self, api_key: str, params: dict) -> dict:
+        symbol = params.get("symbol", "")
+        if symbol not in self._instruments:
+            return {"category": "linear", "list": []}
+        tier = {
+            "id": 1,
+            "symbol": symbol,
+            "riskLimitValue": _s(DEFAULT_RISK_LIMIT_VALUE),
+            "maintenanceMargin": _s(DEFAULT_MAINTENANCE_MARGIN_RATE),
+            "mmDeduction": "0",
+            "initialMargin": _s(1 / self.leverage),
+            "isLowestRisk": 1,
+            "maxLeverage": _s(self.leverage),
+        }
+        return {"category": "linear", "list": [{"symbol": symbol, "list": [tier]}]}
+
+    def _empty_list(self, api_key: str, params: dict) -> dict:
+        return {"category": "linear", "list": [], "nextPageCursor": ""}
+
+    # ------------------------------------------------------------------
+    # Streams
+    # ------------------------------------------------------------------
+
+    def _subscribe(self, key: tuple[str, str], stream: "StandInWebSocket", callback: Callback) -> None:
+        with self._lock:
+            self._subscriptions.setdefault(key, []).append((stream, callback))
+
+    def _unsubscribe(self, stream: "StandInWebSocket") -> None:
+        with self._lock:
+            for key, subs in self._subscriptions.items():
+                self._subscriptions[key] = [s for s in subs if s[0] is not stream]
+
+    def _publish(self, api_key: str, topic: str, message: dict) -> None:
+        """Queue ``message`` for every subscriber (call with the lock held)."""
+        for stream, callback in self._subscriptions.get((api_key, topic), ()):
+            self._outbox.put((stream, callback, message))
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            item = self._outbox.get()
+            if item is _STOP:
+                return
+            stream, callback, message = item
+            if not stream.connected:
+                continue
+            self.stats.ws_messages += 1
+            try:
+                callback(message)
+            except Exception:
+                logger.exception(
+                    "Stand-in stream callback failed (%s)",
+                    message.get("topic") or message.get("op"),
+                )
+
+
+class StandInHTTP:
+    """pybit ``HTTP`` look-alike bound to one account (API key)."""
+
+    def __init__(self, exchange: StandInExchange, api_key: str):
+        self._exchange = exchange
+        self._api_key = api_key
+
+    def _call(self, method: str, handler: Callable[[str, dict], dict], params: dict) -> dict:
+        exchange = self._exchange
+        if exchange.rest_latency:
+            time.sleep(exchange.rest_latency)
+        with exchange._lock:
+            exchange.stats.rest_calls[method] += 1
+            try:
+                result = handler(self._api_key, params)
+            except StandInError as e:
+                exchange.stats.rejects[e.code] += 1
+                return {"retCode": e.code, "retMsg": e.message, "result": {}, "time": _now_ms()}
+        return {"retCode": 0, "retMsg": "OK", "result": result, "retExtInfo": {}, "time": _now_ms()}
+
+    def place_order(self, **params: Any) -> dict:
+        return self._call("place_order", self._exchange._place_order, params)
+
+    def amend_order(self, **params: Any) -> dict:
+        return self._call("amend_order", self._exchange._amend_order, params)
+
+    def cancel_order(self, **params: Any) -> dict:
+        return self._call("cancel_order", self._exchange._cancel_order, params)
+
+    def cancel_all_orders(self, **params: Any) -> dict:
+        return self._call("cancel_all_orders", self._exchange._cancel_all_orders, params)
+
+    def get_open_orders(self, **params: Any) -> dict:
+        return self._call("get_open_orders", self._exchange._get_open_orders, params)
+
+    def get_order_history(self, **params: Any) -> dict:
+        return self._call("get_order_history", self._exchange._get_order_history, params)
+
+    def get_executions(self, **params: Any) -> dict:
+        return self._call("get_executions", self._exchange._get_executions, params)
+
+    def get_positions(self, **params: Any) -> dict:
+        return self._call("get_positions", self._exchange._get_positions, params)
+
+    def get_wallet_balance(self, **params: Any) -> dict:
+        return self._call("get_wallet_balance", self._exchange._get_wallet_balance, params)
+
+    def get_account_info(self, **params: Any) -> dict:
+        return self._call("get_account_info", self._exchange._get_account_info, params)
+
+    def get_instruments_info(self, **params: Any) -> dict:
+        return self._call("get_instruments_info", self._exchange._get_instruments_info, params)
+
+    def get_tickers(self, **params: Any) -> dict:
+        return self._call("get_tickers", self._exchange._get_tickers, params)
+
+    def get_risk_limit(self, **params: Any) -> dict:
+        return self._call("get_risk_limit", self._exchange._get_risk_limit, params)
+
+    def get_transaction_log(self, **params: Any) -> dict:
+        return self._call("get_transaction_log", self._exchange._empty_list, params)
+
+    def get_public_trade_history(self, **params: Any) -> dict:
+        return self._call("get_public_trade_history", self._exchange._empty_list, params)
+
+
+class StandInWebSocket:
+    """pybit ``WebSocket`` look-alike: public (linear) or private channel."""
+
+    def __init__(self, exchange: StandInExchange, channel_type: str, api_key: str):
+        if channel_type == "private" and not api_key:
+            raise PermissionError("Private stand-in stream requires an api_key")
+        self._exchange = exchange
+        self.channel_type = channel_type
+        self._api_key = api_key if channel_type == "private" else ""
+        self.connected = True
+
+    def _subscribe(self, topic: str, callback: Callback) -> None:
+        self._exchange._subscribe((self._api_key, topic), self, callback)
+
+    def _subscribe_symbols(self, prefix: str, symbol: str | Iterable[str], callback: Callback) -> None:
+        for s in [symbol] if isinstance(symbol, str) else symbol:
+            self._subscribe(f"{prefix}.{s}", callback)
+
+    def ticker_stream(self, symbol: str | Iterable[str], callback: Callback) -> None:
+        self._subscribe_symbols("tickers", symbol, callback)
+
+    def trade_stream(self, symbol: str | Iterable[str], callback: Callback) -> None:
+        self._subscribe_symbols("publicTrade", symbol, callback)
+
+    def execution_stream(self, callback: Callback) -> None:
+        self._subscribe("execution", callback)
+
+    def order_stream(self, callback: Callback) -> None:
+        self._subscribe("order", callback)
+
+    def position_stream(self, callback: Callback) -> None:
+        self._subscribe("position", callback)
+
+    def wallet_stream(self, callback: Callback) -> None:
+        self._subscribe("wallet", callback)
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def exit(self) -> None:
+        self.connected = False
+        self._exchange._unsubscribe(self)
+
+
+class StandInTradeWebSocket:
+    """pybit ``WebSocketTrading`` look-alike bound to one account.
+
+    Requests are served at once; the response is delivered to the request's
+    callback (``error_callback`` for a non-zero ``retCode``) on the dispatcher
+    thread, as pybit's read thread would.
+    """
+
+    def __init__(self, exchange: StandInExchange, api_key: str):
+        if not api_key:
+            raise PermissionError("Stand-in trade socket requires an api_key")
+        self._exchange = exchange
+        self._api_key = api_key
+        self.connected = True
+
+    def _request(
+        self,
+        op: str,
+        handler: Callable[[str, dict], dict],
+        callback: Callback,
+        error_callback: Optional[Callback],
+        params: dict,
+    ) -> None:
+        exchange = self._exchange
+        if not self.connected:
+            raise ConnectionError("Stand-in trade socket is closed")
+        if exchange.ws_trade_latency:
+            time.sleep(exchange.ws_trade_latency)
+        message = {"reqId": str(uuid.uuid4()), "op": op, "retExtInfo": {}, "header": {}}
+        with exchange._lock:
+            exchange.stats.ws_trade_calls[op] += 1
+            try:
+                data = handler(self._api_key, params)
+            except StandInError as e:
+                exchange.stats.rejects[e.code] += 1
+                message.update(retCode=e.code, retMsg=e.message, data={})
+                if error_callback is not None:
+                    exchange._outbox.put((self, error_callback, message))
+                return
+            message.update(retCode=0, retMsg="OK", data=data)
+            exchange._outbox.put((self, callback, message))
+
+    def place_order(self, callback: Callback, error_callback: Optional[Callback] = None, **params: Any) -> None:
+        self._request("order.create", self._exchange._place_order, callback, error_callback, params)
+
+    def amend_order(self, callback: Callback, error_callback: Optional[Callback] = None, **params: Any) -> None:
+        self._request("order.amend", self._exchange._amend_order, callback, error_callback, params)
+
+    def cancel_order(self, callback: Callback, error_callback: Optional[Callback] = None, **params: Any) -> None:
+        self._request("order.cancel", self._exchange._cancel_order, callback, error_callback, params)
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def exit(self) -> None:
+        self.connected = False
@@ -90,6 +90,9 @@ class PublicWebSocketClient:
     on_reconnect: Optional[Callable[[datetime, datetime], None]] = None
     heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL
     disconnect_threshold: float = DEFAULT_DISCONNECT_THRESHOLD
+    # Replacement for pybit's ``WebSocket`` (same constructor kwargs), e.g. the
+    # local stand-in exchange (``bybit_adapter.standin``). None = real Bybit.
+    ws_factory: Optional[Callable[..., WebSocket]] = field(default=None, repr=False)
 
     _ws: Optional[WebSocket] = field(default=None, init=False, repr=False)
     _state: ConnectionState = field(default_factory=ConnectionState, init=False)
@@ -109,7 +112,7 @@ class PublicWebSocketClient:
 
             logger.info(f"Connecting public WebSocket (testnet={self.testnet}) for symbols: {self.symbols}")
 
-            self._ws = WebSocket(
+            self._ws = (self.ws_factory or WebSocket)(
                 testnet=self.testnet,
                 channel_type=CHANNEL_TYPE_LINEAR,
                 retries=0,
@@ -388,6 +391,7 @@ class PrivateWebSocketClient:
     heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL
     disconnect_threshold: float = DEFAULT_DISCONNECT_THRESHOLD
     message_gap_watchdog_enabled: bool = True
+    ws_factory: Optional[Callable[..., WebSocket]] = field(default=None, repr=False)
 
     _ws: Optional[WebSocket] = field(default=None, init=False, repr=False)
     _state: ConnectionState = field(default_factory=ConnectionState, init=False)
@@ -408,7 +412,7 @@ class PrivateWebSocketClient:
 
             logger.info(f"Connecting private WebSocket (testnet={self.testnet})")
 
-            self._ws = WebSocket(
+            self._ws = (self.ws_factory or WebSocket)(
                 testnet=self.testnet,
                 channel_type=CHANNEL_TYPE_PRIVATE,
                 api_key=self.api_key,
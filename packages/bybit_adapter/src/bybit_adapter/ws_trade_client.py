@@ -0,0 +1,297 @@
+"""Order entry over Bybit's WebSocket trade API.
+
+``WebSocketTradeClient`` keeps one persistent, authenticated trade socket per
+account and exposes ``place_order`` / ``amend_order`` / ``cancel_order`` with the
+same signatures and return shapes as ``BybitRestClient``, so a caller can route
+either way. Each call blocks until its response arrives or ``request_timeout``
+expires.
+
+pybit's ``WebSocketTrading`` stamps every request with a ``reqId`` and routes the
+matching response to that request's callbacks; this client hands it a one-shot
+callback per call, so concurrent callers each get their own response.
+
+A socket that is down, or that has timed out ``max_consecutive_timeouts``
+requests in a row, is unhealthy: calls raise ``TradeSocketUnavailableError``
+before anything is sent, which is the caller's cue to use REST instead. A
+timeout on a request that WAS sent raises ``TimeoutError`` instead, because the
+order may have reached the exchange.
+
+Reference:
+- WebSocket Trade: https://bybit-exchange.github.io/docs/v5/websocket/trade/guideline
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+import logging
+import threading
+
+from pybit.unified_trading import WebSocketTrading
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUEST_TIMEOUT = 5.0
+DEFAULT_MAX_CONSECUTIVE_TIMEOUTS = 3
+
+# Same "already terminal / not found" codes BybitRestClient.cancel_order expects.
+_EXPECTED_CANCEL_CODES = {110001, 110003, 170213}
+
+
+class TradeSocketUnavailableError(ConnectionError):
+    """The trade socket is down or unhealthy; the request was NOT sent."""
+
+
+@dataclass
+class WebSocketTradeClient:
+    """Persistent authenticated WS order-entry session for one account.
+
+    Example:
+        client = WebSocketTradeClient(api_key="xxx", api_secret="yyy", testnet=True)
+        client.connect()
+        result = client.place_order(
+            symbol="BTCUSDT", side="Buy", order_type="Limit",
+            qty="0.001", price="60000", position_idx=1,
+        )
+        client.disconnect()
+    """
+
+    api_key: str
+    api_secret: str
+    testnet: bool = True
+    request_timeout: float = DEFAULT_REQUEST_TIMEOUT
+    max_consecutive_timeouts: int = DEFAULT_MAX_CONSECUTIVE_TIMEOUTS
+    ws_factory: Optional[Callable[..., WebSocketTrading]] = field(default=None, repr=False)
+    """Replacement for pybit's ``WebSocketTrading`` (same constructor kwargs),
+    e.g. ``StandInExchange.trade_websocket``. None = real Bybit."""
+    acquire_order_slot: Optional[Callable[[], None]] = field(default=None, repr=False)
+    """Called (and may block) before each request. Bybit counts WS and REST
+    order entry against one per-UID budget, so pass the REST client's
+    ``wait_for_order_slot``."""
+
+    _ws: Optional[WebSocketTrading] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _consecutive_timeouts: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.request_timeout <= 0:
+            raise ValueError(
+                f"WebSocketTradeClient request_timeout must be > 0, got {self.request_timeout!r}"
+            )
+
+    def connect(self) -> None:
+        """Open and authenticate the trade socket (replacing any open one)."""
+        with self._lock:
+            self._disconnect_internal()
+            logger.info(f"Connecting trade WebSocket (testnet={self.testnet})")
+            self._ws = (self.ws_factory or WebSocketTrading)(
+                testnet=self.testnet,
+                api_key=self.api_key,
+                api_secret=self.api_secret,
+                trace_logging=False,
+                retries=0,
+            )
+            self._consecutive_timeouts = 0
+            logger.info("Trade WebSocket connected")
+
+    def disconnect(self) -> None:
+        """Close the trade socket."""
+        with self._lock:
+            self._disconnect_internal()
+
+    def _disconnect_internal(self) -> None:
+        """Internal disconnect without lock (must be called with lock held)."""
+        if self._ws is not None:
+            try:
+                self._ws.exit()
+            except Exception as e:
+                logger.warning(f"Error during trade WebSocket disconnect: {e}")
+            self._ws = None
+            logger.info("Trade WebSocket disconnected")
+
+    def reset(self) -> None:
+        """Reconnect: a fresh socket starts healthy."""
+        logger.info("Trade WebSocket reset (reconnect attempt)")
+        self.connect()
+
+    def is_socket_alive(self) -> bool:
+        """Check the underlying TCP socket (pybit's ``is_connected()``)."""
+        with self._lock:
+            return self._socket_alive()
+
+    def _socket_alive(self) -> bool:
+        if self._ws is None:
+            return False
+        try:
+            return bool(self._ws.is_connected())
+        except Exception as e:
+            logger.warning(f"Trade socket is_connected check raised: {e}")
+            return False
+
+    def is_healthy(self) -> bool:
+        """Socket alive and not timing out: requests should go over WS."""
+        with self._lock:
+            return (
+                self._socket_alive()
+                and self._consecutive_timeouts < self.max_consecutive_timeouts
+            )
+
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: str,
+        price: Optional[str] = None,
+        reduce_only: bool = False,
+        position_idx: int = 0,
+        order_link_id: Optional[str] = None,
+        time_in_force: str = "GTC",
+    ) -> dict:
+        """Place a new order (``order.create``); see ``BybitRestClient.place_order``.
+
+        Returns:
+            Response data with keys: orderId, orderLinkId
+
+        Raises:
+            TradeSocketUnavailableError: Socket unhealthy, nothing sent
+            TimeoutError: No response within ``request_timeout``
+            Exception: If Bybit rejects the order
+        """
+        params = {
+            "category": "linear",
+            "symbol": symbol,
+            "side": side,
+            "orderType": order_type,
+            "qty": qty,
+            "reduceOnly": reduce_only,
+            "positionIdx": position_idx,
+            "timeInForce": time_in_force,
+        }
+        if price is not None:
+            params["price"] = price
+        if order_link_id is not None:
+            params["orderLinkId"] = order_link_id
+        response = self._request("place_order", params)
+        self._check_response(response, "place_order")
+        return response.get("data") or {}
+
+    def amend_order(
+        self,
+        symbol: str,
+        order_id: Optional[str] = None,
+        order_link_id: Optional[str] = None,
+        qty: Optional[str] = None,
+        price: Optional[str] = None,
+    ) -> dict:
+        """Amend a resting order (``order.amend``); see ``BybitRestClient.amend_order``.
+
+        Raises:
+            ValueError: If neither order_id nor order_link_id provided
+            TradeSocketUnavailableError: Socket unhealthy, nothing sent
+            TimeoutError: No response within ``request_timeout``
+            Exception: If Bybit rejects the amend
+        """
+        if order_id is None and order_link_id is None:
+            raise ValueError("Either order_id or order_link_id must be provided")
+        params = {"category": "linear", "symbol": symbol}
+        if order_id is not None:
+            params["orderId"] = order_id
+        if order_link_id is not None:
+            params["orderLinkId"] = order_link_id
+        if qty is not None:
+            params["qty"] = qty
+        if price is not None:
+            params["price"] = price
+        response = self._request("amend_order", params)
+        self._check_response(response, "amend_order")
+        return response.get("data") or {}
+
+    def cancel_order(
+        self,
+        symbol: str,
+        order_id: Optional[str] = None,
+        order_link_id: Optional[str] = None,
+    ) -> bool:
+        """Cancel an order (``order.cancel``); see ``BybitRestClient.cancel_order``.
+
+        Like the REST method, a rejected or timed-out cancel returns False.
+
+        Raises:
+            ValueError: If neither order_id nor order_link_id provided
+            TradeSocketUnavailableError: Socket unhealthy, nothing sent
+        """
+        if order_id is None and order_link_id is None:
+            raise ValueError("Either order_id or order_link_id must be provided")
+        params = {"category": "linear", "symbol": symbol}
+        if order_id is not None:
+            params["orderId"] = order_id
+        if order_link_id is not None:
+            params["orderLinkId"] = order_link_id
+        try:
+            response = self._request("cancel_order", params)
+        except TimeoutError as e:
+            logger.error(f"Cancel order request failed: {e}")
+            return False
+
+        ret_code = response.get("retCode", -1)
+        ret_msg = response.get("retMsg", "Unknown error")
+        if ret_code == 0:
+            return True
+        if ret_code in _EXPECTED_CANCEL_CODES:
+            logger.warning(f"Cancel order failed (expected): [{ret_code}] {ret_msg}")
+        else:
+            logger.error(f"Cancel order failed (unexpected): [{ret_code}] {ret_msg}")
+        return False
+
+    def _request(self, method: str, params: dict) -> dict:
+        """Send one request and wait for its response message."""
+        with self._lock:
+            ws = self._ws
+            if not self._socket_alive():
+                raise TradeSocketUnavailableError(f"Trade socket down, {method} not sent")
+            if self._consecutive_timeouts >= self.max_consecutive_timeouts:
+                raise TradeSocketUnavailableError(
+                    f"Trade socket unhealthy ({self._consecutive_timeouts} consecutive "
+                    f"timeouts), {method} not sent"
+                )
+        if self.acquire_order_slot is not None:
+            self.acquire_order_slot()
+
+        done = threading.Event()
+        responses: list[dict[str, Any]] = []
+
+        def on_response(message: dict) -> None:
+            responses.append(message)
+            done.set()
+
+        try:
+            getattr(ws, method)(callback=on_response, error_callback=on_response, **params)
+        except Exception as e:
+            # websocket-client raises before writing to a closed socket.
+            raise TradeSocketUnavailableError(f"Trade socket send failed for {method}: {e}") from e
+
+        if not done.wait(self.request_timeout):
+            with self._lock:
+                self._consecutive_timeouts += 1
+                count = self._consecutive_timeouts
+            logger.warning(f"Trade WS {method} timed out ({count} in a row)")
+            # "timeout" in the text: gridbot's is_network_error keys off it.
+            raise TimeoutError(
+                f"Trade WS {method} timeout: no response within {self.request_timeout}s"
+            )
+        with self._lock:
+            self._consecutive_timeouts = 0
+        return responses[0]
+
+    @staticmethod
+    def _check_response(response: dict, method: str) -> None:
+        """Raise on a non-zero retCode, in ``BybitRestClient``'s error format."""
+        ret_code = response.get("retCode", -1)
+        if ret_code != 0:
+            ret_msg = response.get("retMsg", "Unknown error")
+            error_msg = (
+                f"Bybit WS API error in {method} (reqId={response.get('reqId')}): "
+                f"[{ret_code}] {ret_msg}"
+            )
+            logger.error(error_msg)
+            raise Exception(error_msg)
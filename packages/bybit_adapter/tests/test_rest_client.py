@@ -473,6 +473,53 @@ class TestCancelOrder:
         assert result is False
 
 
+# ---------------------------------------------------------------------------
+# amend_order
+# ---------------------------------------------------------------------------
+
+
+class TestAmendOrder:
+    def test_amends_price_and_qty(self, client, mock_session):
+        mock_session.amend_order.return_value = _ok_response(
+            {"orderId": "o1", "orderLinkId": "link1"}
+        )
+
+        result = client.amend_order(symbol="BTCUSDT", order_id="o1", qty="0.002", price="99000")
+
+        assert result == {"orderId": "o1", "orderLinkId": "link1"}
+        mock_session.amend_order.assert_called_once_with(
+            category="linear", symbol="BTCUSDT", orderId="o1", qty="0.002", price="99000"
+        )
+
+    def test_omits_unchanged_fields(self, client, mock_session):
+        mock_session.amend_order.return_value = _ok_response({"orderId": "o1"})
+
+        client.amend_order(symbol="BTCUSDT", order_link_id="link1", price="99000")
+
+        call_kwargs = mock_session.amend_order.call_args[1]
+        assert call_kwargs["orderLinkId"] == "link1"
+        assert "orderId" not in call_kwargs
+        assert "qty" not in call_kwargs
+
+    def test_uses_order_rate_bucket(self, client, mock_session):
+        mock_session.amend_order.return_value = _ok_response({"orderId": "o1"})
+        before = client.get_rate_limit_status()["order_available"]
+
+        client.amend_order(symbol="BTCUSDT", order_id="o1", price="99000")
+
+        assert client.get_rate_limit_status()["order_available"] == before - 1
+
+    def test_requires_at_least_one_id(self, client, mock_session):
+        with pytest.raises(ValueError, match="Either order_id or order_link_id"):
+            client.amend_order(symbol="BTCUSDT", price="99000")
+
+    def test_api_error_raises(self, client, mock_session):
+        mock_session.amend_order.return_value = _error_response(110001, "order not exists")
+
+        with pytest.raises(Exception, match="order not exists"):
+            client.amend_order(symbol="BTCUSDT", order_id="o1", price="99000")
+
+
 # ---------------------------------------------------------------------------
 # cancel_all_orders
 # ---------------------------------------------------------------------------
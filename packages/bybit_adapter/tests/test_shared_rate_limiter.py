@@ -0,0 +1,180 @@
+"""Tests for the cross-process SharedRateLimiter."""
+
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from bybit_adapter.rate_limiter import RateLimitConfig
+from bybit_adapter.rest_client import BybitRestClient
+from bybit_adapter.shared_rate_limiter import SHARED_RATE_LIMIT_DIR_ENV, SharedRateLimiter
+
+
+# 5 queries per 0.5 s: one token every 0.1 s.
+_CONFIG = RateLimitConfig(order_rate=2, query_rate=5, window_seconds=0.5)
+
+
+@pytest.fixture
+def make_limiter(tmp_path):
+    limiters = []
+
+    def _make(api_key="key-a"):
+        limiter = SharedRateLimiter(api_key=api_key, config=_CONFIG, directory=tmp_path)
+        limiters.append(limiter)
+        return limiter
+
+    yield _make
+    for limiter in limiters:
+        limiter.close()
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self, make_limiter):
+        limiter = make_limiter()
+        assert [limiter.acquire("query") for _ in range(5)] == [0.0] * 5
+        assert limiter.acquire("query") == pytest.approx(0.1, abs=0.03)
+
+    def test_request_types_have_separate_buckets(self, make_limiter):
+        limiter = make_limiter()
+        for _ in range(5):
+            limiter.acquire("query")
+        assert limiter.get_available_capacity("query") == 0
+        assert limiter.get_available_capacity("order") == 2
+
+    def test_instances_with_same_key_share_a_bucket(self, make_limiter):
+        first, second, other_key = make_limiter(), make_limiter(), make_limiter("key-b")
+        for _ in range(5):
+            first.acquire("query")
+        assert second.get_available_capacity("query") == 0
+        assert other_key.get_available_capacity("query") == 5
+
+    def test_key_is_not_written_to_disk_names(self, make_limiter, tmp_path):
+        make_limiter("super-secret").acquire("order")
+        assert all("super-secret" not in p.name for p in tmp_path.iterdir())
+
+    def test_threads_sharing_an_instance_never_double_spend(self, tmp_path):
+        # Threads share the instance's bucket fd, and flock does not exclude
+        # them from each other: every token taken must still be counted.
+        limiter = SharedRateLimiter(
+            api_key="key-a",
+            config=RateLimitConfig(query_rate=1000, window_seconds=36000),
+            directory=tmp_path,
+        )
+        barrier = threading.Barrier(16)
+
+        def take():
+            barrier.wait()
+            for _ in range(60):
+                limiter.acquire("query")
+
+        threads = [threading.Thread(target=take) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert limiter.get_available_capacity("query") == 1000 - 16 * 60
+        limiter.close()
+
+    def test_shared_across_processes(self, tmp_path):
+        script = textwrap.dedent(
+            f"""
+            from bybit_adapter.rate_limiter import RateLimitConfig
+            from bybit_adapter.shared_rate_limiter import SharedRateLimiter
+            limiter = SharedRateLimiter(
+                api_key="key-a",
+                config=RateLimitConfig(query_rate=5, window_seconds=60),
+                directory={str(tmp_path)!r},
+            )
+            for _ in range(5):
+                limiter.acquire("query")
+            """
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        subprocess.run([sys.executable, "-c", script], check=True, timeout=60, env=env)
+        limiter = SharedRateLimiter(
+            api_key="key-a",
+            config=RateLimitConfig(query_rate=5, window_seconds=60),
+            directory=tmp_path,
+        )
+        assert limiter.get_available_capacity("query") == 0
+        limiter.close()
+
+
+class TestCorrections:
+    def test_exhausted_limit_status_blocks_until_reset(self, make_limiter):
+        limiter = make_limiter()
+        reset_ms = int((time.time() + 0.2) * 1000)
+        limiter.observe_headers(
+            "order",
+            {"X-Bapi-Limit-Status": "0", "X-Bapi-Limit-Reset-Timestamp": str(reset_ms)},
+        )
+        assert limiter.get_backoff_remaining() == pytest.approx(0.2, abs=0.05)
+        assert limiter.acquire("order") == pytest.approx(0.2, abs=0.05)
+
+    def test_limit_status_caps_tokens(self, make_limiter):
+        limiter = make_limiter()
+        limiter.observe_headers("query", {"X-Bapi-Limit-Status": "1"})
+        assert limiter.get_available_capacity("query") == 1
+
+    def test_missing_or_bad_headers_are_ignored(self, make_limiter):
+        limiter = make_limiter()
+        limiter.observe_headers("query", {})
+        limiter.observe_headers("query", {"X-Bapi-Limit-Status": "n/a"})
+        assert limiter.get_available_capacity("query") == 5
+
+    def test_rate_limit_hit_blocks_bucket(self, make_limiter):
+        limiter = make_limiter()
+        limiter.record_rate_limit_hit("query", retry_after=0.15)
+        assert limiter.get_available_capacity("query") == 0
+        assert limiter.acquire("query", caller="recorder") == pytest.approx(0.15, abs=0.05)
+
+    def test_wait_stats_per_caller(self, make_limiter):
+        limiter = make_limiter()
+        for _ in range(3):
+            limiter.acquire("order", caller="gridbot")
+        limiter.acquire("query", caller="pnl_checker")
+        stats = limiter.wait_stats()
+        assert set(stats) == {"gridbot"}
+        assert stats["gridbot"]["waits"] == 1
+        assert stats["gridbot"]["wait_seconds"] > 0
+
+
+class TestRestClientIntegration:
+    def test_env_var_enables_shared_limiter_and_header_hook(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(SHARED_RATE_LIMIT_DIR_ENV, str(tmp_path))
+        session = MagicMock()
+        session.client = requests.Session()
+        session.get_tickers.return_value = {"retCode": 0, "retMsg": "OK", "result": {"list": [{}]}}
+        with patch("bybit_adapter.rest_client.HTTP", return_value=session):
+            client = BybitRestClient(
+                api_key="k", api_secret="s", rate_limit_caller="recorder"
+            )
+        assert client.shared_rate_limiter is not None
+        assert client.shared_rate_limiter.directory == tmp_path
+
+        client.get_tickers("BTCUSDT")
+        response = requests.Response()
+        response.headers["X-Bapi-Limit-Status"] = "0"
+        response.headers["X-Bapi-Limit-Reset-Timestamp"] = str(int((time.time() + 5) * 1000))
+        for hook in session.client.hooks["response"]:
+            hook(response)
+
+        status = client.get_rate_limit_status()
+        assert status["query_available"] == 0
+        assert status["backoff_remaining"] > 4
+        assert status["callers"] == {}
+        client.shared_rate_limiter.close()
+
+    def test_in_process_limiter_without_env(self, monkeypatch):
+        monkeypatch.delenv(SHARED_RATE_LIMIT_DIR_ENV, raising=False)
+        with patch("bybit_adapter.rest_client.HTTP", return_value=MagicMock()):
+            client = BybitRestClient(api_key="k", api_secret="s")
+        assert client.shared_rate_limiter is None
+        assert "callers" not in client.get_rate_limit_status()
@@ -0,0 +1,224 @@
+"""Tests for the local stand-in exchange, driven through the real adapter clients."""
+
+import threading
+from decimal import Decimal
+
+import pytest
+
+from gridcore import InstrumentInfo
+
+from bybit_adapter.normalizer import BybitNormalizer
+from bybit_adapter.rate_limiter import RateLimitConfig
+from bybit_adapter.rest_client import BybitRestClient
+from bybit_adapter.standin import StandInExchange
+from bybit_adapter.ws_client import PrivateWebSocketClient, PublicWebSocketClient
+
+
+class _Inbox:
+    """Collects stream messages delivered on the dispatcher thread."""
+
+    def __init__(self):
+        self.messages: list[dict] = []
+        self._cond = threading.Condition()
+
+    def __call__(self, message: dict) -> None:
+        with self._cond:
+            self.messages.append(message)
+            self._cond.notify_all()
+
+    def wait_for(self, n: int, timeout: float = 2.0) -> list[dict]:
+        with self._cond:
+            assert self._cond.wait_for(lambda: len(self.messages) >= n, timeout), self.messages
+            return list(self.messages)
+
+
+@pytest.fixture
+def exchange():
+    ex = StandInExchange(initial_balance=Decimal("10000"))
+    ex.add_instrument("BTCUSDT", tick_size="0.1", qty_step="0.001")
+    ex.start()
+    yield ex
+    ex.close()
+
+
+@pytest.fixture
+def client(exchange):
+    return BybitRestClient(api_key="k1", api_secret="s1", session_factory=exchange.http)
+
+
+def _place(client, side="Buy", price="99000.0", qty="0.010", idx=1, **kwargs):
+    return client.place_order(
+        symbol="BTCUSDT", side=side, order_type="Limit", qty=qty, price=price,
+        position_idx=idx, **kwargs,
+    )
+
+
+class TestRest:
+    def test_instrument_and_risk_limit_parse(self, client):
+        info = InstrumentInfo.from_bybit_response("BTCUSDT", client.get_instruments_info("BTCUSDT"))
+        assert info.tick_size == Decimal("0.1")
+        assert info.qty_step == Decimal("0.001")
+        tiers = client.get_risk_limit("BTCUSDT")
+        assert tiers[0]["maintenanceMargin"] == "0.005"
+
+    def test_place_cancel_and_open_orders(self, exchange, client):
+        exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+        placed = _place(client, order_link_id="link-1")
+        assert placed["orderLinkId"] == "link-1"
+
+        open_orders = client.get_open_orders(symbol="BTCUSDT")
+        assert [o["orderId"] for o in open_orders] == [placed["orderId"]]
+        assert open_orders[0]["orderStatus"] == "New"
+
+        assert client.cancel_order("BTCUSDT", order_id=placed["orderId"]) is True
+        assert client.get_open_orders(symbol="BTCUSDT") == []
+        # Already gone: the expected-failure path of cancel_order.
+        assert client.cancel_order("BTCUSDT", order_id=placed["orderId"]) is False
+
+    def test_amend_keeps_order_ids(self, exchange, client):
+        exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+        placed = _place(client, order_link_id="link-1")
+
+        amended = client.amend_order("BTCUSDT", order_id=placed["orderId"], qty="0.020", price="98000.0")
+
+        assert amended == placed
+        [order] = client.get_open_orders(symbol="BTCUSDT")
+        assert (order["price"], order["qty"], order["orderLinkId"]) == ("98000.0", "0.020", "link-1")
+        assert exchange.stats.orders_amended == 1
+        with pytest.raises(Exception, match=r"\[10001\]"):
+            client.amend_order("BTCUSDT", order_id=placed["orderId"], price="98000.05")
+        client.cancel_order("BTCUSDT", order_id=placed["orderId"])
+        with pytest.raises(Exception, match=r"\[110001\]"):
+            client.amend_order("BTCUSDT", order_id=placed["orderId"], price="97000.0")
+
+    def test_open_orders_paginate(self, exchange, client):
+        exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+        for i in range(7):
+            _place(client, price=f"{99000 - i}.0", qty="0.001")
+        assert len(client.get_open_orders(symbol="BTCUSDT", limit=3)) == 7
+
+    @pytest.mark.parametrize("kwargs, code", [
+        ({"side": "Sell", "idx": 1}, "110017"),  # close long with no position
+        ({"qty": "1000"}, "110007"),              # margin above balance
+        ({"price": "99000.05"}, "10001"),         # off the tick grid
+        ({"idx": 0}, "10001"),                    # one-way mode unsupported
+    ])
+    def test_rejects(self, exchange, client, kwargs, code):
+        exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+        with pytest.raises(Exception, match=rf"\[{code}\]"):
+            _place(client, **kwargs)
+        assert exchange.stats.rejects[int(code)] == 1
+
+    def test_duplicate_order_link_id(self, exchange, client):
+        exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+        _place(client, order_link_id="dup")
+        with pytest.raises(Exception, match=r"\[110072\]"):
+            _place(client, order_link_id="dup")
+
+    def test_rest_latency_and_call_counts(self, exchange, client):
+        exchange.rest_latency = 0.01
+        client.get_wallet_balance()
+        client.get_positions()
+        assert exchange.stats.rest_calls == {"get_wallet_balance": 1, "get_positions": 1}
+
+    def test_rate_limiter_waits_are_counted(self, exchange):
+        client = BybitRestClient(
+            api_key="k1", api_secret="s1", session_factory=exchange.http,
+            rate_limit_config=RateLimitConfig(query_rate=2, window_seconds=0.05),
+        )
+        for _ in range(3):
+            client.get_positions()
+        status = client.get_rate_limit_status()
+        assert status["waits"] == 1
+        assert 0 < status["wait_seconds"] <= 0.05
+
+
+class TestMatching:
+    def test_trade_through_fills_and_updates_position_and_wallet(self, exchange, client):
+        exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+        placed = _place(client, price="99000.0", qty="0.010")
+
+        exchange.publish_ticker("BTCUSDT", Decimal("99500"))
+        assert client.get_open_orders(symbol="BTCUSDT")  # not crossed yet
+        exchange.publish_ticker("BTCUSDT", Decimal("98900"))
+        assert client.get_open_orders(symbol="BTCUSDT") == []
+
+        long_row = next(p for p in client.get_positions() if p["positionIdx"] == 1)
+        assert Decimal(long_row["size"]) == Decimal("0.010")
+        assert Decimal(long_row["avgPrice"]) == Decimal("99000.0")
+
+        executions, _ = client.get_executions(symbol="BTCUSDT")
+        assert executions[0]["orderId"] == placed["orderId"]
+        assert executions[0]["isMaker"] is True
+
+        # Close at a profit: realized PnL minus maker fees lands in the wallet.
+        _place(client, side="Sell", price="100000.0", qty="0.010", idx=1)
+        exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+        coin = client.get_wallet_balance()["list"][0]["coin"][0]
+        fees = (Decimal("99000") + Decimal("100000")) * Decimal("0.010") * Decimal("0.0002")
+        assert Decimal(coin["walletBalance"]) == Decimal("10000") + Decimal("10") - fees
+
+    def test_crossing_order_fills_as_taker_post_only_is_cancelled(self, exchange, client):
+        exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+        _place(client, price="101000.0", time_in_force="PostOnly")
+        assert exchange.stats.orders_cancelled == 1
+
+        _place(client, price="101000.0")
+        executions, _ = client.get_executions(symbol="BTCUSDT")
+        assert executions[0]["isMaker"] is False
+        assert executions[0]["execPrice"] == "100000"
+
+
+class TestStreams:
+    def test_public_ticker_reaches_ws_client_and_normalizes(self, exchange):
+        inbox = _Inbox()
+        ws = PublicWebSocketClient(
+            symbols=["BTCUSDT"], on_ticker=inbox, ws_factory=exchange.websocket,
+        )
+        ws.connect()
+        try:
+            exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+            event = BybitNormalizer().normalize_ticker(inbox.wait_for(1)[0])
+        finally:
+            ws.disconnect()
+        assert event.last_price == Decimal("100000")
+        assert event.bid1_price == Decimal("99999.9")
+
+    def test_private_streams_are_per_account(self, exchange, client):
+        mine, other = _Inbox(), _Inbox()
+        streams = [
+            PrivateWebSocketClient(
+                api_key=key, api_secret="s", on_order=inbox, on_execution=inbox,
+                on_position=inbox, on_wallet=inbox, ws_factory=exchange.websocket,
+                message_gap_watchdog_enabled=False,
+            )
+            for key, inbox in (("k1", mine), ("k2", other))
+        ]
+        for ws in streams:
+            ws.connect()
+        try:
+            exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+            _place(client, price="99000.0", qty="0.010")
+            exchange.publish_ticker("BTCUSDT", Decimal("98000"))
+            # order New, execution, order Filled, position, wallet
+            topics = [m["topic"] for m in mine.wait_for(5)]
+        finally:
+            for ws in streams:
+                ws.disconnect()
+
+        assert topics == ["order", "execution", "order", "position", "wallet"]
+        assert other.messages == []
+        normalizer = BybitNormalizer()
+        execution = normalizer.normalize_execution(mine.messages[1])[0]
+        assert execution.qty == Decimal("0.010")
+        assert normalizer.normalize_order(mine.messages[2])[0].status == "Filled"
+
+    def test_exit_stops_delivery(self, exchange):
+        inbox = _Inbox()
+        stream = exchange.websocket(channel_type="linear")
+        stream.ticker_stream(symbol="BTCUSDT", callback=inbox)
+        stream.exit()
+        exchange.publish_ticker("BTCUSDT", Decimal("100000"))
+        exchange.close()
+        assert inbox.messages == []
+        assert stream.is_connected() is False
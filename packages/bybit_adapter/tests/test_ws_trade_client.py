@@ -0,0 +1,120 @@
+"""Tests for WebSocket order entry, against the stand-in trade socket."""
+
+from decimal import Decimal
+
+import pytest
+
+from bybit_adapter.standin import StandInExchange
+from bybit_adapter.ws_trade_client import TradeSocketUnavailableError, WebSocketTradeClient
+
+
+class _SilentTradeSocket:
+    """Trade socket that accepts requests and never answers."""
+
+    def __init__(self, **_kwargs):
+        self.sent: list[dict] = []
+        self.connected = True
+
+    def place_order(self, callback, error_callback=None, **params):
+        self.sent.append(params)
+
+    cancel_order = amend_order = place_order
+
+    def is_connected(self):
+        return self.connected
+
+    def exit(self):
+        self.connected = False
+
+
+@pytest.fixture
+def exchange():
+    ex = StandInExchange()
+    ex.add_instrument("BTCUSDT", tick_size="0.1", qty_step="0.001")
+    ex.start()
+    ex.publish_ticker("BTCUSDT", Decimal("100000"))
+    yield ex
+    ex.close()
+
+
+@pytest.fixture
+def client(exchange):
+    client = WebSocketTradeClient(
+        api_key="k1", api_secret="s1", ws_factory=exchange.trade_websocket, request_timeout=2.0,
+    )
+    client.connect()
+    yield client
+    client.disconnect()
+
+
+def _place(client, price="99000.0", **kwargs):
+    return client.place_order(
+        symbol="BTCUSDT", side="Buy", order_type="Limit", qty="0.010", price=price,
+        position_idx=1, **kwargs,
+    )
+
+
+class TestRequests:
+    def test_place_amend_cancel(self, exchange, client):
+        placed = _place(client, order_link_id="link-1")
+        assert placed["orderLinkId"] == "link-1"
+
+        assert client.amend_order("BTCUSDT", order_id=placed["orderId"], price="98000.0") == placed
+        assert client.cancel_order("BTCUSDT", order_id=placed["orderId"]) is True
+        # Already gone: the expected-failure path, as over REST.
+        assert client.cancel_order("BTCUSDT", order_id=placed["orderId"]) is False
+        assert exchange.stats.ws_trade_calls == {
+            "order.create": 1, "order.amend": 1, "order.cancel": 2,
+        }
+
+    def test_reject_raises_with_code(self, client):
+        _place(client, order_link_id="dup")
+        with pytest.raises(Exception, match=r"\[110072\]"):
+            _place(client, order_link_id="dup")
+
+    def test_rate_limit_hook_runs_per_request(self, exchange):
+        slots = []
+        client = WebSocketTradeClient(
+            api_key="k1", api_secret="s1", ws_factory=exchange.trade_websocket,
+            acquire_order_slot=lambda: slots.append(1),
+        )
+        client.connect()
+        _place(client)
+        assert slots == [1]
+
+
+class TestHealth:
+    def test_not_connected_raises_unavailable(self, exchange):
+        client = WebSocketTradeClient(api_key="k1", api_secret="s1", ws_factory=exchange.trade_websocket)
+        assert client.is_healthy() is False
+        with pytest.raises(TradeSocketUnavailableError):
+            _place(client)
+
+    def test_dead_socket_raises_unavailable_until_reset(self, exchange, client):
+        client._ws.connected = False
+        with pytest.raises(TradeSocketUnavailableError):
+            _place(client)
+        assert exchange.stats.ws_trade_calls == {}
+
+        client.reset()
+        assert client.is_healthy() is True
+        assert _place(client)["orderId"]
+
+    def test_timeouts_mark_unhealthy(self):
+        client = WebSocketTradeClient(
+            api_key="k1", api_secret="s1", ws_factory=_SilentTradeSocket,
+            request_timeout=0.01, max_consecutive_timeouts=2,
+        )
+        client.connect()
+        with pytest.raises(TimeoutError):
+            _place(client)
+        # A cancel that times out is a failed cancel, as over REST.
+        assert client.cancel_order("BTCUSDT", order_id="x") is False
+        assert client.is_healthy() is False
+        with pytest.raises(TradeSocketUnavailableError):
+            _place(client)
+        assert len(client._ws.sent) == 2
+
+    def test_request_timeout_must_be_positive(self):
+        with pytest.raises(ValueError):
+            WebSocketTradeClient(api_key="k1", api_secret="s1", request_timeout=0)
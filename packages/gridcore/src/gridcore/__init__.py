@@ -7,7 +7,14 @@ applications.
 """
 
 from gridcore.events import Event, EventType, TickerEvent, PublicTradeEvent, ExecutionEvent, OrderUpdateEvent
-from gridcore.intents import PlaceLimitIntent, CancelIntent, extract_client_order_prefix
+from gridcore.intents import (
+    PlaceLimitIntent,
+    CancelIntent,
+    AmendIntent,
+    ClientOrderIdCache,
+    collapse_to_amends,
+    extract_client_order_prefix,
+)
 from gridcore.config import GridConfig
 from gridcore.grid import Grid, GridSideType
 from gridcore.engine import GridEngine
@@ -40,6 +47,9 @@ __all__ = [
     "OrderUpdateEvent",
     "PlaceLimitIntent",
     "CancelIntent",
+    "AmendIntent",
+    "ClientOrderIdCache",
+    "collapse_to_amends",
     "extract_client_order_prefix",
     "GridConfig",
     "Grid",
@@ -17,7 +17,7 @@ from gridcore.config import GridConfig
 
 from gridcore.events import Event, TickerEvent, ExecutionEvent, OrderUpdateEvent
 from gridcore.grid import Grid, GridSideType
-from gridcore.intents import PlaceLimitIntent, CancelIntent
+from gridcore.intents import PlaceLimitIntent, CancelIntent, ClientOrderIdCache
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +93,11 @@ class GridEngine:
         # client_order_id → order_id mapping
         self.pending_orders: dict[str, str] = {}
 
+        # Memoized client_order_ids for this engine's grid identities. Sized for
+        # both directions of the live ladder plus one superseded ladder, so a
+        # rebuild pushes the previous grid's levels out LRU-first.
+        self._client_order_ids = ClientOrderIdCache(maxsize=4 * (config.grid_count + 1))
+
     def on_event(self, event: Event, limit_orders: dict[str, list[dict]] | None = None) -> list[PlaceLimitIntent | CancelIntent]:
         """
         Process event and return list of intents.
@@ -497,4 +502,5 @@ class GridEngine:
             direction=direction,
             reduce_only=self._REDUCE_ONLY_MAP[(direction, grid['side'])],
             strat_id=self.strat_id,
+            id_cache=self._client_order_ids,
         )
@@ -10,6 +10,7 @@ Extracted from bbu2-master/greed.py with the following key transformations:
 """
 
 import logging
+from collections import Counter, OrderedDict
 from datetime import datetime
 from decimal import Decimal
 from enum import StrEnum
@@ -34,6 +35,10 @@ class Grid:
     the original greed.py when given the same inputs.
     """
 
+    # Max precomputed ladders kept per Grid (see _ladder). A ladder is
+    # grid_count + 1 floats, so this bounds the cache to a few KB-MB.
+    LADDER_CACHE_SIZE = 256
+
     def __init__(self, tick_size: Decimal, grid_count: int = 50, grid_step: float = 0.2, rebalance_threshold: float = 0.3,
                  on_change: Optional[Callable[[list[dict], Optional[datetime]], None]] = None):
         """
@@ -64,6 +69,8 @@ class Grid:
         # handler so multiple inner notifies share the same ts; cleared on
         # handler exit. Read-only here — never reset by _notify_change.
         self._current_exchange_ts: Optional[datetime] = None
+        # Precomputed price ladders, LRU-bounded by LADDER_CACHE_SIZE (see _ladder)
+        self._ladder_cache: OrderedDict[tuple, tuple[float, ...]] = OrderedDict()
 
     def _notify_change(self) -> None:
         """Invoke on_change callback. Errors are logged but never propagate —
@@ -109,47 +116,86 @@ class Grid:
         if not last_close:
             return
 
-        # Clear existing grid before building (prevents doubling on rebuild)
+        # Clear existing grid before building (prevents doubling on rebuild);
+        # a ladder rejected by _ladder's duplicate check leaves it empty.
         self.grid = []
 
+        # Middle line = actual price (WAIT zone)
+        # Store the original anchor price for persistence
+        self._original_anchor_price = self._round_price(last_close)
+
+        prices = self._ladder(last_close)
+        half_grid = self.grid_count // 2
+
+        # Fresh dicts on every build: levels are mutated in place by
+        # _assign_sides, so the cached ladder only ever holds prices.
+        self.grid = [{'side': GridSideType.BUY, 'price': price} for price in prices[:half_grid]]
+        self.grid.append({'side': GridSideType.WAIT, 'price': prices[half_grid]})
+        self.grid.extend({'side': GridSideType.SELL, 'price': price} for price in prices[half_grid + 1:])
+
+        self._notify_change()
+
+    def _ladder(self, last_close: float) -> tuple[float, ...]:
+        """
+        Ascending level prices (BUY half, WAIT center, SELL half) for last_close.
+
+        Each level is the previous one times (1 ± grid_step%), rounded to tick,
+        walked outward from the unrounded anchor — the bbu2 recurrence. Because
+        rounding compounds along the walk, levels are not a fixed multiplier
+        table; instead whole ladders are memoized, keyed by (last_close,
+        tick_size, grid_step, grid_count). Market prices are tick-aligned, so
+        the key is effectively the anchor's tick index, and a rebuild back at a
+        previously seen tick (common in volatile backtests and sweeps) costs one
+        dict lookup. The exact float is kept in the key because the first step
+        multiplies the unrounded anchor: an off-tick anchor_price can yield a
+        different ladder than its rounded tick.
+
+        Raises:
+            ValueError: If the ladder contains duplicate prices
+        """
+        key = (last_close, self.tick_size, self.grid_step, self.grid_count)
+        prices = self._ladder_cache.get(key)
+        if prices is not None:
+            self._ladder_cache.move_to_end(key)
+            return prices
+
         half_grid = self.grid_count // 2
         step = self.grid_step / 100
+        up = 1 + step
+        down = 1 - step
 
-        # Middle line = actual price (WAIT zone)
-        # Store the original anchor price for persistence
-        rounded_price = self._round_price(last_close)
-        self._original_anchor_price = rounded_price
-        self.grid.append({
-            'side': GridSideType.WAIT,
-            'price': rounded_price
-        })
-
-        # Build upper half (SELL orders)
+        # Single outward walk per half; the BUY half is built top-down and
+        # reversed once (was insert(0, ...) per level).
+        buys = []
         price = last_close
         for _ in range(half_grid):
-            price = self._round_price(price * (1 + step))
-            self.grid.append({'side': GridSideType.SELL, 'price': price})
+            price = self._round_price(price * down)
+            buys.append(price)
+        buys.reverse()
 
-        # Build lower half (BUY orders)
+        sells = []
         price = last_close
         for _ in range(half_grid):
-            price = self._round_price(price * (1 - step))
-            self.grid.insert(0, {'side': GridSideType.BUY, 'price': price})
+            price = self._round_price(price * up)
+            sells.append(price)
 
-        # Safety check: Ensure no duplicate prices (critical since grid_level not in hash)
-        prices = [g['price'] for g in self.grid]
-        unique_prices = set(prices)
-        if len(prices) != len(unique_prices):
-            # Find duplicates for error message
-            from collections import Counter
-            duplicates = [price for price, count in Counter(prices).items() if count > 1]
-            raise ValueError(
-                f"Grid contains duplicate prices: {duplicates}. "
-                f"This violates order identity uniqueness (grid_level not in hash). "
-                f"Check tick_size={self.tick_size} and grid_step={self.grid_step}."
-            )
+        prices = (*buys, self._round_price(last_close), *sells)
 
-        self._notify_change()
+        # Safety check: Ensure no duplicate prices (critical since grid_level not in hash).
+        # A strictly ascending ladder has none; only otherwise pay for the Counter.
+        if any(lower >= upper for lower, upper in zip(prices, prices[1:])):
+            duplicates = [price for price, count in Counter(prices).items() if count > 1]
+            if duplicates:
+                raise ValueError(
+                    f"Grid contains duplicate prices: {duplicates}. "
+                    f"This violates order identity uniqueness (grid_level not in hash). "
+                    f"Check tick_size={self.tick_size} and grid_step={self.grid_step}."
+                )
+
+        self._ladder_cache[key] = prices
+        if len(self._ladder_cache) > self.LADDER_CACHE_SIZE:
+            self._ladder_cache.popitem(last=False)
+        return prices
 
     def __rebuild_grid(self, last_close: float) -> None:
         """
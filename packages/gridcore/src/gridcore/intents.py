@@ -8,9 +8,11 @@ handles actually placing/canceling orders.
 This separation ensures the strategy remains pure and testable.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from decimal import Decimal
 import hashlib
+from typing import Callable
 
 
 def extract_client_order_prefix(order_link_id: str | None) -> str | None:
@@ -85,6 +87,7 @@ class PlaceLimitIntent:
         reduce_only: bool = False,
         post_only: bool = False,
         strat_id: str | None = None,
+        id_cache: "ClientOrderIdCache | None" = None,
     ) -> "PlaceLimitIntent":
         """
         Factory method to create a PlaceLimitIntent with deterministic client_order_id.
@@ -119,22 +122,17 @@ class PlaceLimitIntent:
                 the survive-rebalance property are unaffected). When None (default),
                 the hash is byte-for-byte identical to the pre-0080 id, preserving
                 existing callers and historical-row matching.
+            id_cache: Optional ClientOrderIdCache to memoize the hash. The id is
+                byte-for-byte the uncached value; only the SHA-256 is skipped
+                on a repeat identity.
 
         Returns:
             PlaceLimitIntent with deterministic client_order_id
         """
-        # Generate deterministic client_order_id from identity parameters
-        # Dynamically build from _IDENTITY_PARAMS to avoid maintenance issues
-        params = locals()
-        id_components = [str(params[param]) for param in cls._IDENTITY_PARAMS]
-        id_string = "_".join(id_components)
-        # Feature 0080 (issue #183): namespace the identity hash by strat_id so two
-        # strategies on the same (account, symbol) produce DISTINCT client_order_ids.
-        # strat_id is a salt, NOT an _IDENTITY_PARAMS entry. When None, id_string is
-        # byte-for-byte the pre-0080 value (back-compat for callers + historical rows).
-        if strat_id is not None:
-            id_string = f"{strat_id}_{id_string}"
-        deterministic_id = hashlib.sha256(id_string.encode()).hexdigest()[:16]
+        if id_cache is not None:
+            deterministic_id = id_cache.get(symbol, side, price, direction, strat_id)
+        else:
+            deterministic_id = cls.client_order_id_for(symbol, side, price, direction, strat_id)
 
         return cls(
             symbol=symbol,
@@ -148,6 +146,80 @@ class PlaceLimitIntent:
             post_only=post_only,
         )
 
+    @classmethod
+    def client_order_id_for(
+        cls,
+        symbol: str,
+        side: str,
+        price: Decimal,
+        direction: str,
+        strat_id: str | None = None,
+    ) -> str:
+        """Deterministic client_order_id for an order identity (see create)."""
+        # Built from _IDENTITY_PARAMS so the hash input order has one definition
+        identity = {'symbol': symbol, 'side': side, 'price': price, 'direction': direction}
+        id_string = "_".join(str(identity[param]) for param in cls._IDENTITY_PARAMS)
+        # Feature 0080 (issue #183): namespace the identity hash by strat_id so two
+        # strategies on the same (account, symbol) produce DISTINCT client_order_ids.
+        # strat_id is a salt, NOT an _IDENTITY_PARAMS entry. When None, id_string is
+        # byte-for-byte the pre-0080 value (back-compat for callers + historical rows).
+        if strat_id is not None:
+            id_string = f"{strat_id}_{id_string}"
+        return hashlib.sha256(id_string.encode()).hexdigest()[:16]
+
+
+class ClientOrderIdCache:
+    """
+    Bounded LRU memo of deterministic client_order_ids.
+
+    A grid at a fixed anchor re-emits the same (strat_id, symbol, side, price,
+    direction) identities on every tick; this skips the string join and
+    SHA-256 for repeats. Values are exactly PlaceLimitIntent.client_order_id_for
+    output. The price enters the key via str() because that is what the hash
+    consumes: Decimal('1.0') == Decimal('1.00') but they hash to different ids.
+
+    Least-recently-used identities are evicted once maxsize is exceeded, so
+    levels from a previous (rebuilt) grid age out while the live ladder stays hot.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self._ids: OrderedDict[tuple, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def get(
+        self,
+        symbol: str,
+        side: str,
+        price: Decimal,
+        direction: str,
+        strat_id: str | None = None,
+    ) -> str:
+        """Return the client_order_id for an identity, computing it on a miss."""
+        key = (strat_id, symbol, side, str(price), direction)
+        client_order_id = self._ids.get(key)
+        if client_order_id is not None:
+            self._ids.move_to_end(key)
+            self.hits += 1
+            return client_order_id
+
+        self.misses += 1
+        client_order_id = PlaceLimitIntent.client_order_id_for(symbol, side, price, direction, strat_id)
+        self._ids[key] = client_order_id
+        if len(self._ids) > self.maxsize:
+            self._ids.popitem(last=False)
+        return client_order_id
+
+    def clear(self) -> None:
+        """Drop all memoized ids (counters are kept)."""
+        self._ids.clear()
+
 
 @dataclass(frozen=True)
 class CancelIntent:
@@ -165,3 +237,73 @@ class CancelIntent:
     # Optional fields for tracking
     price: Decimal | None = None
     side: str | None = None
+
+
+@dataclass(frozen=True)
+class AmendIntent:
+    """
+    Intent to move a resting order to a new price/qty in place.
+
+    Stands for a CancelIntent + PlaceLimitIntent pair: one order-rate slot and
+    one round trip instead of two, and the order never leaves the book.
+    Exchanges amend only price and qty, so the resting order must already
+    match the replacement's side, direction and flags (see collapse_to_amends).
+
+    ``cancel`` and ``place`` are the original pair. The execution layer falls
+    back to executing them separately when the amend is rejected (e.g. the
+    order filled in the meantime).
+    """
+    cancel: CancelIntent
+    place: PlaceLimitIntent
+
+    @property
+    def symbol(self) -> str:
+        return self.place.symbol
+
+    @property
+    def order_id(self) -> str:
+        """Exchange order_id of the resting order being amended."""
+        return self.cancel.order_id
+
+    @property
+    def reason(self) -> str:
+        return self.cancel.reason
+
+
+def collapse_to_amends(
+    intents: list[PlaceLimitIntent | CancelIntent],
+    can_amend: Callable[[CancelIntent, PlaceLimitIntent], bool],
+) -> list[PlaceLimitIntent | CancelIntent | AmendIntent]:
+    """
+    Replace cancel+place pairs with AmendIntents.
+
+    Each place is paired with the first still-unpaired cancel that
+    ``can_amend`` accepts. The strategy has no view of the resting order
+    behind a CancelIntent (side, reduce-only, time in force), so the caller
+    decides. The AmendIntent takes the place's position in the list; unpaired
+    intents keep their order.
+    """
+    cancels = [i for i in intents if isinstance(i, CancelIntent)]
+    if not cancels:
+        return list(intents)
+
+    paired: set[int] = set()
+    amends: dict[int, AmendIntent] = {}
+    for index, intent in enumerate(intents):
+        if not isinstance(intent, PlaceLimitIntent):
+            continue
+        for cancel in cancels:
+            if id(cancel) not in paired and can_amend(cancel, intent):
+                paired.add(id(cancel))
+                amends[index] = AmendIntent(cancel=cancel, place=intent)
+                break
+    if not amends:
+        return list(intents)
+
+    collapsed: list[PlaceLimitIntent | CancelIntent | AmendIntent] = []
+    for index, intent in enumerate(intents):
+        if index in amends:
+            collapsed.append(amends[index])
+        elif not (isinstance(intent, CancelIntent) and id(intent) in paired):
+            collapsed.append(intent)
+    return collapsed
@@ -1,18 +1,25 @@
 """
 Grid state persistence for maintaining full grid levels across restarts.
 
-This module provides file-based persistence for grid state, keyed by strat_id
-to support multiple strategy instances.
+This module provides persistence for grid state, keyed by strat_id to support
+multiple strategy instances. Storage is pluggable:
+
+- ``JsonFileBackend`` (default): the legacy single JSON file shared by all
+  strats. Every commit re-reads and atomically rewrites the whole file.
+- ``SqliteBackend``: one row per strat in a SQLite table in WAL mode, so a
+  commit costs O(strats in the batch) instead of O(all strats). On first
+  open it imports the legacy JSON file (which is left in place, so rolling
+  back to the JSON backend only loses saves made since the switch).
 
 Save semantics:
-- Sync API, non-blocking: cheap-fingerprint dedupe + a daemon
-  threading.Thread for the actual disk I/O. Atomic writes via tmp +
-  os.replace + fsync.
-- Single-writer-per-strat: a per-strat pending slot holds the latest payload;
-  if a writer is already running for that strat, save() just updates the slot
-  and the in-flight writer drains it. This guarantees latest-wins ordering
-  per strat (threading.Lock by itself is not FIFO, so a naive "spawn-a-thread-
-  per-save" design can write payloads out of order).
+- Sync API, non-blocking: cheap-fingerprint dedupe + one long-lived daemon
+  writer thread per store for the actual disk I/O. Both backends commit
+  atomically (tmp + fsync + os.replace / one SQLite transaction).
+- Latest-wins per strat: a per-strat pending slot holds the latest payload;
+  save() just overwrites the slot. The writer swaps out every pending slot at
+  once and commits them as one batch (group commit), so a burst of saves
+  across many strats costs one fsync, and a strat's payloads can never be
+  written out of order.
 
 Threads (rather than asyncio) are used because the live gridbot orchestrator
 runs a synchronous main loop (time.sleep), so asyncio.create_task would
@@ -23,11 +30,16 @@ import hashlib
 import json
 import logging
 import os
+import sqlite3
 import threading
-from typing import Optional
+import time
+from typing import Optional, Protocol
 
 logger = logging.getLogger(__name__)
 
+GRID_STATE_BACKENDS = ("json", "sqlite")
+SQLITE_SUFFIX = ".sqlite3"
+
 
 def grid_fingerprint(grid: list[dict], grid_step: float, grid_count: int) -> tuple:
     """Cheap structural identity of a grid payload.
@@ -60,41 +72,272 @@ def grid_fingerprint_hash(grid: list[dict], grid_step: float, grid_count: int) -
     ).hexdigest()
 
 
-class GridStateStore:
+class GridStateBackend(Protocol):
+    """Storage behind ``GridStateStore``.
+
+    Only the store's writer thread (and ``delete``, under the store's I/O
+    lock) calls ``write``/``delete``; ``read`` may run on any thread. I/O
+    failures surface as ``OSError``.
     """
-    File-based storage for full grid state.
 
-    Stores the full ordered grid (list of {side, price}) per strat_id along with
-    grid_step and grid_count for config-mismatch invalidation.
+    def read(self, strat_id: str) -> Optional[object]:
+        """Raw saved entry for ``strat_id`` (not validated), or None."""
+        ...
+
+    def write(self, entries: dict[str, dict]) -> None:
+        """Atomically upsert ``{strat_id: payload}``: all entries or none."""
+        ...
+
+    def delete(self, strat_id: str) -> bool:
+        """Remove ``strat_id``; False if it was not stored."""
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class JsonFileBackend:
+    """Legacy single-file JSON storage: ``{strat_id: payload}``.
 
     Reference: bbu2-master/db_files.py greed.json schema (array form);
     we use a dict-per-strat_id shape (carried over from the legacy format).
     """
 
-    def __init__(self, file_path: str = 'db/grid_anchor.json'):
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+    def read_all(self) -> dict:
+        """Read the full JSON file, returning {} on any error or if the root
+        is not a JSON object. A hand-edited file with a list/string/number
+        root would otherwise crash load()/save()/delete() with AttributeError
+        or TypeError; this helper makes the persistence layer self-healing."""
+        if not os.path.exists(self.file_path):
+            return {}
+        try:
+            with open(self.file_path, 'r') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return data
+
+    def read(self, strat_id: str) -> Optional[object]:
+        return self.read_all().get(strat_id)
+
+    def write(self, entries: dict[str, dict]) -> None:
+        """Merge ``entries`` into the file with one atomic rewrite. A corrupt
+        or non-dict-root file is silently overwritten with a fresh dict."""
+        all_data = self.read_all()
+        all_data.update(entries)
+        self._atomic_write(all_data)
+
+    def delete(self, strat_id: str) -> bool:
+        if not os.path.exists(self.file_path):
+            return False
+        all_data = self.read_all()
+        if strat_id not in all_data:
+            return False
+        del all_data[strat_id]
+        self._atomic_write(all_data)
+        return True
+
+    def close(self) -> None:
+        pass
+
+    def _atomic_write(self, all_data: dict) -> None:
+        """Write the full data dict to self.file_path atomically: tmp file +
+        fsync + os.replace, so a kill -9 mid-write cannot leave a half-written
+        file in place. On any failure (json.dump, fsync, or os.replace) the
+        half-written .tmp file is removed so failed writes do not leave
+        garbage behind. After a successful os.replace the .tmp path no longer
+        exists, so the cleanup branch only runs on real failure."""
+        dir_path = os.path.dirname(self.file_path)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+        tmp_path = self.file_path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(all_data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+
+class SqliteBackend:
+    """One row per strat in a SQLite WAL table.
+
+    ``synchronous=FULL`` makes every committed batch durable (one WAL fsync
+    per commit); a crash mid-commit rolls the whole batch back. When the
+    table is empty on open and ``legacy_json_path`` exists, its entries are
+    imported once (see ``migrate_json_file``).
+
+    Args:
+        db_path: SQLite database file.
+        legacy_json_path: ``JsonFileBackend`` file to import on first open.
+        read_only: Open an existing database with ``mode=ro``: no PRAGMA,
+            no DDL, no import, and ``write``/``delete`` raise ``OSError``.
+            Raises ``FileNotFoundError`` if ``db_path`` does not exist
+            instead of creating an empty database.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        legacy_json_path: Optional[str] = None,
+        read_only: bool = False,
+    ):
+        self.db_path = db_path
+        self.read_only = read_only
+        # One connection shared by the writer thread and load() callers,
+        # serialized by _lock (sqlite3 connections are not thread-safe).
+        self._lock = threading.Lock()
+        if read_only:
+            if not os.path.exists(db_path):
+                raise FileNotFoundError(f"grid state database not found: {db_path}")
+            self._conn = sqlite3.connect(
+                f"file:{db_path}?mode=ro", uri=True,
+                check_same_thread=False, isolation_level=None,
+            )
+            return
+        dir_path = os.path.dirname(db_path)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=FULL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS grid_state ("
+                "strat_id TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+            empty = self._conn.execute("SELECT 1 FROM grid_state LIMIT 1").fetchone() is None
+        if empty and legacy_json_path and os.path.exists(legacy_json_path):
+            migrate_json_file(legacy_json_path, self)
+
+    def read(self, strat_id: str) -> Optional[object]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM grid_state WHERE strat_id = ?", (strat_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def write(self, entries: dict[str, dict]) -> None:
+        self._check_writable()
+        now = time.time()
+        rows = [(sid, json.dumps(payload), now) for sid, payload in entries.items()]
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO grid_state (strat_id, payload, updated_at) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                self._rollback()
+                raise OSError(f"grid state commit failed: {e}") from e
+
+    def delete(self, strat_id: str) -> bool:
+        self._check_writable()
+        with self._lock:
+            try:
+                cursor = self._conn.execute(
+                    "DELETE FROM grid_state WHERE strat_id = ?", (strat_id,)
+                )
+            except sqlite3.Error as e:
+                raise OSError(f"grid state delete failed: {e}") from e
+        return cursor.rowcount > 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _check_writable(self) -> None:
+        if self.read_only:
+            raise OSError(f"grid state database opened read-only: {self.db_path}")
+
+    def _rollback(self) -> None:
+        try:
+            self._conn.execute("ROLLBACK")
+        except sqlite3.Error:
+            pass  # No transaction open (BEGIN itself failed).
+
+
+def migrate_json_file(json_path: str, backend: GridStateBackend) -> int:
+    """Copy every full-grid entry of a legacy JSON file into ``backend``.
+
+    Anchor-only and malformed entries are skipped (``GridStateStore.load``
+    ignores them anyway). The JSON file is not modified. Returns the number
+    of strats imported.
+    """
+    entries = {
+        strat_id: entry
+        for strat_id, entry in JsonFileBackend(json_path).read_all().items()
+        if strat_id and isinstance(entry, dict) and 'grid' in entry
+    }
+    if entries:
+        backend.write(entries)
+    logger.info("Imported grid state for %d strats from %s", len(entries), json_path)
+    return len(entries)
+
+
+class GridStateStore:
+    """
+    Storage for full grid state.
+
+    Stores the full ordered grid (list of {side, price}) per strat_id along with
+    grid_step and grid_count for config-mismatch invalidation.
+    """
+
+    def __init__(
+        self,
+        file_path: str = 'db/grid_anchor.json',
+        backend: Optional[GridStateBackend] = None,
+    ):
         """
         Initialize state store.
 
         Args:
             file_path: Path to JSON file for storing grid state. The default
                        name is preserved from the legacy GridAnchorStore to
-                       avoid disturbing deploy configs.
+                       avoid disturbing deploy configs. Ignored when
+                       ``backend`` is given.
+            backend: Storage backend (default: ``JsonFileBackend(file_path)``).
         """
         self.file_path = file_path
+        self._backend: GridStateBackend = backend or JsonFileBackend(file_path)
         # Cheap fingerprint of the last-enqueued payload per strat_id, used to
         # short-circuit identical save() calls without paying for deepcopy.
         self._last_fingerprint: dict[str, tuple] = {}
         # The latest payload waiting to be written, per strat_id. A new save()
-        # overwrites the slot — the in-flight writer (if any) will pick up the
-        # newer value the next time it loops, so a burst of saves coalesces
-        # into one final disk write per strat.
+        # overwrites the slot — the writer picks up whatever is there when it
+        # takes its next batch, so a burst of saves coalesces into one write
+        # per strat.
         self._pending_payload: dict[str, tuple[tuple, dict]] = {}
         # State + condition variable for: serializing slot access, dedupe
-        # bookkeeping, the active-writer set, and flush() wait/notify.
+        # bookkeeping, writer wakeups, and flush() wait/notify.
         self._cv = threading.Condition()
-        # strat_ids that currently have a writer thread running.
-        self._active_writers: set[str] = set()
-        # Serializes concurrent disk I/O across strats (the file is shared).
+        # The long-lived writer thread (started by the first save()), and
+        # whether it is committing a batch right now.
+        self._writer: Optional[threading.Thread] = None
+        self._writing = False
+        self._closed = False
+        # Serializes backend writes against delete().
         self._io_lock = threading.Lock()
 
     def _validate_strat_id(self, strat_id: str) -> None:
@@ -105,22 +348,6 @@ class GridStateStore:
     # scope as ``grid_fingerprint`` (0047).
     _fingerprint = staticmethod(grid_fingerprint)
 
-    def _read_all_data(self) -> dict:
-        """Read the full JSON file, returning {} on any error or if the root
-        is not a JSON object. A hand-edited file with a list/string/number
-        root would otherwise crash load()/save()/delete() with AttributeError
-        or TypeError; this helper makes the persistence layer self-healing."""
-        if not os.path.exists(self.file_path):
-            return {}
-        try:
-            with open(self.file_path, 'r') as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return {}
-        if not isinstance(data, dict):
-            return {}
-        return data
-
     def load(self, strat_id: str) -> Optional[dict]:
         """
         Load grid state for a strategy.
@@ -139,9 +366,7 @@ class GridStateStore:
             Saved entry dict (with `grid`, `grid_step`, `grid_count`) or None.
         """
         self._validate_strat_id(strat_id)
-        all_data = self._read_all_data()
-
-        entry = all_data.get(strat_id)
+        entry = self._backend.read(strat_id)
         if entry is None:
             return None
 
@@ -164,13 +389,12 @@ class GridStateStore:
         """
         Save grid state for a strategy.
 
-        Sync wrapper: cheap-fingerprint dedupe and then dispatch via a per-strat
-        pending slot. Returns immediately; does not block on fsync.
+        Sync wrapper: cheap-fingerprint dedupe, then the payload goes into the
+        strat's pending slot for the writer thread. Returns immediately; does
+        not block on fsync.
 
-        If a writer thread is already running for this strat_id, this call just
-        updates the slot — the in-flight writer drains it. Otherwise a fresh
-        writer thread is spawned. Net effect: latest-wins per strat, no write
-        reordering across rapid bursts.
+        Net effect: latest-wins per strat, no write reordering across rapid
+        bursts, and one commit for every strat saved since the last one.
 
         Args:
             strat_id: Strategy identifier
@@ -202,126 +426,121 @@ class GridStateStore:
             # enqueued payload that arrived in the meantime.
             self._pending_payload[strat_id] = (fingerprint, payload)
 
-            if strat_id not in self._active_writers:
-                self._active_writers.add(strat_id)
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    name="grid-state-writer",
+                    daemon=True,
+                )
                 spawn = True
+            else:
+                self._cv.notify_all()
 
         if spawn:
-            threading.Thread(
-                target=self._writer_loop,
-                args=(strat_id,),
-                daemon=True,
-            ).start()
-
-    def _writer_loop(self, strat_id: str) -> None:
-        """Drain the per-strat pending slot until empty, then exit. Each
-        iteration writes the latest payload; concurrent saves arriving while
-        the previous write is in flight just overwrite the slot and the next
-        loop iteration picks them up. Errors are logged, never propagated —
-        persistence failures must not crash strategy logic.
+            self._writer.start()
+
+    def _writer_loop(self) -> None:
+        """Commit every pending slot as one batch, then sleep until the next
+        save(). Saves arriving while a batch is in flight just fill slots for
+        the next batch. Errors are logged, never propagated — persistence
+        failures must not crash strategy logic.
 
         Exception strategy is two-level:
           - inner `except Exception` (around _sync_write_to_disk): catches
-            recoverable per-write failures (disk full, permission denied,
+            recoverable per-batch failures (disk full, permission denied,
             fsync errors, JSON serialization errors). Logs, rolls back the
-            dedupe fingerprint so a retry with the same payload reaches
-            disk, and CONTINUES the loop to drain any newer pending payload.
+            dedupe fingerprints so a retry with the same payload reaches
+            disk, and CONTINUES with any newer pending payloads.
           - outer `except BaseException`: catches non-Exception signals
             (KeyboardInterrupt, SystemExit, MemoryError) that the inner
-            handler intentionally lets through. Releases the _active_writers
-            slot before re-raising so a concurrent flush() does not deadlock
-            waiting for a thread that is about to die.
+            handler intentionally lets through. Clears the writer slot before
+            re-raising so a concurrent flush() does not deadlock waiting for
+            a thread that is about to die (the next save() starts a new one).
         """
         try:
             while True:
                 with self._cv:
-                    item = self._pending_payload.pop(strat_id, None)
-                    if item is None:
-                        self._active_writers.discard(strat_id)
+                    self._cv.wait_for(lambda: self._pending_payload or self._closed)
+                    if not self._pending_payload:
+                        self._writer = None
                         self._cv.notify_all()
                         return
-                fingerprint, payload = item
+                    batch, self._pending_payload = self._pending_payload, {}
+                    self._writing = True
                 try:
                     with self._io_lock:
-                        self._sync_write_to_disk(strat_id, payload)
+                        self._sync_write_to_disk(
+                            {strat_id: payload for strat_id, (_, payload) in batch.items()}
+                        )
                 except Exception as e:
                     # Recoverable failure: log, rebrand dedupe, keep draining.
-                    logger.error("Save failed for %s: %s", strat_id, e)
-                    # Roll back the dedupe key only if no newer payload has
+                    logger.error("Save failed for %s: %s", ", ".join(batch), e)
+                    # Roll back each dedupe key only if no newer payload has
                     # arrived since (a newer payload would have already
                     # replaced our fingerprint in _last_fingerprint).
                     with self._cv:
-                        if self._last_fingerprint.get(strat_id) == fingerprint:
-                            self._last_fingerprint.pop(strat_id, None)
+                        for strat_id, (fingerprint, _) in batch.items():
+                            if self._last_fingerprint.get(strat_id) == fingerprint:
+                                self._last_fingerprint.pop(strat_id, None)
+                with self._cv:
+                    self._writing = False
+                    self._cv.notify_all()
         except BaseException:
             # KeyboardInterrupt / SystemExit / other BaseException — release
             # the writer slot so flush() can return, then let the signal
             # propagate normally to terminate the thread (and the process).
             with self._cv:
-                self._active_writers.discard(strat_id)
+                self._writer = None
+                self._writing = False
                 self._cv.notify_all()
             raise
 
     def flush(self, timeout: Optional[float] = None) -> None:
-        """Block until all in-flight background writes have completed.
+        """Block until all pending background writes have completed.
 
         Useful in tests and for graceful shutdown. Production callers do not
-        need to invoke this — daemon threads either complete or die with the
-        process, and the next save() will retry (the write itself is atomic).
+        need to invoke this — the daemon writer either completes or dies with
+        the process, and the next save() will retry (the write itself is
+        atomic).
         """
         with self._cv:
-            self._cv.wait_for(lambda: not self._active_writers, timeout=timeout)
-
-    def _sync_write_to_disk(self, strat_id: str, payload: dict) -> None:
-        """Atomic write: tmp file + fsync + os.replace. Either the new file
-        fully replaces the old one or nothing happens — a kill -9 mid-write
-        cannot leave a corrupted half-written file in place. A corrupt or
-        non-dict-root file is silently overwritten with a fresh dict."""
-        all_data = self._read_all_data()
-        all_data[strat_id] = payload
-        self._atomic_write(all_data)
+            self._cv.wait_for(
+                lambda: self._writer is None
+                or (not self._pending_payload and not self._writing),
+                timeout=timeout,
+            )
 
-    def _atomic_write(self, all_data: dict) -> None:
-        """Write the full data dict to self.file_path atomically. On any
-        failure (json.dump, fsync, or os.replace) the half-written .tmp file
-        is removed so failed writes do not leave garbage behind. After a
-        successful os.replace the .tmp path no longer exists, so the cleanup
-        branch only runs on real failure."""
-        dir_path = os.path.dirname(self.file_path)
-        if dir_path and not os.path.exists(dir_path):
-            os.makedirs(dir_path)
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush, stop the writer thread and close the backend.
 
-        tmp_path = self.file_path + '.tmp'
-        try:
-            with open(tmp_path, 'w') as f:
-                json.dump(all_data, f, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
-            os.replace(tmp_path, self.file_path)
-        except BaseException:
-            try:
-                os.remove(tmp_path)
-            except FileNotFoundError:
-                pass
-            raise
+        The store must not be used afterwards.
+        """
+        self.flush(timeout=timeout)
+        with self._cv:
+            self._closed = True
+            writer = self._writer
+            self._cv.notify_all()
+        if writer is not None:
+            writer.join(timeout=timeout)
+        with self._io_lock:
+            self._backend.close()
+
+    def _sync_write_to_disk(self, entries: dict[str, dict]) -> None:
+        """Commit ``{strat_id: payload}`` atomically through the backend."""
+        self._backend.write(entries)
 
     def delete(self, strat_id: str) -> bool:
         """
         Delete grid state for a strategy.
 
-        Atomic (uses the same tmp + os.replace pattern as save) and serialized
-        through the same I/O lock that gates background writes, so it cannot
-        race with an in-flight write to the shared file.
+        Atomic and serialized through the same I/O lock that gates background
+        writes, so it cannot race with an in-flight batch.
 
-        Returns True if deleted, False if not found.
+        Returns True if deleted, False if not found or the write failed.
         """
         self._validate_strat_id(strat_id)
-        if not os.path.exists(self.file_path):
-            return False
-
         with self._io_lock:
-            all_data = self._read_all_data()
-            if strat_id not in all_data:
+            if self._backend.read(strat_id) is None:
                 return False
 
             # Clear dedupe state BEFORE the disk write. Otherwise a concurrent
@@ -329,17 +548,43 @@ class GridStateStore:
             # write and the cleanup, see a stale _last_fingerprint match, and
             # silently dedupe-skip — losing the caller's save with no error.
             # A save() racing AFTER the cleanup will set its own fingerprint
-            # and queue a writer that waits on _io_lock; once we release it,
+            # and queue a batch that waits on _io_lock; once we release it,
             # the writer persists the new payload — caller intent honored.
             with self._cv:
                 self._last_fingerprint.pop(strat_id, None)
                 self._pending_payload.pop(strat_id, None)
 
-            del all_data[strat_id]
-
             try:
-                self._atomic_write(all_data)
+                return self._backend.delete(strat_id)
             except (IOError, OSError):
                 return False
 
-        return True
+
+def open_grid_state_store(
+    file_path: str, backend: str = "json", read_only: bool = False
+) -> GridStateStore:
+    """``GridStateStore`` on the named backend (one of ``GRID_STATE_BACKENDS``).
+
+    ``file_path`` is the legacy JSON path. With ``"sqlite"`` the database sits
+    next to it (``grid_anchor.json`` -> ``grid_anchor.sqlite3``) and imports
+    it on first open. A ``file_path`` ending in ``.sqlite3`` always opens that
+    database directly.
+
+    ``read_only`` is for consumers that only load (replay seeding): a SQLite
+    database is opened ``mode=ro`` and must already exist
+    (``FileNotFoundError`` otherwise); nothing is created or imported.
+    """
+    if file_path.endswith(SQLITE_SUFFIX):
+        return GridStateStore(file_path, backend=SqliteBackend(file_path, read_only=read_only))
+    if backend == "sqlite":
+        db_path = os.path.splitext(file_path)[0] + SQLITE_SUFFIX
+        if read_only:
+            return GridStateStore(file_path, backend=SqliteBackend(db_path, read_only=True))
+        return GridStateStore(
+            file_path, backend=SqliteBackend(db_path, legacy_json_path=file_path)
+        )
+    if backend != "json":
+        raise ValueError(
+            f"Unknown grid state backend {backend!r}, expected one of {GRID_STATE_BACKENDS}"
+        )
+    return GridStateStore(file_path)
@@ -650,6 +650,35 @@ class TestDeterministicClientOrderId:
         assert intent1.grid_level == 10
         assert intent2.grid_level == 15
 
+    def test_engine_ids_match_uncached_create(self):
+        """Engine's memoized ids are byte-for-byte PlaceLimitIntent.create's (strat_id salted)."""
+        config = GridConfig(grid_count=20, grid_step=0.2)
+        engine = GridEngine(symbol='BTCUSDT', tick_size=Decimal('0.1'), config=config, strat_id='btcusdt_test')
+        event = TickerEvent(
+            event_type=EventType.TICKER,
+            symbol='BTCUSDT',
+            exchange_ts=datetime.now(UTC),
+            local_ts=datetime.now(UTC),
+            last_price=Decimal('100000.0'),
+            mark_price=Decimal('100000.0'),
+            bid1_price=Decimal('99999.0'),
+            ask1_price=Decimal('100001.0'),
+            funding_rate=Decimal('0.0001'),
+        )
+
+        first = [i for i in engine.on_event(event, {'long': [], 'short': []}) if isinstance(i, PlaceLimitIntent)]
+        second = [i for i in engine.on_event(event, {'long': [], 'short': []}) if isinstance(i, PlaceLimitIntent)]
+
+        assert first
+        for intent in first:
+            expected = PlaceLimitIntent.create(
+                symbol=intent.symbol, side=intent.side, price=intent.price, qty=intent.qty,
+                grid_level=intent.grid_level, direction=intent.direction, strat_id='btcusdt_test',
+            )
+            assert intent.client_order_id == expected.client_order_id
+        assert [i.client_order_id for i in second] == [i.client_order_id for i in first]
+        assert engine._client_order_ids.hits == len(second)
+
 
 class TestAnchorPricePersistence:
     """Tests for anchor price persistence functionality."""
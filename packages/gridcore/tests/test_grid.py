@@ -852,3 +852,79 @@ class TestUpdateGridSidewayOscillation:
         assert grid.anchor_price == 100.0
         stale_wait = next((g for g in grid.grid if g['price'] == 54.0), None)
         assert stale_wait is None or stale_wait['side'] != GridSideType.WAIT
+
+
+class TestGridLadderCache:
+    """build_grid reuses precomputed ladders without changing any level."""
+
+    @staticmethod
+    def _reference_prices(grid: Grid, last_close: float) -> list[float]:
+        """The original insert(0, ...) construction, for parity."""
+        step = grid.grid_step / 100
+        levels = [grid._round_price(last_close)]
+        price = last_close
+        for _ in range(grid.grid_count // 2):
+            price = grid._round_price(price * (1 + step))
+            levels.append(price)
+        price = last_close
+        for _ in range(grid.grid_count // 2):
+            price = grid._round_price(price * (1 - step))
+            levels.insert(0, price)
+        return levels
+
+    @pytest.mark.parametrize("tick_size, grid_step, last_close", [
+        (Decimal('0.1'), 0.2, 100000.0),
+        (Decimal('0.01'), 0.3, 44.37),
+        (Decimal('0.0001'), 0.5, 0.5123),
+        (Decimal('0.1'), 0.2, 100000.05),  # off-tick anchor
+    ])
+    def test_ladder_matches_reference_construction(self, tick_size, grid_step, last_close):
+        grid = Grid(tick_size=tick_size, grid_count=50, grid_step=grid_step)
+        grid.build_grid(last_close)
+
+        assert [g['price'] for g in grid.grid] == self._reference_prices(grid, last_close)
+        assert grid.anchor_price == grid._round_price(last_close)
+
+    def test_returning_anchor_reuses_cached_ladder(self):
+        grid = Grid(tick_size=Decimal('0.1'), grid_count=50, grid_step=0.2)
+        grid.build_grid(100000.0)
+        first = [dict(g) for g in grid.grid]
+        grid.build_grid(101000.0)
+        grid.build_grid(100000.0)
+
+        assert len(grid._ladder_cache) == 2
+        assert grid.grid == first
+
+    def test_cached_rebuild_does_not_share_level_dicts(self):
+        """update_grid mutates levels in place; a rebuild must start clean."""
+        grid = Grid(tick_size=Decimal('0.1'), grid_count=50, grid_step=0.2)
+        grid.build_grid(100000.0)
+        grid.update_grid(last_filled_price=99800.0, last_close=99900.0)
+        grid.build_grid(100000.0)
+
+        sides = [g['side'] for g in grid.grid]
+        assert sides == [GridSideType.BUY] * 25 + [GridSideType.WAIT] + [GridSideType.SELL] * 25
+
+    def test_ladder_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(Grid, 'LADDER_CACHE_SIZE', 3)
+        grid = Grid(tick_size=Decimal('0.1'), grid_count=10, grid_step=0.2)
+        for anchor in (100.0, 101.0, 102.0, 103.0):
+            grid.build_grid(anchor)
+
+        assert list(key[0] for key in grid._ladder_cache) == [101.0, 102.0, 103.0]
+
+    def test_duplicate_ladder_is_not_cached(self):
+        grid = Grid(tick_size=Decimal('1'), grid_count=10, grid_step=0.2)
+
+        with pytest.raises(ValueError, match="duplicate prices"):
+            grid.build_grid(10.0)
+        assert not grid._ladder_cache
+
+    def test_duplicate_ladder_clears_previous_grid(self):
+        grid = Grid(tick_size=Decimal('1'), grid_count=10, grid_step=0.2)
+        grid.build_grid(100000.0)
+
+        with pytest.raises(ValueError, match="duplicate prices"):
+            grid.build_grid(10.0)
+        assert grid.grid == []
+        assert grid.anchor_price == 10.0
@@ -5,7 +5,14 @@ from decimal import Decimal
 
 import pytest
 
-from gridcore.intents import PlaceLimitIntent, extract_client_order_prefix
+from gridcore.intents import (
+    AmendIntent,
+    CancelIntent,
+    ClientOrderIdCache,
+    PlaceLimitIntent,
+    collapse_to_amends,
+    extract_client_order_prefix,
+)
 
 
 @pytest.mark.parametrize("order_link_id, expected", [
@@ -172,3 +179,101 @@ def test_strat_id_cross_strat_boundary_match():
     assert extract_client_order_prefix(recorded_wire) == replay_live.client_order_id
     # Negative: a synthetic replay strat_id would NOT match (documents engine.py:337).
     assert extract_client_order_prefix(recorded_wire) != replay_synthetic.client_order_id
+
+
+# --- ClientOrderIdCache: memoized ids must be byte-for-byte the uncached ids ---
+
+
+@pytest.mark.parametrize("strat_id", [None, "s1", "ltcusdt_test"])
+def test_id_cache_matches_uncached_ids(strat_id):
+    cache = ClientOrderIdCache(maxsize=8)
+    base = dict(symbol="BTCUSDT", side="Buy", price=Decimal("50000.0"),
+                qty=Decimal("0.001"), grid_level=10, direction="long", strat_id=strat_id)
+
+    plain = PlaceLimitIntent.create(**base)
+    first = PlaceLimitIntent.create(**base, id_cache=cache)
+    second = PlaceLimitIntent.create(**base, id_cache=cache)
+
+    assert first.client_order_id == plain.client_order_id
+    assert second.client_order_id == plain.client_order_id
+    assert (cache.misses, cache.hits) == (1, 1)
+
+
+def test_id_cache_preserves_pinned_pre_0080_hash():
+    cache = ClientOrderIdCache()
+    assert cache.get("BTCUSDT", "Buy", Decimal("50000.0"), "long") == _OLD_HASH_NO_STRAT
+
+
+def test_id_cache_keys_price_by_string_form():
+    """Decimal('1.0') == Decimal('1.00') but their ids differ; the cache must too."""
+    cache = ClientOrderIdCache()
+    one = cache.get("BTCUSDT", "Buy", Decimal("1.0"), "long", "s1")
+    one_00 = cache.get("BTCUSDT", "Buy", Decimal("1.00"), "long", "s1")
+
+    assert one == PlaceLimitIntent.client_order_id_for("BTCUSDT", "Buy", Decimal("1.0"), "long", "s1")
+    assert one_00 == PlaceLimitIntent.client_order_id_for("BTCUSDT", "Buy", Decimal("1.00"), "long", "s1")
+    assert one != one_00
+
+
+def test_id_cache_evicts_least_recently_used():
+    cache = ClientOrderIdCache(maxsize=2)
+    cache.get("BTCUSDT", "Buy", Decimal("1"), "long")
+    cache.get("BTCUSDT", "Buy", Decimal("2"), "long")
+    cache.get("BTCUSDT", "Buy", Decimal("1"), "long")  # refresh 1 -> 2 is now LRU
+    cache.get("BTCUSDT", "Buy", Decimal("3"), "long")  # evicts 2
+
+    assert len(cache) == 2
+    misses = cache.misses
+    cache.get("BTCUSDT", "Buy", Decimal("1"), "long")
+    assert cache.misses == misses
+    cache.get("BTCUSDT", "Buy", Decimal("2"), "long")
+    assert cache.misses == misses + 1
+
+
+def test_id_cache_rejects_non_positive_maxsize():
+    with pytest.raises(ValueError, match="maxsize"):
+        ClientOrderIdCache(maxsize=0)
+
+
+def _cancel(order_id: str, side: str = "Buy") -> CancelIntent:
+    return CancelIntent(symbol="BTCUSDT", order_id=order_id, reason="outside_grid", side=side)
+
+
+def _place(price: str, side: str = "Buy") -> PlaceLimitIntent:
+    return PlaceLimitIntent.create(
+        symbol="BTCUSDT", side=side, price=Decimal(price), qty=Decimal("0.001"),
+        grid_level=1, direction="long",
+    )
+
+
+def _same_side(cancel: CancelIntent, place: PlaceLimitIntent) -> bool:
+    return cancel.side == place.side
+
+
+def test_collapse_pairs_same_side_cancel_and_place():
+    cancel, place = _cancel("o1"), _place("100")
+
+    collapsed = collapse_to_amends([place, cancel], _same_side)
+
+    assert collapsed == [AmendIntent(cancel=cancel, place=place)]
+    amend = collapsed[0]
+    assert (amend.order_id, amend.symbol, amend.reason) == ("o1", "BTCUSDT", "outside_grid")
+
+
+def test_collapse_keeps_unpaired_intents_in_order():
+    sell_cancel, buy_cancel = _cancel("o1", side="Sell"), _cancel("o2")
+    buy_a, buy_b = _place("100"), _place("99")
+
+    collapsed = collapse_to_amends([buy_a, buy_b, sell_cancel, buy_cancel], _same_side)
+
+    # Each cancel pairs at most once; the first place wins it.
+    assert collapsed == [AmendIntent(cancel=buy_cancel, place=buy_a), buy_b, sell_cancel]
+
+
+def test_collapse_without_pairs_is_a_copy():
+    intents = [_place("100", side="Sell"), _cancel("o1")]
+
+    collapsed = collapse_to_amends(intents, _same_side)
+
+    assert collapsed == intents
+    assert collapsed is not intents
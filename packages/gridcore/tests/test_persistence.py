@@ -10,7 +10,13 @@ from unittest.mock import patch
 
 import pytest
 
-from gridcore.persistence import GridStateStore
+from gridcore.persistence import (
+    GridStateStore,
+    JsonFileBackend,
+    SqliteBackend,
+    migrate_json_file,
+    open_grid_state_store,
+)
 
 
 def _sample_grid() -> list[dict]:
@@ -219,8 +225,7 @@ class TestAtomicWrite:
         with patch("os.replace", side_effect=OSError("simulated failure")):
             with pytest.raises(OSError):
                 store._sync_write_to_disk(
-                    "strat1",
-                    {"grid": new_grid, "grid_step": 0.2, "grid_count": 20},
+                    {"strat1": {"grid": new_grid, "grid_step": 0.2, "grid_count": 20}},
                 )
 
         # Original file is untouched.
@@ -239,8 +244,7 @@ class TestAtomicWrite:
         with patch("os.replace", side_effect=OSError("simulated failure")):
             with pytest.raises(OSError):
                 store._sync_write_to_disk(
-                    "strat1",
-                    {"grid": _sample_grid(), "grid_step": 0.2, "grid_count": 20},
+                    {"strat1": {"grid": _sample_grid(), "grid_step": 0.2, "grid_count": 20}},
                 )
 
         assert not os.path.exists(tmp_file), (
@@ -322,9 +326,9 @@ class TestDedupe:
 
         grid[0]["side"] = "Wait"  # In-place mutation by caller.
 
-        with patch("threading.Thread") as mock_thread:
-            store.save("strat1", grid, grid_step=0.2, grid_count=20)
-            assert mock_thread.call_count == 1
+        store.save("strat1", grid, grid_step=0.2, grid_count=20)
+        store.flush()
+        assert store.load("strat1")["grid"][0]["side"] == "Wait"
 
 
 class TestFlush:
@@ -388,8 +392,8 @@ class TestBackgroundWrite:
         assert loaded["grid"][1]["price"] == 204.0
 
     def test_save_during_in_flight_write_is_coalesced(self, tmp_path):
-        """A save() that arrives while an earlier write is in flight must NOT
-        spawn a second writer thread — the in-flight writer drains the slot."""
+        """Saves never spawn more than the one long-lived writer thread —
+        a save() during an in-flight write just fills the next batch."""
         file_path = str(tmp_path / "grid_state.json")
         store = GridStateStore(file_path)
 
@@ -407,9 +411,7 @@ class TestBackgroundWrite:
             store.save("strat1", grid_b, 0.2, 20)
 
         store.flush()
-        # At most 2 thread spawns (in the worst case the first finished before
-        # the second save), but importantly the disk has the latest payload.
-        assert spawn_count <= 2
+        assert spawn_count == 1
         assert store.load("strat1")["grid"] == grid_b
 
     def test_write_failure_logged_not_raised(self, tmp_path, caplog):
@@ -548,3 +550,149 @@ class TestDelete:
             "delete()'s dedupe cleanup happened too late."
         )
         assert loaded["grid"] == grid
+
+
+class TestGroupCommit:
+    def test_saves_during_in_flight_write_commit_as_one_batch(self, tmp_path):
+        """While one batch is being written, saves for many strats pile up in
+        their slots and the writer commits them together (one fsync)."""
+        store = GridStateStore(str(tmp_path / "grid_state.json"))
+        batches = []
+        release = threading.Event()
+        original = store._sync_write_to_disk
+
+        def recording_write(entries):
+            batches.append(sorted(entries))
+            if len(batches) == 1:
+                release.wait(timeout=2.0)
+            original(entries)
+
+        with patch.object(store, "_sync_write_to_disk", side_effect=recording_write):
+            store.save("first", _sample_grid(), 0.2, 20)
+            while not batches:
+                threading.Event().wait(0.001)
+            for i in range(5):
+                store.save(f"s{i}", _sample_grid(), 0.2, 20)
+                store.save(f"s{i}", _sample_grid()[:3], 0.2, 20)  # latest wins
+            release.set()
+            store.flush()
+
+        assert batches == [["first"], ["s0", "s1", "s2", "s3", "s4"]]
+        assert len(store.load("s3")["grid"]) == 3
+
+    def test_close_stops_writer_after_flushing(self, tmp_path):
+        store = GridStateStore(str(tmp_path / "grid_state.json"))
+        store.save("strat1", _sample_grid(), 0.2, 20)
+        writer = store._writer
+        store.close(timeout=2.0)
+        assert not writer.is_alive()
+        assert JsonFileBackend(str(tmp_path / "grid_state.json")).read("strat1") is not None
+
+
+class TestSqliteBackend:
+    def _store(self, tmp_path, **kwargs) -> GridStateStore:
+        return GridStateStore(backend=SqliteBackend(str(tmp_path / "grid_state.sqlite3"), **kwargs))
+
+    def test_roundtrip_delete_and_reopen(self, tmp_path):
+        store = self._store(tmp_path)
+        store.save("a", _sample_grid(), 0.2, 20)
+        store.save("b", _sample_grid()[:2], 0.3, 10)
+        store.flush()
+        assert store.delete("b") is True
+        assert store.delete("b") is False
+        store.close()
+
+        reopened = self._store(tmp_path)
+        assert reopened.load("a") == {"grid": _sample_grid(), "grid_step": 0.2, "grid_count": 20}
+        assert reopened.load("b") is None
+        reopened.close()
+
+    def test_uses_wal_journal(self, tmp_path):
+        backend = SqliteBackend(str(tmp_path / "grid_state.sqlite3"))
+        with backend._lock:
+            mode = backend._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        backend.close()
+        assert mode == "wal"
+
+    def test_failed_commit_rolls_back_whole_batch(self, tmp_path):
+        backend = SqliteBackend(str(tmp_path / "grid_state.sqlite3"))
+        with backend._lock:
+            backend._conn.execute(
+                "CREATE TRIGGER reject_b BEFORE INSERT ON grid_state "
+                "WHEN NEW.strat_id = 'b' BEGIN SELECT RAISE(ABORT, 'disk full'); END"
+            )
+        with pytest.raises(OSError, match="disk full"):
+            backend.write({"a": {"grid": []}, "b": {"grid": []}})
+        assert backend.read("a") is None
+        backend.write({"a": {"grid": []}})  # no transaction left dangling
+        assert backend.read("a") == {"grid": []}
+        backend.close()
+
+    def test_migrates_legacy_json_on_first_open_only(self, tmp_path):
+        legacy = tmp_path / "grid_anchor.json"
+        legacy.write_text(json.dumps({
+            "full": {"grid": _sample_grid(), "grid_step": 0.2, "grid_count": 20},
+            "anchor_only": {"anchor_price": 100.0},
+            "broken": 1,
+        }))
+        store = self._store(tmp_path, legacy_json_path=str(legacy))
+        assert store.load("full")["grid"] == _sample_grid()
+        assert store._backend.read("anchor_only") is None
+        store.save("full", _sample_grid()[:2], 0.2, 20)
+        store.close()
+
+        # The legacy file is untouched and not re-imported over newer state.
+        assert "anchor_only" in json.loads(legacy.read_text())
+        reopened = self._store(tmp_path, legacy_json_path=str(legacy))
+        assert len(reopened.load("full")["grid"]) == 2
+        reopened.close()
+
+    def test_migrate_json_file_counts_imported(self, tmp_path):
+        legacy = tmp_path / "grid_anchor.json"
+        legacy.write_text(json.dumps({"a": {"grid": []}, "b": {"grid": []}}))
+        backend = SqliteBackend(str(tmp_path / "other.sqlite3"))
+        assert migrate_json_file(str(legacy), backend) == 2
+        backend.close()
+
+
+class TestOpenGridStateStore:
+    def test_backends_by_name_and_suffix(self, tmp_path):
+        json_path = str(tmp_path / "grid_anchor.json")
+        assert isinstance(open_grid_state_store(json_path)._backend, JsonFileBackend)
+
+        store = open_grid_state_store(json_path, backend="sqlite")
+        assert store._backend.db_path == str(tmp_path / "grid_anchor.sqlite3")
+        store.close()
+
+        direct = open_grid_state_store(str(tmp_path / "grid_anchor.sqlite3"))
+        assert isinstance(direct._backend, SqliteBackend)
+        direct.close()
+
+    def test_read_only_missing_sqlite_raises_and_creates_nothing(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            open_grid_state_store(str(tmp_path / "grid_anchor.sqlite3"), read_only=True)
+        with pytest.raises(FileNotFoundError):
+            open_grid_state_store(
+                str(tmp_path / "grid_anchor.json"), backend="sqlite", read_only=True
+            )
+        assert list(tmp_path.iterdir()) == []
+
+    def test_read_only_loads_and_rejects_writes(self, tmp_path):
+        db_path = str(tmp_path / "grid_anchor.sqlite3")
+        writer = open_grid_state_store(db_path)
+        writer.save("s1", _sample_grid()[:2], 0.2, 20)
+        writer.close()
+
+        store = open_grid_state_store(db_path, read_only=True)
+        try:
+            assert len(store.load("s1")["grid"]) == 2
+            with pytest.raises(OSError, match="read-only"):
+                store._backend.write({"s2": {"grid": []}})
+            assert store.load("s2") is None
+        finally:
+            store.close()
+
+    def test_unknown_backend_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown grid state backend"):
+            open_grid_state_store(str(tmp_path / "grid.json"), backend="lmdb")
+
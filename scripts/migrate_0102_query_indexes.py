@@ -0,0 +1,137 @@
+"""One-off schema migration for feature 0102 (replay/seed query indexes).
+
+Creates the composite indexes the replay and seed read paths need:
+    ix_private_executions_run_ts_exec      (run_id, exchange_ts, exec_id)
+    ix_orders_run_ts                       (run_id, exchange_ts)
+    ix_orders_run_account_symbol_order_ts  (run_id, account_id, symbol,
+                                            order_id, exchange_ts)
+    ix_grid_state_snapshots_account_strat_symbol_ts
+                                           (account_id, strat_id, symbol,
+                                            exchange_ts, id)
+
+then drops the indexes they replace (each is a left prefix of, or a strict
+subset of, its replacement):
+    ix_private_executions_run_id, ix_orders_run_id,
+    ix_orders_run_account_symbol_ts
+
+New indexes are built before the old ones are dropped, so the queries are
+never left without an index mid-migration. The position/wallet "latest
+before ts" indexes (0029/0034) already match their queries and are not
+touched; ``shared/db/tests/test_query_plans.py`` pins all of them.
+
+PostgreSQL: indexes are built and dropped ``CONCURRENTLY`` (outside a
+transaction), so a live recorder keeps writing during the build. An
+interrupted concurrent build leaves an INVALID index behind; the next run
+drops and rebuilds it. SQLite: plain DDL in one transaction. Both finish
+with ``ANALYZE`` on the touched tables so the planner sees the new indexes.
+
+Idempotent: each step is gated on a probe.
+
+Usage:
+    uv run python scripts/migrate_0102_query_indexes.py \\
+        --database-url "sqlite:///data/recorder_ltcusdt_phase4.db"
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+from sqlalchemy import create_engine, inspect, text
+
+logger = logging.getLogger("migrate_0102")
+
+
+# (table, index name, column list)
+NEW_INDEXES: list[tuple[str, str, str]] = [
+    ("private_executions", "ix_private_executions_run_ts_exec",
+     "run_id, exchange_ts, exec_id"),
+    ("orders", "ix_orders_run_ts", "run_id, exchange_ts"),
+    ("orders", "ix_orders_run_account_symbol_order_ts",
+     "run_id, account_id, symbol, order_id, exchange_ts"),
+    ("grid_state_snapshots", "ix_grid_state_snapshots_account_strat_symbol_ts",
+     "account_id, strat_id, symbol, exchange_ts, id"),
+]
+
+# (table, index name)
+OLD_INDEXES: list[tuple[str, str]] = [
+    ("private_executions", "ix_private_executions_run_id"),
+    ("orders", "ix_orders_run_id"),
+    ("orders", "ix_orders_run_account_symbol_ts"),
+]
+
+
+def _index_exists(conn, table: str, index_name: str) -> bool:
+    inspector = inspect(conn)
+    return any(i["name"] == index_name for i in inspector.get_indexes(table))
+
+
+def _pg_index_is_invalid(conn, index_name: str) -> bool:
+    """True if a failed ``CREATE INDEX CONCURRENTLY`` left ``index_name`` INVALID."""
+    row = conn.execute(
+        text(
+            "SELECT NOT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name"
+        ),
+        {"name": index_name},
+    ).first()
+    return bool(row and row[0])
+
+
+def migrate(database_url: str) -> None:
+    engine = create_engine(database_url)
+    dialect = engine.dialect.name
+    logger.info("Migrating %s (dialect=%s)", database_url, dialect)
+
+    if dialect == "postgresql":
+        # CONCURRENTLY cannot run inside a transaction block.
+        conn_cm = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        concurrently = "CONCURRENTLY "
+    else:
+        conn_cm = engine.begin()
+        concurrently = ""
+
+    # Direct f-string DDL: table / index / column names are repo-local
+    # constants (no user input), as in migrate_0034 / migrate_0042.
+    with conn_cm as conn:
+        created: list[str] = []
+        for table, index_name, columns in NEW_INDEXES:
+            if _index_exists(conn, table, index_name):
+                if dialect != "postgresql" or not _pg_index_is_invalid(conn, index_name):
+                    continue
+                logger.warning("Rebuilding INVALID index %s", index_name)
+                conn.execute(text(f"DROP INDEX {concurrently}{index_name}"))
+            conn.execute(
+                text(f"CREATE INDEX {concurrently}{index_name} ON {table} ({columns})")
+            )
+            created.append(index_name)
+        if created:
+            logger.info("Created indexes: %s", created)
+        else:
+            logger.info("All 0102 indexes already present")
+
+        dropped: list[str] = []
+        for table, index_name in OLD_INDEXES:
+            if _index_exists(conn, table, index_name):
+                conn.execute(text(f"DROP INDEX {concurrently}{index_name}"))
+                dropped.append(index_name)
+        if dropped:
+            logger.info("Dropped superseded indexes: %s", dropped)
+
+        for table in sorted({table for table, _, _ in NEW_INDEXES}):
+            conn.execute(text(f"ANALYZE {table}"))
+
+    logger.info("Migration complete")
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", required=True)
+    args = parser.parse_args()
+    migrate(args.database_url)
+
+
+if __name__ == "__main__":
+    main()
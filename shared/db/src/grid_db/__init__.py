@@ -14,6 +14,7 @@ from grid_db.models import (
     Strategy,
     Run,
     TickerSnapshot,
+    TickerRollup,
     PublicTrade,
     PrivateExecution,
     Order,
@@ -37,6 +38,7 @@ from grid_db.repositories import (
     StrategyRepository,
     RunRepository,
     TickerSnapshotRepository,
+    TickerRollupRepository,
     PublicTradeRepository,
     PrivateExecutionRepository,
     OrderRepository,
@@ -61,6 +63,7 @@ __all__ = [
     "Run",
     "RunType",
     "TickerSnapshot",
+    "TickerRollup",
     "PublicTrade",
     "PrivateExecution",
     "Order",
@@ -75,6 +78,7 @@ __all__ = [
     "StrategyRepository",
     "RunRepository",
     "TickerSnapshotRepository",
+    "TickerRollupRepository",
     "PublicTradeRepository",
     "PrivateExecutionRepository",
     "OrderRepository",
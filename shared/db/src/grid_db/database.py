@@ -119,7 +119,28 @@ class DatabaseFactory:
         return engine
 
     def create_tables(self) -> None:
-        """Create all tables defined in models."""
+        """Create all tables defined in models.
+
+        With ``settings.partition_by_month`` on PostgreSQL, the time-series
+        tables are created as monthly partitioned parents instead, after
+        the ``runs`` table their foreign keys point at, and partitions are
+        pre-created ahead of the current month (feature 0104).
+        """
+        if self.settings.partition_by_month and self.engine.dialect.name == "postgresql":
+            from grid_db.partitioning import (
+                PARTITIONED_TABLES,
+                create_partitioned_tables,
+                ensure_partitions,
+            )
+
+            with self.engine.begin() as conn:
+                Base.metadata.create_all(bind=conn, tables=[
+                    table for table in Base.metadata.sorted_tables
+                    if table.name not in PARTITIONED_TABLES
+                ])
+                create_partitioned_tables(conn)
+                ensure_partitions(conn)
+            return
         Base.metadata.create_all(bind=self.engine)
 
     def drop_tables(self) -> None:
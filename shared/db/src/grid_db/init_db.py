@@ -2,20 +2,31 @@
 
 Usage:
     python -m grid_db.init_db
+    python -m grid_db.init_db --partition-by-month --retention-months 6  # cron
 
 Environment variables:
     GRIDBOT_DB_TYPE: 'sqlite' (default) or 'postgresql'
     GRIDBOT_DB_NAME: Database name or file path
     GRIDBOT_DB_HOST, GRIDBOT_DB_PORT, GRIDBOT_DB_USER, GRIDBOT_DB_PASSWORD: PostgreSQL config
+    GRIDBOT_PARTITION_BY_MONTH: 'true' for monthly partitioned tables (PostgreSQL)
 """
 
 import argparse
 import sys
+from datetime import UTC, datetime
+from typing import Optional
 
 from sqlalchemy import inspect
 
 from grid_db.settings import DatabaseSettings
 from grid_db.database import DatabaseFactory
+from grid_db.partitioning import (
+    DEFAULT_MONTHS_AHEAD,
+    add_months,
+    drop_partitions_before,
+    ensure_partitions,
+    month_start,
+)
 
 
 def initialize_database(settings: DatabaseSettings = None) -> DatabaseFactory:
@@ -33,6 +44,24 @@ def initialize_database(settings: DatabaseSettings = None) -> DatabaseFactory:
     return db
 
 
+def _maintain_partitions(
+    db: DatabaseFactory, months_ahead: int, retention_months: Optional[int] = None
+) -> None:
+    """Extend the partition horizon and apply retention (feature 0104)."""
+    with db.engine.begin() as conn:
+        created = ensure_partitions(conn, months_ahead=months_ahead)
+        dropped = []
+        if retention_months is not None:
+            cutoff = add_months(month_start(datetime.now(UTC)), -retention_months)
+            dropped = drop_partitions_before(conn, cutoff)
+    print(f"Partitions created: {len(created)}")
+    for name in created:
+        print(f"  + {name}")
+    print(f"Partitions dropped: {len(dropped)}")
+    for name in dropped:
+        print(f"  - {name}")
+
+
 def main():
     """CLI entry point for database initialization."""
     parser = argparse.ArgumentParser(
@@ -47,6 +76,22 @@ def main():
         "--db-name",
         help="Database name or file path",
     )
+    parser.add_argument(
+        "--partition-by-month",
+        action="store_true",
+        help="PostgreSQL: create time-series tables partitioned by month (feature 0104)",
+    )
+    parser.add_argument(
+        "--months-ahead",
+        type=int,
+        default=DEFAULT_MONTHS_AHEAD,
+        help=f"Monthly partitions to pre-create ahead (default: {DEFAULT_MONTHS_AHEAD})",
+    )
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        help="Detach and drop monthly partitions older than N whole months",
+    )
     parser.add_argument(
         "--echo-sql",
         action="store_true",
@@ -62,6 +107,8 @@ def main():
         settings_kwargs["db_name"] = args.db_name
     if args.echo_sql:
         settings_kwargs["echo_sql"] = True
+    if args.partition_by_month:
+        settings_kwargs["partition_by_month"] = True
 
     settings = DatabaseSettings(**settings_kwargs)
 
@@ -74,6 +121,8 @@ def main():
         inspector = inspect(db.engine)
         for table in inspector.get_table_names():
             print(f"  - {table}")
+        if settings.partition_by_month and db.engine.dialect.name == "postgresql":
+            _maintain_partitions(db, args.months_ahead, args.retention_months)
         return 0
     except Exception as e:
         print(f"Error initializing database: {e}", file=sys.stderr)
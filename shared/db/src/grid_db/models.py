@@ -1,9 +1,10 @@
 """SQLAlchemy ORM models for multi-tenant grid bot database.
 
-Supports 12 tables:
+Supports 13 tables:
 - Core entities: users, bybit_accounts, api_credentials, strategies, runs
 - Data tables: ticker_snapshots, public_trades, private_executions, orders,
   position_snapshots, wallet_snapshots, grid_state_snapshots
+- Maintenance: ticker_rollups
 """
 
 from datetime import datetime, UTC
@@ -268,6 +269,40 @@ class TickerSnapshot(Base):
     )
 
 
+class TickerRollup(Base):
+    """A ``ticker_snapshots`` range thinned by ticker compaction (feature 0103).
+
+    Inside ``[start_ts, end_ts)`` only the first, lowest-``last_price``,
+    highest-``last_price`` and last row of each ``bucket_seconds`` bucket
+    survive, verbatim. Every price level the raw stream crossed is still
+    crossed, but intra-bucket timing is coarser; readers consult this table
+    to report which part of a window is rolled up. Dedupe of consecutive
+    identical L1 states keeps the replayed stream (and a heartbeat row) and
+    is not recorded here.
+    """
+
+    __tablename__ = "ticker_rollups"
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    symbol: Mapped[str] = mapped_column(String(20), nullable=False)
+    start_ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    end_ts: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    bucket_seconds: Mapped[int] = mapped_column(Integer, nullable=False)
+    rows_before: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    rows_after: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=utc_now, nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_ticker_rollups_symbol_start_ts", "symbol", "start_ts"),
+    )
+
+
 class PrivateExecution(Base):
     """Private execution data - ground truth for validation."""
 
@@ -301,7 +336,15 @@ class PrivateExecution(Base):
 
     __table_args__ = (
         Index("ix_private_executions_account_exchange_ts", "account_id", "exchange_ts"),
-        Index("ix_private_executions_run_id", "run_id"),
+        # 0102: replaces the bare run_id index. get_by_run_range /
+        # iter_by_run_range filter run_id + exchange_ts range and sort by
+        # (exchange_ts, exec_id); this order serves the filter and the sort
+        # from the index, with no temp b-tree. run_id stays the leading
+        # column, so the FK cascade lookup is still indexed.
+        Index(
+            "ix_private_executions_run_ts_exec",
+            "run_id", "exchange_ts", "exec_id",
+        ),
         Index("ix_private_executions_exec_id", "exec_id", unique=True),
     )
 
@@ -346,10 +389,18 @@ class Order(Base):
 
     __table_args__ = (
         Index("ix_orders_account_exchange_ts", "account_id", "exchange_ts"),
-        Index("ix_orders_run_id", "run_id"),
-        # 0029: supports OrderRepository.get_active_at(run_id, account_id, symbol, at_ts).
-        Index("ix_orders_run_account_symbol_ts",
-              "run_id", "account_id", "symbol", "exchange_ts"),
+        # 0102: replaces ix_orders_run_id; get_by_run_range filters and sorts
+        # on exchange_ts within a run.
+        Index("ix_orders_run_ts", "run_id", "exchange_ts"),
+        # 0102: replaces the 0029 (run, account, symbol, ts) index for
+        # OrderRepository.get_active_at. order_id before exchange_ts lets the
+        # per-order max(exchange_ts) subquery walk the index in group order
+        # (covering: no table reads, no temp b-tree) and makes the join back
+        # to the latest row a full-equality index probe.
+        Index(
+            "ix_orders_run_account_symbol_order_ts",
+            "run_id", "account_id", "symbol", "order_id", "exchange_ts",
+        ),
         UniqueConstraint("account_id", "order_id", "exchange_ts",
                         name="uq_orders_account_order_ts"),
     )
@@ -454,6 +505,14 @@ class GridStateSnapshot(Base):
             "ix_grid_state_snapshots_lookup",
             "run_id", "account_id", "strat_id", "exchange_ts", "id",
         ),
+        # 0102: get_at_or_before (replay seed) is cross-run, so the run_id-led
+        # lookup index cannot serve it; this one matches its equality
+        # predicates, the exchange_ts bound and the (exchange_ts, id) DESC
+        # order, so the first qualifying row comes off the index.
+        Index(
+            "ix_grid_state_snapshots_account_strat_symbol_ts",
+            "account_id", "strat_id", "symbol", "exchange_ts", "id",
+        ),
         # Partial unique index: blocks race-double-inserts at the same
         # (run, account, strat, ts, fingerprint) while allowing repeats
         # across different exchange_ts values. Migration creates the
@@ -0,0 +1,92 @@
+"""Spawned worker pools that log through the parent (``--jobs`` drivers).
+
+The importer and live_check fan independent per-symbol / per-strat work out
+to worker processes. Both need the same plumbing: a ``spawn`` pool (a
+forked child could inherit the parent's logging thread mid-write, and
+engines do not cross a process boundary anyway, so workers open their own
+``DatabaseFactory``), and a log queue drained by a ``QueueListener`` on the
+parent's handlers, so the console shows one merged stream.
+"""
+
+from __future__ import annotations
+
+import logging
+import logging.handlers
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+
+def spawn_context() -> Any:
+    """The multiprocessing context every pool here uses.
+
+    Shared-memory objects handed to workers (locks, values) must come from
+    it.
+    """
+    return multiprocessing.get_context("spawn")
+
+
+def _init_worker(
+    log_queue: Any,
+    level: int,
+    quiet_loggers: Sequence[str],
+    initializer: Optional[Callable[..., None]],
+    initargs: tuple,
+) -> None:
+    """Route worker logging to the parent's queue, then run ``initializer``."""
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.setLevel(level)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    for name in quiet_loggers:
+        logging.getLogger(name).setLevel(logging.WARNING)
+    if initializer is not None:
+        initializer(*initargs)
+
+
+@contextmanager
+def worker_pool(
+    max_workers: int,
+    *,
+    level: Optional[int] = None,
+    quiet_loggers: Sequence[str] = (),
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple = (),
+) -> Iterator[ProcessPoolExecutor]:
+    """A spawned ``ProcessPoolExecutor`` whose workers log via the parent.
+
+    Submitted functions (and ``initializer``) must be module-level so they
+    pickle by reference.
+
+    Args:
+        max_workers: Worker processes.
+        level: Workers' root log level; defaults to the parent's effective
+            level.
+        quiet_loggers: Loggers capped at WARNING in the workers.
+        initializer: Run in each worker after logging is set up.
+        initargs: Arguments for ``initializer``.
+    """
+    ctx = spawn_context()
+    log_queue = ctx.Queue()
+    root_logger = logging.getLogger()
+    listener = logging.handlers.QueueListener(
+        log_queue, *root_logger.handlers, respect_handler_level=True
+    )
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(
+                log_queue,
+                root_logger.getEffectiveLevel() if level is None else level,
+                tuple(quiet_loggers),
+                initializer,
+                initargs,
+            ),
+        ) as pool:
+            yield pool
+    finally:
+        listener.stop()
@@ -0,0 +1,272 @@
+"""Monthly range partitioning of the time-series tables (PostgreSQL only, feature 0104).
+
+With ``DatabaseSettings.partition_by_month`` on a PostgreSQL database,
+``DatabaseFactory.create_tables`` creates the tables in
+``PARTITIONED_TABLES`` as ``PARTITION BY RANGE (exchange_ts)`` parents, with
+one partition per calendar month (UTC) plus a ``DEFAULT`` catch-all, and
+pre-creates partitions ``DEFAULT_MONTHS_AHEAD`` months ahead on every call —
+so each gridbot / recorder start extends the horizon. Retention is
+:func:`drop_partitions_before`: detach a whole month, then drop it, instead
+of a slow ``DELETE``. ``python -m grid_db.init_db --partition-by-month
+--retention-months N`` runs both from cron. ``scripts/migrate_0104_partition_by_month.py``
+converts an existing database.
+
+PostgreSQL requires every unique constraint on a partitioned table to
+include the partition key, so the parents differ from the ORM tables in
+two ways: the primary key is ``(id, exchange_ts)`` and the unique
+``trade_id`` / ``exec_id`` indexes become ``(trade_id, exchange_ts)`` /
+``(exec_id, exchange_ts)``. An exchange id always comes with the same
+timestamp, so dedupe is unchanged; the bulk inserts pick their
+``ON CONFLICT`` target with :func:`conflict_target`, which reads the layout
+from the catalog once per engine and table. The ORM keeps
+``id`` as its identity (still unique: it comes from one sequence), and
+SQLite never sees any of this.
+
+Range reads (``exchange_ts`` between bounds, or ``<= at_ts`` ordered
+``DESC`` with ``LIMIT 1``) prune to the partitions they touch; lookups with
+no ``exchange_ts`` predicate (``exists_by_exec_id``) probe every
+partition's index.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from datetime import UTC, datetime
+from typing import Iterable, Optional
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Index, MetaData, PrimaryKeyConstraint, Table, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from grid_db.models import Base
+
+logger = logging.getLogger(__name__)
+
+PARTITION_KEY = "exchange_ts"
+PARTITIONED_TABLES: tuple[str, ...] = (
+    "public_trades",
+    "ticker_snapshots",
+    "private_executions",
+    "orders",
+    "position_snapshots",
+    "wallet_snapshots",
+    "grid_state_snapshots",
+)
+DEFAULT_MONTHS_AHEAD = 3
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+
+# engine -> {table: partitioned?}. The layout only changes through
+# migrate_0104, which runs with the writers stopped.
+_layout_cache: WeakKeyDictionary[Engine, dict[str, bool]] = WeakKeyDictionary()
+
+
+def month_start(ts: datetime) -> datetime:
+    """First instant (UTC) of ``ts``'s month; naive values are UTC."""
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=UTC)
+    ts = ts.astimezone(UTC)
+    return datetime(ts.year, ts.month, 1, tzinfo=UTC)
+
+
+def add_months(month: datetime, n: int) -> datetime:
+    """``month`` (a :func:`month_start` value) shifted by ``n`` months."""
+    index = month.year * 12 + month.month - 1 + n
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=UTC)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """``<table>_pYYYYMM``."""
+    return f"{table}_p{month:%Y%m}"
+
+
+def partitioned_table(name: str, metadata: MetaData) -> Table:
+    """Copy of ORM table ``name`` into ``metadata`` as a partitioned parent.
+
+    Primary key and unique indexes are widened with ``exchange_ts``;
+    ``metadata`` must already hold ``runs`` so foreign keys resolve.
+    """
+    table = Base.metadata.tables[name].to_metadata(metadata)
+    key = table.c[PARTITION_KEY]
+    key.primary_key = True
+    table.append_constraint(PrimaryKeyConstraint(*table.primary_key.columns, key))
+    for index in list(table.indexes):
+        if index.unique and not index.columns.contains_column(key):
+            table.indexes.discard(index)
+            # Bound to the copy's columns, the new Index attaches itself.
+            Index(index.name, *index.columns, key, unique=True)
+    table.dialect_kwargs["postgresql_partition_by"] = f"RANGE ({PARTITION_KEY})"
+    return table
+
+
+def _partition_metadata() -> MetaData:
+    metadata = MetaData()
+    Base.metadata.tables["runs"].to_metadata(metadata)
+    return metadata
+
+
+def is_partitioned(conn: Connection, table: str) -> bool:
+    """True if ``table`` exists as a partitioned parent."""
+    return conn.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = :name AND pg_table_is_visible(c.oid)"
+        ),
+        {"name": table},
+    ).first() is not None
+
+
+def conflict_target(session: Session, table: str, column: str) -> list[str]:
+    """``ON CONFLICT`` columns for the unique ``column`` of ``table``.
+
+    ``[column]`` on a plain table, ``[column, "exchange_ts"]`` on a
+    partitioned parent (its unique index carries the partition key).
+    PostgreSQL only.
+    """
+    layouts = _layout_cache.setdefault(session.get_bind().engine, {})
+    if table not in layouts:
+        layouts[table] = is_partitioned(session.connection(), table)
+    return [column, PARTITION_KEY] if layouts[table] else [column]
+
+
+def create_partitioned_tables(
+    conn: Connection, tables: Iterable[str] = PARTITIONED_TABLES
+) -> list[str]:
+    """Create missing ``tables`` as partitioned parents; returns those created.
+
+    Existing tables, partitioned or not, are left alone: converting a heap
+    table is ``migrate_0104``'s job.
+    """
+    metadata = _partition_metadata()
+    created = []
+    for name in tables:
+        if conn.dialect.has_table(conn, name):
+            continue
+        partitioned_table(name, metadata).create(conn)
+        created.append(name)
+    if created:
+        logger.info("Created partitioned tables: %s", created)
+    return created
+
+
+def ensure_partitions(
+    conn: Connection,
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+    now: Optional[datetime] = None,
+    start: Optional[datetime] = None,
+    tables: Iterable[str] = PARTITIONED_TABLES,
+) -> list[str]:
+    """Create monthly partitions from ``start`` through ``months_ahead`` months past ``now``.
+
+    ``start`` defaults to ``now``'s month. Also creates each parent's
+    ``DEFAULT`` partition, which catches rows outside every monthly range
+    (clock skew, a long-running process outliving the horizon). PostgreSQL
+    refuses to create a monthly partition over rows sitting in it, so such
+    rows are moved into the new partition (logged as a warning). Tables
+    that are not partitioned are skipped.
+
+    Returns:
+        Names of the partitions created.
+    """
+    first = month_start(start or now or datetime.now(UTC))
+    last = add_months(month_start(now or datetime.now(UTC)), months_ahead)
+    created = []
+    for table in tables:
+        if not is_partitioned(conn, table):
+            continue
+        month = first
+        while month <= last:
+            name = partition_name(table, month)
+            if not conn.dialect.has_table(conn, name):
+                _create_partition(conn, table, name, month)
+                created.append(name)
+            month = add_months(month, 1)
+        conn.execute(text(f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"))
+    if created:
+        logger.info("Created partitions: %s", created)
+    return created
+
+
+def _create_partition(conn: Connection, table: str, name: str, month: datetime) -> None:
+    """Create partition ``name`` for ``month``, moving its rows out of ``DEFAULT``."""
+    # Direct f-string DDL: names derive from repo-local table constants and
+    # datetimes, never user input.
+    bounds = {"lo": month, "hi": add_months(month, 1)}
+    in_month = f"{PARTITION_KEY} >= :lo AND {PARTITION_KEY} < :hi"
+    default = f"{table}_default"
+    stranded = 0
+    if conn.dialect.has_table(conn, default):
+        stranded = conn.execute(
+            text(f"SELECT count(*) FROM {default} WHERE {in_month}"), bounds,
+        ).scalar()
+    if stranded:
+        logger.warning(
+            "%s: moving %d rows from %s into new partition %s",
+            table, stranded, default, name,
+        )
+        conn.execute(text(
+            f"CREATE TEMP TABLE partition_move ON COMMIT DROP AS "
+            f"SELECT * FROM {default} WHERE {in_month}"
+        ), bounds)
+        conn.execute(text(f"DELETE FROM {default} WHERE {in_month}"), bounds)
+    conn.execute(text(
+        f"CREATE TABLE {name} PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month.isoformat()}') "
+        f"TO ('{add_months(month, 1).isoformat()}')"
+    ))
+    if stranded:
+        # ``DEFAULT`` has the parent's column order, so ``SELECT *`` lines up.
+        conn.execute(text(f"INSERT INTO {table} SELECT * FROM partition_move"))
+        conn.execute(text("DROP TABLE partition_move"))
+
+
+def monthly_partitions(conn: Connection, table: str) -> dict[str, datetime]:
+    """Attached monthly partitions of ``table``: name -> month start."""
+    rows = conn.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent "
+            "WHERE p.relname = :name AND pg_table_is_visible(p.oid)"
+        ),
+        {"name": table},
+    ).scalars()
+    partitions = {}
+    for name in rows:
+        match = _PARTITION_SUFFIX.search(name)
+        if match and name == f"{table}{match.group(0)}":
+            partitions[name] = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=UTC)
+    return partitions
+
+
+def drop_partitions_before(
+    conn: Connection,
+    cutoff: datetime,
+    tables: Iterable[str] = PARTITIONED_TABLES,
+) -> list[str]:
+    """Detach and drop every monthly partition that ends at or before ``cutoff``.
+
+    Only whole months go: the partition holding ``cutoff`` is kept, as is
+    the ``DEFAULT`` partition. Each month costs a brief parent lock for the
+    detach and a file unlink for the drop, however many rows it held.
+
+    Returns:
+        Names of the partitions dropped.
+    """
+    boundary = month_start(cutoff)
+    dropped = []
+    for table in tables:
+        if not is_partitioned(conn, table):
+            continue
+        for name, month in sorted(monthly_partitions(conn, table).items()):
+            if add_months(month, 1) > boundary:
+                continue
+            conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            conn.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+    if dropped:
+        logger.info("Dropped partitions: %s", dropped)
+    return dropped
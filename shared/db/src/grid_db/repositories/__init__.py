@@ -17,6 +17,7 @@ from grid_db.repositories.identity import (
 )
 from grid_db.repositories.market_data import (
     PublicTradeRepository,
+    TickerRollupRepository,
     TickerSnapshotRepository,
 )
 from grid_db.repositories.execution import (
@@ -39,6 +40,7 @@ __all__ = [
     "RunRepository",
     "PublicTradeRepository",
     "TickerSnapshotRepository",
+    "TickerRollupRepository",
     "PrivateExecutionRepository",
     "OrderRepository",
     "PositionSnapshotRepository",
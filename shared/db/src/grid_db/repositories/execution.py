@@ -1,7 +1,7 @@
 """Execution repositories (split from repositories.py, feature 0081 / issue #184)."""
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Iterator, Optional, List
 
 from sqlalchemy import func, tuple_, insert
 from sqlalchemy.orm import Session
@@ -11,6 +11,7 @@ from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from grid_db.models import (
     PrivateExecution, Order,
 )
+from grid_db.partitioning import conflict_target
 from grid_db.repositories.base import BaseRepository
 
 
@@ -55,6 +56,58 @@ class PrivateExecutionRepository(BaseRepository[PrivateExecution]):
             .all()
         )
 
+    def iter_by_run_range(
+        self,
+        run_id: str,
+        start_ts: datetime,
+        end_ts: datetime,
+        symbol: Optional[str] = None,
+        batch_size: int = 5000,
+    ) -> Iterator[PrivateExecution]:
+        """Stream executions for a run in ``get_by_run_range`` order.
+
+        Pages by keyset on ``(exchange_ts, exec_id)`` so each query touches at
+        most ``batch_size`` rows and memory stays flat on long windows. Rows
+        of a page are expunged before the next one is fetched.
+
+        Args:
+            run_id: The run ID.
+            start_ts: Start timestamp (inclusive).
+            end_ts: End timestamp (inclusive).
+            symbol: Optional symbol filter, applied in SQL.
+            batch_size: Rows per page.
+
+        Yields:
+            PrivateExecution instances ordered by ``(exchange_ts, exec_id)``.
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        cursor: Optional[tuple[datetime, str]] = None
+        while True:
+            query = self.session.query(PrivateExecution).filter(
+                PrivateExecution.run_id == run_id,
+                PrivateExecution.exchange_ts >= start_ts,
+                PrivateExecution.exchange_ts <= end_ts,
+            )
+            if symbol:
+                query = query.filter(PrivateExecution.symbol == symbol)
+            if cursor is not None:
+                query = query.filter(
+                    tuple_(PrivateExecution.exchange_ts, PrivateExecution.exec_id)
+                    > tuple_(*cursor)
+                )
+            rows = (
+                query.order_by(PrivateExecution.exchange_ts, PrivateExecution.exec_id)
+                .limit(batch_size)
+                .all()
+            )
+            for row in rows:
+                self.session.expunge(row)
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            cursor = (rows[-1].exchange_ts, rows[-1].exec_id)
+
     def get_last_execution_ts(self, account_id: str) -> Optional[datetime]:
         """Get timestamp of the last execution for an account.
 
@@ -127,7 +180,11 @@ class PrivateExecutionRepository(BaseRepository[PrivateExecution]):
         db_dialect = self.session.get_bind().dialect.name
         if db_dialect == "postgresql":
             stmt = postgresql_insert(PrivateExecution).values(executions_data)
-            stmt = stmt.on_conflict_do_nothing(index_elements=["exec_id"])
+            # 0104: a month-partitioned table's unique index also
+            # carries exchange_ts.
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=conflict_target(self.session, "private_executions", "exec_id")
+            )
         elif db_dialect == "sqlite":
             stmt = sqlite_insert(PrivateExecution).values(executions_data)
             stmt = stmt.on_conflict_do_nothing(index_elements=["exec_id"])
@@ -4,14 +4,15 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List
 
-from sqlalchemy import insert
+from sqlalchemy import delete, insert, inspect
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 
 from grid_db.models import (
-    PublicTrade, TickerSnapshot,
+    PublicTrade, TickerRollup, TickerSnapshot,
 )
+from grid_db.partitioning import conflict_target
 from grid_db.repositories.base import BaseRepository
 
 
@@ -103,7 +104,11 @@ class PublicTradeRepository(BaseRepository[PublicTrade]):
         db_dialect = self.session.get_bind().dialect.name
         if db_dialect == "postgresql":
             stmt = postgresql_insert(PublicTrade).values(trades_data)
-            stmt = stmt.on_conflict_do_nothing(index_elements=["trade_id"])
+            # 0104: a month-partitioned table's unique index also
+            # carries exchange_ts.
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=conflict_target(self.session, "public_trades", "trade_id")
+            )
         elif db_dialect == "sqlite":
             stmt = sqlite_insert(PublicTrade).values(trades_data)
             stmt = stmt.on_conflict_do_nothing(index_elements=["trade_id"])
@@ -226,4 +231,51 @@ class TickerSnapshotRepository(BaseRepository[TickerSnapshot]):
         self.session.flush()
         return result.rowcount if result.rowcount else 0
 
+    def delete_by_ids(self, ids: List[int]) -> int:
+        """Delete ticker rows by primary key (ticker compaction, feature 0103).
+
+        Args:
+            ids: Row ids to delete; callers chunk them to stay under the
+                driver's bound-parameter limit.
+
+        Returns:
+            Number of rows deleted.
+        """
+        if not ids:
+            return 0
+        result = self.session.execute(
+            delete(TickerSnapshot).where(TickerSnapshot.id.in_(ids))
+        )
+        return result.rowcount if result.rowcount else 0
+
+
+class TickerRollupRepository(BaseRepository[TickerRollup]):
+    """Repository for TickerRollup (compacted ticker range) records."""
 
+    def __init__(self, session: Session):
+        super().__init__(session, TickerRollup)
+
+    def get_overlapping(
+        self, symbol: str, start_ts: datetime, end_ts: datetime
+    ) -> List[TickerRollup]:
+        """Rolled-up ranges for ``symbol`` that intersect ``[start_ts, end_ts]``.
+
+        A DB that was never compacted may predate the ``ticker_rollups``
+        table (and read-only sessions cannot create it); that reads as "no
+        rolled-up ranges" rather than an error.
+
+        Returns:
+            Matching TickerRollup rows ordered by ``start_ts``.
+        """
+        if not inspect(self.session.connection()).has_table(TickerRollup.__tablename__):
+            return []
+        return (
+            self.session.query(TickerRollup)
+            .filter(
+                TickerRollup.symbol == symbol,
+                TickerRollup.start_ts <= end_ts,
+                TickerRollup.end_ts > start_ts,
+            )
+            .order_by(TickerRollup.start_ts)
+            .all()
+        )
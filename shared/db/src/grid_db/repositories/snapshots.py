@@ -326,7 +326,7 @@ class WalletSnapshotRepository(BaseRepository[WalletSnapshot]):
 class GridStateSnapshotRepository(BaseRepository[GridStateSnapshot]):
     """Repository for GridStateSnapshot operations (feature 0047).
 
-    Insert path is single-row with ``ON CONFLICT DO NOTHING`` against the
+    Insert path is multi-row with ``ON CONFLICT DO NOTHING`` against the
     partial unique index ``uq_grid_state_snapshots_fingerprint_at_ts`` (only
     rows with non-NULL ``raw_fingerprint`` participate). The replay loader
     reads back via ``get_at_or_before`` which orders by
@@ -344,18 +344,32 @@ class GridStateSnapshotRepository(BaseRepository[GridStateSnapshot]):
 
         Returns rowcount (0 if dedup'd by the partial unique constraint).
         """
-        snapshot_data = {
-            "run_id": snapshot.run_id,
-            "account_id": snapshot.account_id,
-            "strat_id": snapshot.strat_id,
-            "symbol": snapshot.symbol,
-            "exchange_ts": snapshot.exchange_ts,
-            "local_ts": snapshot.local_ts,
-            "grid_json": snapshot.grid_json,
-            "grid_step": snapshot.grid_step,
-            "grid_count": snapshot.grid_count,
-            "raw_fingerprint": snapshot.raw_fingerprint,
-        }
+        return self.insert_many([snapshot])
+
+    def insert_many(self, snapshots: List[GridStateSnapshot]) -> int:
+        """Insert snapshots as one multi-row ``INSERT ... ON CONFLICT DO NOTHING``.
+
+        Rows are inserted in list order, so ``id`` order matches the
+        writer's FIFO order (the ``get_at_or_before`` tie-break). Returns
+        the number of rows inserted (conflicting rows are skipped).
+        """
+        if not snapshots:
+            return 0
+        snapshots_data = [
+            {
+                "run_id": snapshot.run_id,
+                "account_id": snapshot.account_id,
+                "strat_id": snapshot.strat_id,
+                "symbol": snapshot.symbol,
+                "exchange_ts": snapshot.exchange_ts,
+                "local_ts": snapshot.local_ts,
+                "grid_json": snapshot.grid_json,
+                "grid_step": snapshot.grid_step,
+                "grid_count": snapshot.grid_count,
+                "raw_fingerprint": snapshot.raw_fingerprint,
+            }
+            for snapshot in snapshots
+        ]
 
         # index_where MUST match the partial-index WHERE predicate or
         # PostgreSQL won't bind the conflict target to the partial constraint
@@ -367,19 +381,19 @@ class GridStateSnapshotRepository(BaseRepository[GridStateSnapshot]):
 
         db_dialect = self.session.get_bind().dialect.name
         if db_dialect == "postgresql":
-            stmt = postgresql_insert(GridStateSnapshot).values(**snapshot_data)
+            stmt = postgresql_insert(GridStateSnapshot).values(snapshots_data)
             stmt = stmt.on_conflict_do_nothing(
                 index_elements=index_elements,
                 index_where=index_where,
             )
         elif db_dialect == "sqlite":
-            stmt = sqlite_insert(GridStateSnapshot).values(**snapshot_data)
+            stmt = sqlite_insert(GridStateSnapshot).values(snapshots_data)
             stmt = stmt.on_conflict_do_nothing(
                 index_elements=index_elements,
                 index_where=index_where,
             )
         else:
-            stmt = insert(GridStateSnapshot).values(**snapshot_data)
+            stmt = insert(GridStateSnapshot).values(snapshots_data)
 
         result = self.session.execute(stmt)
         self.session.flush()
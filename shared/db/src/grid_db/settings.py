@@ -38,6 +38,12 @@ class DatabaseSettings(BaseSettings):
     # hide new writer rows from long-lived readers (live_check --watch).
     read_only: bool = False
 
+    # Monthly range partitioning (feature 0104, PostgreSQL only; ignored on
+    # SQLite). create_tables() creates the time-series tables as partitioned
+    # parents and pre-creates upcoming monthly partitions. See
+    # grid_db.partitioning.
+    partition_by_month: bool = False
+
     # Debug
     echo_sql: bool = False
 
@@ -0,0 +1,109 @@
+"""Tests for the feature 0102 query-index migration.
+
+Runs against a SQLite DB built with the pre-0102 index set. The
+PostgreSQL ``CONCURRENTLY`` path requires a live server and is skipped by
+intent.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from grid_db.database import DatabaseFactory
+from grid_db.settings import DatabaseSettings
+
+
+_MIGRATION_PATH = (
+    Path(__file__).resolve().parents[3]
+    / "scripts"
+    / "migrate_0102_query_indexes.py"
+)
+
+_NEW = {
+    "private_executions": {"ix_private_executions_run_ts_exec"},
+    "orders": {"ix_orders_run_ts", "ix_orders_run_account_symbol_order_ts"},
+    "grid_state_snapshots": {"ix_grid_state_snapshots_account_strat_symbol_ts"},
+}
+_OLD = {
+    "private_executions": {"ix_private_executions_run_id"},
+    "orders": {"ix_orders_run_id", "ix_orders_run_account_symbol_ts"},
+}
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location(
+        "migrate_0102_query_indexes", _MIGRATION_PATH,
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _index_names(database_url: str, table: str) -> set[str]:
+    engine = create_engine(database_url)
+    try:
+        return {i["name"] for i in inspect(engine).get_indexes(table)}
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture
+def legacy_url(tmp_path: Path) -> str:
+    """Current schema with the 0102 indexes swapped back to the pre-0102 set."""
+    url = f"sqlite:///{tmp_path / 'recorder.db'}"
+    factory = DatabaseFactory(DatabaseSettings(database_url=url))
+    factory.create_tables()
+    factory.engine.dispose()
+
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        for names in _NEW.values():
+            for name in names:
+                conn.execute(text(f"DROP INDEX {name}"))
+        conn.execute(text("CREATE INDEX ix_private_executions_run_id ON private_executions (run_id)"))
+        conn.execute(text("CREATE INDEX ix_orders_run_id ON orders (run_id)"))
+        conn.execute(
+            text(
+                "CREATE INDEX ix_orders_run_account_symbol_ts ON orders "
+                "(run_id, account_id, symbol, exchange_ts)"
+            )
+        )
+    engine.dispose()
+    return url
+
+
+class TestMigrate0102:
+    """Migration `scripts/migrate_0102_query_indexes.py`."""
+
+    def test_swaps_legacy_indexes(self, legacy_url: str) -> None:
+        _load_migration().migrate(legacy_url)
+
+        for table, names in _NEW.items():
+            indexes = _index_names(legacy_url, table)
+            assert names <= indexes
+            assert indexes.isdisjoint(_OLD.get(table, set()))
+
+    def test_is_idempotent(self, legacy_url: str) -> None:
+        module = _load_migration()
+        module.migrate(legacy_url)
+        module.migrate(legacy_url)  # must not raise
+
+        for table, names in _NEW.items():
+            assert names <= _index_names(legacy_url, table)
+
+    def test_result_matches_model_indexes(self, legacy_url: str, tmp_path: Path) -> None:
+        """A migrated DB ends up with exactly the indexes ``create_tables`` builds."""
+        _load_migration().migrate(legacy_url)
+
+        fresh_url = f"sqlite:///{tmp_path / 'fresh.db'}"
+        factory = DatabaseFactory(DatabaseSettings(database_url=fresh_url))
+        factory.create_tables()
+        factory.engine.dispose()
+
+        for table in _NEW:
+            assert _index_names(legacy_url, table) == _index_names(fresh_url, table)
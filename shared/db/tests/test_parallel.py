@@ -0,0 +1,53 @@
+"""Tests for the spawned worker pool shared by the ``--jobs`` drivers."""
+
+import logging
+
+import pytest
+
+from grid_db.parallel import worker_pool
+
+
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def collected():
+    handler = _Collect()
+    root = logging.getLogger()
+    old_level = root.level
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    try:
+        yield handler.records
+    finally:
+        root.removeHandler(handler)
+        root.setLevel(old_level)
+
+
+class TestWorkerPool:
+    def test_worker_logs_reach_parent_handlers(self, collected):
+        with worker_pool(
+            2,
+            quiet_loggers=("grid_db.test.noisy",),
+            initializer=logging.getLogger("grid_db.test.init").warning,
+            initargs=("worker ready",),
+        ) as pool:
+            pool.submit(logging.getLogger("grid_db.test").info, "hello %s", "parent").result()
+            pool.submit(logging.getLogger("grid_db.test.noisy").info, "dropped").result()
+
+        messages = [(r.name, r.getMessage()) for r in collected]
+        assert ("grid_db.test", "hello parent") in messages
+        assert ("grid_db.test.init", "worker ready") in messages
+        assert all(name != "grid_db.test.noisy" for name, _ in messages)
+
+    def test_results_and_errors_cross_the_process_boundary(self):
+        with worker_pool(2) as pool:
+            assert pool.submit(divmod, 7, 2).result() == (3, 1)
+            with pytest.raises(ZeroDivisionError):
+                pool.submit(divmod, 1, 0).result()
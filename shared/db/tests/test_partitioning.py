@@ -0,0 +1,233 @@
+"""Tests for monthly range partitioning (feature 0104).
+
+Covers the month arithmetic, the partitioned-parent DDL as compiled for
+PostgreSQL, and that the SQLite paths ignore the feature. The
+``postgresql``-marked tests run against the server at
+``GRIDBOT_TEST_PG_URL`` (each in a throwaway schema) and are skipped when
+it is unset.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import uuid
+from datetime import UTC, datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, make_url, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from grid_db.database import DatabaseFactory
+from grid_db.models import Base, PublicTrade
+from grid_db.partitioning import (
+    PARTITIONED_TABLES,
+    _partition_metadata,
+    add_months,
+    ensure_partitions,
+    is_partitioned,
+    monthly_partitions,
+    month_start,
+    partition_name,
+    partitioned_table,
+)
+from grid_db.repositories import PublicTradeRepository
+from grid_db.settings import DatabaseSettings
+
+
+_MIGRATION_PATH = (
+    Path(__file__).resolve().parents[3]
+    / "scripts"
+    / "migrate_0104_partition_by_month.py"
+)
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location(
+        "migrate_0104_partition_by_month", _MIGRATION_PATH,
+    )
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _compile(element) -> str:
+    return " ".join(str(element.compile(dialect=postgresql.dialect())).split())
+
+
+class TestMonthArithmetic:
+    def test_month_start_truncates_in_utc(self):
+        ts = datetime(2026, 3, 1, 1, 30, tzinfo=timezone(timedelta(hours=2)))
+        assert month_start(ts) == datetime(2026, 2, 1, tzinfo=UTC)
+
+    def test_month_start_treats_naive_as_utc(self):
+        assert month_start(datetime(2026, 5, 31, 23, 59)) == datetime(2026, 5, 1, tzinfo=UTC)
+
+    def test_add_months_crosses_years(self):
+        month = datetime(2026, 11, 1, tzinfo=UTC)
+        assert add_months(month, 2) == datetime(2027, 1, 1, tzinfo=UTC)
+        assert add_months(month, -11) == datetime(2025, 12, 1, tzinfo=UTC)
+
+    def test_partition_name(self):
+        assert partition_name("orders", datetime(2026, 7, 1, tzinfo=UTC)) == "orders_p202607"
+
+
+class TestPartitionedTable:
+    def test_parent_ddl_partitions_by_exchange_ts(self):
+        metadata = _partition_metadata()
+        for name in PARTITIONED_TABLES:
+            ddl = _compile(CreateTable(partitioned_table(name, metadata)))
+            assert "PRIMARY KEY (id, exchange_ts)" in ddl, name
+            assert ddl.endswith("PARTITION BY RANGE (exchange_ts)"), name
+
+    def test_unique_indexes_include_partition_key(self):
+        metadata = _partition_metadata()
+        for name in PARTITIONED_TABLES:
+            table = partitioned_table(name, metadata)
+            for index in table.indexes:
+                if index.unique:
+                    assert index.columns.contains_column(table.c.exchange_ts), index.name
+        ddl = _compile(CreateIndex(
+            next(i for i in metadata.tables["private_executions"].indexes
+                 if i.name == "ix_private_executions_exec_id")
+        ))
+        assert "(exec_id, exchange_ts)" in ddl
+
+    def test_orm_tables_unchanged(self):
+        partitioned_table("public_trades", _partition_metadata())
+
+        table = Base.metadata.tables["public_trades"]
+        assert [c.name for c in table.primary_key.columns] == ["id"]
+        trade_id = next(i for i in table.indexes if i.name == "ix_public_trades_trade_id")
+        assert [c.name for c in trade_id.columns] == ["trade_id"]
+        assert "PARTITION BY" not in _compile(CreateTable(table))
+
+
+class TestSqliteIgnoresPartitioning:
+    def test_create_tables_builds_plain_tables(self, tmp_path: Path):
+        url = f"sqlite:///{tmp_path / 'grid.db'}"
+        factory = DatabaseFactory(DatabaseSettings(database_url=url, partition_by_month=True))
+        factory.create_tables()
+
+        tables = set(inspect(factory.engine).get_table_names())
+        factory.engine.dispose()
+        assert set(Base.metadata.tables) == tables
+
+    def test_migration_is_a_no_op(self, tmp_path: Path):
+        url = f"sqlite:///{tmp_path / 'grid.db'}"
+        factory = DatabaseFactory(DatabaseSettings(database_url=url))
+        factory.create_tables()
+        before = set(inspect(factory.engine).get_table_names())
+        factory.engine.dispose()
+
+        _load_migration().migrate(url)
+
+        factory = DatabaseFactory(DatabaseSettings(database_url=url))
+        assert set(inspect(factory.engine).get_table_names()) == before
+        factory.engine.dispose()
+
+
+@pytest.fixture
+def pg_url():
+    """URL of a fresh schema on the GRIDBOT_TEST_PG_URL server, dropped afterwards."""
+    base = os.environ.get("GRIDBOT_TEST_PG_URL")
+    if not base:
+        pytest.skip("GRIDBOT_TEST_PG_URL not set")
+    schema = f"test_0104_{uuid.uuid4().hex[:8]}"
+    admin = create_engine(base)
+    with admin.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+    url = make_url(base).update_query_dict({"options": f"-csearch_path={schema}"})
+    try:
+        yield url.render_as_string(hide_password=False)
+    finally:
+        with admin.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+        admin.dispose()
+
+
+def _trade(trade_id: str, ts: datetime) -> PublicTrade:
+    return PublicTrade(
+        symbol="BTCUSDT", trade_id=trade_id, exchange_ts=ts, local_ts=ts,
+        side="Buy", price=Decimal("100"), size=Decimal("0.1"),
+    )
+
+
+def _insert_twice(factory: DatabaseFactory, trades: list[PublicTrade]) -> tuple[int, int]:
+    counts = []
+    for _ in range(2):
+        with factory.get_session() as session:
+            counts.append(PublicTradeRepository(session).bulk_insert(
+                [_trade(t.trade_id, t.exchange_ts) for t in trades]
+            ))
+    return counts[0], counts[1]
+
+
+@pytest.mark.postgresql
+class TestPostgresPartitioning:
+    def test_upsert_skips_duplicates_on_plain_table(self, pg_url):
+        factory = DatabaseFactory(DatabaseSettings(database_url=pg_url))
+        factory.create_tables()
+        now = datetime.now(UTC)
+
+        assert _insert_twice(factory, [_trade("a", now), _trade("b", now)]) == (2, 0)
+        factory.engine.dispose()
+
+    def test_create_tables_partitions_and_upsert_dedupes(self, pg_url):
+        settings = DatabaseSettings(database_url=pg_url, partition_by_month=True)
+        factory = DatabaseFactory(settings)
+        factory.create_tables()
+        now = datetime.now(UTC)
+
+        with factory.engine.connect() as conn:
+            assert is_partitioned(conn, "public_trades")
+            assert partition_name("public_trades", month_start(now)) in monthly_partitions(
+                conn, "public_trades"
+            )
+        assert _insert_twice(factory, [_trade("a", now), _trade("b", now)]) == (2, 0)
+        factory.engine.dispose()
+
+    def test_migration_converts_existing_rows(self, pg_url):
+        factory = DatabaseFactory(DatabaseSettings(database_url=pg_url))
+        factory.create_tables()
+        old = month_start(datetime.now(UTC)) - timedelta(days=40)
+        with factory.get_session() as session:
+            session.add_all([_trade("old", old), _trade("new", datetime.now(UTC))])
+        factory.engine.dispose()
+
+        _load_migration().migrate(pg_url, drop_legacy=True)
+
+        factory = DatabaseFactory(DatabaseSettings(database_url=pg_url))
+        with factory.engine.connect() as conn:
+            assert is_partitioned(conn, "public_trades")
+            assert partition_name("public_trades", month_start(old)) in monthly_partitions(
+                conn, "public_trades"
+            )
+            assert conn.execute(text("SELECT count(*) FROM public_trades")).scalar() == 2
+        assert _insert_twice(factory, [_trade("old", old)]) == (0, 0)
+        factory.engine.dispose()
+
+    def test_ensure_partitions_moves_rows_out_of_default(self, pg_url):
+        factory = DatabaseFactory(DatabaseSettings(database_url=pg_url, partition_by_month=True))
+        factory.create_tables()
+        beyond = add_months(month_start(datetime.now(UTC)), 12) + timedelta(days=3)
+        with factory.get_session() as session:
+            session.add(_trade("late", beyond))
+
+        with factory.engine.begin() as conn:
+            created = ensure_partitions(conn, months_ahead=0, now=beyond)
+        # A second start (create_tables) no longer trips over the moved rows.
+        factory.create_tables()
+
+        name = partition_name("public_trades", month_start(beyond))
+        assert name in created
+        with factory.engine.connect() as conn:
+            assert conn.execute(text(f"SELECT count(*) FROM {name}")).scalar() == 1
+            assert conn.execute(
+                text("SELECT count(*) FROM public_trades_default")
+            ).scalar() == 0
+        factory.engine.dispose()
@@ -0,0 +1,130 @@
+"""Query-plan regression tests for the replay / seed read paths (feature 0102).
+
+Each test runs the real repository method, captures the SQL it emits, and
+asserts SQLite's ``EXPLAIN QUERY PLAN`` searches the intended index — no
+full-table ``SCAN`` and no ``TEMP B-TREE`` sort. A model or query edit that
+silently drops an index off the plan fails here rather than on a multi-GB
+recorder DB. PostgreSQL plans require a live server and are not covered.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from grid_db.repositories import (
+    GridStateSnapshotRepository,
+    OrderRepository,
+    PositionSnapshotRepository,
+    PrivateExecutionRepository,
+    WalletSnapshotRepository,
+)
+
+
+AT_TS = datetime(2026, 5, 1, 12, 0, 0)
+START_TS = datetime(2026, 5, 1, 0, 0, 0)
+
+
+@pytest.fixture
+def query_plan(db, session):
+    """Run a callable; return the query-plan detail lines of every SELECT it issued."""
+
+    def _plan(fn) -> list[str]:
+        statements: list[tuple[str, object]] = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append((statement, parameters))
+
+        event.listen(db.engine, "before_cursor_execute", _capture)
+        try:
+            fn()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", _capture)
+        assert statements, "callable issued no SELECT"
+
+        lines: list[str] = []
+        for statement, parameters in statements:
+            rows = session.connection().exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+            lines.extend(row[-1] for row in rows)
+        return lines
+
+    return _plan
+
+
+def _assert_index_only(lines: list[str], table: str, index: str) -> None:
+    """Every access to ``table`` is an index search on ``index``; no sort step."""
+    accesses = [line for line in lines if f" {table} " in f"{line} "]
+    assert accesses, f"no access to {table} in plan: {lines}"
+    for line in accesses:
+        assert line.startswith("SEARCH"), f"full scan of {table}: {lines}"
+        assert f"INDEX {index} " in line, f"{table} not using {index}: {lines}"
+    assert not any("TEMP B-TREE" in line for line in lines), f"sort step in plan: {lines}"
+
+
+class TestExecutionPlans:
+    def test_get_by_run_range_filters_and_sorts_on_index(self, session, query_plan):
+        repo = PrivateExecutionRepository(session)
+        lines = query_plan(lambda: repo.get_by_run_range("run-1", START_TS, AT_TS))
+        _assert_index_only(lines, "private_executions", "ix_private_executions_run_ts_exec")
+
+    def test_iter_by_run_range_keyset_page_uses_index(self, session, query_plan):
+        repo = PrivateExecutionRepository(session)
+        lines = query_plan(
+            lambda: list(repo.iter_by_run_range("run-1", START_TS, AT_TS, symbol="BTCUSDT"))
+        )
+        _assert_index_only(lines, "private_executions", "ix_private_executions_run_ts_exec")
+
+
+class TestOrderPlans:
+    def test_get_active_at_groups_on_covering_index(self, session, query_plan):
+        repo = OrderRepository(session)
+        lines = query_plan(lambda: repo.get_active_at("run-1", "acct-1", "BTCUSDT", AT_TS))
+        _assert_index_only(lines, "orders", "ix_orders_run_account_symbol_order_ts")
+        # The per-order max(exchange_ts) subquery never touches the table.
+        assert any(
+            "COVERING INDEX ix_orders_run_account_symbol_order_ts" in line for line in lines
+        ), lines
+
+    def test_get_by_run_range_uses_run_ts_index(self, session, query_plan):
+        repo = OrderRepository(session)
+        lines = query_plan(lambda: repo.get_by_run_range("run-1", START_TS, AT_TS))
+        _assert_index_only(lines, "orders", "ix_orders_run_ts")
+
+
+class TestSnapshotSeedPlans:
+    def test_position_latest_before(self, session, query_plan):
+        repo = PositionSnapshotRepository(session)
+        lines = query_plan(
+            lambda: repo.get_latest_before("run-1", "acct-1", "BTCUSDT", "Buy", AT_TS)
+        )
+        _assert_index_only(
+            lines, "position_snapshots",
+            "ix_position_snapshots_run_account_symbol_side_source_ts",
+        )
+
+    def test_wallet_latest_before(self, session, query_plan):
+        repo = WalletSnapshotRepository(session)
+        lines = query_plan(lambda: repo.get_latest_before("run-1", "acct-1", "USDT", AT_TS))
+        _assert_index_only(lines, "wallet_snapshots", "ix_wallet_snapshots_run_account_coin_ts")
+
+    def test_wallet_all_coins_latest_before_groups_on_index(self, session, query_plan):
+        repo = WalletSnapshotRepository(session)
+        lines = query_plan(lambda: repo.get_all_coins_latest_before("run-1", "acct-1", AT_TS))
+        accesses = [line for line in lines if " wallet_snapshots " in f"{line} "]
+        assert accesses and all(
+            "INDEX ix_wallet_snapshots_run_account_coin_ts " in line for line in accesses
+        ), lines
+        assert not any("TEMP B-TREE FOR GROUP BY" in line for line in lines), lines
+
+    def test_grid_state_at_or_before(self, session, query_plan):
+        repo = GridStateSnapshotRepository(session)
+        lines = query_plan(
+            lambda: repo.get_at_or_before("acct-1", "strat-1", "BTCUSDT", AT_TS)
+        )
+        _assert_index_only(
+            lines, "grid_state_snapshots",
+            "ix_grid_state_snapshots_account_strat_symbol_ts",
+        )
@@ -20,6 +20,7 @@ _CLASSES = [
     "RunRepository",
     "PublicTradeRepository",
     "TickerSnapshotRepository",
+    "TickerRollupRepository",
     "PrivateExecutionRepository",
     "OrderRepository",
     "PositionSnapshotRepository",